@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Archive completed curation data and compact the curation DB.
+
+Moves journals and quote/concept workflows completed more than --days ago,
+with their entity, relationship, span and item rows, into the archive
+database, then frees the emptied pages and refreshes planner statistics.
+Safe to run while the API and worker are up; schedule it (e.g. nightly cron)
+to keep the pending-queue tables small.
+
+Usage:
+    poetry run python scripts/archive_curation.py [--days 90] [--archive PATH]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+
+from minerva_backend.config import settings
+from minerva_backend.processing.curation_manager import CurationManager
+
+
+async def archive(days: int, archive_path: str, compact: bool) -> None:
+    manager = CurationManager(
+        db_path=settings.CURATION_DB_PATH,
+        readers=0,
+        busy_timeout_ms=settings.CURATION_DB_BUSY_TIMEOUT_MS,
+    )
+    await manager.initialize()
+    try:
+        archived = await manager.archive_completed(
+            archive_path, datetime.utcnow() - timedelta(days=days)
+        )
+        print(
+            f"Archived {archived['journals']} journals, "
+            f"{archived['quote_workflows']} quote workflows and "
+            f"{archived['concept_workflows']} concept workflows "
+            f"({archived['rows']} rows) to {archive_path}"
+        )
+        if compact:
+            freed = await manager.compact()
+            print(f"Compacted {settings.CURATION_DB_PATH}: freed {freed} pages")
+    finally:
+        await manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--days", type=int, default=settings.CURATION_ARCHIVE_AFTER_DAYS
+    )
+    parser.add_argument("--archive", default=settings.CURATION_ARCHIVE_PATH)
+    parser.add_argument(
+        "--no-compact", action="store_true", help="Skip vacuum and ANALYZE"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(archive(args.days, args.archive, not args.no_compact))
+
+
+if __name__ == "__main__":
+    main()
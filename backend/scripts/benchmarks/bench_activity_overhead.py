@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for per-activity setup overhead in the Temporal worker.
+Compares building a fresh Container inside every activity (new singletons,
+vault re-walk, and with --neo4j a new driver, health check and index DDL)
+against one initialized Container shared by all activity runs.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_activity_overhead.py [--notes 5000] [--runs 20] [--neo4j]
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from minerva_backend.containers import Container
+
+
+def make_vault(root: Path, notes: int) -> None:
+    for i in range(notes):
+        folder = root / f"area-{i % 20}" / f"topic-{i % 7}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"Nota {i}.md").write_text(f"# Nota {i}\n", encoding="utf-8")
+
+
+def make_container(vault: Path) -> Container:
+    container = Container()
+    container.config.OBSIDIAN_VAULT_PATH.override(str(vault))
+    return container
+
+
+async def activity_setup(container: Container, neo4j: bool) -> None:
+    """What an activity needs before doing real work."""
+    container.extraction_service()
+    container.curation_manager()
+    container.obsidian_service()._build_cache()
+    if neo4j:
+        await container.db_connection().initialize()
+
+
+async def per_activity(vault: Path, runs: int, neo4j: bool) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        container = make_container(vault)
+        await activity_setup(container, neo4j)
+        timings.append((time.perf_counter() - start) * 1000)
+        if neo4j:
+            await container.db_connection().close_async()
+    return timings
+
+
+async def shared(vault: Path, runs: int, neo4j: bool) -> list:
+    container = make_container(vault)
+    await activity_setup(container, neo4j)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await activity_setup(container, neo4j)
+        timings.append((time.perf_counter() - start) * 1000)
+    if neo4j:
+        await container.db_connection().close_async()
+    return timings
+
+
+def report(label: str, timings: list) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<14} p50 {median:9.3f} ms   max {max(timings):9.3f} ms")
+    return median
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--notes", type=int, default=5_000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument(
+        "--neo4j", action="store_true", help="Include driver setup (needs Neo4j)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = Path(tmp)
+        make_vault(vault, args.notes)
+        print(f"{args.notes} vault notes, {args.runs} activity runs\n")
+
+        baseline = report(
+            "per-activity", await per_activity(vault, args.runs, args.neo4j)
+        )
+        improved = report("shared", await shared(vault, args.runs, args.neo4j))
+    print(f"\nper-activity overhead saved: {baseline - improved:.3f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark for reduced embedding storage.
+Measures recall@k of Matryoshka-truncated concept embeddings against exact
+full-size neighbours, brute-force scan latency and bytes stored per vector
+(float64 lists vs float32 vector properties) for several sizes.
+
+Reads Concept embeddings from Neo4j, or generates --synthetic ones.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_embedding_storage.py [--synthetic 2000] [--queries 50] [--k 10] [--dims 768,512,256,128]
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import time
+
+from minerva_backend.config import settings
+from minerva_backend.graph.db import Neo4jConnection
+from minerva_backend.graph.embedding_storage import reduce_embedding
+
+
+async def load_concepts() -> list:
+    connection = Neo4jConnection(
+        uri=settings.NEO4J_URI,
+        user=settings.NEO4J_USER,
+        password=settings.NEO4J_PASSWORD,
+    )
+    await connection.initialize()
+    try:
+        records = await connection.execute_query(
+            # Migrated concepts keep their model-size vector in embedding_full
+            "MATCH (c:Concept) WHERE c.embedding IS NOT NULL "
+            "RETURN coalesce(c.embedding_full, c.embedding) AS embedding"
+        )
+    finally:
+        await connection.close_async()
+    return [list(record["embedding"]) for record in records]
+
+
+def synthetic_concepts(count: int, dimensions: int) -> list:
+    """Clustered vectors whose variance decays along the dimensions, like MRL."""
+    rng = random.Random(0)
+    scales = [1 / (1 + i / 64) for i in range(dimensions)]
+    centers = [
+        [rng.gauss(0, s) for s in scales] for _ in range(max(1, count // 20))
+    ]
+    vectors = []
+    for i in range(count):
+        center = centers[i % len(centers)]
+        vector = [c + rng.gauss(0, 0.5 * s) for c, s in zip(center, scales)]
+        norm = math.sqrt(sum(x * x for x in vector))
+        vectors.append([x / norm for x in vector])
+    return vectors
+
+
+def top_k(query: list, vectors: list, k: int, skip: int) -> list:
+    scores = [
+        (sum(a * b for a, b in zip(query, vector)), i)
+        for i, vector in enumerate(vectors)
+        if i != skip
+    ]
+    scores.sort(reverse=True)
+    return [i for _, i in scores[:k]]
+
+
+def run(vectors: list, queries: list, k: int, dimensions: int, truth: dict):
+    reduced = [reduce_embedding(v, dimensions) for v in vectors]
+    timings, recalls = [], []
+    for q in queries:
+        start = time.perf_counter()
+        found = top_k(reduced[q], reduced, k, q)
+        timings.append((time.perf_counter() - start) * 1000)
+        if truth:
+            recalls.append(len(set(found) & set(truth[q])) / k)
+    return statistics.median(timings), statistics.mean(recalls) if recalls else 1.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic", type=int, default=0)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dims", default="768,512,256,128")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        vectors = synthetic_concepts(args.synthetic, settings.embedding_dimensions())
+    else:
+        vectors = asyncio.run(load_concepts())
+    if len(vectors) <= args.k:
+        raise SystemExit(f"Need more than {args.k} concept embeddings")
+    full = len(vectors[0])
+    queries = random.Random(1).sample(
+        range(len(vectors)), min(args.queries, len(vectors))
+    )
+    print(f"{len(vectors)} concepts, {full} dims, {len(queries)} queries, k={args.k}\n")
+
+    full_ms, _ = run(vectors, queries, args.k, full, {})
+    truth = {q: top_k(vectors[q], vectors, args.k, q) for q in queries}
+    print(
+        f"{'dims':>6} {'recall@k':>9} {'scan p50':>11} {'float64':>9} {'float32':>9}"
+    )
+    print(
+        f"{full:>6} {1.0:>9.3f} {full_ms:>8.2f} ms {full * 8:>7} B {full * 4:>7} B"
+    )
+    for dimensions in sorted({int(d) for d in args.dims.split(",")}, reverse=True):
+        if dimensions >= full:
+            continue
+        scan_ms, recall = run(vectors, queries, args.k, dimensions, truth)
+        print(
+            f"{dimensions:>6} {recall:>9.3f} {scan_ms:>8.2f} ms "
+            f"{dimensions * 8:>7} B {dimensions * 4:>7} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
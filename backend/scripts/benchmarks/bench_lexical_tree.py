@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark for lexical chunk tree construction.
+Compares the recursive builder (Chunk object and text copy per internal
+node, flat relationship list re-filtered by type) against the iterative
+offset-based builder, with text on every chunk or on sentence chunks only,
+on a large journal entry.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_lexical_tree.py [--chars 50000] [--runs 20]
+"""
+
+import argparse
+import statistics
+import time
+
+from minerva_backend.graph.services.lexical_utils import (
+    SpanIndex,
+    _build_balanced_tree,
+    _prepare_chunk_data,
+)
+from minerva_backend.graph.services.sentence_splitter import RegexSentenceSplitter
+from minerva_models import Chunk
+
+SENTENCE = "Hoy pensé un rato largo en la libertad y en lo que significa elegir. "
+
+
+def legacy_build(nodes, text, all_chunks, relationships, result):
+    """Recursive builder as implemented before the bottom-up rewrite."""
+    if len(nodes) == 1:
+        return nodes[0]
+    mid = len(nodes) // 2
+    left = legacy_build(nodes[:mid], text, all_chunks, relationships, result)
+    right = legacy_build(nodes[mid:], text, all_chunks, relationships, result)
+    left_chunk, left_start, _ = left
+    right_chunk, _, right_end = right
+    parent_chunk = Chunk(text=text[left_start:right_end])
+    all_chunks.append(parent_chunk)
+    result.add_span(left_start, right_end, parent_chunk.uuid)
+    relationships.extend(
+        [
+            {"parent": parent_chunk.uuid, "child": left_chunk.uuid, "type": "CONTAINS"},
+            {"parent": parent_chunk.uuid, "child": right_chunk.uuid, "type": "CONTAINS"},
+            {"parent": left_chunk.uuid, "child": right_chunk.uuid, "type": "NEXT_SIBLING"},
+        ]
+    )
+    return parent_chunk, left_start, right_end
+
+
+def legacy(text, spans):
+    result = SpanIndex()
+    sentence_chunks = []
+    for start, end in spans:
+        chunk = Chunk(text=text[start:end])
+        sentence_chunks.append((chunk, start, end))
+        result.add_span(start, end, chunk.uuid)
+    all_chunks = [chunk for chunk, _, _ in sentence_chunks]
+    relationships = []
+    root, _, _ = legacy_build(sentence_chunks, text, all_chunks, relationships, result)
+    relationships.append({"parent": "journal", "child": root.uuid, "type": "CONTAINS"})
+    for chunk in all_chunks:
+        relationships.append({"parent": "journal", "child": chunk.uuid, "type": "HAS_CHUNK"})
+    rows = [
+        {
+            "uuid": c.uuid,
+            "text": c.text,
+            "type": c.type,
+            "partition": c.partition,
+            "created_at": c.created_at.isoformat(),
+        }
+        for c in all_chunks
+    ]
+    groups = {
+        kind: [r for r in relationships if r["type"] == rel_type]
+        for kind, rel_type in (
+            ("contains", "CONTAINS"),
+            ("sibling", "NEXT_SIBLING"),
+            ("has_chunk", "HAS_CHUNK"),
+        )
+    }
+    return rows, groups
+
+
+def iterative(text, spans):
+    result = SpanIndex()
+    chunk_spans, groups = _build_balanced_tree("journal", spans, result)
+    return _prepare_chunk_data(text, chunk_spans), groups
+
+
+def leaf_text(text, spans):
+    result = SpanIndex()
+    chunk_spans, groups = _build_balanced_tree("journal", spans, result)
+    return _prepare_chunk_data(text, chunk_spans, leaf_count=len(spans)), groups
+
+
+def bench(label, build, text, spans, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        rows, _ = build(text, spans)
+        timings.append((time.perf_counter() - start) * 1000)
+    stored = sum(len(row.get("text", "")) for row in rows)
+    print(
+        f"{label:<12} p50 {statistics.median(timings):8.2f} ms   "
+        f"min {min(timings):8.2f} ms   ({len(rows)} chunks, {stored} chars stored)"
+    )
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chars", type=int, default=50_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    text = (SENTENCE * (args.chars // len(SENTENCE) + 1))[: args.chars]
+    spans = RegexSentenceSplitter().split(text)
+    print(f"{len(text)} chars, {len(spans)} sentences\n")
+
+    baseline = bench("recursive", legacy, text, spans, args.runs)
+    improved = bench("iterative", iterative, text, spans, args.runs)
+    leaves = bench("leaf text", leaf_text, text, spans, args.runs)
+    print(
+        f"\nspeedup: {baseline / improved:.2f}x "
+        f"(leaf text {baseline / leaves:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
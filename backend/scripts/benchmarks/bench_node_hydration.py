@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark for BaseRepository node hydration.
+Compares the legacy per-property heuristic against precomputed field
+converters, with and without validation (model_construct).
+
+Usage:
+    poetry run python scripts/benchmarks/bench_node_hydration.py [--nodes 10000]
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+import neo4j
+
+from minerva_backend.graph.repositories.concept_repository import ConceptRepository
+from minerva_backend.graph.repositories.event_repository import EventRepository
+
+
+def legacy_properties_to_node(entity_class, properties):
+    """Hydration as implemented before precomputed converters."""
+    for key, value in properties.items():
+        if (
+            isinstance(value, str)
+            and "T" in value
+            and key.endswith(("_at", "timestamp", "date"))
+        ):
+            try:
+                properties[key] = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                pass
+        elif isinstance(value, neo4j.time.Date):
+            properties[key] = value.to_native()
+        elif isinstance(value, neo4j.time.DateTime):
+            properties[key] = value.to_native()
+    return entity_class(**properties)
+
+
+def make_concept(i: int) -> dict:
+    return {
+        "uuid": f"concept-{i}",
+        "name": f"concept {i}",
+        "title": f"Concept {i}",
+        "concept": "Texto del concepto " * 10,
+        "analysis": "Análisis del concepto " * 10,
+        "summary_short": "Resumen corto",
+        "summary": "Resumen del concepto " * 5,
+        "partition": "DOMAIN",
+        "type": "Concept",
+        "created_at": "2025-09-08T10:15:30.123456",
+        "updated_at": "2025-09-09T11:00:00",
+        "embedding": [0.01] * 1024,
+    }
+
+
+def make_event(i: int) -> dict:
+    return {
+        "uuid": f"event-{i}",
+        "name": f"event {i}",
+        "summary_short": "Resumen corto",
+        "summary": "Resumen del evento",
+        "partition": "DOMAIN",
+        "type": "Event",
+        "category": "social",
+        "date": neo4j.time.DateTime(2025, 9, 8, 10, 0, 0),
+        "duration": "1:30",
+        "location": "Buenos Aires",
+        "created_at": neo4j.time.DateTime(2025, 9, 8, 10, 15, 30),
+    }
+
+
+def bench(label: str, fn, rows) -> float:
+    start = time.perf_counter()
+    for props in rows:
+        fn(dict(props))
+    elapsed = time.perf_counter() - start
+    per_node_us = elapsed / len(rows) * 1e6
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms  ({per_node_us:6.1f} us/node)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=10_000)
+    args = parser.parse_args()
+
+    cases = [
+        (ConceptRepository(connection=None, llm_service=None), make_concept),
+        (EventRepository(connection=None, llm_service=None), make_event),
+    ]
+
+    for repo, factory in cases:
+        rows = [factory(i) for i in range(args.nodes)]
+        print(f"\n{repo.entity_label}: hydrating {args.nodes} nodes")
+        print("-" * 60)
+        baseline = bench(
+            "legacy heuristic",
+            lambda p: legacy_properties_to_node(repo.entity_class, p),
+            rows,
+        )
+        validated = bench(
+            "field converters", lambda p: repo._properties_to_node(p), rows
+        )
+        trusted = bench(
+            "field converters + trusted",
+            lambda p: repo._properties_to_node(p, trusted=True),
+            rows,
+        )
+        print(
+            f"  speedup: {baseline / validated:.2f}x validated, "
+            f"{baseline / trusted:.2f}x trusted"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark for lexical tree sentence splitting.
+Compares per-journal tokenization latency of a fresh Stanza pipeline per
+journal (the old behaviour), the pooled Stanza splitter and the regex
+splitter.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_sentence_splitter.py [--journals 20]
+"""
+
+import argparse
+import statistics
+import time
+
+from minerva_backend.graph.services.sentence_splitter import (
+    RegexSentenceSplitter,
+    StanzaSentenceSplitter,
+)
+
+SAMPLE_PARAGRAPH = (
+    "Hoy me levanté temprano y salí a caminar con el Sr. Gómez por el parque. "
+    "Hablamos de la libertad, del trabajo y de lo que significa elegir. "
+    "¿Por qué me cuesta tanto decidir? No lo sé, pero escribirlo ayuda. "
+    "Después almorcé con Ana; comimos 1.5 kg de pasta entre los dos…\n\n"
+)
+
+
+def make_journal(i: int) -> str:
+    return f"Entrada {i}.\n\n" + SAMPLE_PARAGRAPH * 8
+
+
+def bench(label: str, split, journals) -> None:
+    timings = []
+    sentences = 0
+    for text in journals:
+        start = time.perf_counter()
+        sentences += len(split(text))
+        timings.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<28} p50 {statistics.median(timings):9.2f} ms   "
+        f"max {max(timings):9.2f} ms   ({sentences} sentences)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--journals", type=int, default=20)
+    args = parser.parse_args()
+
+    journals = [make_journal(i) for i in range(args.journals)]
+    print(f"{args.journals} journals, {len(journals[0])} chars each\n")
+
+    bench("regex", RegexSentenceSplitter().split, journals)
+
+    try:
+        import stanza  # noqa: F401
+    except ImportError:
+        print("stanza not installed; skipping Stanza backends")
+        return
+
+    bench(
+        "stanza, pipeline per journal",
+        lambda text: StanzaSentenceSplitter().split(text),
+        journals,
+    )
+
+    pooled = StanzaSentenceSplitter()
+    start = time.perf_counter()
+    pooled.warm_up()
+    print(f"{'stanza pool warm-up':<28} {(time.perf_counter() - start) * 1000:9.2f} ms")
+    bench("stanza, pooled", pooled.split, journals)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark for chunk containment queries.
+Compares the IntervalTree-backed index (overlap query filtered in Python)
+against the sorted-array SpanIndex with parent pointers, querying one span
+per mention over a large journal entry's chunk tree.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_span_index.py [--chars 50000] [--mentions 2000] [--runs 20]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from intervaltree import IntervalTree
+
+from minerva_backend.graph.services.lexical_utils import (
+    SpanIndex,
+    _build_balanced_tree,
+)
+from minerva_backend.graph.services.sentence_splitter import RegexSentenceSplitter
+
+SENTENCE = "Hoy pensé un rato largo en la libertad y en lo que significa elegir. "
+
+
+def interval_tree_queries(chunk_spans, mention_spans):
+    tree = IntervalTree()
+    for uuid, start, end in chunk_spans:
+        tree[start:end] = uuid
+    return [
+        [iv for iv in tree.overlap(start, end) if iv.begin <= start and iv.end >= end]
+        for start, end in mention_spans
+    ]
+
+
+def span_index_queries(chunk_spans, mention_spans):
+    index = SpanIndex()
+    for uuid, start, end in chunk_spans:
+        index.add_span(start, end, uuid)
+    return index.query_containing_batch(mention_spans)
+
+
+def bench(label, run, chunk_spans, mention_spans, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        found = run(chunk_spans, mention_spans)
+        timings.append((time.perf_counter() - start) * 1000)
+    hits = sum(len(chunks) for chunks in found)
+    print(
+        f"{label:<14} p50 {statistics.median(timings):8.2f} ms   "
+        f"min {min(timings):8.2f} ms   ({hits} containing chunks)"
+    )
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chars", type=int, default=50_000)
+    parser.add_argument("--mentions", type=int, default=2_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    text = (SENTENCE * (args.chars // len(SENTENCE) + 1))[: args.chars]
+    sentence_spans = RegexSentenceSplitter().split(text)
+    chunk_spans, _ = _build_balanced_tree("journal", sentence_spans, SpanIndex())
+
+    rng = random.Random(0)
+    mention_spans = []
+    for _ in range(args.mentions):
+        start = rng.randrange(len(text) - 20)
+        mention_spans.append((start, start + rng.randint(3, 15)))
+    print(
+        f"{len(text)} chars, {len(chunk_spans)} chunks, "
+        f"{len(mention_spans)} mentions\n"
+    )
+
+    baseline = bench(
+        "IntervalTree", interval_tree_queries, chunk_spans, mention_spans, args.runs
+    )
+    improved = bench(
+        "SpanIndex", span_index_queries, chunk_spans, mention_spans, args.runs
+    )
+    print(f"\nspeedup: {baseline / improved:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
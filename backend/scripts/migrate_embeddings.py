@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Rewrite stored embeddings in their configured per-label storage format.
+
+Truncates embeddings to MINERVA_EMBEDDING_LABEL_DIMENSIONS, rewrites them as
+float32 vector properties for labels in MINERVA_EMBEDDING_LABEL_PRECISION
+and rebuilds vector indexes whose size no longer matches. Previous vectors
+are kept in each node's `embedding_full` property.
+Run after changing either setting.
+
+Once bench_embedding_storage.py shows acceptable recall, run again with
+--remove-full to delete the `embedding_full` backups and reclaim their space.
+
+Usage:
+    poetry run python scripts/migrate_embeddings.py [--label Concept] [--batch-size 500] [--remove-full]
+"""
+
+import argparse
+import asyncio
+
+from minerva_backend.config import settings
+from minerva_backend.graph.db import VECTOR_INDEX_LABELS, Neo4jConnection
+from minerva_backend.graph.embedding_storage import embedding_storage
+
+
+async def migrate(labels: list, batch_size: int, remove_full: bool) -> None:
+    connection = Neo4jConnection(
+        uri=settings.NEO4J_URI,
+        user=settings.NEO4J_USER,
+        password=settings.NEO4J_PASSWORD,
+    )
+    await connection.initialize()
+    try:
+        for label in labels:
+            if remove_full:
+                removed = await connection.remove_full_embeddings(label, batch_size)
+                print(f"{label}: removed {removed} full-size embedding backups")
+                continue
+            storage = embedding_storage(label)
+            counts = await connection.migrate_embedding_storage(label, batch_size)
+            print(
+                f"{label}: {counts['rewritten']} rewritten at "
+                f"{connection.vector_dimensions_for(label)} dims "
+                f"({storage.precision}), {counts['skipped']} skipped"
+            )
+            if counts["skipped"]:
+                print(
+                    f"  {counts['skipped']} {label} embeddings are shorter than "
+                    "the configured size and need to be re-embedded"
+                )
+    finally:
+        await connection.close_async()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--label",
+        action="append",
+        choices=VECTOR_INDEX_LABELS,
+        help="Label to migrate (repeatable; defaults to every configured label)",
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--remove-full",
+        action="store_true",
+        help="Delete the embedding_full backups instead of migrating "
+        "(irreversible; run once recall has been validated)",
+    )
+    args = parser.parse_args()
+
+    labels = args.label or sorted(
+        set(settings.EMBEDDING_LABEL_DIMENSIONS)
+        | set(settings.EMBEDDING_LABEL_PRECISION)
+    )
+    if not labels:
+        parser.error("no label has a reduced embedding storage configured")
+
+    asyncio.run(migrate(labels, args.batch_size, args.remove_full))
+
+
+if __name__ == "__main__":
+    main()
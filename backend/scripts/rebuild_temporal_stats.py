@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Rebuild the pre-aggregated temporal statistics.
+
+Recomputes journal_count, word_count and mention_count on every Day,
+Month and Year node from the journal entries linked to the time tree.
+Run after bulk imports or deletions that bypass the incremental update.
+
+Usage:
+    poetry run python scripts/rebuild_temporal_stats.py [--start-year 2020]
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from minerva_backend.config import settings
+from minerva_backend.graph.db import Neo4jConnection
+from minerva_backend.graph.repositories.temporal_repository import TemporalRepository
+
+
+async def rebuild(start_year: int, end_year: int) -> None:
+    connection = Neo4jConnection(
+        uri=settings.NEO4J_URI,
+        user=settings.NEO4J_USER,
+        password=settings.NEO4J_PASSWORD,
+    )
+    await connection.initialize()
+    try:
+        repository = TemporalRepository(connection)
+        days = await repository.ensure_time_tree(start_year, end_year)
+        print(f"Ensured {days} days in time tree ({start_year}-{end_year})")
+
+        updated = await repository.rebuild_temporal_stats()
+        print(
+            f"Rebuilt counters on {updated['days']} days, "
+            f"{updated['months']} months, {updated['years']} years"
+        )
+    finally:
+        await connection.close_async()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--start-year", type=int, default=settings.TIME_TREE_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=date.today().year + 1)
+    args = parser.parse_args()
+
+    asyncio.run(rebuild(args.start_year, args.end_year))
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,8 @@ from fastapi import Depends, HTTPException
 
 from minerva_backend.containers import Container
 from minerva_backend.graph.db import Neo4jConnection
+from minerva_backend.graph.services.hybrid_search_service import HybridSearchService
+from minerva_backend.processing.curation_events import CurationEventBroker
 from minerva_backend.processing.curation_manager import CurationManager
 from minerva_backend.processing.llm_service import LLMService
 from minerva_backend.processing.temporal_orchestrator import PipelineOrchestrator
@@ -67,6 +69,14 @@ async def get_llm_service(
         raise ServiceUnavailableError("LLM Service", str(e))
 
 
+@inject
+async def get_curation_event_broker(
+    broker: CurationEventBroker = Depends(Provide[Container.curation_event_broker]),
+) -> CurationEventBroker:
+    """Get the curation event broker (started on first subscription)."""
+    return broker
+
+
 @inject
 async def get_pipeline_orchestrator(
     orchestrator: PipelineOrchestrator = Depends(
@@ -82,6 +92,14 @@ async def get_pipeline_orchestrator(
         raise ServiceUnavailableError("Pipeline Orchestrator", str(e))
 
 
+@inject
+async def get_hybrid_search_service(
+    service: HybridSearchService = Depends(Provide[Container.hybrid_search_service]),
+) -> HybridSearchService:
+    """Get hybrid search service."""
+    return service
+
+
 async def poll_for_initial_status(
     orchestrator: PipelineOrchestrator, workflow_id: str
 ) -> Optional[dict]:
@@ -19,7 +19,7 @@ from minerva_backend.utils.logging import get_logger, setup_logging
 
 from .exceptions import MinervaHTTPException, handle_errors, minerva_exception_handler
 from .models import SuccessResponse
-from .routers import curation, health, journal, pipeline, processing
+from .routers import curation, health, journal, pipeline, processing, search
 
 # Initialize logging
 setup_logging()
@@ -86,6 +86,8 @@ async def lifespan(app: FastAPI):
         try:
             # Close database connections
             await container.db_connection().close_all()
+            await container.curation_event_broker().close()
+            await container.curation_manager().close()
             logger.info("Database connections closed", context={"stage": "shutdown"})
         except Exception as e:
             logger.error(
@@ -122,6 +124,7 @@ backend_app.include_router(pipeline.router)
 backend_app.include_router(curation.router)
 backend_app.include_router(health.router)
 backend_app.include_router(processing.router)
+backend_app.include_router(search.router)
 
 
 # ===== OBSIDIAN INTEGRATION ENDPOINTS =====
@@ -7,7 +7,11 @@ from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
-from minerva_backend.processing.models import CurationStats, JournalEntryCuration
+from minerva_backend.processing.models import (
+    CurationStats,
+    JournalCurationSummary,
+    JournalEntryCuration,
+)
 
 # ===== REQUEST MODELS =====
 
@@ -57,6 +61,20 @@ class CurationAction(BaseModel):
         return curated_data
 
 
+class CurationDecision(CurationAction):
+    """Accept or reject one item of a batch."""
+
+    item_id: str = Field(..., description="Entity or relationship uuid")
+
+
+class BatchCurationRequest(BaseModel):
+    """Decisions on several items of one journal, applied together."""
+
+    decisions: List[CurationDecision] = Field(
+        ..., min_length=1, max_length=1000, description="One decision per item"
+    )
+
+
 class ProcessingControl(BaseModel):
     """Model for processing control actions."""
 
@@ -130,6 +148,31 @@ class PendingCurationResponse(BaseResponse):
         default_factory=dict, description="List of pending journals with curation tasks"
     )
     stats: CurationStats = Field(..., description="Curation statistics")
+    version: int = Field(default=0, description="Curation version of this snapshot")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (None on the last page)"
+    )
+
+
+class PendingCurationSummaryResponse(BaseResponse):
+    """Response model for the pending curation summary."""
+
+    journals: List[JournalCurationSummary] = Field(
+        default_factory=list, description="Pending journals, newest first"
+    )
+    version: int = Field(default=0, description="Curation version of this snapshot")
+
+
+class CurationChangesResponse(BaseResponse):
+    """Response model for journal curation changes since a version."""
+
+    version: int = Field(..., description="Current curation version")
+    journal_entries: Dict[str, JournalEntryCuration] = Field(
+        default_factory=dict, description="Changed journals that are still pending"
+    )
+    removed: List[str] = Field(
+        default_factory=list, description="Changed journals that are no longer pending"
+    )
 
 
 class ProcessingWindowsResponse(BaseResponse):
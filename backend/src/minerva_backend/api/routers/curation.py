@@ -1,47 +1,111 @@
 """Human-in-the-loop curation endpoints."""
 
 import logging
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
+from minerva_backend.processing.curation_events import (
+    EVENT_KINDS,
+    CurationEventBroker,
+    EventFilter,
+)
 from minerva_backend.processing.curation_manager import CurationManager
+from minerva_backend.processing.curation_signals import (
+    CURATION_COMPLETE,
+    ENTITY_CURATION_COMPLETE,
+    RELATIONSHIP_CURATION_COMPLETE,
+)
+from minerva_backend.processing.temporal_orchestrator import PipelineOrchestrator
 from minerva_backend.utils.logging import get_logger
 
 from ..dependencies import (
+    get_curation_event_broker,
     get_curation_manager,
+    get_pipeline_orchestrator,
     validate_entity_id,
     validate_journal_id,
     validate_relationship_id,
 )
 from ..exceptions import NotFoundError, ValidationError, handle_errors
 from ..models import (
+    BatchCurationRequest,
     CurationAction,
+    CurationChangesResponse,
     CurationStatsResponse,
     PendingCurationResponse,
+    PendingCurationSummaryResponse,
     SuccessResponse,
 )
 
 logger = get_logger("minerva_backend.api.curation")
 router = APIRouter(prefix="/api/curation", tags=["curation"])
 
+# Comment line sent on idle event streams so proxies keep them open
+EVENT_STREAM_HEARTBEAT_SECONDS = 15
+
+
+async def _signal_if_reviewed(
+    orchestrator: PipelineOrchestrator, workflow_id: str, pending: int
+) -> bool:
+    """Resume a waiting workflow once its last item has been reviewed."""
+    if pending:
+        return False
+    return await orchestrator.signal_workflow(workflow_id, CURATION_COMPLETE)
+
+
+def _not_modified(request: Request, response: Response, version: int) -> bool:
+    """
+    Tag the response with the curation version; True when the client's
+    If-None-Match already has it (the caller answers 304).
+    """
+    etag = f'W/"{version}"'
+    response.headers["ETag"] = etag
+    # Browsers revalidate on every fetch, so unchanged polls cost a 304
+    response.headers["Cache-Control"] = "no-cache"
+    if_none_match = request.headers.get("if-none-match", "")
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
 
 @router.get("/pending", response_model=PendingCurationResponse)
 @handle_errors(500)
 async def get_pending_curation(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(
+        None, ge=1, le=100, description="Journals per page (all if omitted)"
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor of the last page"),
     curation_manager: CurationManager = Depends(get_curation_manager),
-) -> PendingCurationResponse:
+):
     """
     Get all pending curation tasks across all journal entries.
 
     Returns both entity and relationship curation tasks that require
-    human review and approval.
+    human review and approval. Pass `limit` (and then `next_cursor`) to page
+    through journals; an unchanged result is answered with 304 when the
+    request carries the previous ETag.
     """
     try:
-        pending_journals = await curation_manager.get_all_pending_curation_tasks()
+        version = await curation_manager.get_curation_version()
+        if _not_modified(request, response, version):
+            return Response(status_code=304, headers=dict(response.headers))
+
+        next_cursor = None
+        if limit is None and cursor is None:
+            pending_journals = await curation_manager.get_all_pending_curation_tasks()
+        else:
+            pending_journals, next_cursor = (
+                await curation_manager.get_pending_curation_page(limit or 20, cursor)
+            )
         stats_model = await curation_manager.get_curation_stats()
 
         return PendingCurationResponse(
-            journal_entries=pending_journals, stats=stats_model
+            journal_entries=pending_journals,
+            stats=stats_model,
+            version=version,
+            next_cursor=next_cursor,
         )
 
     except Exception as e:
@@ -49,6 +113,110 @@ async def get_pending_curation(
         raise
 
 
+@router.get("/pending/summary", response_model=PendingCurationSummaryResponse)
+@handle_errors(500)
+async def get_pending_curation_summary(
+    request: Request,
+    response: Response,
+    curation_manager: CurationManager = Depends(get_curation_manager),
+):
+    """
+    Get pending journals with their pending task counts.
+
+    Leaves out journal text and tasks, for cheap dashboard polling.
+    """
+    version = await curation_manager.get_curation_version()
+    if _not_modified(request, response, version):
+        return Response(status_code=304, headers=dict(response.headers))
+
+    journals = await curation_manager.get_pending_curation_summary()
+    return PendingCurationSummaryResponse(journals=journals, version=version)
+
+
+@router.get("/changes", response_model=CurationChangesResponse)
+@handle_errors(500)
+async def get_curation_changes(
+    since: int = Query(..., ge=0, description="version of the client's last snapshot"),
+    curation_manager: CurationManager = Depends(get_curation_manager),
+) -> CurationChangesResponse:
+    """
+    Get journals changed since a curation version.
+
+    Changed journals that are still pending are returned in full; the ones
+    that were completed or deleted are listed in `removed`.
+    """
+    # Read the version first: a concurrent write is then sent again next poll
+    version = await curation_manager.get_curation_version()
+    if since == version:
+        return CurationChangesResponse(version=version)
+
+    # A version ahead of the DB comes from before it was recreated: resend all
+    journal_entries, removed = await curation_manager.get_curation_changes(
+        since if since < version else 0
+    )
+    return CurationChangesResponse(
+        version=version, journal_entries=journal_entries, removed=removed
+    )
+
+
+@router.get("/events")
+@handle_errors(500)
+async def stream_curation_events(
+    request: Request,
+    kinds: Optional[List[str]] = Query(None, description="Event kinds to receive"),
+    stages: Optional[List[str]] = Query(
+        None, description="Stages to receive (entities, relationships, quotes, ...)"
+    ),
+    workflow_id: Optional[str] = Query(None, description="Only this workflow"),
+    journal_id: Optional[str] = Query(None, description="Only this journal"),
+    broker: CurationEventBroker = Depends(get_curation_event_broker),
+) -> StreamingResponse:
+    """
+    Stream curation changes as Server-Sent Events.
+
+    Sends items_queued, item_reviewed, stage_completed, notification_created
+    and notification_updated events (from the API and the Temporal worker),
+    so dashboards update without polling. A `resync` event means the client
+    fell behind: reload through the REST endpoints. Reconnecting clients
+    resume from the Last-Event-ID header.
+    """
+    unknown = set(kinds or ()) - EVENT_KINDS
+    if unknown:
+        raise ValidationError(f"Unknown event kinds: {', '.join(sorted(unknown))}")
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id is not None and not last_event_id.isdigit():
+        raise ValidationError(f"Invalid Last-Event-ID: {last_event_id}")
+
+    event_filter = EventFilter(
+        kinds=frozenset(kinds) if kinds else None,
+        stages=frozenset(stages) if stages else None,
+        workflow_id=workflow_id,
+        journal_id=journal_id,
+    )
+
+    async def stream() -> AsyncIterator[str]:
+        async with broker.subscribe(
+            event_filter, int(last_event_id) if last_event_id else None
+        ) as subscription:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                event = await subscription.next(EVENT_STREAM_HEARTBEAT_SECONDS)
+                if subscription.closed:
+                    break
+                if subscription.take_resync():
+                    yield "event: resync\ndata: {}\n\n"
+                elif event is not None:
+                    yield event.to_sse()
+                else:
+                    yield ": keepalive\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/stats", response_model=CurationStatsResponse)
 @handle_errors(500)
 async def get_curation_stats(
@@ -77,6 +245,7 @@ async def get_curation_stats(
 async def complete_entity_curation(
     journal_id: str = Depends(validate_journal_id),
     curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
 ) -> SuccessResponse:
     """
     Mark entity curation phase as complete for a journal entry.
@@ -86,14 +255,18 @@ async def complete_entity_curation(
     """
     try:
         await curation_manager.complete_entity_phase(journal_id)
+        workflow_id = await curation_manager.get_journal_workflow_id(journal_id)
+        signalled = bool(workflow_id) and await orchestrator.signal_workflow(
+            workflow_id, ENTITY_CURATION_COMPLETE
+        )
 
         logger.info(f"Entity curation completed for journal {journal_id}")
 
         return SuccessResponse(
             message="Entity curation phase completed",
-            workflow_id=None,
+            workflow_id=workflow_id,
             journal_id=journal_id,
-            data={"phase": "entity", "status": "completed"},
+            data={"phase": "entity", "status": "completed", "signalled": signalled},
         )
 
     except Exception as e:
@@ -166,6 +339,7 @@ async def handle_entity_curation(
 async def complete_relationship_curation(
     journal_id: str = Depends(validate_journal_id),
     curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
 ) -> SuccessResponse:
     """
     Mark relationship curation phase as complete for a journal entry.
@@ -175,14 +349,22 @@ async def complete_relationship_curation(
     """
     try:
         await curation_manager.complete_relationship_phase(journal_id)
+        workflow_id = await curation_manager.get_journal_workflow_id(journal_id)
+        signalled = bool(workflow_id) and await orchestrator.signal_workflow(
+            workflow_id, RELATIONSHIP_CURATION_COMPLETE
+        )
 
         logger.info(f"Relationship curation completed for journal {journal_id}")
 
         return SuccessResponse(
             message="Relationship curation phase completed",
-            workflow_id=None,
+            workflow_id=workflow_id,
             journal_id=journal_id,
-            data={"phase": "relationship", "status": "completed"},
+            data={
+                "phase": "relationship",
+                "status": "completed",
+                "signalled": signalled,
+            },
         )
 
     except Exception as e:
@@ -277,14 +459,16 @@ async def get_quote_curation_items(
 async def complete_quote_workflow(
     workflow_id: str,
     curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
 ) -> SuccessResponse:
     """Mark quote workflow as completed (signals Temporal to proceed)."""
     await curation_manager.complete_quote_workflow(workflow_id)
+    signalled = await orchestrator.signal_workflow(workflow_id, CURATION_COMPLETE)
     return SuccessResponse(
         message="Quote workflow completed",
         workflow_id=workflow_id,
         journal_id=None,
-        data={"status": "completed"},
+        data={"status": "completed", "signalled": signalled},
     )
 
 
@@ -295,6 +479,7 @@ async def handle_quote_curation(
     workflow_id: str,
     quote_id: str,
     curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
 ) -> SuccessResponse:
     """Accept or reject a quote item."""
     if action_data.action == "accept":
@@ -307,11 +492,18 @@ async def handle_quote_curation(
         message = "Quote rejected"
     if not success:
         raise NotFoundError("Quote", quote_id)
+    pending = await curation_manager.get_quote_pending_count(workflow_id)
+    signalled = await _signal_if_reviewed(orchestrator, workflow_id, pending)
     return SuccessResponse(
         message=message,
         workflow_id=workflow_id,
         journal_id=None,
-        data={"quote_id": quote_id, "action": action_data.action},
+        data={
+            "quote_id": quote_id,
+            "action": action_data.action,
+            "pending": pending,
+            "signalled": signalled,
+        },
     )
 
 
@@ -345,14 +537,16 @@ async def get_concept_curation_items(
 async def complete_concept_workflow(
     workflow_id: str,
     curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
 ) -> SuccessResponse:
-    """Mark concept workflow as completed."""
+    """Mark concept workflow as completed (signals Temporal to proceed)."""
     await curation_manager.complete_concept_workflow(workflow_id)
+    signalled = await orchestrator.signal_workflow(workflow_id, CURATION_COMPLETE)
     return SuccessResponse(
         message="Concept workflow completed",
         workflow_id=workflow_id,
         journal_id=None,
-        data={"status": "completed"},
+        data={"status": "completed", "signalled": signalled},
     )
 
 
@@ -363,6 +557,7 @@ async def handle_concept_curation(
     workflow_id: str,
     concept_id: str,
     curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
 ) -> SuccessResponse:
     """Accept or reject a concept item."""
     if action_data.action == "accept":
@@ -375,11 +570,18 @@ async def handle_concept_curation(
         message = "Concept rejected"
     if not success:
         raise NotFoundError("Concept", concept_id)
+    pending = await curation_manager.get_concept_pending_count(workflow_id)
+    signalled = await _signal_if_reviewed(orchestrator, workflow_id, pending)
     return SuccessResponse(
         message=message,
         workflow_id=workflow_id,
         journal_id=None,
-        data={"concept_id": concept_id, "action": action_data.action},
+        data={
+            "concept_id": concept_id,
+            "action": action_data.action,
+            "pending": pending,
+            "signalled": signalled,
+        },
     )
 
 
@@ -390,6 +592,7 @@ async def handle_concept_relation_curation(
     workflow_id: str,
     relation_id: str,
     curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
 ) -> SuccessResponse:
     """Accept or reject a concept relation item."""
     if action_data.action == "accept":
@@ -404,11 +607,18 @@ async def handle_concept_relation_curation(
         message = "Concept relation rejected"
     if not success:
         raise NotFoundError("Concept relation", relation_id)
+    pending = await curation_manager.get_concept_pending_count(workflow_id)
+    signalled = await _signal_if_reviewed(orchestrator, workflow_id, pending)
     return SuccessResponse(
         message=message,
         workflow_id=workflow_id,
         journal_id=None,
-        data={"relation_id": relation_id, "action": action_data.action},
+        data={
+            "relation_id": relation_id,
+            "action": action_data.action,
+            "pending": pending,
+            "signalled": signalled,
+        },
     )
 
 
@@ -436,6 +646,27 @@ async def get_inbox_classification_items(
     return {"workflow_id": workflow_id, "items": items}
 
 
+@router.post("/inbox/{workflow_id}/complete", response_model=SuccessResponse)
+@handle_errors(404)
+async def complete_inbox_workflow(
+    workflow_id: str,
+    curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
+) -> SuccessResponse:
+    """
+    Finish inbox review early (signals Temporal to proceed). Items still
+    pending are left in the inbox.
+    """
+    await curation_manager.complete_inbox_workflow(workflow_id)
+    signalled = await orchestrator.signal_workflow(workflow_id, CURATION_COMPLETE)
+    return SuccessResponse(
+        message="Inbox classification completed",
+        workflow_id=workflow_id,
+        journal_id=None,
+        data={"status": "completed", "signalled": signalled},
+    )
+
+
 @router.post("/inbox/{workflow_id}/{item_id}", response_model=SuccessResponse)
 @handle_errors(404)
 async def handle_inbox_classification_curation(
@@ -443,6 +674,7 @@ async def handle_inbox_classification_curation(
     workflow_id: str,
     item_id: str,
     curation_manager: CurationManager = Depends(get_curation_manager),
+    orchestrator: PipelineOrchestrator = Depends(get_pipeline_orchestrator),
 ) -> SuccessResponse:
     """Accept or reject an inbox classification item."""
     if action_data.action == "accept":
@@ -457,11 +689,18 @@ async def handle_inbox_classification_curation(
         message = "Classification rejected"
     if not success:
         raise NotFoundError("Inbox classification item", item_id)
+    pending = await curation_manager.get_inbox_classification_pending_count(workflow_id)
+    signalled = await _signal_if_reviewed(orchestrator, workflow_id, pending)
     return SuccessResponse(
         message=message,
         workflow_id=workflow_id,
         journal_id=None,
-        data={"item_id": item_id, "action": action_data.action},
+        data={
+            "item_id": item_id,
+            "action": action_data.action,
+            "pending": pending,
+            "signalled": signalled,
+        },
     )
 
 
@@ -522,33 +761,114 @@ async def mark_notification_dismissed(
 # ===== BULK OPERATIONS =====
 
 
+BULK_PHASES = ("entity", "relationship")
+
+
+def _check_bulk_phase(phase: str) -> None:
+    if phase not in BULK_PHASES:
+        raise ValidationError("Phase must be 'entity' or 'relationship'")
+
+
 @router.post("/bulk/accept-all/{journal_id}", response_model=SuccessResponse)
 @handle_errors(404)
 async def bulk_accept_all(
     journal_id: str = Depends(validate_journal_id),
     phase: str = "entity",  # or "relationship"
+    item_type: Optional[str] = Query(
+        None, description="Only items of this entity or relationship type"
+    ),
     curation_manager: CurationManager = Depends(get_curation_manager),
 ) -> SuccessResponse:
     """
     Accept all pending curation tasks for a journal entry.
 
     Useful when the AI extraction quality is high and manual review
-    of each item is not necessary.
+    of each item is not necessary. Items are accepted as extracted.
     """
     try:
-        if phase not in ["entity", "relationship"]:
-            raise ValidationError("Phase must be 'entity' or 'relationship'")
-
-        # This method would need to be implemented in CurationManager
-        count = 0  # await curation_manager.bulk_accept_all(journal_id, phase)
+        _check_bulk_phase(phase)
+        count = await curation_manager.bulk_accept_all(journal_id, phase, item_type)
 
         return SuccessResponse(
             message=f"Bulk accepted {count} {phase} items",
             workflow_id=None,
             journal_id=journal_id,
-            data={"phase": phase, "accepted_count": count},
+            data={"phase": phase, "item_type": item_type, "accepted_count": count},
         )
 
     except Exception as e:
         logger.error(f"Failed to bulk accept for {journal_id}: {e}")
         raise
+
+
+@router.post("/bulk/reject-all/{journal_id}", response_model=SuccessResponse)
+@handle_errors(404)
+async def bulk_reject_all(
+    journal_id: str = Depends(validate_journal_id),
+    phase: str = "entity",  # or "relationship"
+    item_type: Optional[str] = Query(
+        None, description="Only items of this entity or relationship type"
+    ),
+    curation_manager: CurationManager = Depends(get_curation_manager),
+) -> SuccessResponse:
+    """Reject all pending curation tasks for a journal entry."""
+    try:
+        _check_bulk_phase(phase)
+        count = await curation_manager.bulk_reject(journal_id, phase, item_type)
+
+        return SuccessResponse(
+            message=f"Bulk rejected {count} {phase} items",
+            workflow_id=None,
+            journal_id=journal_id,
+            data={"phase": phase, "item_type": item_type, "rejected_count": count},
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to bulk reject for {journal_id}: {e}")
+        raise
+
+
+@router.post("/bulk/review/{journal_id}", response_model=SuccessResponse)
+@handle_errors(404)
+async def bulk_review(
+    batch: BatchCurationRequest,
+    journal_id: str = Depends(validate_journal_id),
+    phase: str = "entity",  # or "relationship"
+    curation_manager: CurationManager = Depends(get_curation_manager),
+) -> SuccessResponse:
+    """
+    Accept or reject several items of a journal in one request.
+
+    Decisions are applied in a single transaction; items not found in the
+    journal are skipped and listed in `not_found`.
+    """
+    try:
+        _check_bulk_phase(phase)
+        accepted = {
+            d.item_id: d.curated_data for d in batch.decisions if d.action == "accept"
+        }
+        rejected = [d.item_id for d in batch.decisions if d.action == "reject"]
+        accepted_count, rejected_count, not_found = await curation_manager.review_items(
+            journal_id, phase, accepted, rejected
+        )
+
+        logger.info(
+            f"Reviewed {accepted_count + rejected_count} {phase} items "
+            f"for journal {journal_id}"
+        )
+
+        return SuccessResponse(
+            message=f"Reviewed {accepted_count + rejected_count} {phase} items",
+            workflow_id=None,
+            journal_id=journal_id,
+            data={
+                "phase": phase,
+                "accepted_count": accepted_count,
+                "rejected_count": rejected_count,
+                "not_found": not_found,
+            },
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to review items for {journal_id}: {e}")
+        raise
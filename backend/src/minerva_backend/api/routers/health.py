@@ -4,7 +4,7 @@ import time
 from datetime import datetime
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 
 from minerva_backend.graph.db import Neo4jConnection
@@ -219,6 +219,33 @@ def _build_error_response() -> JSONResponse:
     )
 
 
+@router.get("/queries")
+@handle_errors(500)
+async def query_metrics(
+    limit: int = Query(50, ge=1, le=500),
+    reset: bool = Query(False, description="Clear the metrics after reading"),
+    db_connection: Neo4jConnection = Depends(get_db_connection),
+) -> JSONResponse:
+    """
+    Per-query Neo4j metrics, most expensive first.
+
+    Each entry holds call and error counts, rows returned, total/mean/max
+    latency with a histogram, result consumption time and the update
+    counters reported by the database.
+    """
+    queries = db_connection.query_metrics.snapshot()
+    if reset:
+        db_connection.query_metrics.reset()
+    return JSONResponse(
+        content={
+            "enabled": db_connection.query_metrics_enabled,
+            "slow_query_ms": db_connection.slow_query_ms,
+            "query_count": len(queries),
+            "queries": queries[:limit],
+        }
+    )
+
+
 @router.get("/curation")
 @handle_errors(500)
 async def curation_health(
@@ -251,8 +278,10 @@ async def curation_health(
             recommendations.append(
                 "Consider dedicating time to curation to reduce backlog"
             )
-        # Note: oldest_pending_age_hours and avg_processing_time_minutes are not available in CurationStats
-        # These recommendations are disabled until those fields are added to the model
+        if stats.oldest_pending_age_hours > 72:
+            recommendations.append(
+                "Some journals have been waiting for curation for over 3 days"
+            )
 
         if not recommendations:
             recommendations.append("Curation system is operating optimally")
@@ -267,8 +296,8 @@ async def curation_health(
                     "pending_relationships": stats.pending_relationships,
                     "total_pending": total_pending,
                     "completed_today": total_completed,
-                    "oldest_pending_age_hours": 0,  # Not available in current model
-                    "avg_processing_time_minutes": 0,  # Not available in current model
+                    "oldest_pending_age_hours": stats.oldest_pending_age_hours,
+                    "avg_processing_time_minutes": stats.avg_processing_time_minutes,
                 },
                 "recommendations": recommendations,
             }
@@ -0,0 +1,59 @@
+"""Hybrid search endpoints."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+
+from minerva_backend.graph.services.hybrid_search_service import HybridSearchService
+from minerva_backend.utils.logging import get_logger
+
+from ..dependencies import get_hybrid_search_service
+from ..exceptions import handle_errors
+
+logger = get_logger("minerva_backend.api.search")
+router = APIRouter(prefix="/api/search", tags=["search"])
+
+
+@router.get("/")
+@handle_errors(500)
+async def hybrid_search(
+    q: str = Query(..., min_length=1, description="Free text query"),
+    labels: Optional[List[str]] = Query(None, description="Node labels to search"),
+    limit: int = Query(10, ge=1, le=100),
+    journal_uuid: Optional[str] = Query(
+        None, description="Boost results close to this journal's mentions"
+    ),
+    graph_weight: float = Query(0.5, ge=0.0),
+    search_service: HybridSearchService = Depends(get_hybrid_search_service),
+) -> JSONResponse:
+    """
+    Search entities combining vector similarity, full-text relevance
+    and graph proximity.
+
+    Results are fused with reciprocal rank fusion and include the
+    per-signal ranks that produced each score.
+    """
+    results = await search_service.search(
+        q,
+        labels=labels,
+        limit=limit,
+        journal_uuid=journal_uuid,
+        graph_weight=graph_weight,
+    )
+    return JSONResponse(
+        content={
+            "query": q,
+            "count": len(results),
+            "results": [result.to_dict() for result in results],
+        }
+    )
+
+
+@router.get("/metrics")
+@handle_errors(500)
+async def search_metrics(
+    search_service: HybridSearchService = Depends(get_hybrid_search_service),
+) -> JSONResponse:
+    """Latency percentiles (ms) per hybrid search stage."""
+    return JSONResponse(content={"latency_ms": search_service.latency_percentiles()})
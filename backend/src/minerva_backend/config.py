@@ -3,11 +3,20 @@ Application Configuration
 Loads settings from environment variables.
 """
 
-from typing import List
+from typing import Dict, List
 
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Output size of known embedding models, by model name without the ":tag"
+EMBEDDING_MODEL_DIMENSIONS = {
+    "mxbai-embed-large": 1024,
+    "bge-m3": 1024,
+    "snowflake-arctic-embed": 1024,
+    "nomic-embed-text": 768,
+    "all-minilm": 384,
+}
+
 
 class Settings(BaseSettings):
     """Application configuration settings, loaded from environment variables."""
@@ -17,6 +26,46 @@ class Settings(BaseSettings):
     NEO4J_USER: str = "neo4j"
     NEO4J_PASSWORD: str = "Alxe342!"
     CURATION_DB_PATH: str = "curation.db"
+    # Curation DB connection pool: reader connections (WAL mode, alongside
+    # one writer) and how long a write waits for another process's lock
+    CURATION_DB_READERS: int = 4
+    CURATION_DB_BUSY_TIMEOUT_MS: int = 5000
+    # Curation event stream: how often the API checks for events written by
+    # the worker, and events buffered per client before it must resync
+    CURATION_EVENTS_POLL_MS: int = 500
+    CURATION_EVENTS_QUEUE_SIZE: int = 100
+    # Completed curation data older than this many days is moved to the
+    # archive DB by scripts/archive_curation.py
+    CURATION_ARCHIVE_PATH: str = "curation_archive.db"
+    CURATION_ARCHIVE_AFTER_DAYS: int = 90
+    # Lucene analyzer for full-text indexes (see SHOW FULLTEXT ANALYZERS)
+    FULLTEXT_ANALYZER: str = "spanish"
+    # First year of the precreated Year -> Month -> Day time tree
+    TIME_TREE_START_YEAR: int = 2020
+    # Sentence splitter for lexical trees: "stanza" or "regex"
+    SENTENCE_SPLITTER: str = "stanza"
+    STANZA_POOL_SIZE: int = 1
+    # Chunk text storage: "all" stores text on every chunk; "leaves" (opt-in)
+    # stores it on sentence chunks only, and internal chunks keep start/end
+    # offsets into the journal text. In "leaves" mode internal Chunk nodes have
+    # no text property: anything reading c.text directly (Cypher queries,
+    # Neo4j Browser, exports) gets null for them and must go through
+    # lexical_utils.get_chunk_texts instead
+    CHUNK_TEXT_MODE: str = "all"
+    # Query instrumentation: per-query metrics, slow-query logging and
+    # (optionally) PROFILE/EXPLAIN plans logged for slow queries
+    NEO4J_QUERY_METRICS: bool = True
+    NEO4J_SLOW_QUERY_MS: float = 500.0
+    NEO4J_PROFILE_SLOW_QUERIES: bool = False
+    # Embedding model; vector indexes are sized for its output (set
+    # EMBEDDING_DIMENSIONS for models missing from EMBEDDING_MODEL_DIMENSIONS)
+    EMBEDDING_MODEL: str = "mxbai-embed-large:latest"
+    EMBEDDING_DIMENSIONS: int = 0
+    # Per-label embedding storage (see graph/embedding_storage.py): Matryoshka
+    # truncation, e.g. {"Concept": 512}, and "float32" vector properties, e.g.
+    # {"Concept": "float32"}. Run scripts/migrate_embeddings.py after changes
+    EMBEDDING_LABEL_DIMENSIONS: Dict[str, int] = {}
+    EMBEDDING_LABEL_PRECISION: Dict[str, str] = {}
 
     # Temporal Configuration
     TEMPORAL_URI: str = "localhost:7233"
@@ -54,6 +103,18 @@ class Settings(BaseSettings):
         env_file=".env", env_prefix="MINERVA_", case_sensitive=False, extra='ignore'
     )
 
+    def embedding_dimensions(self) -> int:
+        """Vector size produced by EMBEDDING_MODEL."""
+        if self.EMBEDDING_DIMENSIONS:
+            return self.EMBEDDING_DIMENSIONS
+        model = self.EMBEDDING_MODEL.split(":", 1)[0]
+        if model not in EMBEDDING_MODEL_DIMENSIONS:
+            raise ValueError(
+                f"Unknown dimensions for embedding model {self.EMBEDDING_MODEL!r}; "
+                "set MINERVA_EMBEDDING_DIMENSIONS"
+            )
+        return EMBEDDING_MODEL_DIMENSIONS[model]
+
 
 # Singleton instance of settings
 settings = Settings()
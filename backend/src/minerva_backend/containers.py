@@ -13,6 +13,8 @@ Key patterns:
 - Lambda providers for complex initialization (emotions_dict)
 """
 
+from datetime import date
+
 from dependency_injector import containers, providers 
 
 from minerva_backend.config import settings
@@ -40,8 +42,10 @@ from minerva_backend.graph.repositories.project_repository import ProjectReposit
 from minerva_backend.graph.repositories.quote_repository import QuoteRepository
 from minerva_backend.graph.repositories.relation_repository import RelationRepository
 from minerva_backend.graph.repositories.temporal_repository import TemporalRepository
+from minerva_backend.graph.services.hybrid_search_service import HybridSearchService
 from minerva_backend.graph.services.knowledge_graph_service import KnowledgeGraphService
 from minerva_backend.obsidian.obsidian_service import ObsidianService
+from minerva_backend.processing.curation_events import CurationEventBroker
 from minerva_backend.processing.curation_manager import CurationManager
 from minerva_backend.processing.extraction_service import ExtractionService
 from minerva_backend.processing.llm_service import LLMService
@@ -53,14 +57,17 @@ async def initialize_async_services(container):
     # Initialize Neo4j async connection
     await container.db_connection().initialize()
 
+    # Precreate the time tree through next year so day linking is a cache hit
+    await container.temporal_repository().ensure_time_tree(
+        settings.TIME_TREE_START_YEAR, date.today().year + 1
+    )
+
     # Initialize other async services
     await container.curation_manager().initialize()
     await container.pipeline_orchestrator().initialize()
 
-    # Initialize emotions dict with async connection and update the provider
-    emotions_dict = await container.db_connection().init_emotion_types()
-    # Override the emotions_dict_async provider with the actual data
-    container.emotions_dict_async.override(emotions_dict)
+    # Upsert emotion types once; the emotions_dict providers serve the cached mapping
+    await container.db_connection().init_emotion_types()
 
 
 class Container(containers.DeclarativeContainer):
@@ -82,6 +89,15 @@ class Container(containers.DeclarativeContainer):
     curation_manager = providers.Singleton(
         CurationManager,
         db_path=config.CURATION_DB_PATH,
+        readers=config.CURATION_DB_READERS,
+        busy_timeout_ms=config.CURATION_DB_BUSY_TIMEOUT_MS,
+    )
+
+    curation_event_broker = providers.Singleton(
+        CurationEventBroker,
+        curation_manager=curation_manager,
+        poll_interval_ms=config.CURATION_EVENTS_POLL_MS,
+        queue_size=config.CURATION_EVENTS_QUEUE_SIZE,
     )
 
     pipeline_orchestrator = providers.Singleton(
@@ -89,20 +105,19 @@ class Container(containers.DeclarativeContainer):
         temporal_uri=config.TEMPORAL_URI,
     )
 
-    def _create_emotions_dict(db_connection):
-        return db_connection.init_emotion_types()
-
-    async def _create_emotions_dict_async(db_connection):
-        return await db_connection.init_emotion_types()
+    def _cached_emotions_dict(db_connection):
+        return db_connection.emotion_types
 
+    # EmotionType -> uuid mapping cached by the connection; it is filled by
+    # init_emotion_types in initialize_async_services
     emotions_dict = providers.Singleton(
-        _create_emotions_dict, db_connection=db_connection
+        _cached_emotions_dict, db_connection=db_connection
     )
+    emotions_dict_async = emotions_dict
 
-    # Use a simple provider that will be set during async initialization
-    emotions_dict_async = providers.Singleton(lambda: {})
-
-    llm_service = providers.Singleton(LLMService, cache=True)
+    llm_service = providers.Singleton(
+        LLMService, cache=True, embedding_model=config.EMBEDDING_MODEL
+    )
 
     # Repository providers (need to be defined before services that use them)
     journal_entry_repository = providers.Factory(
@@ -225,6 +240,12 @@ class Container(containers.DeclarativeContainer):
         entity_repositories=entity_repositories,
     )
 
+    hybrid_search_service = providers.Singleton(
+        HybridSearchService,
+        connection=db_connection,
+        llm_service=llm_service,
+    )
+
     extraction_service = providers.Singleton(
         ExtractionService,
         connection=db_connection,
@@ -232,4 +253,5 @@ class Container(containers.DeclarativeContainer):
         obsidian_service=obsidian_service,
         kg_service=kg_service,
         entity_repositories=entity_repositories,
+        hybrid_search_service=hybrid_search_service,
     )
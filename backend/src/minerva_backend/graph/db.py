@@ -6,19 +6,147 @@ Repository classes handle all CRUD operations.
 Async-only implementation for optimal performance.
 """
 
+import asyncio
 import logging
+import re
+import time
 from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from neo4j import AsyncDriver, AsyncGraphDatabase
 
 from minerva_backend.config import settings
+from minerva_backend.graph.embedding_storage import embedding_storage, reduce_embedding
+from minerva_backend.graph.query_metrics import (
+    InstrumentedSession,
+    QueryMetrics,
+    caller_name,
+    format_plan,
+)
 from minerva_models import EmotionType
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Text properties covered by each label's full-text index
+DEFAULT_FULLTEXT_FIELDS = ["name", "title", "summary_short", "summary", "aliases"]
+FULLTEXT_INDEXES: Dict[str, List[str]] = {
+    "Person": DEFAULT_FULLTEXT_FIELDS,
+    "FeelingEmotion": DEFAULT_FULLTEXT_FIELDS,
+    "FeelingConcept": DEFAULT_FULLTEXT_FIELDS,
+    "Emotion": DEFAULT_FULLTEXT_FIELDS,
+    "Event": DEFAULT_FULLTEXT_FIELDS,
+    "Project": DEFAULT_FULLTEXT_FIELDS,
+    "Concept": DEFAULT_FULLTEXT_FIELDS,
+    "Content": DEFAULT_FULLTEXT_FIELDS,
+    "Consumable": DEFAULT_FULLTEXT_FIELDS,
+    "Place": DEFAULT_FULLTEXT_FIELDS,
+    "Quote": ["text"],
+    "Relation": ["summary_short", "summary"],
+}
+
+
+# Labels with a vector index over their `embedding` property
+VECTOR_INDEX_LABELS = [
+    # Entity indexes
+    "Person",
+    "Feeling",
+    "Emotion",
+    "Event",
+    "Project",
+    "Concept",
+    "Content",
+    "Consumable",
+    "Place",
+    # Document indexes
+    "Quote",
+    # Relation indexes
+    "Relation",
+]
+
+# Range indexes backing time tree MERGEs and Day lookups by uuid
+TEMPORAL_INDEXES = [
+    ("year_index", "Year", ["year"]),
+    ("month_index", "Month", ["year", "month"]),
+    ("day_index", "Day", ["year", "month", "day"]),
+    ("day_uuid_index", "Day", ["uuid"]),
+]
+
+# Minimum seconds between two plan captures for the same slow query name
+SLOW_QUERY_PROFILE_INTERVAL = 300
+
+# Indexes known to exist per (uri, database), filled from SHOW INDEXES once
+# per process so later connections skip the schema round-trips entirely
+_schema_cache: Dict[Tuple[str, Optional[str]], Dict[str, Dict[str, Any]]] = {}
+
+# EmotionType name -> Emotion node uuid per (uri, database), filled once per
+# process by init_emotion_types
+_emotion_types_cache: Dict[Tuple[str, Optional[str]], Dict[str, str]] = {}
+
+
+def fulltext_index_name(label: str) -> str:
+    """Name of the full-text index for a label."""
+    return f"{label.lower()}_fulltext_index"
+
+
+def vector_index_name(label: str) -> str:
+    """Name of the vector index for a label."""
+    return f"{label.lower()}_embeddings_index"
+
+
+_LABEL_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Single-label vector query; the index name is a parameter so the text
+# never changes and the server-side plan cache always hits
+VECTOR_SEARCH_QUERY = """
+CALL db.index.vector.queryNodes($index_name, $limit, $query_embedding)
+YIELD node, score
+WHERE score >= $threshold
+RETURN node, score
+ORDER BY score DESC
+"""
+
+
+def _query_embedding_parameter(dimensions: Optional[int]) -> str:
+    """Parameter holding the query vector truncated to `dimensions` (None: full)."""
+    return f"query_embedding_{dimensions}" if dimensions else "query_embedding"
+
+
+@lru_cache(maxsize=64)
+def _vector_search_many_query(
+    labels: Tuple[str, ...], dimensions: Tuple[Optional[int], ...] = ()
+) -> str:
+    """
+    Build (once per label tuple) a query that searches every label's vector
+    index inside a single CALL {} UNION ALL subquery.
+
+    `dimensions` gives, per label, the size its index was truncated to
+    (None or missing: full size); those branches read a truncated query vector.
+    """
+    for label in labels:
+        if not _LABEL_PATTERN.match(label):
+            raise ValueError(f"Invalid node label: {label!r}")
+
+    sizes = dimensions + (None,) * (len(labels) - len(dimensions))
+    branches = [
+        f"""
+        CALL db.index.vector.queryNodes('{vector_index_name(label)}', $k, ${_query_embedding_parameter(size)})
+        YIELD node, score
+        RETURN '{label}' AS label, node, score"""
+        for label, size in zip(labels, sizes)
+    ]
+    union = "\n        UNION ALL".join(branches)
+    return f"""
+    CALL {{{union}
+    }}
+    WITH label, node, score
+    WHERE score >= $threshold
+    RETURN label, node, score, elementId(node) AS element_id
+    ORDER BY score DESC
+    """
+
 
 class Neo4jConnection:
     """
@@ -36,6 +164,11 @@ class Neo4jConnection:
         max_pool_size: int = 50,
         max_connection_lifetime: int = 3600,
         database: str = None,
+        fulltext_analyzer: str = settings.FULLTEXT_ANALYZER,
+        query_metrics: bool = settings.NEO4J_QUERY_METRICS,
+        slow_query_ms: float = settings.NEO4J_SLOW_QUERY_MS,
+        profile_slow_queries: bool = settings.NEO4J_PROFILE_SLOW_QUERIES,
+        vector_dimensions: Optional[int] = None,
     ):
         """
         Initialize Neo4j connection.
@@ -46,6 +179,13 @@ class Neo4jConnection:
             password: Database password
             max_pool_size: Maximum number of connections in pool
             max_connection_lifetime: Max lifetime of connections in seconds
+            fulltext_analyzer: Lucene analyzer used by full-text indexes
+            query_metrics: Record per-query metrics for sessions
+            slow_query_ms: Queries slower than this are logged (0 disables)
+            profile_slow_queries: Also log the PROFILE (read queries) or
+                EXPLAIN (write queries) plan of slow queries
+            vector_dimensions: Size of vector indexes (defaults to the
+                configured embedding model's output size)
         """
         self.uri = uri
         self.user = user
@@ -53,6 +193,14 @@ class Neo4jConnection:
         self.max_pool_size = max_pool_size
         self.max_connection_lifetime = max_connection_lifetime
         self.database = database
+        self.fulltext_analyzer = fulltext_analyzer
+        self.query_metrics_enabled = query_metrics
+        self.slow_query_ms = slow_query_ms
+        self.profile_slow_queries = profile_slow_queries
+        self.vector_dimensions = vector_dimensions or settings.embedding_dimensions()
+        self.query_metrics = QueryMetrics()
+        self._last_profiled: Dict[str, float] = {}
+        self._profile_tasks: Set[asyncio.Task] = set()
 
         # Async driver
         self.async_driver: Optional[AsyncDriver] = None
@@ -78,11 +226,11 @@ class Neo4jConnection:
                     "Failed to establish healthy async connection to Neo4j"
                 )
 
-            # Set initialized flag BEFORE creating vector indexes to prevent recursion
+            # Set initialized flag BEFORE creating indexes to prevent recursion
             self._initialized = True
-            
-            # Initialize vector indexes
-            await self._ensure_vector_indexes()
+
+            # Create whichever vector, full-text and time tree indexes are missing
+            await self.ensure_indexes()
 
         except Exception as e:
             logger.error(f"Failed to initialize Neo4j async connection: {e}")
@@ -129,7 +277,16 @@ class Neo4jConnection:
             await self.initialize()
 
         async with self.async_driver.session() as session:
-            yield session
+            if not self.query_metrics_enabled:
+                yield session
+                return
+            instrumented = InstrumentedSession(
+                session, self.query_metrics, self._on_query_done
+            )
+            try:
+                yield instrumented
+            finally:
+                await instrumented.finish_open_results()
 
     async def execute_query(
         self, query: str, parameters: Dict[str, Any] = None
@@ -148,28 +305,100 @@ class Neo4jConnection:
         parameters = parameters or {}
 
         async with self.session_async() as session:
-            result = await session.run(query, parameters)
+            if isinstance(session, InstrumentedSession):
+                result = await session.run(
+                    query, parameters, query_name=caller_name()
+                )
+            else:
+                result = await session.run(query, parameters)
             return [record async for record in result]
 
-    async def init_emotion_types(self) -> Dict[str, str]:
+    async def init_emotion_types(self, refresh: bool = False) -> Dict[str, str]:
         """
         Insert all EmotionType values as nodes into the database (idempotent - async).
         Ensures each node has a uuid. Returns a mapping of EmotionType to uuid.
-        Requires APOC plugin for uuid generation.
+
+        All emotions are upserted with one UNWIND MERGE; the mapping is cached
+        per (uri, database) so later calls in the process skip the query.
+
+        Args:
+            refresh: Re-run the upsert instead of returning the cached mapping
         """
+        key = (self.uri, self.database)
+        if not refresh and _emotion_types_cache.get(key):
+            return _emotion_types_cache[key]
+
         query = """
-        MERGE (e:Emotion {name: $name})
+        UNWIND $names AS name
+        MERGE (e:Emotion {name: name})
         ON CREATE SET e.uuid = randomUUID()
         RETURN e.name AS name, e.uuid AS uuid
         """
-        result: Dict[str, str] = {}
+        names = [emotion.value for emotion in EmotionType]
         async with self.session_async() as session:
-            for emotion in EmotionType:
-                result_query = await session.run(query, {"name": emotion})
-                record = await result_query.single()
-                if record:
-                    result[emotion] = str(record["uuid"])
-        return result
+            result = await session.run(query, {"names": names})
+            records = [record async for record in result]
+
+        mapping = _emotion_types_cache.setdefault(key, {})
+        mapping.clear()
+        mapping.update({record["name"]: str(record["uuid"]) for record in records})
+        return mapping
+
+    @property
+    def emotion_types(self) -> Dict[str, str]:
+        """
+        Cached EmotionType -> uuid mapping, filled by init_emotion_types.
+        The same dict object is returned before and after it is filled.
+        """
+        return _emotion_types_cache.setdefault((self.uri, self.database), {})
+
+    def _on_query_done(
+        self,
+        name: str,
+        query: str,
+        parameters: Dict[str, Any],
+        duration_ms: float,
+        summary: Any,
+    ) -> None:
+        """Log slow queries and schedule a plan capture for them."""
+        if not self.slow_query_ms or duration_ms < self.slow_query_ms:
+            return
+        logger.warning(f"Slow query {name}: {duration_ms:.0f} ms")
+        if not self.profile_slow_queries:
+            return
+
+        # One plan per query name every SLOW_QUERY_PROFILE_INTERVAL seconds
+        now = time.monotonic()
+        last = self._last_profiled.get(name)
+        if last is not None and now - last < SLOW_QUERY_PROFILE_INTERVAL:
+            return
+        self._last_profiled[name] = now
+
+        # PROFILE re-executes the query, so writes only get an EXPLAIN plan
+        counters = getattr(summary, "counters", None)
+        profile = getattr(counters, "contains_updates", True) is False
+        task = asyncio.create_task(
+            self._log_query_plan(name, query, parameters, profile)
+        )
+        self._profile_tasks.add(task)
+        task.add_done_callback(self._profile_tasks.discard)
+
+    async def _log_query_plan(
+        self, name: str, query: str, parameters: Dict[str, Any], profile: bool
+    ) -> None:
+        """Run a query under PROFILE/EXPLAIN and log its plan."""
+        mode = "PROFILE" if profile else "EXPLAIN"
+        try:
+            # Uninstrumented session so the plan run is not itself recorded
+            async with self.async_driver.session() as session:
+                result = await session.run(f"{mode} {query}", parameters)
+                summary = await result.consume()
+            plan = summary.profile if profile else summary.plan
+            logger.warning(
+                f"{mode} plan for slow query {name}:\n{format_plan(plan)}"
+            )
+        except Exception as e:
+            logger.debug(f"Could not capture {mode} plan for {name}: {e}")
 
     async def close_async(self):
         """Close the async database connection and cleanup resources."""
@@ -183,55 +412,288 @@ class Neo4jConnection:
         """Close async connection."""
         await self.close_async()
 
-    async def _ensure_vector_indexes(self):
-        """
-        Create vector indexes for all entity types and relations (async).
-        This method should be called during async initialization.
-        """
-        vector_indexes = [
-            # Entity indexes
-            ("Person", "person_embeddings_index"),
-            ("Feeling", "feeling_embeddings_index"),
-            ("Emotion", "emotion_embeddings_index"),
-            ("Event", "event_embeddings_index"),
-            ("Project", "project_embeddings_index"),
-            ("Concept", "concept_embeddings_index"),
-            ("Content", "content_embeddings_index"),
-            ("Consumable", "consumable_embeddings_index"),
-            ("Place", "place_embeddings_index"),
-            # Document indexes
-            ("Quote", "quote_embeddings_index"),
-            # Relation indexes
-            ("Relation", "relation_embeddings_index"),
-        ]
-
-        for label, index_name in vector_indexes:
-            try:
-                await self._create_vector_index(label, index_name)
-            except Exception as e:
-                logger.warning(f"Failed to create vector index {index_name}: {e}")
+    async def ensure_indexes(self, refresh: bool = False) -> List[str]:
+        """
+        Create the vector, full-text and time tree indexes that do not exist yet.
+
+        Existing indexes are read once with SHOW INDEXES and cached for the
+        process; DDL only runs for indexes missing from that cache, all in
+        one session.
+
+        Args:
+            refresh: Re-read SHOW INDEXES instead of trusting the cache
+
+        Returns:
+            Names of the indexes created
+        """
+        key = (self.uri, self.database)
+        existing = None if refresh else _schema_cache.get(key)
+        wanted = self._index_definitions()
+        if existing is not None and wanted.keys() <= existing.keys():
+            return []
+
+        created: List[str] = []
+        async with self.session_async() as session:
+            if existing is None:
+                existing = await self._show_indexes(session)
+                self._check_vector_dimensions(existing)
+            for name, query in wanted.items():
+                if name in existing:
+                    continue
+                try:
+                    result = await session.run(query)
+                    await result.consume()
+                except Exception as e:
+                    logger.warning(f"Failed to create index {name}: {e}")
+                    continue
+                existing[name] = {}
+                created.append(name)
+
+        _schema_cache[key] = existing
+        if created:
+            logger.info(f"Created Neo4j indexes: {', '.join(created)}")
+        return created
+
+    @staticmethod
+    async def _show_indexes(session) -> Dict[str, Dict[str, Any]]:
+        """Existing indexes by name, with their vector size if any."""
+        result = await session.run(
+            "SHOW INDEXES YIELD name, type, labelsOrTypes, properties, options"
+        )
+        indexes: Dict[str, Dict[str, Any]] = {}
+        async for record in result:
+            index_config = (record["options"] or {}).get("indexConfig") or {}
+            indexes[record["name"]] = {
+                "type": record["type"],
+                "labels": record["labelsOrTypes"],
+                "properties": record["properties"],
+                "dimensions": index_config.get("vector.dimensions"),
+            }
+        return indexes
+
+    def _check_vector_dimensions(self, existing: Dict[str, Dict[str, Any]]) -> None:
+        """Warn about vector indexes sized differently from their label's storage."""
+        for label in VECTOR_INDEX_LABELS:
+            dimensions = existing.get(vector_index_name(label), {}).get("dimensions")
+            expected = self.vector_dimensions_for(label)
+            if dimensions and int(dimensions) != expected:
+                logger.warning(
+                    f"Vector index {vector_index_name(label)} has {dimensions} "
+                    f"dimensions but {label} embeddings have {expected}; run "
+                    f"scripts/migrate_embeddings.py to rebuild it"
+                )
 
-    async def _create_vector_index(self, label: str, index_name: str):
+    async def migrate_embedding_storage(
+        self, label: str, batch_size: int = 500
+    ) -> Dict[str, int]:
         """
-        Create a vector index for a specific label (async).
+        Rewrite a label's stored embeddings in its configured storage format.
+
+        Longer embeddings are truncated (Matryoshka prefixes need no
+        re-embedding); shorter ones cannot be widened and are skipped.
+
+        The rewrite runs in three steps:
+        1. Reduced vectors are staged in `embedding_staged`; `embedding` and
+           the vector index are untouched.
+        2. Each staged vector is swapped into `embedding`, and the previous
+           value is kept in `embedding_full`.
+        3. A vector index of the wrong size is dropped and recreated.
+
+        Vector search on the label is partial from the start of the swap
+        until the new index is populated: swapped nodes no longer fit the
+        old index, and the new one is built after the swap.
+
+        `embedding_full` keeps the longest vector a node has had, so a later
+        migration to a larger size (or back to the model size) reads it
+        instead of the truncated `embedding`. It keeps the full-size storage
+        cost until removed with remove_full_embeddings.
+
+        Args:
+            label: Neo4j node label with a vector index
+            batch_size: Nodes rewritten per query
+
+        Returns:
+            Number of rewritten and skipped nodes
+        """
+        if not _LABEL_PATTERN.match(label):
+            raise ValueError(f"Invalid node label: {label!r}")
+        storage = embedding_storage(label)
+        dimensions = self.vector_dimensions_for(label)
+        index_name = vector_index_name(label)
+
+        # Nodes are matched by the element id read here, a direct lookup
+        read_query = f"""
+        MATCH (n:{label})
+        WHERE n.embedding IS NOT NULL
+        RETURN elementId(n) AS element_id, n.embedding AS embedding,
+               n.embedding_full AS embedding_full
+        """
+        stage_query = """
+        UNWIND $rows AS row
+        MATCH (n) WHERE elementId(n) = row.element_id
+        SET n.embedding_staged = row.embedding
+        """
+        swap_query = f"""
+        UNWIND $element_ids AS element_id
+        MATCH (n) WHERE elementId(n) = element_id AND n.embedding_staged IS NOT NULL
+        SET n.embedding_full = CASE
+                WHEN size(n.embedding) >= size(coalesce(n.embedding_full, []))
+                THEN n.embedding ELSE n.embedding_full
+            END,
+            n.embedding = n.embedding_staged
+        REMOVE n.embedding_staged
+        {storage.store_clause("n")}
+        """
+
+        counts = {"rewritten": 0, "skipped": 0}
+        staged: List[str] = []
+
+        async def stage(session, rows: List[Dict[str, Any]]) -> None:
+            result = await session.run(stage_query, {"rows": rows})
+            await result.consume()
+            staged.extend(row["element_id"] for row in rows)
+
+        async with self.session_async() as read_session:
+            async with self.session_async() as write_session:
+                result = await read_session.run(read_query)
+                rows = []
+                async for record in result:
+                    # Truncate from the full vector when the stored one is too short
+                    source = record["embedding"]
+                    if len(source) < dimensions and record["embedding_full"]:
+                        source = record["embedding_full"]
+                    if len(source) < dimensions:
+                        counts["skipped"] += 1
+                        continue
+                    rows.append(
+                        {
+                            "element_id": record["element_id"],
+                            "embedding": storage.reduce(source),
+                        }
+                    )
+                    if len(rows) >= batch_size:
+                        await stage(write_session, rows)
+                        rows = []
+                if rows:
+                    await stage(write_session, rows)
+
+        for start in range(0, len(staged), batch_size):
+            element_ids = staged[start : start + batch_size]
+            async with self.session_async() as session:
+                result = await session.run(swap_query, {"element_ids": element_ids})
+                await result.consume()
+            counts["rewritten"] += len(element_ids)
+
+        async with self.session_async() as session:
+            existing = await self._show_indexes(session)
+            indexed = existing.get(index_name, {}).get("dimensions")
+            if indexed and int(indexed) != dimensions:
+                result = await session.run(f"DROP INDEX {index_name} IF EXISTS")
+                await result.consume()
+                logger.info(f"Dropped {index_name} ({indexed} dimensions)")
+        await self.ensure_indexes(refresh=True)
+        return counts
+
+    async def remove_full_embeddings(self, label: str, batch_size: int = 500) -> int:
+        """
+        Remove the `embedding_full` backups left by migrate_embedding_storage.
+
+        Run once recall of the reduced vectors has been validated: the
+        migration can no longer be reverted and the storage benchmark falls
+        back to the stored (reduced) vectors.
+
+        Args:
+            label: Neo4j node label with a vector index
+            batch_size: Nodes updated per query
+
+        Returns:
+            Number of nodes whose backup was removed
+        """
+        if not _LABEL_PATTERN.match(label):
+            raise ValueError(f"Invalid node label: {label!r}")
+        read_query = f"""
+        MATCH (n:{label})
+        WHERE n.embedding_full IS NOT NULL
+        RETURN elementId(n) AS element_id
+        """
+        remove_query = """
+        UNWIND $element_ids AS element_id
+        MATCH (n) WHERE elementId(n) = element_id
+        REMOVE n.embedding_full
+        """
+        async with self.session_async() as session:
+            result = await session.run(read_query)
+            element_ids = [record["element_id"] async for record in result]
+
+        for start in range(0, len(element_ids), batch_size):
+            async with self.session_async() as session:
+                result = await session.run(
+                    remove_query,
+                    {"element_ids": element_ids[start : start + batch_size]},
+                )
+                await result.consume()
+        return len(element_ids)
+
+    def vector_dimensions_for(self, label: str) -> int:
+        """Size of a label's stored embeddings (and of its vector index)."""
+        dimensions = embedding_storage(label).dimensions
+        if dimensions and dimensions < self.vector_dimensions:
+            return dimensions
+        return self.vector_dimensions
+
+    def _index_definitions(self) -> Dict[str, str]:
+        """DDL for every index the graph needs, by index name."""
+        definitions: Dict[str, str] = {}
+        for label in VECTOR_INDEX_LABELS:
+            definitions[vector_index_name(label)] = self._vector_index_query(label)
+        for label, fields in FULLTEXT_INDEXES.items():
+            definitions[fulltext_index_name(label)] = self._fulltext_index_query(
+                label, fields
+            )
+        for index_name, label, fields in TEMPORAL_INDEXES:
+            properties = ", ".join(f"n.{field}" for field in fields)
+            definitions[index_name] = f"""
+            CREATE INDEX {index_name} IF NOT EXISTS
+            FOR (n:{label}) ON ({properties})
+            """
+        return definitions
+
+    def _vector_index_query(self, label: str) -> str:
+        """
+        DDL for the vector index of a label.
 
         Args:
             label: Neo4j node label
-            index_name: Name of the vector index
         """
-        query = f"""
-        CREATE VECTOR INDEX {index_name} IF NOT EXISTS
+        return f"""
+        CREATE VECTOR INDEX {vector_index_name(label)} IF NOT EXISTS
         FOR (n:{label}) ON (n.embedding)
         OPTIONS {{
             indexConfig: {{
-                `vector.dimensions`: 1024,
+                `vector.dimensions`: {self.vector_dimensions_for(label)},
                 `vector.similarity_function`: 'cosine'
             }}
         }}
         """
 
-        async with self.session_async() as session:
-            await session.run(query)
+    def _fulltext_index_query(self, label: str, fields: List[str]) -> str:
+        """
+        DDL for the full-text index of a label.
+
+        Args:
+            label: Neo4j node label
+            fields: Node properties to index
+        """
+        properties = ", ".join(f"n.{field}" for field in fields)
+        return f"""
+        CREATE FULLTEXT INDEX {fulltext_index_name(label)} IF NOT EXISTS
+        FOR (n:{label}) ON EACH [{properties}]
+        OPTIONS {{
+            indexConfig: {{
+                `fulltext.analyzer`: '{self.fulltext_analyzer}'
+            }}
+        }}
+        """
 
     async def vector_search(
         self,
@@ -252,21 +714,100 @@ class Neo4jConnection:
         Returns:
             List of matching nodes with similarity scores
         """
-        query = f"""
-        CALL db.index.vector.queryNodes('{label.lower()}_embeddings_index', $limit, $query_embedding)
+        async with self.session_async() as session:
+            result = await session.run(
+                VECTOR_SEARCH_QUERY,
+                {
+                    "index_name": vector_index_name(label),
+                    "query_embedding": reduce_embedding(
+                        query_embedding, self.vector_dimensions_for(label)
+                    ),
+                    "limit": limit,
+                    "threshold": threshold,
+                },
+            )
+            return [record async for record in result]
+
+    async def vector_search_many(
+        self,
+        labels: Sequence[str],
+        query_embedding: list[float],
+        k: int = 10,
+        threshold: float = 0.0,
+    ) -> list:
+        """
+        Perform vector similarity search over several labels in one round-trip.
+
+        All index queries run inside a single CALL {} UNION ALL, so one
+        session and one transaction serve every label.
+
+        Args:
+            labels: Neo4j node labels to search
+            query_embedding: Query vector for similarity search
+            k: Maximum number of results per label
+            threshold: Minimum similarity threshold (0.0-1.0)
+
+        Returns:
+            List of records with label, node, score and element_id, best first
+        """
+        if not labels:
+            return []
+
+        labels = tuple(dict.fromkeys(labels))
+        parameters = {"query_embedding": query_embedding, "k": k, "threshold": threshold}
+
+        # Labels stored with truncated embeddings read a truncated query vector
+        sizes = []
+        for label in labels:
+            size = self.vector_dimensions_for(label)
+            if size == self.vector_dimensions:
+                sizes.append(None)
+                continue
+            sizes.append(size)
+            parameters[_query_embedding_parameter(size)] = reduce_embedding(
+                query_embedding, size
+            )
+        if any(sizes):
+            query = _vector_search_many_query(labels, tuple(sizes))
+        else:
+            query = _vector_search_many_query(labels)
+
+        async with self.session_async() as session:
+            result = await session.run(query, parameters)
+            return [record async for record in result]
+
+    async def fulltext_search(
+        self,
+        label: str,
+        query_text: str,
+        limit: int = 10,
+    ) -> list:
+        """
+        Perform ranked full-text search on a specific label (async).
+
+        Args:
+            label: Neo4j node label to search
+            query_text: Escaped Lucene query string
+            limit: Maximum number of results
+
+        Returns:
+            List of matching nodes with relevance scores and element ids
+        """
+        query = """
+        CALL db.index.fulltext.queryNodes($index_name, $query_text)
         YIELD node, score
-        WHERE score >= $threshold
-        RETURN node, score
+        RETURN node, score, elementId(node) AS element_id
         ORDER BY score DESC
+        LIMIT $limit
         """
 
         async with self.session_async() as session:
             result = await session.run(
                 query,
                 {
-                    "query_embedding": query_embedding,
+                    "index_name": fulltext_index_name(label),
+                    "query_text": query_text,
                     "limit": limit,
-                    "threshold": threshold,
                 },
             )
             return [record async for record in result]
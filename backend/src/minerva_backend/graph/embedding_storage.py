@@ -0,0 +1,85 @@
+"""
+Embedding Storage for Minerva
+Per-label storage format of node embeddings.
+
+Two reductions can be configured for each label:
+- dimensions (MINERVA_EMBEDDING_LABEL_DIMENSIONS): Matryoshka truncation,
+  keeping the first N components of the model output and re-normalizing.
+  mxbai-embed-large is trained so that prefixes remain useful embeddings.
+- precision (MINERVA_EMBEDDING_LABEL_PRECISION): "float32" stores the list
+  through db.create.setNodeVectorProperty as a float32 array instead of the
+  float64 list Cypher writes by default. The vector index reads it directly.
+
+Labels not listed keep full-size float64 lists. Query vectors are truncated
+the same way before they reach a reduced index.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from minerva_backend.config import settings
+
+PRECISIONS = ("float64", "float32")
+
+
+def reduce_embedding(
+    embedding: Sequence[float], dimensions: Optional[int]
+) -> List[float]:
+    """
+    Truncate an embedding to its first `dimensions` components and
+    re-normalize it to unit length. Shorter embeddings are returned as is.
+    """
+    if not dimensions or len(embedding) <= dimensions:
+        return list(embedding)
+    truncated = list(embedding[:dimensions])
+    norm = math.sqrt(sum(x * x for x in truncated))
+    if norm == 0:
+        return truncated
+    return [x / norm for x in truncated]
+
+
+@dataclass(frozen=True)
+class EmbeddingStorage:
+    """How one label stores its `embedding` property."""
+
+    dimensions: Optional[int] = None
+    precision: str = "float64"
+
+    @property
+    def float32(self) -> bool:
+        return self.precision == "float32"
+
+    def reduce(self, embedding: Optional[Sequence[float]]) -> Optional[List[float]]:
+        """Apply the label's truncation to a model embedding."""
+        if not embedding or not self.dimensions:
+            return embedding
+        return reduce_embedding(embedding, self.dimensions)
+
+    def store_clause(self, variable: str) -> str:
+        """
+        Cypher run after `variable.embedding` has been SET, rewriting it as a
+        float32 vector property when the label asks for it.
+        """
+        if not self.float32:
+            return ""
+        return f"""
+        CALL {{
+            WITH {variable}
+            WITH {variable} WHERE {variable}.embedding IS NOT NULL
+            CALL db.create.setNodeVectorProperty({variable}, 'embedding', {variable}.embedding)
+        }}"""
+
+
+def embedding_storage(label: str) -> EmbeddingStorage:
+    """Configured storage for a label."""
+    precision = settings.EMBEDDING_LABEL_PRECISION.get(label, "float64")
+    if precision not in PRECISIONS:
+        raise ValueError(
+            f"Unknown embedding precision {precision!r} for {label}; "
+            f"expected one of {PRECISIONS}"
+        )
+    return EmbeddingStorage(
+        dimensions=settings.EMBEDDING_LABEL_DIMENSIONS.get(label),
+        precision=precision,
+    )
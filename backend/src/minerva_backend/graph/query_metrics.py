@@ -0,0 +1,320 @@
+"""
+Query Instrumentation for Minerva
+Records latency histograms, returned rows, result consumption time and
+database counters for every Cypher query run through Neo4jConnection
+sessions, keyed by query name.
+
+The query name defaults to the calling function (e.g.
+"temporal_repository.TemporalRepository.link_nodes_to_day_batch"), so
+repositories are instrumented without changes.
+"""
+
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Update counters reported by the database in the result summary
+SUMMARY_COUNTERS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "labels_added",
+    "labels_removed",
+    "indexes_added",
+    "indexes_removed",
+    "constraints_added",
+    "constraints_removed",
+)
+
+
+@dataclass
+class QueryStats:
+    """Aggregated measurements for one query name."""
+
+    name: str
+    count: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    consume_ms: float = 0.0
+    server_ms: float = 0.0
+    buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    def add(
+        self,
+        duration_ms: float,
+        rows: int = 0,
+        consume_ms: float = 0.0,
+        summary: Any = None,
+        failed: bool = False,
+    ) -> None:
+        self.count += 1
+        self.errors += int(failed)
+        self.rows += rows
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.consume_ms += consume_ms
+        self.buckets[_bucket_index(duration_ms)] += 1
+        if summary is not None:
+            self._add_summary(summary)
+
+    def _add_summary(self, summary: Any) -> None:
+        for attr in ("result_available_after", "result_consumed_after"):
+            value = getattr(summary, attr, None)
+            if isinstance(value, (int, float)):
+                self.server_ms += value
+        counters = getattr(summary, "counters", None)
+        for name in SUMMARY_COUNTERS:
+            value = getattr(counters, name, 0)
+            if isinstance(value, int) and value:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the metrics endpoint."""
+        histogram = {
+            f"le_{bound}": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)
+        }
+        histogram["le_inf"] = self.buckets[-1]
+        return {
+            "name": self.name,
+            "count": self.count,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "consume_ms": round(self.consume_ms, 3),
+            "server_ms": round(self.server_ms, 3),
+            "histogram_ms": histogram,
+            "counters": dict(self.counters),
+        }
+
+
+def _bucket_index(duration_ms: float) -> int:
+    for i, bound in enumerate(LATENCY_BUCKETS_MS):
+        if duration_ms <= bound:
+            return i
+    return len(LATENCY_BUCKETS_MS)
+
+
+class QueryMetrics:
+    """Registry of QueryStats, one per query name."""
+
+    def __init__(self):
+        self._stats: Dict[str, QueryStats] = {}
+
+    def record(
+        self,
+        name: str,
+        duration_ms: float,
+        rows: int = 0,
+        consume_ms: float = 0.0,
+        summary: Any = None,
+        failed: bool = False,
+    ) -> QueryStats:
+        """Add one query execution to the stats for its name."""
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = QueryStats(name)
+        stats.add(duration_ms, rows, consume_ms, summary, failed)
+        return stats
+
+    def get(self, name: str) -> Optional[QueryStats]:
+        return self._stats.get(name)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """All query stats, most expensive (total time) first."""
+        return [
+            stats.to_dict()
+            for stats in sorted(
+                self._stats.values(), key=lambda s: s.total_ms, reverse=True
+            )
+        ]
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+def caller_name(depth: int = 1) -> str:
+    """Name of the function `depth` frames above the caller, for query names."""
+    frame = sys._getframe(depth + 1)
+    module = frame.f_globals.get("__name__", "?").rsplit(".", 1)[-1]
+    return f"{module}.{frame.f_code.co_qualname}"
+
+
+# Called once per query with (name, query, parameters, duration_ms, summary)
+QueryDoneHook = Callable[[str, str, Dict[str, Any], float, Any], None]
+
+
+class InstrumentedResult:
+    """
+    Wraps a driver result, counting rows as they are read and recording the
+    query once the result is exhausted, consumed or its session closes.
+    """
+
+    def __init__(self, result: Any, on_done: Callable[[int, Any], None]):
+        self._result = result
+        self._on_done = on_done
+        self._iterator = None
+        self.rows = 0
+        self.done = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._result, name)
+
+    def __aiter__(self) -> "InstrumentedResult":
+        self._iterator = self._result.__aiter__()
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            record = await self._iterator.__anext__()
+        except StopAsyncIteration:
+            await self.finish()
+            raise
+        self.rows += 1
+        return record
+
+    async def single(self, *args, **kwargs) -> Any:
+        record = await self._result.single(*args, **kwargs)
+        self.rows += int(record is not None)
+        await self.finish()
+        return record
+
+    async def data(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        records = await self._result.data(*args, **kwargs)
+        self.rows += len(records)
+        await self.finish()
+        return records
+
+    async def values(self, *args, **kwargs) -> List[List[Any]]:
+        records = await self._result.values(*args, **kwargs)
+        self.rows += len(records)
+        await self.finish()
+        return records
+
+    async def value(self, *args, **kwargs) -> List[Any]:
+        records = await self._result.value(*args, **kwargs)
+        self.rows += len(records)
+        await self.finish()
+        return records
+
+    async def fetch(self, n: int) -> List[Any]:
+        records = await self._result.fetch(n)
+        self.rows += len(records)
+        return records
+
+    async def consume(self) -> Any:
+        summary = await self._result.consume()
+        await self.finish(summary)
+        return summary
+
+    async def finish(self, summary: Any = None) -> None:
+        """Record the query (at most once), fetching the summary if needed."""
+        if self.done:
+            return
+        self.done = True
+        if summary is None:
+            try:
+                summary = await self._result.consume()
+            except Exception:
+                summary = None
+        self._on_done(self.rows, summary)
+
+
+class InstrumentedSession:
+    """Session proxy whose run() records every query in a QueryMetrics."""
+
+    def __init__(
+        self,
+        session: Any,
+        metrics: QueryMetrics,
+        on_query_done: Optional[QueryDoneHook] = None,
+    ):
+        self._session = session
+        self._metrics = metrics
+        self._on_query_done = on_query_done
+        self._open_results: List[InstrumentedResult] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    async def run(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        *,
+        query_name: Optional[str] = None,
+        **kwargs,
+    ) -> InstrumentedResult:
+        """
+        Run a query like AsyncSession.run.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            query_name: Name to record the query under (defaults to the caller)
+            **kwargs: Extra query parameters
+        """
+        name = query_name or caller_name()
+        start = time.perf_counter()
+        try:
+            result = await self._session.run(query, parameters, **kwargs)
+        except Exception:
+            self._metrics.record(name, _elapsed_ms(start), failed=True)
+            raise
+        ready = time.perf_counter()
+
+        def on_done(rows: int, summary: Any) -> None:
+            duration_ms = _elapsed_ms(start)
+            self._metrics.record(
+                name, duration_ms, rows, _elapsed_ms(ready), summary
+            )
+            if self._on_query_done:
+                self._on_query_done(
+                    name, query, {**(parameters or {}), **kwargs}, duration_ms, summary
+                )
+
+        instrumented = InstrumentedResult(result, on_done)
+        self._open_results.append(instrumented)
+        return instrumented
+
+    async def finish_open_results(self) -> None:
+        """Record results the caller never exhausted, before the session closes."""
+        for result in self._open_results:
+            await result.finish()
+        self._open_results.clear()
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def format_plan(plan: Optional[Dict[str, Any]], depth: int = 0) -> str:
+    """Render a PROFILE/EXPLAIN plan dict from a result summary as a tree."""
+    if not plan:
+        return ""
+    operator = plan.get("operatorType", "?")
+    details = (plan.get("args") or {}).get("Details")
+    stats = []
+    for key in ("rows", "dbHits"):
+        if key in plan:
+            stats.append(f"{key}={plan[key]}")
+    line = "  " * depth + " ".join([operator, *stats])
+    if details:
+        line += f"  [{details}]"
+    lines = [line]
+    for child in plan.get("children") or []:
+        lines.append(format_plan(child, depth + 1))
+    return "\n".join(lines)
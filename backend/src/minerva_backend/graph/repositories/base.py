@@ -4,14 +4,25 @@ Provides common functionality for all node repositories.
 """
 
 import logging
+import re
+import types
+import typing
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 
 import neo4j
 
-from minerva_backend.graph.db import Neo4jConnection
+from minerva_backend.graph.db import (
+    DEFAULT_FULLTEXT_FIELDS,
+    FULLTEXT_INDEXES,
+    Neo4jConnection,
+    fulltext_index_name,
+)
+from minerva_backend.graph.embedding_storage import embedding_storage
 from minerva_models import Node
+from minerva_models.utils import duration_validator
 from minerva_backend.processing.llm_service import LLMService
 
 logger = logging.getLogger(__name__)
@@ -19,6 +30,164 @@ logger = logging.getLogger(__name__)
 # Generic type for nodes
 T = TypeVar("T", bound=Node)
 
+# Lucene query syntax characters that must be escaped in user search terms
+_LUCENE_SPECIAL_CHARS = re.compile(r'([+\-!(){}\[\]^"~*?:\\/]|&&|\|\|)')
+# Words Lucene reads as boolean operators; the index analyzer lowercases
+# terms, so lowercasing them makes them plain words
+_LUCENE_OPERATORS = re.compile(r"\b(AND|OR|NOT)\b")
+
+# Per-model-class cache of {field_name: converter} built from field annotations
+_FIELD_CONVERTERS: Dict[type, Dict[str, Callable[[Any], Any]]] = {}
+# Per-model-class cache of {field_name: converter} for enum-typed fields, used
+# by trusted reads in place of Pydantic's enum coercion
+_ENUM_CONVERTERS: Dict[type, Dict[str, Callable[[Any], Any]]] = {}
+
+
+def _to_datetime(value: Any) -> Any:
+    """Convert an ISO string or Neo4j temporal value to ``datetime``."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            # If parsing fails, keep as string
+            return value
+    if isinstance(value, (neo4j.time.DateTime, neo4j.time.Date)):
+        return value.to_native()
+    return value
+
+
+def _to_date(value: Any) -> Any:
+    """Convert an ISO string or Neo4j temporal value to ``date``."""
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return value
+    if isinstance(value, neo4j.time.DateTime):
+        return value.to_native().date()
+    if isinstance(value, neo4j.time.Date):
+        return value.to_native()
+    return value
+
+
+def _unwrap_annotation(annotation: Any) -> tuple:
+    """Return the concrete types of an annotation, unwrapping Optional/Union."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        return tuple(
+            arg for arg in typing.get_args(annotation) if arg is not type(None)
+        )
+    return (annotation,)
+
+
+def _enum_converter(field_type: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Build a converter that coerces a value to an enum field's stored value.
+
+    Mirrors ``use_enum_values``: enum members become their ``.value`` and
+    values outside the enum (or outside a ``Literal`` of members, such as a
+    node's ``partition``) raise ``ValueError``.
+    """
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        enum_class = field_type
+
+        def convert_enum(value: Any) -> Any:
+            return enum_class(value).value
+
+        return convert_enum
+
+    if typing.get_origin(field_type) is typing.Literal:
+        members = typing.get_args(field_type)
+        if not all(isinstance(member, Enum) for member in members):
+            return None
+        allowed = {member.value for member in members}
+
+        def convert_literal(value: Any) -> Any:
+            if isinstance(value, Enum):
+                value = value.value
+            if value not in allowed:
+                raise ValueError(f"{value!r} is not one of {sorted(allowed)}")
+            return value
+
+        return convert_literal
+
+    return None
+
+
+def to_fulltext_query(search_term: str) -> str:
+    """
+    Escape a free-text search term for ``db.index.fulltext.queryNodes``.
+
+    Args:
+        search_term: Raw user search text
+
+    Returns:
+        Lucene query string matching any of the terms
+    """
+    escaped = _LUCENE_SPECIAL_CHARS.sub(r"\\\1", search_term.strip())
+    return _LUCENE_OPERATORS.sub(lambda match: match.group(1).lower(), escaped)
+
+
+def get_field_converters(model_class: type) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Get precomputed property converters for a Pydantic node class.
+
+    Converters are derived once per class from the model field annotations, so
+    hydration only touches temporal fields instead of every property.
+
+    Args:
+        model_class: Pydantic model class
+
+    Returns:
+        Dict mapping field name to a converter callable
+    """
+    converters = _FIELD_CONVERTERS.get(model_class)
+    if converters is not None:
+        return converters
+
+    converters = {}
+    for name, field in model_class.model_fields.items():
+        field_types = _unwrap_annotation(field.annotation)
+        # datetime is a subclass of date, so check it first
+        if datetime in field_types:
+            converters[name] = _to_datetime
+        elif date in field_types:
+            converters[name] = _to_date
+        elif timedelta in field_types:
+            converters[name] = duration_validator
+
+    _FIELD_CONVERTERS[model_class] = converters
+    return converters
+
+
+def get_enum_converters(model_class: type) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Get precomputed enum converters for a Pydantic node class.
+
+    ``model_construct`` skips validation, so trusted reads run these instead to
+    keep enum fields (``type``, ``partition``, ...) coerced and checked.
+
+    Args:
+        model_class: Pydantic model class
+
+    Returns:
+        Dict mapping field name to a converter callable
+    """
+    converters = _ENUM_CONVERTERS.get(model_class)
+    if converters is not None:
+        return converters
+
+    converters = {}
+    for name, field in model_class.model_fields.items():
+        for field_type in _unwrap_annotation(field.annotation):
+            convert = _enum_converter(field_type)
+            if convert is not None:
+                converters[name] = convert
+                break
+
+    _ENUM_CONVERTERS[model_class] = converters
+    return converters
+
 
 class BaseRepository(Generic[T], ABC):
     """
@@ -26,6 +195,11 @@ class BaseRepository(Generic[T], ABC):
     All node repositories should inherit from this class.
     """
 
+    # When True, nodes read from the database skip Pydantic validation
+    # (model_construct); only enum fields are still coerced and checked.
+    # Only enable for labels written exclusively by Minerva.
+    trusted_reads: bool = False
+
     def __init__(self, connection: Neo4jConnection, llm_service: LLMService):
         """Initialize repository with database connection and LLM service."""
         self.connection = connection
@@ -63,35 +237,34 @@ class BaseRepository(Generic[T], ABC):
 
         return properties
 
-    def _properties_to_node(self, properties: Dict[str, Any]) -> T:
+    def _properties_to_node(
+        self, properties: Dict[str, Any], trusted: Optional[bool] = None
+    ) -> T:
         """
         Convert Neo4j properties back to Pydantic node.
 
         Args:
             properties: Dictionary from Neo4j node
+            trusted: Skip validation and use ``model_construct``. Defaults to
+                the repository's ``trusted_reads`` setting.
 
         Returns:
             Pydantic node instance
         """
-        # Convert ISO datetime strings back to datetime objects
-        for key, value in properties.items():
-            if (
-                isinstance(value, str)
-                and "T" in value
-                and key.endswith(("_at", "timestamp", "date"))
-            ):
-                try:
-                    properties[key] = datetime.fromisoformat(
-                        value.replace("Z", "+00:00")
-                    )
-                except ValueError:
-                    # If parsing fails, keep as string
-                    pass
-            elif isinstance(value, neo4j.time.Date):
-                properties[key] = value.to_native()  # gives datetime.date
-            elif isinstance(value, neo4j.time.DateTime):
-                properties[key] = value.to_native()  # gives datetime.datetime
-
+        # Convert ISO strings and Neo4j temporal types on known fields only
+        for key, convert in get_field_converters(self.entity_class).items():
+            value = properties.get(key)
+            if value is not None:
+                properties[key] = convert(value)
+
+        if trusted is None:
+            trusted = self.trusted_reads
+        if trusted:
+            for key, convert in get_enum_converters(self.entity_class).items():
+                value = properties.get(key)
+                if value is not None:
+                    properties[key] = convert(value)
+            return self.entity_class.model_construct(**properties)
         return self.entity_class(**properties)
 
     async def create(self, node: T) -> str:
@@ -113,6 +286,7 @@ class BaseRepository(Generic[T], ABC):
 
         query = f"""
         CREATE (e:{self.entity_label} $properties)
+        {embedding_storage(self.entity_label).store_clause("e")}
         RETURN e.uuid as uuid
         """
 
@@ -208,9 +382,13 @@ class BaseRepository(Generic[T], ABC):
             except Exception as e:
                 logger.warning(f"Failed to regenerate embedding for {uuid}: {e}")
 
+        store_embedding = ""
+        if "embedding" in updates:
+            store_embedding = embedding_storage(self.entity_label).store_clause("e")
         query = f"""
         MATCH (e:{self.entity_label} {{uuid: $uuid}})
         SET e += $updates
+        {store_embedding}
         RETURN e.uuid as uuid
         """
 
@@ -271,27 +449,82 @@ class BaseRepository(Generic[T], ABC):
             record = await result.single()
             return record["count"] if record else 0
 
+    @property
+    def fulltext_index(self) -> str:
+        """Name of the Neo4j full-text index for this label."""
+        return fulltext_index_name(self.entity_label)
+
+    @property
+    def fulltext_fields(self) -> List[str]:
+        """Text properties covered by this label's full-text index."""
+        return FULLTEXT_INDEXES.get(self.entity_label, DEFAULT_FULLTEXT_FIELDS)
+
     async def search_by_text(self, search_term: str, limit: int = 50) -> List[T]:
         """
-        Search nodes by text across string properties.
+        Search nodes by text using the label's full-text index, ranked by score.
+        Falls back to a substring scan over the indexed properties when the
+        index does not exist.
 
         Args:
             search_term: Text to search for
             limit: Maximum results to return
 
         Returns:
-            List of matching nodes
+            List of matching nodes, best match first
+        """
+        fulltext_query = to_fulltext_query(search_term)
+        if not fulltext_query:
+            return []
+
+        query = """
+        CALL db.index.fulltext.queryNodes($index_name, $fulltext_query)
+        YIELD node, score
+        RETURN node AS e, score
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+
+        async with self.connection.session_async() as session:
+            try:
+                result = await session.run(
+                    query,
+                    index_name=self.fulltext_index,
+                    fulltext_query=fulltext_query,
+                    limit=limit,
+                )
+                records = [record async for record in result]
+            except neo4j.exceptions.ClientError as e:
+                if "no such fulltext schema index" not in str(e).lower():
+                    raise
+                logger.warning(
+                    f"Full-text index {self.fulltext_index} missing, "
+                    f"falling back to substring scan"
+                )
+                return await self._search_by_text_scan(search_term, limit)
+
+            return [self._properties_to_node(dict(record["e"])) for record in records]
+
+    async def _search_by_text_scan(self, search_term: str, limit: int) -> List[T]:
+        """
+        Case-insensitive substring search over the label's text properties.
+        Used only when the full-text index is unavailable.
         """
         query = f"""
         MATCH (e:{self.entity_label})
-        WHERE any(prop in keys(e) WHERE toString(e[prop]) CONTAINS $search_term)
+        WHERE any(prop IN $fields WHERE e[prop] IS NOT NULL
+                  AND toLower(toString(e[prop])) CONTAINS toLower($search_term))
         RETURN e
         ORDER BY e.created_at DESC
         LIMIT $limit
         """
 
         async with self.connection.session_async() as session:
-            result = await session.run(query, search_term=search_term, limit=limit)
+            result = await session.run(
+                query,
+                fields=self.fulltext_fields,
+                search_term=search_term,
+                limit=limit,
+            )
             nodes = []
 
             async for record in result:
@@ -319,7 +552,8 @@ class BaseRepository(Generic[T], ABC):
 
     async def _generate_embedding(self, text: str) -> List[float]:
         """
-        Generate embedding for text using LLM service.
+        Generate embedding for text using LLM service, reduced to the label's
+        configured storage size.
 
         Args:
             text: Text to generate embedding for
@@ -328,9 +562,8 @@ class BaseRepository(Generic[T], ABC):
             List of float values representing the embedding
         """
         try:
-            # Use a simple embedding model - you can adjust this
             embedding = await self.llm_service.create_embedding(text=text)
-            return embedding
+            return embedding_storage(self.entity_label).reduce(embedding)
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             return []
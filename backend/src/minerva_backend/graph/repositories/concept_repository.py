@@ -11,6 +11,10 @@ logger = logging.getLogger(__name__)
 class ConceptRepository(BaseRepository[Concept]):
     """Repository for Concept entities with specialized concept operations."""
 
+    # Concept nodes are only written through this repository from validated
+    # models (extraction and Obsidian sync), and are read on every RAG lookup
+    trusted_reads = True
+
     @property
     def entity_label(self) -> str:
         return EntityType.CONCEPT.value
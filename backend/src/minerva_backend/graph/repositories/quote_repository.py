@@ -7,6 +7,7 @@ import logging
 
 from minerva_models import Quote
 from minerva_backend.graph.db import Neo4jConnection
+from minerva_backend.graph.embedding_storage import embedding_storage
 from minerva_backend.processing.llm_service import LLMService
 
 logger = logging.getLogger(__name__)
@@ -45,8 +46,9 @@ class QuoteRepository:
         
         properties = self._node_to_properties(quote)
         
-        query = """
+        query = f"""
         CREATE (q:Quote $properties)
+        {embedding_storage("Quote").store_clause("q")}
         RETURN q.uuid as uuid
         """
         
@@ -88,12 +90,13 @@ class QuoteRepository:
         # Prepare quote properties for batch creation
         quote_properties = [self._node_to_properties(quote) for quote in quotes]
         
-        query = """
-        MATCH (c:Content {uuid: $content_uuid})
+        query = f"""
+        MATCH (c:Content {{uuid: $content_uuid}})
         UNWIND $quotes AS quote_props
         CREATE (q:Quote)
         SET q = quote_props
         CREATE (q)-[:QUOTED_IN]->(c)
+        {embedding_storage("Quote").store_clause("q")}
         RETURN q.uuid as uuid
         ORDER BY q.created_at DESC
         """
@@ -158,7 +161,7 @@ class QuoteRepository:
         try:
             embedding = await self.llm_service.create_embedding(text)
             logger.debug(f"Generated embedding for quote text: {text[:50]}...")
-            return embedding
+            return embedding_storage("Quote").reduce(embedding)
         except Exception as e:
             logger.error(f"Error generating embedding for quote: {e}")
             raise
@@ -238,9 +241,10 @@ class QuoteRepository:
                 embedding = await self._generate_embedding(text)
                 
                 # Update the quote with new embedding
-                update_query = """
-                MATCH (q:Quote {uuid: $quote_uuid})
+                update_query = f"""
+                MATCH (q:Quote {{uuid: $quote_uuid}})
                 SET q.embedding = $embedding
+                {embedding_storage("Quote").store_clause("q")}
                 RETURN q.uuid as uuid
                 """
                 
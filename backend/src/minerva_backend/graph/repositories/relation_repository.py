@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Tuple
 
 from minerva_models import Relation
+from minerva_backend.graph.embedding_storage import embedding_storage
 from minerva_backend.graph.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -108,21 +109,22 @@ class RelationRepository(BaseRepository[Relation]):
         properties = self._node_to_properties(relation)
         properties["edge_uuid"] = edge_uuid
 
-        query = """
+        query = f"""
         // Find source and target entities first
-        MATCH (source {uuid: $source_uuid})
-        MATCH (target {uuid: $target_uuid})
+        MATCH (source {{uuid: $source_uuid}})
+        MATCH (target {{uuid: $target_uuid}})
 
         // Create direct edge with its own UUID for fast traversal
-        CREATE (source)-[edge:RELATED_TO {
+        CREATE (source)-[edge:RELATED_TO {{
             uuid: $edge_uuid,
             type: $type,
             created_at: $created_at,
             summary_short: $summary_short
-        }]->(target)
+        }}]->(target)
 
         // Create the reified relation node that references the edge
         CREATE (r:Relation $properties)
+        {embedding_storage("Relation").store_clause("r")}
 
         // Create bidirectional connections to reified relation
         CREATE (source)-[:HAS_RELATION]->(r)
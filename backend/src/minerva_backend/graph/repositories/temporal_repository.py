@@ -4,9 +4,11 @@ Handles time-based operations and the temporal hierarchy (Year -> Month -> Day).
 """
 
 import logging
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from minerva_backend.graph.db import Neo4jConnection
 from minerva_models import JournalEntry
@@ -14,6 +16,39 @@ from minerva_models import JournalEntry
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _TimeTreeCache:
+    """Known Year/Month/Day uuids; time nodes are never deleted once created."""
+
+    days: Dict[date, str] = field(default_factory=dict)
+    months: Dict[Tuple[int, int], str] = field(default_factory=dict)
+    years: Dict[int, str] = field(default_factory=dict)
+
+
+# Per-journal contributions to the Day/Month/Year counters. Shared by the
+# incremental update and the rebuild so both count the same way.
+JOURNAL_WORDS_CYPHER = """
+size([w IN split(
+    replace(replace(replace(coalesce({j}.entry_text, ''), '\\r', ' '), '\\n', ' '), '\\t', ' '),
+    ' ') WHERE w <> ''])
+"""
+JOURNAL_MENTIONS_CYPHER = """
+COUNT {{ MATCH ({j})-[:HAS_CHUNK]->(:Chunk)-[:MENTIONS]->(e) RETURN DISTINCT e }}
+"""
+
+# Repositories are created per request, so the cache lives per connection
+_TIME_TREE_CACHES: "WeakKeyDictionary[Neo4jConnection, _TimeTreeCache]" = (
+    WeakKeyDictionary()
+)
+
+
+def _time_tree_cache(connection: Neo4jConnection) -> _TimeTreeCache:
+    cache = _TIME_TREE_CACHES.get(connection)
+    if cache is None:
+        cache = _TIME_TREE_CACHES[connection] = _TimeTreeCache()
+    return cache
+
+
 class TemporalRepository:
     """
     Repository for temporal operations and time tree management.
@@ -23,12 +58,106 @@ class TemporalRepository:
     def __init__(self, connection: Neo4jConnection):
         """Initialize repository with database connection."""
         self.connection = connection
+        self._cache = _time_tree_cache(connection)
+
+    async def ensure_time_tree(self, start_year: int, end_year: int) -> int:
+        """
+        Precreate Year -> Month -> Day nodes for every day of a range of years
+        in a single UNWIND, and prime the in-process uuid cache.
+
+        Args:
+            start_year: First year to create (inclusive)
+            end_year: Last year to create (inclusive)
+
+        Returns:
+            int: Number of Day nodes ensured
+        """
+        rows = []
+        current = date(start_year, 1, 1)
+        while current.year <= end_year:
+            rows.append(
+                {
+                    "year": current.year,
+                    "month": current.month,
+                    "day": current.day,
+                    "month_name": current.strftime("%B"),
+                    "date_str": current.isoformat(),
+                    "year_uuid": str(uuid4()),
+                    "month_uuid": str(uuid4()),
+                    "day_uuid": str(uuid4()),
+                }
+            )
+            current += timedelta(days=1)
+
+        if not rows:
+            return 0
+
+        query = """
+        UNWIND $rows AS row
+        MERGE (y:Year {year: row.year, partition: 'TEMPORAL'})
+        ON CREATE SET
+            y.uuid = row.year_uuid,
+            y.name = row.year,
+            y.created_at = datetime()
+        MERGE (y)-[:HAS_MONTH]->(m:Month {
+            year: row.year,
+            month: row.month,
+            partition: 'TEMPORAL'
+        })
+        ON CREATE SET
+            m.uuid = row.month_uuid,
+            m.created_at = datetime(),
+            m.name = row.month_name
+        MERGE (m)-[:HAS_DAY]->(d:Day {
+            year: row.year,
+            month: row.month,
+            day: row.day,
+            date: date(row.date_str),
+            partition: 'TEMPORAL'
+        })
+        ON CREATE SET
+            d.uuid = row.day_uuid,
+            d.created_at = datetime()
+        RETURN row.date_str AS date_str, y.uuid AS year_uuid,
+               m.uuid AS month_uuid, d.uuid AS day_uuid
+        """
+
+        async with self.connection.session_async() as session:
+            result = await session.run(query, rows=rows)
+            async for record in result:
+                self._remember(
+                    date.fromisoformat(record["date_str"]),
+                    record["year_uuid"],
+                    record["month_uuid"],
+                    record["day_uuid"],
+                )
+
+        logger.info(
+            f"Ensured time tree for {start_year}-{end_year} ({len(rows)} days)"
+        )
+        return len(rows)
+
+    def _remember(
+        self,
+        target_date: date,
+        year_uuid: Optional[str],
+        month_uuid: Optional[str],
+        day_uuid: Optional[str],
+    ) -> None:
+        """Record known time node uuids in the in-process cache."""
+        if year_uuid:
+            self._cache.years[target_date.year] = year_uuid
+        if month_uuid:
+            self._cache.months[(target_date.year, target_date.month)] = month_uuid
+        if day_uuid:
+            self._cache.days[target_date] = day_uuid
 
     async def ensure_day_in_time_tree(self, target_date: date) -> str:
         """
         Ensure a day exists in the time tree hierarchy: Year -> Month -> Day.
         Creates Year, Month, and Day nodes if they don't exist and establishes relationships.
         All time nodes are created in the TEMPORAL partition.
+        Days already seen by this process are answered from the cache.
 
         Args:
             target_date: The date to ensure exists in the tree
@@ -36,6 +165,10 @@ class TemporalRepository:
         Returns:
             str: UUID of the Day node
         """
+        cached = self._cache.days.get(target_date)
+        if cached:
+            return cached
+
         year = target_date.year
         month = target_date.month
         day = target_date.day
@@ -72,7 +205,7 @@ class TemporalRepository:
             d.uuid = $day_uuid,
             d.created_at = datetime()
 
-        RETURN d.uuid as day_uuid
+        RETURN y.uuid as year_uuid, m.uuid as month_uuid, d.uuid as day_uuid
         """
 
         async with self.connection.session_async() as session:
@@ -90,6 +223,9 @@ class TemporalRepository:
 
             record = await result.single()
             day_uuid = record["day_uuid"]
+            self._remember(
+                target_date, record["year_uuid"], record["month_uuid"], day_uuid
+            )
 
             logger.info(f"Ensured day in time tree: {target_date} (UUID: {day_uuid})")
             return day_uuid
@@ -108,9 +244,9 @@ class TemporalRepository:
 
         # Then create the relationship
         query = """
-        MATCH (n {uuid: $uuid})
         MATCH (d:Day {uuid: $day_uuid})
-        MERGE (j)-[:OCCURRED_ON]->(d)
+        MATCH (n {uuid: $uuid})
+        MERGE (n)-[:OCCURRED_ON]->(d)
         RETURN count(*) as linked
         """
         async with self.connection.session_async() as session:
@@ -128,6 +264,7 @@ class TemporalRepository:
     async def link_nodes_to_day_batch(self, uuids: List[str], target_date: date) -> int:
         """
         Link multiple nodes to a day in the time tree in batch.
+        Linked journal entries are added to the Day/Month/Year counters.
 
         Args:
             uuids: List of node UUIDs
@@ -139,23 +276,39 @@ class TemporalRepository:
         if not uuids:
             return 0
 
-        # First ensure the day exists
+        # First ensure the day exists (usually a cache hit)
         day_uuid = await self.ensure_day_in_time_tree(target_date)
 
-        # Then create all relationships in batch
-        query = """
+        # Then create the missing relationships against a single Day lookup and
+        # bump the pre-aggregated counters of the Day, Month and Year in the
+        # same transaction
+        query = f"""
+        MATCH (y:Year)-[:HAS_MONTH]->(m:Month)-[:HAS_DAY]->(d:Day {{uuid: $day_uuid}})
         UNWIND $uuids as node_uuid
-        MATCH (n {uuid: node_uuid})
-        MATCH (d:Day {uuid: $day_uuid})
-        MERGE (n)-[:OCCURRED_ON]->(d)
-        RETURN count(*) as linked
+        MATCH (n {{uuid: node_uuid}})
+        WHERE NOT (n)-[:OCCURRED_ON]->(d)
+        CREATE (n)-[:OCCURRED_ON]->(d)
+        WITH y, m, d, n, n:JournalEntry AS is_journal
+        WITH y, m, d,
+             count(n) AS linked,
+             sum(CASE WHEN is_journal THEN 1 ELSE 0 END) AS journals,
+             sum(CASE WHEN is_journal
+                 THEN {JOURNAL_WORDS_CYPHER.format(j="n")} ELSE 0 END) AS words,
+             sum(CASE WHEN is_journal
+                 THEN {JOURNAL_MENTIONS_CYPHER.format(j="n")} ELSE 0 END) AS mentions
+        FOREACH (t IN [d, m, y] |
+            SET t.journal_count = coalesce(t.journal_count, 0) + journals,
+                t.word_count = coalesce(t.word_count, 0) + words,
+                t.mention_count = coalesce(t.mention_count, 0) + mentions
+        )
+        RETURN linked
         """
 
         async with self.connection.session_async() as session:
             try:
                 result = await session.run(query, uuids=uuids, day_uuid=day_uuid)
                 record = await result.single()
-                linked_count = record["linked"]
+                linked_count = record["linked"] if record else 0
 
                 if linked_count > 0:
                     logger.info(f"Linked {linked_count} nodes to day {target_date}")
@@ -176,6 +329,10 @@ class TemporalRepository:
         Returns:
             UUID of day node or None if not found
         """
+        cached = self._cache.days.get(target_date)
+        if cached:
+            return cached
+
         query = """
         MATCH (d:Day {
             year: $year,
@@ -195,7 +352,9 @@ class TemporalRepository:
             )
 
             record = await result.single()
-            return record["day_uuid"] if record else None
+            day_uuid = record["day_uuid"] if record else None
+            self._remember(target_date, None, None, day_uuid)
+            return day_uuid
 
     async def get_month_uuid(self, year: int, month: int) -> Optional[str]:
         """
@@ -208,6 +367,10 @@ class TemporalRepository:
         Returns:
             UUID of month node or None if not found
         """
+        cached = self._cache.months.get((year, month))
+        if cached:
+            return cached
+
         query = """
         MATCH (m:Month {
             year: $year,
@@ -219,7 +382,10 @@ class TemporalRepository:
         async with self.connection.session_async() as session:
             result = await session.run(query, year=year, month=month)
             record = await result.single()
-            return record["month_uuid"] if record else None
+            month_uuid = record["month_uuid"] if record else None
+            if month_uuid:
+                self._cache.months[(year, month)] = month_uuid
+            return month_uuid
 
     async def get_year_uuid(self, year: int) -> Optional[str]:
         """
@@ -231,6 +397,10 @@ class TemporalRepository:
         Returns:
             UUID of year node or None if not found
         """
+        cached = self._cache.years.get(year)
+        if cached:
+            return cached
+
         query = """
         MATCH (y:Year {
             year: $year,
@@ -241,7 +411,10 @@ class TemporalRepository:
         async with self.connection.session_async() as session:
             result = await session.run(query, year=year)
             record = await result.single()
-            return record["year_uuid"] if record else None
+            year_uuid = record["year_uuid"] if record else None
+            if year_uuid:
+                self._cache.years[year] = year_uuid
+            return year_uuid
 
     async def get_journal_entries_for_date(
         self, target_date: date
@@ -334,7 +507,7 @@ class TemporalRepository:
 
     async def get_month_stats(self, year: int, month: int) -> Dict[str, Any]:
         """
-        Get statistics for a specific month.
+        Get statistics for a specific month from its pre-aggregated counters.
 
         Args:
             year: Year
@@ -344,12 +517,15 @@ class TemporalRepository:
             Dictionary with month statistics
         """
         query = """
-        MATCH (m:Month {year: $year, month: $month})-[:HAS_DAY]->(d:Day)
-        OPTIONAL MATCH (j:JournalEntry)-[:OCCURRED_ON]->(d)
-        RETURN 
-            count(DISTINCT d) as days_in_month,
-            count(DISTINCT j) as journal_entries,
-            collect(DISTINCT d.date) as dates_with_days
+        MATCH (m:Month {year: $year, month: $month})
+        OPTIONAL MATCH (m)-[:HAS_DAY]->(d:Day)
+        RETURN
+            count(d) as days_in_month,
+            coalesce(m.journal_count, 0) as journal_entries,
+            coalesce(m.mention_count, 0) as entity_mentions,
+            coalesce(m.word_count, 0) as word_count,
+            collect(d.date) as dates_with_days,
+            [x IN collect(d) WHERE x.journal_count > 0 | x.date] as dates_with_entries
         """
 
         async with self.connection.session_async() as session:
@@ -362,7 +538,10 @@ class TemporalRepository:
                     "month": month,
                     "days_created": record["days_in_month"],
                     "journal_entries": record["journal_entries"],
+                    "entity_mentions": record["entity_mentions"],
+                    "word_count": record["word_count"],
                     "dates_with_days": record["dates_with_days"],
+                    "dates_with_entries": record["dates_with_entries"],
                 }
 
             return {
@@ -370,12 +549,15 @@ class TemporalRepository:
                 "month": month,
                 "days_created": 0,
                 "journal_entries": 0,
+                "entity_mentions": 0,
+                "word_count": 0,
                 "dates_with_days": [],
+                "dates_with_entries": [],
             }
 
     async def get_year_stats(self, year: int) -> Dict[str, Any]:
         """
-        Get statistics for a specific year.
+        Get statistics for a specific year from its pre-aggregated counters.
 
         Args:
             year: Year
@@ -384,14 +566,25 @@ class TemporalRepository:
             Dictionary with year statistics
         """
         query = """
-        MATCH (y:Year {year: $year})-[:HAS_MONTH]->(m:Month)-[:HAS_DAY]->(d:Day)
-        OPTIONAL MATCH (j:JournalEntry)-[:OCCURRED_ON]->(d)
-        RETURN 
-            count(DISTINCT m) as months_in_year,
-            count(DISTINCT d) as days_in_year,
-            count(DISTINCT j) as journal_entries,
-            min(d.date) as earliest_date,
-            max(d.date) as latest_date
+        MATCH (y:Year {year: $year})
+        OPTIONAL MATCH (y)-[:HAS_MONTH]->(m:Month)
+        WITH y, m, COUNT { (m)-[:HAS_DAY]->() } AS month_days
+        ORDER BY m.month
+        WITH y, collect(m) AS months, sum(month_days) AS days
+        CALL {
+            WITH months
+            UNWIND [head(months), last(months)] AS edge_month
+            OPTIONAL MATCH (edge_month)-[:HAS_DAY]->(d:Day)
+            RETURN min(d.date) AS earliest_date, max(d.date) AS latest_date
+        }
+        RETURN
+            size(months) as months_in_year,
+            days as days_in_year,
+            coalesce(y.journal_count, 0) as journal_entries,
+            coalesce(y.mention_count, 0) as entity_mentions,
+            coalesce(y.word_count, 0) as word_count,
+            earliest_date,
+            latest_date
         """
 
         async with self.connection.session_async() as session:
@@ -404,6 +597,8 @@ class TemporalRepository:
                     "months_created": record["months_in_year"],
                     "days_created": record["days_in_year"],
                     "journal_entries": record["journal_entries"],
+                    "entity_mentions": record["entity_mentions"],
+                    "word_count": record["word_count"],
                     "earliest_date": record["earliest_date"],
                     "latest_date": record["latest_date"],
                 }
@@ -413,6 +608,8 @@ class TemporalRepository:
                 "months_created": 0,
                 "days_created": 0,
                 "journal_entries": 0,
+                "entity_mentions": 0,
+                "word_count": 0,
                 "earliest_date": None,
                 "latest_date": None,
             }
@@ -420,6 +617,8 @@ class TemporalRepository:
     async def get_temporal_overview(self) -> Dict[str, Any]:
         """
         Get overview of entire temporal structure.
+        Reads only Year and Month nodes; day and journal totals come from
+        relationship degrees and pre-aggregated counters.
 
         Returns:
             Dictionary with temporal statistics
@@ -427,13 +626,16 @@ class TemporalRepository:
         query = """
         MATCH (y:Year)
         OPTIONAL MATCH (y)-[:HAS_MONTH]->(m:Month)
-        OPTIONAL MATCH (m)-[:HAS_DAY]->(d:Day)
-        OPTIONAL MATCH (j:JournalEntry)-[:OCCURRED_ON]->(d)
-        RETURN 
-            count(DISTINCT y) as total_years,
-            count(DISTINCT m) as total_months,
-            count(DISTINCT d) as total_days,
-            count(DISTINCT j) as total_journal_entries,
+        WITH y,
+             count(m) as months,
+             sum(COUNT { (m)-[:HAS_DAY]->() }) as days
+        RETURN
+            count(y) as total_years,
+            sum(months) as total_months,
+            sum(days) as total_days,
+            sum(coalesce(y.journal_count, 0)) as total_journal_entries,
+            sum(coalesce(y.mention_count, 0)) as total_entity_mentions,
+            sum(coalesce(y.word_count, 0)) as total_word_count,
             min(y.year) as earliest_year,
             max(y.year) as latest_year
         """
@@ -448,6 +650,8 @@ class TemporalRepository:
                     "total_months": record["total_months"],
                     "total_days": record["total_days"],
                     "total_journal_entries": record["total_journal_entries"],
+                    "total_entity_mentions": record["total_entity_mentions"],
+                    "total_word_count": record["total_word_count"],
                     "earliest_year": record["earliest_year"],
                     "latest_year": record["latest_year"],
                 }
@@ -457,6 +661,72 @@ class TemporalRepository:
                 "total_months": 0,
                 "total_days": 0,
                 "total_journal_entries": 0,
+                "total_entity_mentions": 0,
+                "total_word_count": 0,
                 "earliest_year": None,
                 "latest_year": None,
             }
+
+    async def rebuild_temporal_stats(self) -> Dict[str, int]:
+        """
+        Recompute the Day/Month/Year counters from the linked journal entries.
+        Use after bulk imports or deletions that bypass link_nodes_to_day_batch.
+
+        Returns:
+            Dictionary with the number of Day, Month and Year nodes updated
+        """
+        day_query = f"""
+        MATCH (d:Day)
+        CALL {{
+            WITH d
+            OPTIONAL MATCH (j:JournalEntry)-[:OCCURRED_ON]->(d)
+            RETURN
+                count(j) AS journals,
+                sum(CASE WHEN j IS NULL THEN 0
+                    ELSE {JOURNAL_WORDS_CYPHER.format(j="j")} END) AS words,
+                sum(CASE WHEN j IS NULL THEN 0
+                    ELSE {JOURNAL_MENTIONS_CYPHER.format(j="j")} END) AS mentions
+        }}
+        SET d.journal_count = journals,
+            d.word_count = words,
+            d.mention_count = mentions
+        RETURN count(d) AS updated
+        """
+        month_query = """
+        MATCH (m:Month)
+        OPTIONAL MATCH (m)-[:HAS_DAY]->(d:Day)
+        WITH m,
+             sum(coalesce(d.journal_count, 0)) AS journals,
+             sum(coalesce(d.word_count, 0)) AS words,
+             sum(coalesce(d.mention_count, 0)) AS mentions
+        SET m.journal_count = journals,
+            m.word_count = words,
+            m.mention_count = mentions
+        RETURN count(m) AS updated
+        """
+        year_query = """
+        MATCH (y:Year)
+        OPTIONAL MATCH (y)-[:HAS_MONTH]->(m:Month)
+        WITH y,
+             sum(coalesce(m.journal_count, 0)) AS journals,
+             sum(coalesce(m.word_count, 0)) AS words,
+             sum(coalesce(m.mention_count, 0)) AS mentions
+        SET y.journal_count = journals,
+            y.word_count = words,
+            y.mention_count = mentions
+        RETURN count(y) AS updated
+        """
+
+        updated: Dict[str, int] = {}
+        async with self.connection.session_async() as session:
+            for level, query in (
+                ("days", day_query),
+                ("months", month_query),
+                ("years", year_query),
+            ):
+                result = await session.run(query)
+                record = await result.single()
+                updated[level] = record["updated"] if record else 0
+
+        logger.info(f"Rebuilt temporal stats: {updated}")
+        return updated
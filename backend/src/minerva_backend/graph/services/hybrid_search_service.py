@@ -0,0 +1,388 @@
+"""
+Hybrid Search Service for Minerva
+Combines vector similarity, full-text relevance and graph proximity into a
+single ranked candidate list using reciprocal rank fusion (RRF).
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Deque, Dict, List, Optional
+
+from minerva_backend.graph.db import Neo4jConnection
+from minerva_backend.graph.repositories.base import to_fulltext_query
+from minerva_backend.processing.llm_service import LLMService
+from minerva_models import EntityType
+
+logger = logging.getLogger(__name__)
+
+# Labels searched when the caller does not specify any
+DEFAULT_SEARCH_LABELS = ["Person", "Concept", "Project", "Place"]
+
+# Standard RRF damping constant (Cormack et al.)
+RRF_K = 60
+
+# Lucene rejects queries with too many clauses; long texts (whole journal
+# entries) are truncated to their first terms for the full-text signal
+MAX_FULLTEXT_TERMS = 256
+
+# Label disjunction for anchor lookups, so they plan as label scans rather
+# than an AllNodesScan
+ANCHOR_LABELS = "|".join(entity_type.value for entity_type in EntityType)
+
+
+@dataclass
+class HybridSearchResult:
+    """A fused search hit with the per-signal ranks that produced it."""
+
+    uuid: str
+    label: str
+    properties: Dict[str, Any]
+    score: float = 0.0
+    vector_rank: Optional[int] = None
+    vector_score: Optional[float] = None
+    fulltext_rank: Optional[int] = None
+    fulltext_score: Optional[float] = None
+    graph_distance: Optional[int] = None
+    element_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for API responses, dropping the raw embeddings."""
+        return {
+            "uuid": self.uuid,
+            "label": self.label,
+            "score": self.score,
+            "vector_rank": self.vector_rank,
+            "vector_score": self.vector_score,
+            "fulltext_rank": self.fulltext_rank,
+            "fulltext_score": self.fulltext_score,
+            "graph_distance": self.graph_distance,
+            "properties": {
+                k: _json_value(v)
+                for k, v in self.properties.items()
+                if not k.startswith("embedding")
+            },
+        }
+
+
+def _json_value(value: Any) -> Any:
+    """Render neo4j/python temporal values as ISO strings."""
+    if hasattr(value, "iso_format"):
+        return value.iso_format()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+@dataclass
+class _LatencyWindow:
+    """Bounded window of latency samples for one search stage."""
+
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def add(self, duration_ms: float) -> None:
+        self.samples.append(duration_ms)
+
+    def percentiles(self) -> Dict[str, float]:
+        if not self.samples:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ordered = sorted(self.samples)
+
+        def pick(q: float) -> float:
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+        return {
+            "count": len(ordered),
+            "p50": pick(0.50),
+            "p95": pick(0.95),
+            "p99": pick(0.99),
+        }
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: List[List[str]], k: int = RRF_K
+) -> Dict[str, float]:
+    """
+    Fuse several ranked uuid lists into a single score per uuid.
+
+    Args:
+        ranked_lists: Lists of uuids, best first
+        k: RRF damping constant
+
+    Returns:
+        Dict mapping uuid to fused score
+    """
+    scores: Dict[str, float] = {}
+    for ranked in ranked_lists:
+        for rank, uuid in enumerate(ranked, start=1):
+            scores[uuid] = scores.get(uuid, 0.0) + 1.0 / (k + rank)
+    return scores
+
+
+class HybridSearchService:
+    """
+    Service for hybrid retrieval across several labels.
+    Runs vector and full-text queries concurrently, fuses them with RRF and
+    optionally boosts candidates close to a journal's linked entities.
+    """
+
+    def __init__(
+        self,
+        connection: Neo4jConnection,
+        llm_service: LLMService,
+        embedding_cache_size: int = 256,
+        max_graph_hops: int = 3,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            connection: Neo4j connection
+            llm_service: Service used to embed query text
+            embedding_cache_size: Number of query embeddings kept in memory
+            max_graph_hops: Maximum path length considered for graph boosting
+        """
+        self.connection = connection
+        self.llm_service = llm_service
+        self.embedding_cache_size = embedding_cache_size
+        self.max_graph_hops = max_graph_hops
+        self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._latencies: Dict[str, _LatencyWindow] = {}
+
+    async def search(
+        self,
+        query_text: str,
+        labels: Optional[List[str]] = None,
+        limit: int = 10,
+        journal_uuid: Optional[str] = None,
+        anchor_uuids: Optional[List[str]] = None,
+        graph_weight: float = 0.5,
+        candidate_k: Optional[int] = None,
+        min_vector_score: Optional[float] = None,
+    ) -> List[HybridSearchResult]:
+        """
+        Run a hybrid search.
+
+        Args:
+            query_text: Free text to search for
+            labels: Node labels to search (defaults to DEFAULT_SEARCH_LABELS)
+            limit: Maximum number of fused results
+            journal_uuid: If given, boost candidates near entities mentioned
+                in this journal entry
+            anchor_uuids: Extra nodes (e.g. the entry's [[links]]) whose
+                neighbourhood is boosted like the journal's mentions
+            graph_weight: Strength of the graph proximity boost
+            candidate_k: Candidates fetched per label and signal
+                (defaults to 2 * limit)
+            min_vector_score: If given, drop candidates whose vector
+                similarity is missing or below this score
+
+        Returns:
+            Fused results, best first
+        """
+        total_start = time.perf_counter()
+        labels = labels or DEFAULT_SEARCH_LABELS
+        candidate_k = candidate_k or limit * 2
+
+        stage_start = time.perf_counter()
+        embedding = await self._get_query_embedding(query_text)
+        self._record("embedding", stage_start)
+
+        fulltext_query = to_fulltext_query(
+            " ".join(query_text.split()[:MAX_FULLTEXT_TERMS])
+        )
+
+        stage_start = time.perf_counter()
+        vector_records, *fulltext_lists = await asyncio.gather(
+            self._vector_candidates(labels, embedding, candidate_k),
+            *(
+                self._fulltext_candidates(label, fulltext_query, candidate_k)
+                for label in labels
+            ),
+        )
+        self._record("retrieval", stage_start)
+
+        # One ranked list per label and signal; vector records arrive
+        # label-tagged and sorted by score from a single query
+        signal_lists = []
+        for label, fulltext_records in zip(labels, fulltext_lists):
+            label_vector_records = [r for r in vector_records if r["label"] == label]
+            signal_lists.append((label, True, label_vector_records))
+            signal_lists.append((label, False, fulltext_records))
+
+        candidates: Dict[str, HybridSearchResult] = {}
+        ranked_lists: List[List[str]] = []
+        for label, is_vector, records in signal_lists:
+            ranked: List[str] = []
+            for rank, record in enumerate(records, start=1):
+                properties = dict(record["node"])
+                uuid = properties.get("uuid")
+                if not uuid:
+                    continue
+                result = candidates.setdefault(
+                    uuid,
+                    HybridSearchResult(
+                        uuid, label, properties, element_id=record.get("element_id")
+                    ),
+                )
+                if is_vector:
+                    result.vector_rank, result.vector_score = rank, record["score"]
+                else:
+                    result.fulltext_rank, result.fulltext_score = rank, record["score"]
+                ranked.append(uuid)
+            ranked_lists.append(ranked)
+
+        for uuid, score in reciprocal_rank_fusion(ranked_lists).items():
+            candidates[uuid].score = score
+
+        if min_vector_score is not None:
+            candidates = {
+                uuid: result
+                for uuid, result in candidates.items()
+                if result.vector_score is not None
+                and result.vector_score >= min_vector_score
+            }
+
+        anchor_uuids = [uuid for uuid in anchor_uuids or [] if uuid]
+        if (journal_uuid or anchor_uuids) and candidates and graph_weight > 0:
+            stage_start = time.perf_counter()
+            distances = await self._graph_distances(
+                journal_uuid, anchor_uuids, list(candidates.values())
+            )
+            for uuid, distance in distances.items():
+                result = candidates[uuid]
+                result.graph_distance = distance
+                result.score *= 1.0 + graph_weight / (1.0 + distance)
+            self._record("graph_boost", stage_start)
+
+        results = sorted(candidates.values(), key=lambda r: r.score, reverse=True)
+        self._record("total", total_start)
+        return results[:limit]
+
+    def latency_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """
+        Latency percentiles (ms) per search stage over the recent window.
+
+        Returns:
+            Dict mapping stage name to count/p50/p95/p99
+        """
+        return {
+            stage: window.percentiles() for stage, window in self._latencies.items()
+        }
+
+    async def _get_query_embedding(self, query_text: str) -> List[float]:
+        """Embed the query, reusing cached embeddings for repeated queries."""
+        cached = self._embedding_cache.get(query_text)
+        if cached is not None:
+            self._embedding_cache.move_to_end(query_text)
+            return cached
+
+        try:
+            embedding = await self.llm_service.create_embedding(text=query_text)
+        except Exception as e:
+            logger.error(f"Failed to embed hybrid search query: {e}")
+            return []
+
+        if embedding:
+            self._embedding_cache[query_text] = embedding
+            if len(self._embedding_cache) > self.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+        return embedding
+
+    async def _vector_candidates(
+        self, labels: List[str], embedding: List[float], limit: int
+    ) -> list:
+        if not embedding:
+            return []
+        try:
+            return await self.connection.vector_search_many(
+                labels=labels, query_embedding=embedding, k=limit, threshold=0.0
+            )
+        except Exception as e:
+            logger.warning(f"Vector search failed for {labels}: {e}")
+            return []
+
+    async def _fulltext_candidates(
+        self, label: str, fulltext_query: str, limit: int
+    ) -> list:
+        if not fulltext_query:
+            return []
+        try:
+            return await self.connection.fulltext_search(
+                label=label, query_text=fulltext_query, limit=limit
+            )
+        except Exception as e:
+            logger.warning(f"Full-text search failed for {label}: {e}")
+            return []
+
+    async def _graph_distances(
+        self,
+        journal_uuid: Optional[str],
+        anchor_uuids: List[str],
+        candidates: List[HybridSearchResult],
+    ) -> Dict[str, int]:
+        """
+        Shortest path length from each candidate to any entity mentioned in
+        the journal entry or listed as an anchor. Candidates farther than
+        max_graph_hops are omitted.
+
+        Candidates are matched by the element id their search query returned,
+        which is a direct node lookup.
+        """
+        candidate_ids = [
+            {"element_id": c.element_id, "uuid": c.uuid}
+            for c in candidates
+            if c.element_id
+        ]
+        if not candidate_ids:
+            return {}
+
+        anchor_clause = ""
+        if anchor_uuids:
+            anchor_clause = f"""
+        OPTIONAL MATCH (anchor:{ANCHOR_LABELS}) WHERE anchor.uuid IN $anchor_uuids
+        WITH linked_nodes + collect(DISTINCT anchor) AS linked_nodes"""
+
+        query = f"""
+        OPTIONAL MATCH (:JournalEntry {{uuid: $journal_uuid}})-[:HAS_CHUNK]->(:Chunk)-[:MENTIONS]->(mentioned)
+        WITH collect(DISTINCT mentioned) AS linked_nodes{anchor_clause}
+        UNWIND $candidates AS candidate
+        MATCH (c) WHERE elementId(c) = candidate.element_id
+        WITH candidate.uuid AS candidate_uuid, c, linked_nodes
+        CALL {{
+            WITH c, linked_nodes
+            UNWIND linked_nodes AS l
+            WITH c, l WHERE c <> l
+            MATCH p = shortestPath((c)-[*..{int(self.max_graph_hops)}]-(l))
+            RETURN min(length(p)) AS path_distance
+        }}
+        WITH candidate_uuid,
+             CASE WHEN c IN linked_nodes THEN 0 ELSE path_distance END AS distance
+        WHERE distance IS NOT NULL
+        RETURN candidate_uuid, distance
+        """
+
+        try:
+            async with self.connection.session_async() as session:
+                result = await session.run(
+                    query,
+                    journal_uuid=journal_uuid,
+                    anchor_uuids=anchor_uuids,
+                    candidates=candidate_ids,
+                )
+                return {
+                    record["candidate_uuid"]: record["distance"]
+                    async for record in result
+                }
+        except Exception as e:
+            logger.warning(f"Graph proximity boost failed: {e}")
+            return {}
+
+    def _record(self, stage: str, start: float) -> None:
+        duration_ms = (time.perf_counter() - start) * 1000
+        self._latencies.setdefault(stage, _LatencyWindow()).add(duration_ms)
@@ -82,7 +82,12 @@ class KnowledgeGraphService:
         span_index: Optional[SpanIndex] = await build_and_insert_lexical_tree(
             self.connection, journal_entry
         )
-        chunk_uuids = [x[1] for x in span_index] if span_index else []
+        # The index also holds the journal's own full-text span; skip it here
+        chunk_uuids = (
+            [uuid for _, uuid in span_index if uuid != journal_uuid]
+            if span_index
+            else []
+        )
 
         # Link journal and chunks to day
         node_day.append(journal_uuid)
@@ -119,16 +124,18 @@ class KnowledgeGraphService:
                         SUMMARY_KEY: entity.summary,
                     },
                 )
-            for span in spans:
-                found_chunks = (
-                    span_index.query_containing(span.start, span.end)
-                    if span_index
-                    else []
+            found_per_span = (
+                span_index.query_containing_batch(
+                    (span.start, span.end) for span in spans
                 )
+                if span_index
+                else []
+            )
+            for found_chunks in found_per_span:
                 for chunk in found_chunks:
                     # Entity span is in chunk, add mention
-                    if entity_uuid and isinstance(chunk[2], str):
-                        node_mentions.append((chunk[2], entity_uuid))
+                    if entity_uuid and isinstance(chunk.data, str):
+                        node_mentions.append((chunk.data, entity_uuid))
 
         # Create Relationship edge, ReifiedRelationship node, context relations and Mentions
         for r in relationships:
@@ -139,16 +146,18 @@ class KnowledgeGraphService:
             relationship_uuid = await self.relation_repository.create_full_relationship(
                 relationship
             )
-            for span in spans:
-                found_chunks = (
-                    span_index.query_containing(span.start, span.end)
-                    if span_index
-                    else []
+            found_per_span = (
+                span_index.query_containing_batch(
+                    (span.start, span.end) for span in spans
                 )
+                if span_index
+                else []
+            )
+            for found_chunks in found_per_span:
                 for chunk in found_chunks:
                     # Relation span is in chunk, add mention
-                    if relationship_uuid and isinstance(chunk[2], str):
-                        node_mentions.append((chunk[2], relationship_uuid))
+                    if relationship_uuid and isinstance(chunk.data, str):
+                        node_mentions.append((chunk.data, relationship_uuid))
             if context and len(context) > 0:
                 for relationship_context in context:
                     # Create subsequent RELATED_TO for reified relation
@@ -1,41 +1,144 @@
-from typing import Any, Dict, List, Tuple
-
-from intervaltree import IntervalTree
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
 
+from minerva_backend.config import settings
 from minerva_backend.graph.db import Neo4jConnection
-from minerva_models import Chunk, JournalEntry
+from minerva_backend.graph.services.sentence_splitter import (
+    SentenceSplitter,
+    StanzaSentenceSplitter,
+    get_sentence_splitter,
+)
+from minerva_models import JournalEntry, LexicalType, PartitionType
+
+
+class SpanEntry(NamedTuple):
+    """An indexed span: [begin, end) and the uuid of the node covering it."""
+
+    begin: int
+    end: int
+    data: str
 
 
 class SpanIndex:
+    """
+    Containment index over the nested spans of a lexical tree.
+
+    Spans are kept in flat arrays sorted by (begin asc, end desc) together with
+    parent pointers to the nearest enclosing span. "All spans containing
+    [start, end)" is answered by bisecting to the last span starting at or
+    before `start` and walking parent pointers upward, i.e. O(log n + depth).
+    Spans added after a query are folded in by rebuilding the arrays lazily.
+    """
+
     def __init__(self):
-        self.tree = IntervalTree()
+        self._pending: List[SpanEntry] = []
+        self._starts = array("l")
+        self._ends = array("l")
+        self._parents = array("l")
+        self._data: List[str] = []
+        self._laminar = True
+        self._dirty = False
 
     def add_span(self, start: int, end: int, chunk_uuid: str):
-        # IntervalTree uses [start, end), so end is exclusive
-        self.tree[start:end] = chunk_uuid
+        # Spans are half-open: [start, end)
+        self._pending.append(SpanEntry(start, end, chunk_uuid))
+        self._dirty = True
 
     def add_span_batch(self, spans_dict: Dict[Tuple[int, int], str]):
-        for span, uuid in spans_dict.items():
-            self.tree[span[0] : span[1]] = uuid
+        for (start, end), uuid in spans_dict.items():
+            self._pending.append(SpanEntry(start, end, uuid))
+        self._dirty = True
 
-    def query_containing(self, start: int, end: int) -> list[str]:
+    def query_containing(self, start: int, end: int) -> List[SpanEntry]:
         """
-        Return all chunk_uuids whose spans fully contain [start, end).
+        Return all spans that fully contain [start, end), innermost first.
         """
-        candidates = self.tree.overlap(start, end)
-        result = [iv for iv in candidates if iv.begin <= start and iv.end >= end]
-        return result
+        if start >= end:
+            return []
+        self._freeze()
+        starts, ends, parents = self._starts, self._ends, self._parents
+        i = bisect_right(starts, start) - 1
+
+        if not self._laminar:
+            # Partially overlapping spans break the parent chain; scan instead
+            return [
+                self._entry(j) for j in range(i, -1, -1) if ends[j] >= end
+            ]
+
+        # Climb to the innermost containing span; its ancestors contain it
+        while i >= 0 and ends[i] < end:
+            i = parents[i]
+        found = []
+        while i >= 0:
+            found.append(self._entry(i))
+            i = parents[i]
+        return found
+
+    def query_containing_batch(
+        self, spans: Iterable[Tuple[int, int]]
+    ) -> List[List[SpanEntry]]:
+        """
+        Return the containing spans for every (start, end) pair, in order.
+        Repeated spans are resolved once.
+        """
+        memo: Dict[Tuple[int, int], List[SpanEntry]] = {}
+        results = []
+        for start, end in spans:
+            key = (start, end)
+            found = memo.get(key)
+            if found is None:
+                found = memo[key] = self.query_containing(start, end)
+            results.append(found)
+        return results
+
+    def _entry(self, i: int) -> SpanEntry:
+        return SpanEntry(self._starts[i], self._ends[i], self._data[i])
+
+    def _freeze(self):
+        """Merge pending spans into the sorted arrays and link parents."""
+        if not self._dirty:
+            return
+        entries = [self._entry(i) for i in range(len(self._data))]
+        entries.extend(self._pending)
+        # Stable sort keeps insertion order between identical spans
+        entries.sort(key=lambda entry: (entry.begin, -entry.end))
+
+        parents = array("l", [-1]) * len(entries)
+        laminar = True
+        stack: List[int] = []
+        for i, entry in enumerate(entries):
+            while stack and entries[stack[-1]].end < entry.end:
+                if entries[stack.pop()].end > entry.begin:
+                    laminar = False
+            if stack:
+                parents[i] = stack[-1]
+            stack.append(i)
+
+        self._starts = array("l", (entry.begin for entry in entries))
+        self._ends = array("l", (entry.end for entry in entries))
+        self._parents = parents
+        self._data = [entry.data for entry in entries]
+        self._laminar = laminar
+        self._pending = []
+        self._dirty = False
 
     def __len__(self):
-        return len(self.tree)
+        return len(self._data) + len(self._pending)
 
     def __iter__(self):
-        for iv in self.tree:
-            yield (iv.begin, iv.end), iv.data
+        self._freeze()
+        for i in range(len(self._data)):
+            yield (self._starts[i], self._ends[i]), self._data[i]
 
 
 async def build_and_insert_lexical_tree(
-    connection: Neo4jConnection, journal_entry: JournalEntry, nlp=None
+    connection: Neo4jConnection,
+    journal_entry: JournalEntry,
+    nlp=None,
+    splitter: SentenceSplitter | None = None,
 ) -> SpanIndex | None:
     """
     Build a lexical tree from a JournalEntry's text and insert it into the database.
@@ -44,6 +147,7 @@ async def build_and_insert_lexical_tree(
         connection: Neo4jConnection
         journal_entry: JournalEntry object (already in DB)
         nlp: Optional Stanza pipeline for testing
+        splitter: Optional sentence splitter (defaults to the process-wide one)
 
     Returns:
         Dict[Tuple[int, int], str]: Mapping from (start_char, end_char) spans to chunk UUIDs
@@ -57,54 +161,31 @@ async def build_and_insert_lexical_tree(
     # Initialize span mapping with journal entry (full text span)
     result.add_span(0, len(text), journal_entry.uuid)
 
-    # Allow injecting a nlp pipeline for testing; lazily import stanza if needed
-    if nlp is None:
-        import stanza
-
-        nlp = stanza.Pipeline(lang="es", processors="tokenize", download_method=None)
-
-    doc = nlp(text)
-    if not doc.sentences:
-        return None
-
-    # Create sentence chunks
-    sentence_chunks = []
-    for sent in doc.sentences:
-        start = int(sent.tokens[0].start_char)
-        end = int(sent.tokens[-1].end_char)
-        chunk = Chunk(text=text[start:end])
-        sentence_chunks.append((chunk, start, end))
-        result.add_span(start, end, chunk.uuid)
-
-    # Build balanced binary tree
-    all_chunks = []
-    relationships: List[Dict[str, Any]] = []
-
-    # Add all sentence chunks to our collections
-    all_chunks.extend([chunk for chunk, _, _ in sentence_chunks])
-
-    # Build tree and get root
-    if sentence_chunks:
-        root_chunk, root_start, root_end = _build_balanced_tree(
-            sentence_chunks, text, all_chunks, relationships, result
+    # Allow injecting a nlp pipeline for testing; otherwise reuse the
+    # process-wide splitter so models are loaded once, not per journal
+    if splitter is None:
+        splitter = (
+            StanzaSentenceSplitter.from_pipeline(nlp)
+            if nlp is not None
+            else get_sentence_splitter()
         )
 
-        # Connect root to journal entry
-        relationships.append(
-            {"parent": journal_entry.uuid, "child": root_chunk.uuid, "type": "CONTAINS"}
-        )
+    sentence_spans = await splitter.split_async(text)
+    if not sentence_spans:
+        return None
 
-        # Add HAS_CHUNK relationships from journal entry to every chunk
-        for chunk in all_chunks:
-            relationships.append(
-                {"parent": journal_entry.uuid, "child": chunk.uuid, "type": "HAS_CHUNK"}
-            )
+    # Build the balanced chunk tree over the sentences, indexing every span
+    chunk_spans, relationship_groups = _build_balanced_tree(
+        journal_entry.uuid, sentence_spans, result
+    )
+    chunk_data = _prepare_chunk_data(
+        text, chunk_spans, leaf_count=_text_leaf_count(len(sentence_spans))
+    )
 
     try:
-        print(
-            f"Inserting {len(all_chunks)} chunks and {len(relationships)} relationships"
+        await _insert_chunks_and_relationships(
+            connection, chunk_data, relationship_groups
         )
-        await _insert_chunks_and_relationships(connection, all_chunks, relationships)
     except Exception as e:
         print(f"Error inserting chunks: {e}")
         raise
@@ -113,110 +194,83 @@ async def build_and_insert_lexical_tree(
 
 
 def _build_balanced_tree(
-    nodes: List[Tuple],
-    text: str,
-    all_chunks: List,
-    relationships: List[Dict],
+    journal_uuid: str,
+    sentence_spans: List[Tuple[int, int]],
     result: SpanIndex,
-) -> Tuple:
-    """
-    Build a balanced binary tree from a list of (chunk, start, end) tuples.
-    Returns the root (chunk, start, end).
+) -> Tuple[List[Tuple[str, int, int]], Dict[str, List[Dict]]]:
     """
-    if len(nodes) == 1:
-        return nodes[0]
-
-    if len(nodes) == 2:
-        # Create parent for the pair
-        left_chunk, left_start, left_end = nodes[0]
-        right_chunk, right_start, right_end = nodes[1]
-
-        # Create parent chunk spanning both children
-        parent_start = min(left_start, right_start)
-        parent_end = max(left_end, right_end)
-        parent_text = text[parent_start:parent_end]
-        parent_chunk = Chunk(text=parent_text)
-
-        all_chunks.append(parent_chunk)
-        result.add_span(parent_start, parent_end, parent_chunk.uuid)
-
-        # Create relationships
-        relationships.extend(
-            [
-                {
-                    "parent": parent_chunk.uuid,
-                    "child": left_chunk.uuid,
-                    "type": "CONTAINS",
-                },
-                {
-                    "parent": parent_chunk.uuid,
-                    "child": right_chunk.uuid,
-                    "type": "CONTAINS",
-                },
-                {
-                    "parent": left_chunk.uuid,
-                    "child": right_chunk.uuid,
-                    "type": "NEXT_SIBLING",
-                },
-            ]
-        )
+    Build a balanced binary chunk tree bottom-up over sentence spans.
 
-        return parent_chunk, parent_start, parent_end
+    Adjacent nodes are paired level by level (an odd node out is carried up)
+    until a single root remains. Nodes are kept as (uuid, start, end) offsets;
+    their text is only sliced when the insert payload is prepared.
 
-    # Split into two halves and recursively build subtrees
-    mid = len(nodes) // 2
-    left_nodes = nodes[:mid]
-    right_nodes = nodes[mid:]
+    Args:
+        journal_uuid: UUID of the journal entry owning the tree
+        sentence_spans: Ordered (start, end) sentence offsets
+        result: SpanIndex populated with every chunk span
 
-    left_root = _build_balanced_tree(
-        left_nodes, text, all_chunks, relationships, result
-    )
-    right_root = _build_balanced_tree(
-        right_nodes, text, all_chunks, relationships, result
-    )
+    Returns:
+        Tuple of (chunk spans, relationships grouped by type)
+    """
+    contains: List[Dict] = []
+    sibling: List[Dict] = []
+    chunk_spans: List[Tuple[str, int, int]] = []
+
+    for start, end in sentence_spans:
+        chunk_spans.append((str(uuid4()), start, end))
+
+    level = list(chunk_spans)
+    while len(level) > 1:
+        next_level = []
+        for i in range(0, len(level) - 1, 2):
+            left_uuid, left_start, _ = level[i]
+            right_uuid, _, right_end = level[i + 1]
+            parent = (str(uuid4()), left_start, right_end)
+            chunk_spans.append(parent)
+            next_level.append(parent)
+
+            contains.append(
+                {"parent": parent[0], "child": left_uuid, "type": "CONTAINS"}
+            )
+            contains.append(
+                {"parent": parent[0], "child": right_uuid, "type": "CONTAINS"}
+            )
+            sibling.append(
+                {"parent": left_uuid, "child": right_uuid, "type": "NEXT_SIBLING"}
+            )
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
 
-    # Create parent for the two subtrees
-    left_chunk, left_start, left_end = left_root
-    right_chunk, right_start, right_end = right_root
-
-    parent_start = min(left_start, right_start)
-    parent_end = max(left_end, right_end)
-    parent_text = text[parent_start:parent_end]
-    parent_chunk = Chunk(text=parent_text)
-
-    all_chunks.append(parent_chunk)
-    result.add_span(parent_start, parent_end, parent_chunk.uuid)
-
-    # Create relationships
-    relationships.extend(
-        [
-            {"parent": parent_chunk.uuid, "child": left_chunk.uuid, "type": "CONTAINS"},
-            {
-                "parent": parent_chunk.uuid,
-                "child": right_chunk.uuid,
-                "type": "CONTAINS",
-            },
-            {
-                "parent": left_chunk.uuid,
-                "child": right_chunk.uuid,
-                "type": "NEXT_SIBLING",
-            },
-        ]
-    )
+    if level:
+        # Connect root to journal entry
+        contains.append(
+            {"parent": journal_uuid, "child": level[0][0], "type": "CONTAINS"}
+        )
+
+    # Index every chunk and give the journal entry direct access to it
+    has_chunk: List[Dict] = []
+    for chunk_uuid, start, end in chunk_spans:
+        result.add_span(start, end, chunk_uuid)
+        has_chunk.append(
+            {"parent": journal_uuid, "child": chunk_uuid, "type": "HAS_CHUNK"}
+        )
 
-    return parent_chunk, parent_start, parent_end
+    relationship_groups = {
+        "contains": contains,
+        "sibling": sibling,
+        "has_chunk": has_chunk,
+    }
+    return chunk_spans, relationship_groups
 
 
 async def _insert_chunks_and_relationships(
-    connection, chunks: List, relationships: List[Dict]
+    connection, chunk_data: List[Dict], relationship_groups: Dict[str, List[Dict]]
 ):
     """Insert chunks and their relationships into Neo4j database."""
-    # Prepare data and separate relationships by type
-    chunk_data = _prepare_chunk_data(chunks)
-    relationship_groups = _separate_relationships_by_type(relationships)
-
     # Log creation statistics
-    _log_creation_stats(chunks, relationship_groups)
+    _log_creation_stats(chunk_data, relationship_groups)
 
     # Execute database operations
     async with connection.session_async() as session:
@@ -224,27 +278,88 @@ async def _insert_chunks_and_relationships(
         await _create_relationships(session, relationship_groups)
 
 
-def _prepare_chunk_data(chunks: List) -> List[Dict]:
-    """Prepare chunk data for Cypher insertion."""
-    return [
-        {
-            "uuid": chunk.uuid,
-            "text": chunk.text,
-            "type": chunk.type,
-            "partition": chunk.partition,
-            "created_at": chunk.created_at.isoformat(),
+def _text_leaf_count(sentence_count: int) -> Optional[int]:
+    """Number of leading chunks that keep their text, per CHUNK_TEXT_MODE."""
+    mode = settings.CHUNK_TEXT_MODE
+    if mode == "leaves":
+        return sentence_count
+    if mode == "all":
+        return None
+    raise ValueError(f"Unknown chunk text mode: {mode!r}")
+
+
+def _prepare_chunk_data(
+    text: str,
+    chunk_spans: List[Tuple[str, int, int]],
+    created_at: Optional[datetime] = None,
+    leaf_count: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Prepare chunk data for Cypher insertion.
+
+    Every chunk carries its (start, end) offsets into the journal text. With
+    leaf_count set, only the first leaf_count chunks (the sentences, as
+    ordered by _build_balanced_tree) carry text; the rest are rebuilt from
+    their offsets by get_chunk_texts.
+    """
+    created_at_str = (created_at or datetime.now()).isoformat()
+    chunk_type = LexicalType.CHUNK.value
+    partition = PartitionType.LEXICAL.value
+    if leaf_count is None:
+        leaf_count = len(chunk_spans)
+    chunk_data = []
+    for i, (chunk_uuid, start, end) in enumerate(chunk_spans):
+        chunk = {
+            "uuid": chunk_uuid,
+            "start": start,
+            "end": end,
+            "type": chunk_type,
+            "partition": partition,
+            "created_at": created_at_str,
         }
-        for chunk in chunks
-    ]
+        if i < leaf_count:
+            chunk["text"] = text[start:end]
+        chunk_data.append(chunk)
+    return chunk_data
 
 
-def _separate_relationships_by_type(relationships: List[Dict]) -> Dict[str, List[Dict]]:
-    """Separate relationships by type for better organization."""
-    return {
-        "contains": [r for r in relationships if r["type"] == "CONTAINS"],
-        "sibling": [r for r in relationships if r["type"] == "NEXT_SIBLING"],
-        "has_chunk": [r for r in relationships if r["type"] == "HAS_CHUNK"],
-    }
+async def get_chunk_texts(
+    connection: Neo4jConnection, chunk_uuids: List[str]
+) -> Dict[str, str]:
+    """
+    Fetch chunk texts, slicing offset-only chunks out of their journal entry.
+
+    This is the only reader that handles CHUNK_TEXT_MODE="leaves"; reading
+    ``c.text`` directly returns null for internal chunks in that mode.
+
+    Args:
+        connection: Neo4jConnection
+        chunk_uuids: UUIDs of the chunks to read
+
+    Returns:
+        Dict mapping chunk UUID to its text (unknown UUIDs are omitted)
+    """
+    if not chunk_uuids:
+        return {}
+
+    query = """
+    MATCH (j:JournalEntry)-[:HAS_CHUNK]->(c:Chunk)
+    WHERE c.uuid IN $chunk_uuids
+    RETURN j.entry_text AS entry_text,
+           collect(c {.uuid, .text, .start, .end}) AS chunks
+    """
+    texts: Dict[str, str] = {}
+    async with connection.session_async() as session:
+        result = await session.run(query, chunk_uuids=list(chunk_uuids))
+        async for record in result:
+            entry_text = record["entry_text"] or ""
+            for chunk in record["chunks"]:
+                if chunk["text"] is not None:
+                    texts[chunk["uuid"]] = chunk["text"]
+                elif chunk["start"] is not None and chunk["end"] is not None:
+                    # Sliced here, not in Cypher, so offsets stay in code points
+                    texts[chunk["uuid"]] = entry_text[chunk["start"] : chunk["end"]]
+    return texts
 
 
 def _log_creation_stats(
@@ -265,6 +380,8 @@ async def _create_chunks(session, chunk_data: List[Dict]) -> None:
         CREATE (:Chunk {
             uuid: c.uuid,
             text: c.text,
+            start: c.start,
+            end: c.end,
             type: c.type,
             partition: c.partition,
             created_at: datetime(c.created_at)
@@ -272,7 +389,8 @@ async def _create_chunks(session, chunk_data: List[Dict]) -> None:
     """,
         chunks=chunk_data,
     )
-    print(f"Chunks created: {result.consume().counters.nodes_created}")
+    summary = await result.consume()
+    print(f"Chunks created: {summary.counters.nodes_created}")
 
 
 async def _create_relationships(
@@ -300,9 +418,8 @@ async def _create_contains_relationships(session, contains_rels: List[Dict]) ->
     """,
         contains_rels=contains_rels,
     )
-    print(
-        f"CONTAINS relationships created: {result.consume().counters.relationships_created}"
-    )
+    summary = await result.consume()
+    print(f"CONTAINS relationships created: {summary.counters.relationships_created}")
 
 
 async def _create_has_chunk_relationships(session, has_chunk_rels: List[Dict]) -> None:
@@ -321,9 +438,8 @@ async def _create_has_chunk_relationships(session, has_chunk_rels: List[Dict]) -
     """,
         has_chunk_rels=has_chunk_rels,
     )
-    print(
-        f"HAS_CHUNK relationships created: {result.consume().counters.relationships_created}"
-    )
+    summary = await result.consume()
+    print(f"HAS_CHUNK relationships created: {summary.counters.relationships_created}")
 
 
 async def _create_sibling_relationships(session, sibling_rels: List[Dict]) -> None:
@@ -342,6 +458,5 @@ async def _create_sibling_relationships(session, sibling_rels: List[Dict]) -> No
     """,
         sibling_rels=sibling_rels,
     )
-    print(
-        f"NEXT_SIBLING relationships created: {result.consume().counters.relationships_created}"
-    )
+    summary = await result.consume()
+    print(f"NEXT_SIBLING relationships created: {summary.counters.relationships_created}")
@@ -0,0 +1,226 @@
+"""
+Sentence Splitting for Minerva
+Splits journal text into sentence spans for the lexical tree.
+
+Two backends are available, selected with MINERVA_SENTENCE_SPLITTER:
+- "stanza": Stanza tokenizer pipelines, loaded once per process and shared
+  through a small thread-safe pool
+- "regex": a rule-based splitter with no model to load
+"""
+
+import asyncio
+import logging
+import queue
+import re
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from minerva_backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+Span = Tuple[int, int]
+
+
+class SentenceSplitter(ABC):
+    """Base class for sentence splitters returning (start, end) char spans."""
+
+    name = "base"
+
+    @abstractmethod
+    def split(self, text: str) -> List[Span]:
+        """Split text into sentence spans, in order."""
+        pass
+
+    async def split_async(self, text: str) -> List[Span]:
+        """Split text without blocking the event loop."""
+        return await asyncio.to_thread(self.split, text)
+
+    def warm_up(self) -> None:
+        """Load whatever the splitter needs before the first real call."""
+
+
+class StanzaSentenceSplitter(SentenceSplitter):
+    """
+    Sentence splitter backed by a pool of Stanza tokenize pipelines.
+    Pipelines are created lazily on first use and reused for the life of the
+    process; a pipeline is never used by two threads at once.
+    """
+
+    name = "stanza"
+
+    def __init__(
+        self,
+        lang: str = "es",
+        pool_size: int = 1,
+        pipeline_factory: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize the splitter.
+
+        Args:
+            lang: Stanza language code
+            pool_size: Maximum number of pipelines kept in memory
+            pipeline_factory: Builds one pipeline (defaults to Stanza tokenize)
+        """
+        self.lang = lang
+        self.pool_size = max(1, pool_size)
+        self._pipeline_factory = pipeline_factory or self._create_stanza_pipeline
+        self._pool: "queue.Queue[Any]" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Any) -> "StanzaSentenceSplitter":
+        """Wrap an existing pipeline (e.g. a test double)."""
+        return cls(pool_size=1, pipeline_factory=lambda: pipeline)
+
+    def _create_stanza_pipeline(self) -> Any:
+        import stanza
+
+        logger.info(f"Loading Stanza tokenize pipeline ({self.lang})")
+        return stanza.Pipeline(
+            lang=self.lang, processors="tokenize", download_method=None
+        )
+
+    @contextmanager
+    def _acquire(self) -> Iterator[Any]:
+        try:
+            pipeline = self._pool.get_nowait()
+        except queue.Empty:
+            pipeline = None
+            with self._lock:
+                if self._created < self.pool_size:
+                    self._created += 1
+                    create = True
+                else:
+                    create = False
+            if create:
+                try:
+                    pipeline = self._pipeline_factory()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                pipeline = self._pool.get()
+        try:
+            yield pipeline
+        finally:
+            self._pool.put(pipeline)
+
+    def split(self, text: str) -> List[Span]:
+        with self._acquire() as nlp:
+            doc = nlp(text)
+        return [
+            (int(sent.tokens[0].start_char), int(sent.tokens[-1].end_char))
+            for sent in doc.sentences
+            if sent.tokens
+        ]
+
+    def warm_up(self) -> None:
+        with self._acquire():
+            pass
+
+
+# Abbreviations that end in a period without ending the sentence
+SPANISH_ABBREVIATIONS = frozenset(
+    {
+        "sr", "sra", "srta", "sres", "dr", "dra", "lic", "ing", "prof", "arq",
+        "ud", "uds", "vd", "vds", "etc", "pág", "págs", "pp", "cap", "núm",
+        "nro", "tel", "aprox", "av", "avda", "gral", "cía", "ej", "vs", "fig",
+        "vol", "hs", "aa", "ee", "uu",
+    }
+)
+
+
+class RegexSentenceSplitter(SentenceSplitter):
+    """
+    Rule-based sentence splitter for Spanish journal text.
+    Breaks after . ! ? … (plus closing quotes/brackets) when followed by
+    whitespace, and at line breaks; skips common abbreviations, initials
+    and decimal numbers.
+    """
+
+    name = "regex"
+
+    _BOUNDARY = re.compile(r"[.!?…]+[\"'”’»)\]]*(?=\s)|\n+")
+    _WORD_BEFORE = re.compile(r"(\w+)\.$")
+
+    def split(self, text: str) -> List[Span]:
+        spans: List[Span] = []
+        start = 0
+        for match in self._BOUNDARY.finditer(text):
+            end = match.end()
+            if match.group().startswith(".") and self._is_abbreviation(
+                text, match.start()
+            ):
+                continue
+            self._append(spans, text, start, end)
+            start = end
+        self._append(spans, text, start, len(text))
+        return spans
+
+    def _is_abbreviation(self, text: str, period_index: int) -> bool:
+        word = self._WORD_BEFORE.search(
+            text, max(0, period_index - 20), period_index + 1
+        )
+        if not word:
+            return False
+        token = word.group(1)
+        # Initials ("J. Pérez"), decimals ("3.5" never matches: no trailing
+        # whitespace) and known abbreviations
+        return (len(token) == 1 and token.isalpha()) or (
+            token.lower() in SPANISH_ABBREVIATIONS
+        )
+
+    @staticmethod
+    def _append(spans: List[Span], text: str, start: int, end: int) -> None:
+        # Trim surrounding whitespace so spans match the visible sentence
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            spans.append((start, end))
+
+
+_splitter: Optional[SentenceSplitter] = None
+_splitter_lock = threading.Lock()
+
+
+def create_sentence_splitter(backend: str) -> SentenceSplitter:
+    """
+    Build a splitter for a backend name.
+
+    Args:
+        backend: "stanza" or "regex"
+
+    Returns:
+        SentenceSplitter instance
+    """
+    if backend == "stanza":
+        return StanzaSentenceSplitter(pool_size=settings.STANZA_POOL_SIZE)
+    if backend == "regex":
+        return RegexSentenceSplitter()
+    raise ValueError(f"Unknown sentence splitter backend: {backend!r}")
+
+
+def get_sentence_splitter() -> SentenceSplitter:
+    """Process-wide splitter for the configured backend, created lazily."""
+    global _splitter
+    if _splitter is None:
+        with _splitter_lock:
+            if _splitter is None:
+                _splitter = create_sentence_splitter(settings.SENTENCE_SPLITTER)
+    return _splitter
+
+
+async def warm_up_sentence_splitter() -> SentenceSplitter:
+    """Load the configured splitter ahead of the first journal write."""
+    splitter = get_sentence_splitter()
+    await asyncio.to_thread(splitter.warm_up)
+    logger.info(f"Sentence splitter ready ({splitter.name})")
+    return splitter
@@ -1,19 +1,33 @@
 """Temporal workflow for concept extraction from content quotes, with human curation."""
 
-import asyncio
 import os
 import time
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import uuid4
 
 from temporalio import activity, workflow
 from temporalio.common import RetryPolicy
 
+from minerva_backend.processing.curation_signals import (
+    CURATION_ACTIVITY_TIMEOUT,
+    CURATION_COMPLETE,
+    wait_for_curation,
+)
+
+if TYPE_CHECKING:
+    from minerva_backend.containers import Container
+
 
 class ConceptExtractionActivities:
+    """Concept extraction activities, bound to the worker's Container."""
+
+    def __init__(self, container: "Container"):
+        self.container = container
+
     @activity.defn
     async def emit_notification(
+        self,
         workflow_id: str,
         workflow_type: str,
         notification_type: str,
@@ -22,10 +36,7 @@ class ConceptExtractionActivities:
         payload: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Write a notification to the curation DB (for UI display)."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        await container.curation_manager().create_notification(
+        await self.container.curation_manager().create_notification(
             workflow_id=workflow_id,
             workflow_type=workflow_type,
             notification_type=notification_type,
@@ -35,13 +46,10 @@ class ConceptExtractionActivities:
         )
 
     @activity.defn
-    async def load_content_and_quotes(content_uuid: str) -> Dict[str, Any]:
+    async def load_content_and_quotes(self, content_uuid: str) -> Dict[str, Any]:
         """Fetch Content and Quote nodes from Neo4j for the given content."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        content_repo = container.content_repository()
-        quote_repo = container.quote_repository()
+        content_repo = self.container.content_repository()
+        quote_repo = self.container.quote_repository()
         content = await content_repo.find_by_uuid(content_uuid)
         if not content:
             raise ValueError(f"Content not found: {content_uuid}")
@@ -57,7 +65,7 @@ class ConceptExtractionActivities:
 
     @activity.defn
     async def extract_candidate_concepts(
-        content_uuid: str, quotes: List[Dict], user_suggestions: str | None
+        self, content_uuid: str, quotes: List[Dict], user_suggestions: str | None
     ) -> List[Dict[str, Any]]:
         """LLM: Extract candidate concepts from quotes. Stub: one placeholder concept."""
         from langchain.chat_models import init_chat_model
@@ -110,7 +118,7 @@ class ConceptExtractionActivities:
 
     @activity.defn
     async def detect_duplicates(
-        candidates: List[Dict], content_uuid: str
+        self, candidates: List[Dict], content_uuid: str
     ) -> Dict[str, Any]:
         """Stub: return novel_concepts = candidates, existing_with_new_quotes = []."""
         return {
@@ -120,37 +128,35 @@ class ConceptExtractionActivities:
 
     @activity.defn
     async def discover_relations(
-        novel_concepts: List[Dict], content_uuid: str
+        self, novel_concepts: List[Dict], content_uuid: str
     ) -> List[Dict[str, Any]]:
         """Stub: return empty relations."""
         return []
 
     @activity.defn
     async def self_critique(
-        concepts: List[Dict], relations: List[Dict]
+        self, concepts: List[Dict], relations: List[Dict]
     ) -> Dict[str, Any]:
         """Stub: return passes=True."""
         return {"passes": True, "issues": []}
 
     @activity.defn
     async def refine_extraction(
-        concepts: List[Dict], relations: List[Dict], issues: List[str]
+        self, concepts: List[Dict], relations: List[Dict], issues: List[str]
     ) -> Dict[str, Any]:
         """Stub: return same concepts and relations."""
         return {"concepts": concepts, "relations": relations}
 
     @activity.defn
     async def submit_concept_curation(
+        self,
         workflow_id: str,
         content_uuid: str,
         concepts: List[Dict],
         relations: List[Dict],
     ) -> None:
         """Write concepts and relations to curation DB."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        await container.curation_manager().create_concept_workflow(
+        await self.container.curation_manager().create_concept_workflow(
             workflow_id, content_uuid
         )
         concept_items = [
@@ -160,7 +166,7 @@ class ConceptExtractionActivities:
             }
             for c in concepts
         ]
-        await container.curation_manager().queue_concept_curation_items(
+        await self.container.curation_manager().queue_concept_curation_items(
             workflow_id, concept_items
         )
         rel_items = [
@@ -170,10 +176,10 @@ class ConceptExtractionActivities:
             }
             for r in relations
         ]
-        await container.curation_manager().queue_concept_relation_curation_items(
+        await self.container.curation_manager().queue_concept_relation_curation_items(
             workflow_id, rel_items
         )
-        await container.curation_manager().create_notification(
+        await self.container.curation_manager().create_notification(
             workflow_id=workflow_id,
             workflow_type="concept_extraction",
             notification_type="curation_pending",
@@ -183,42 +189,40 @@ class ConceptExtractionActivities:
         )
 
     @activity.defn
-    async def wait_for_concept_curation(
-        workflow_id: str
-    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-        """Poll until all items approved/rejected; return (approved_concepts, approved_relations)."""
-        from minerva_backend.containers import Container
+    async def get_concept_pending_count(self, workflow_id: str) -> int:
+        """Concepts and relations still awaited (0 once completed), checked without a signal."""
+        curation_manager = self.container.curation_manager()
+        # Completed early from the API: the remaining items are not waited for
+        if await curation_manager.is_concept_workflow_completed(workflow_id):
+            return 0
+        return await curation_manager.get_concept_pending_count(workflow_id)
 
-        container = Container()
-        while True:
-            pending = await container.curation_manager().get_concept_pending_count(
-                workflow_id
-            )
-            if pending == 0:
-                concepts = await container.curation_manager().get_approved_concept_items(
-                    workflow_id
-                )
-                relations = await container.curation_manager().get_approved_concept_relation_items(
-                    workflow_id
-                )
-                return (concepts, relations)
-            activity.heartbeat()
-            await asyncio.sleep(30)
+    @activity.defn
+    async def get_approved_concepts(
+        self, workflow_id: str
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Return (approved_concepts, approved_relations) once curation is complete."""
+        concepts = await self.container.curation_manager().get_approved_concept_items(
+            workflow_id
+        )
+        relations = await self.container.curation_manager().get_approved_concept_relation_items(
+            workflow_id
+        )
+        return (concepts, relations)
 
     @activity.defn
     async def write_concepts_to_graph(
+        self,
         workflow_id: str,
         content_uuid: str,
         approved_concepts: List[Dict],
         approved_relations: List[Dict],
     ) -> List[str]:
         """Create Concept nodes, SUPPORTS (Quote->Concept), and concept relations in Neo4j."""
-        from minerva_backend.containers import Container
         from minerva_models import Concept
 
-        container = Container()
-        concept_repo = container.concept_repository()
-        connection = container.db_connection()
+        concept_repo = self.container.concept_repository()
+        connection = self.container.db_connection()
         concept_uuids = []
         for c in approved_concepts:
             title = c.get("title", "Sin título")
@@ -266,6 +270,7 @@ class ConceptExtractionActivities:
 
     @activity.defn
     async def create_obsidian_files(
+        self,
         content_uuid: str,
         approved_concepts: List[Dict],
         concept_uuids: List[str],
@@ -276,7 +281,7 @@ class ConceptExtractionActivities:
         )
 
     @activity.defn
-    async def mark_content_processed(content_uuid: str) -> None:
+    async def mark_content_processed(self, content_uuid: str) -> None:
         """Stub: Mark content as processed (update Content node if field exists)."""
         activity.logger.info(f"mark_content_processed stub: {content_uuid}")
 
@@ -285,10 +290,27 @@ class ConceptExtractionActivities:
 class ConceptExtractionWorkflow:
     """Extract concepts from content quotes and write to Neo4j after human curation."""
 
+    def __init__(self):
+        self.curation_complete = False
+
+    @workflow.signal(name=CURATION_COMPLETE)
+    def complete_curation(self) -> None:
+        """Sent by the curation API once every concept and relation has been reviewed."""
+        self.curation_complete = True
+
+    async def _no_concepts_pending(self, workflow_id: str) -> bool:
+        pending = await workflow.execute_activity_method(
+            ConceptExtractionActivities.get_concept_pending_count,
+            args=[workflow_id],
+            start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
+        )
+        return pending == 0
+
     @workflow.run
     async def run(self, content_uuid: str) -> Dict[str, Any]:
-        workflow_id = f"concept-{content_uuid}"
-        await workflow.execute_activity(
+        # Curation rows are keyed by the Temporal id so the API can signal back
+        workflow_id = workflow.info().workflow_id
+        await workflow.execute_activity_method(
             ConceptExtractionActivities.emit_notification,
             args=[
                 workflow_id,
@@ -307,7 +329,7 @@ class ConceptExtractionWorkflow:
             maximum_interval=timedelta(minutes=2),
         )
 
-        data = await workflow.execute_activity(
+        data = await workflow.execute_activity_method(
             ConceptExtractionActivities.load_content_and_quotes,
             args=[content_uuid],
             start_to_close_timeout=timedelta(minutes=5),
@@ -320,30 +342,30 @@ class ConceptExtractionWorkflow:
                 "message": "No quotes for this content",
             }
 
-        concepts = await workflow.execute_activity(
+        concepts = await workflow.execute_activity_method(
             ConceptExtractionActivities.extract_candidate_concepts,
             args=[content_uuid, quotes, None],
             start_to_close_timeout=timedelta(minutes=10),
             retry_policy=llm_retry,
         )
-        dup_result = await workflow.execute_activity(
+        dup_result = await workflow.execute_activity_method(
             ConceptExtractionActivities.detect_duplicates,
             args=[concepts, content_uuid],
             start_to_close_timeout=timedelta(minutes=5),
         )
         novel = dup_result["novel_concepts"]
-        relations = await workflow.execute_activity(
+        relations = await workflow.execute_activity_method(
             ConceptExtractionActivities.discover_relations,
             args=[novel, content_uuid],
             start_to_close_timeout=timedelta(minutes=5),
         )
-        critique = await workflow.execute_activity(
+        critique = await workflow.execute_activity_method(
             ConceptExtractionActivities.self_critique,
             args=[novel, relations],
             start_to_close_timeout=timedelta(minutes=3),
         )
         if not critique.get("passes"):
-            refined = await workflow.execute_activity(
+            refined = await workflow.execute_activity_method(
                 ConceptExtractionActivities.refine_extraction,
                 args=[novel, relations, critique.get("issues", [])],
                 start_to_close_timeout=timedelta(minutes=5),
@@ -352,30 +374,37 @@ class ConceptExtractionWorkflow:
             novel = refined.get("concepts", novel)
             relations = refined.get("relations", relations)
 
-        await workflow.execute_activity(
+        await workflow.execute_activity_method(
             ConceptExtractionActivities.submit_concept_curation,
             args=[workflow_id, content_uuid, novel, relations],
             start_to_close_timeout=timedelta(minutes=2),
         )
-        approved_concepts, approved_relations = await workflow.execute_activity(
-            ConceptExtractionActivities.wait_for_concept_curation,
-            args=[workflow_id],
-            schedule_to_close_timeout=timedelta(days=7),
-            heartbeat_timeout=timedelta(minutes=2),
-        )
+        approved_concepts: List[Dict[str, Any]] = []
+        approved_relations: List[Dict[str, Any]] = []
+        if novel or relations:
+            await wait_for_curation(
+                lambda: self.curation_complete,
+                lambda: self._no_concepts_pending(workflow_id),
+                "Concept",
+            )
+            approved_concepts, approved_relations = await workflow.execute_activity_method(
+                ConceptExtractionActivities.get_approved_concepts,
+                args=[workflow_id],
+                start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
+            )
 
         if approved_concepts:
-            concept_uuids = await workflow.execute_activity(
+            concept_uuids = await workflow.execute_activity_method(
                 ConceptExtractionActivities.write_concepts_to_graph,
                 args=[workflow_id, content_uuid, approved_concepts, approved_relations],
                 start_to_close_timeout=timedelta(minutes=10),
             )
-            await workflow.execute_activity(
+            await workflow.execute_activity_method(
                 ConceptExtractionActivities.create_obsidian_files,
                 args=[content_uuid, approved_concepts, concept_uuids],
                 start_to_close_timeout=timedelta(minutes=5),
             )
-            await workflow.execute_activity(
+            await workflow.execute_activity_method(
                 ConceptExtractionActivities.mark_content_processed,
                 args=[content_uuid],
                 start_to_close_timeout=timedelta(minutes=1),
@@ -0,0 +1,199 @@
+"""
+Curation Archive for Minerva
+Moves completed journals and quote/concept workflows, with all their item
+rows, out of the curation DB into an archive SQLite file, and compacts
+the curation DB afterwards.
+
+Archive tables are created from the live tables' own CREATE statements, so
+they keep the same columns and primary keys. Each batch is copied and
+committed first, then deleted from the curation DB in a second
+transaction. WAL mode does not make transactions atomic across attached
+databases; with this order an interrupted run at worst leaves rows in
+both files, and the next run copies them again (INSERT OR IGNORE) and
+deletes them.
+
+Archived rows stay counted: curation_stats is restored after the deletes
+in the same transaction, so the delete triggers do not erase history.
+"""
+
+import logging
+import re
+from typing import Dict, List, Set, Tuple
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SCHEMA = "archive"
+
+# Journals or workflows archived per transaction, so other writers get turns
+ARCHIVE_BATCH = 200
+
+# Completed parents older than the cutoff, by parent kind
+ARCHIVABLE_QUERIES = {
+    "journals": """
+        SELECT uuid FROM journal_curation
+        WHERE overall_status = 'COMPLETED'
+            AND COALESCE(completed_at, created_at) < ?
+        LIMIT ?
+    """,
+    "quote_workflows": """
+        SELECT workflow_id FROM quote_workflow_curation
+        WHERE overall_status = 'COMPLETED' AND created_at < ?
+        LIMIT ?
+    """,
+    "concept_workflows": """
+        SELECT workflow_id FROM concept_workflow_curation
+        WHERE overall_status = 'COMPLETED' AND created_at < ?
+        LIMIT ?
+    """,
+}
+
+# (table, parent key column) per parent kind, children first
+ARCHIVED_TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "journals": [
+        ("span_curation_items", "journal_id"),
+        ("relationship_context_items", "journal_id"),
+        ("relationship_curation_items", "journal_id"),
+        ("entity_curation_items", "journal_id"),
+        ("journal_curation", "uuid"),
+    ],
+    "quote_workflows": [
+        ("quote_curation_items", "workflow_id"),
+        ("quote_workflow_curation", "workflow_id"),
+    ],
+    "concept_workflows": [
+        ("concept_relation_curation_items", "workflow_id"),
+        ("concept_curation_items", "workflow_id"),
+        ("concept_workflow_curation", "workflow_id"),
+    ],
+}
+
+# Pages returned to the filesystem per compaction (4 KiB each by default)
+VACUUM_PAGES = 4096
+# Rows sampled per index by PRAGMA optimize's ANALYZE
+ANALYSIS_LIMIT = 400
+
+
+async def _columns(
+    db: aiosqlite.Connection, table: str, schema: str = "main"
+) -> List[Tuple[str, str]]:
+    """(name, declared type) of each column of `table`"""
+    rows = await db.execute_fetchall(f"PRAGMA {schema}.table_info({table})")
+    return [(row[1], row[2]) for row in rows]
+
+
+async def _ensure_archive_table(db: aiosqlite.Connection, table: str) -> List[str]:
+    """Create or extend the archive copy of `table`; returns the shared columns"""
+    [(create_sql,)] = await db.execute_fetchall(
+        "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?",
+        (table,),
+    )
+    # Tables rebuilt by a migration keep their name quoted after the rename
+    await db.execute(
+        re.sub(
+            rf'^CREATE TABLE\s+"?{table}"?',
+            f"CREATE TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.{table}",
+            create_sql,
+            count=1,
+        )
+    )
+    archived: Set[str] = {name for name, _ in await _columns(db, table, ARCHIVE_SCHEMA)}
+    columns = await _columns(db, table)
+    for name, column_type in columns:
+        if name not in archived:
+            # Added to the live table after the archive was created
+            await db.execute(
+                f"ALTER TABLE {ARCHIVE_SCHEMA}.{table} ADD COLUMN {name} {column_type}"
+            )
+    return [name for name, _ in columns]
+
+
+async def archive_batch(
+    db: aiosqlite.Connection, kind: str, cutoff: str
+) -> Tuple[int, int]:
+    """
+    Move up to ARCHIVE_BATCH completed parents of `kind` (and their rows)
+    to the attached archive.
+
+    Returns:
+        (parents archived, rows moved)
+    """
+    parents = [
+        row[0]
+        for row in await db.execute_fetchall(
+            ARCHIVABLE_QUERIES[kind], (cutoff, ARCHIVE_BATCH)
+        )
+    ]
+    if not parents:
+        return 0, 0
+
+    await db.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS archive_keys (key TEXT PRIMARY KEY)"
+    )
+    await db.execute("DELETE FROM temp.archive_keys")
+    await db.executemany(
+        "INSERT INTO temp.archive_keys (key) VALUES (?)", [(p,) for p in parents]
+    )
+    for table, key in ARCHIVED_TABLES[kind]:
+        columns = ", ".join(await _ensure_archive_table(db, table))
+        await db.execute(
+            f"""
+            INSERT OR IGNORE INTO {ARCHIVE_SCHEMA}.{table} ({columns})
+            SELECT {columns} FROM main.{table}
+            WHERE {key} IN (SELECT key FROM temp.archive_keys)
+        """
+        )
+    await db.commit()
+
+    # The write lock is held from the snapshot to the restore, so the only
+    # stats changes in between are the delete triggers of this batch
+    await db.execute("BEGIN IMMEDIATE")
+    await db.execute("DROP TABLE IF EXISTS temp.stats_snapshot")
+    await db.execute("CREATE TEMP TABLE stats_snapshot AS SELECT * FROM curation_stats")
+    moved = 0
+    for table, key in ARCHIVED_TABLES[kind]:
+        cursor = await db.execute(
+            f"""
+            DELETE FROM main.{table}
+            WHERE {key} IN (SELECT key FROM temp.archive_keys)
+        """
+        )
+        moved += cursor.rowcount
+    await db.execute("DELETE FROM main.curation_stats")
+    await db.execute(
+        "INSERT INTO main.curation_stats SELECT * FROM temp.stats_snapshot"
+    )
+    await db.execute("DROP TABLE temp.stats_snapshot")
+    await db.execute("DELETE FROM temp.archive_keys")
+    await db.commit()
+    return len(parents), moved
+
+
+async def compact(db: aiosqlite.Connection, vacuum_pages: int = VACUUM_PAGES) -> int:
+    """
+    Return free pages to the filesystem and refresh planner statistics.
+
+    The first run switches the database to incremental auto-vacuum, which
+    takes one full VACUUM; later runs free at most `vacuum_pages` pages.
+
+    Returns:
+        Pages freed
+    """
+    if db.in_transaction:
+        await db.commit()
+    free_before = (await db.execute_fetchall("PRAGMA freelist_count"))[0][0]
+    if (await db.execute_fetchall("PRAGMA auto_vacuum"))[0][0] != 2:
+        logger.info("Switching curation DB to incremental auto-vacuum (full VACUUM)")
+        await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        await db.execute("VACUUM")
+    else:
+        # executescript steps the pragma to completion, one page per step
+        await db.executescript(f"PRAGMA incremental_vacuum({int(vacuum_pages)})")
+    free_after = (await db.execute_fetchall("PRAGMA freelist_count"))[0][0]
+
+    # ANALYZE only the tables whose statistics are stale, on a sample
+    await db.execute_fetchall(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+    await db.execute_fetchall("PRAGMA optimize")
+    await db.execute_fetchall("PRAGMA wal_checkpoint(TRUNCATE)")
+    return free_before - free_after
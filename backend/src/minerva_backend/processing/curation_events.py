@@ -0,0 +1,246 @@
+"""
+Curation Events for Minerva
+Push channel for curation changes: items queued, items reviewed, stages
+completed and notifications, streamed to dashboards instead of polling.
+
+CurationManager appends an event row in the same transaction as each write,
+so events from the Temporal worker process reach the API too. One broker per
+API process tails the curation_events table (woken at once by local writes,
+every poll interval otherwise) and fans events out to subscribers, each with
+its own filter and a bounded queue. A subscriber that falls behind gets its
+queue dropped and a resync marker: the client reloads through the REST
+endpoints and carries on with live events.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, FrozenSet, Optional, Set
+
+from minerva_backend.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from minerva_backend.processing.curation_manager import CurationManager
+
+logger = get_logger("minerva_backend.processing.curation_events")
+
+# Event kinds
+ITEMS_QUEUED = "items_queued"
+ITEM_REVIEWED = "item_reviewed"
+STAGE_COMPLETED = "stage_completed"
+NOTIFICATION_CREATED = "notification_created"
+NOTIFICATION_UPDATED = "notification_updated"
+EVENT_KINDS = frozenset(
+    {
+        ITEMS_QUEUED,
+        ITEM_REVIEWED,
+        STAGE_COMPLETED,
+        NOTIFICATION_CREATED,
+        NOTIFICATION_UPDATED,
+    }
+)
+
+# Events are kept this long for clients resuming with Last-Event-ID
+EVENT_RETENTION = timedelta(days=1)
+PRUNE_INTERVAL = timedelta(hours=1)
+# Rows read from curation_events per poll
+FETCH_BATCH = 500
+
+
+@dataclass(frozen=True)
+class CurationEvent:
+    """A change to the curation DB, as stored in curation_events."""
+
+    id: int
+    kind: str
+    stage: Optional[str] = None
+    workflow_id: Optional[str] = None
+    journal_id: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    created_at: Optional[str] = None
+
+    def to_sse(self) -> str:
+        """Server-Sent Events frame; the id lets clients resume."""
+        payload = {
+            "stage": self.stage,
+            "workflow_id": self.workflow_id,
+            "journal_id": self.journal_id,
+            "data": self.data,
+            "created_at": self.created_at,
+        }
+        return f"id: {self.id}\nevent: {self.kind}\ndata: {json.dumps(payload)}\n\n"
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Events a subscriber wants; None matches anything."""
+
+    kinds: Optional[FrozenSet[str]] = None
+    stages: Optional[FrozenSet[str]] = None
+    workflow_id: Optional[str] = None
+    journal_id: Optional[str] = None
+
+    def matches(self, event: CurationEvent) -> bool:
+        return (
+            (self.kinds is None or event.kind in self.kinds)
+            and (self.stages is None or event.stage in self.stages)
+            and (self.workflow_id is None or event.workflow_id == self.workflow_id)
+            and (self.journal_id is None or event.journal_id == self.journal_id)
+        )
+
+
+class Subscription:
+    """Bounded queue of the events matching one client's filter."""
+
+    def __init__(self, event_filter: EventFilter, queue_size: int):
+        self.event_filter = event_filter
+        # One extra slot for the wake-up sentinel after an overflow
+        self._queue: "asyncio.Queue[Optional[CurationEvent]]" = asyncio.Queue(
+            queue_size + 1
+        )
+        self._queue_size = queue_size
+        self._resync = False
+        self.closed = False
+
+    def offer(self, event: CurationEvent) -> None:
+        """Queue `event` if it matches; on overflow drop the backlog and resync."""
+        if not self.event_filter.matches(event):
+            return
+        if self._queue.qsize() >= self._queue_size:
+            self.request_resync()
+            return
+        self._queue.put_nowait(event)
+
+    def request_resync(self) -> None:
+        """Discard queued events; the client must reload its state."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._resync = True
+        self._queue.put_nowait(None)
+
+    def close(self) -> None:
+        """End the subscription; the stream stops after its next event."""
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    def take_resync(self) -> bool:
+        """True once after the queue overflowed."""
+        resync, self._resync = self._resync, False
+        return resync
+
+    async def next(self, timeout: float) -> Optional[CurationEvent]:
+        """Next event, or None on timeout or after a resync."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class CurationEventBroker:
+    """Tails curation_events and fans events out to subscribers."""
+
+    def __init__(
+        self,
+        curation_manager: "CurationManager",
+        poll_interval_ms: int = 500,
+        queue_size: int = 100,
+    ):
+        self.curation_manager = curation_manager
+        self.poll_interval = poll_interval_ms / 1000
+        self.queue_size = queue_size
+        self._subscriptions: Set[Subscription] = set()
+        self._last_id = 0
+        self._wake = asyncio.Event()
+        # Held while fetching and dispatching, so resumes see no gap
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._next_prune = datetime.utcnow()
+
+    async def start(self) -> None:
+        """Start tailing events written from now on."""
+        async with self._lock:
+            if self._task is not None:
+                return
+            _, self._last_id = await self.curation_manager.get_event_id_range()
+            self.curation_manager.add_write_listener(self._wake.set)
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop tailing and end every open subscription."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for subscription in self._subscriptions:
+            subscription.close()
+        self._subscriptions.clear()
+
+    @asynccontextmanager
+    async def subscribe(
+        self, event_filter: EventFilter, last_event_id: Optional[int] = None
+    ) -> AsyncIterator[Subscription]:
+        """
+        Receive events matching `event_filter` while the context is open.
+
+        Args:
+            event_filter: Events to deliver
+            last_event_id: Replay retained events after this id first
+        """
+        await self.start()
+        subscription = Subscription(event_filter, self.queue_size)
+        async with self._lock:
+            if last_event_id is not None and last_event_id < self._last_id:
+                await self._replay(subscription, last_event_id)
+            self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+    async def _replay(self, subscription: Subscription, after: int) -> None:
+        first_id, _ = await self.curation_manager.get_event_id_range()
+        if not first_id or first_id > after + 1:
+            # Some of the missed events were pruned
+            subscription.request_resync()
+            return
+        events = await self.curation_manager.get_curation_events(
+            after, limit=self._last_id - after, until=self._last_id
+        )
+        for event in events:
+            subscription.offer(event)
+
+    async def _run(self) -> None:
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            self._wake.clear()
+            try:
+                await self._dispatch()
+                if datetime.utcnow() >= self._next_prune:
+                    self._next_prune = datetime.utcnow() + PRUNE_INTERVAL
+                    await self.curation_manager.prune_curation_events(
+                        datetime.utcnow() - EVENT_RETENTION
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to read curation events: {e}")
+
+    async def _dispatch(self) -> None:
+        async with self._lock:
+            while True:
+                events = await self.curation_manager.get_curation_events(
+                    self._last_id, limit=FETCH_BATCH
+                )
+                for event in events:
+                    for subscription in self._subscriptions:
+                        subscription.offer(event)
+                if events:
+                    self._last_id = events[-1].id
+                if len(events) < FETCH_BATCH:
+                    return
@@ -1,11 +1,13 @@
+import base64
+import binascii
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from uuid import uuid4
 
-import aiosqlite
-
 from minerva_models import (
+    LexicalType,
+    PartitionType,
     Span,
     Concept,
     Consumable,
@@ -20,6 +22,16 @@ from minerva_models import (
     Project,
 )
 from minerva_models import Relation
+from minerva_backend.processing import curation_archive
+from minerva_backend.processing.curation_events import (
+    ITEM_REVIEWED,
+    ITEMS_QUEUED,
+    NOTIFICATION_CREATED,
+    NOTIFICATION_UPDATED,
+    STAGE_COMPLETED,
+    CurationEvent,
+)
+from minerva_backend.processing.curation_migrations import migrate
 from minerva_backend.processing.models import (
     CuratableMapping,
     CurationEntityStats,
@@ -27,8 +39,10 @@ from minerva_backend.processing.models import (
     CurationStats,
     CurationTask,
     EntityMapping,
+    JournalCurationSummary,
     JournalEntryCuration,
 )
+from minerva_backend.processing.sqlite_pool import SQLitePool
 from minerva_backend.prompt.extract_relationships import RelationshipContext
 
 ENTITY_TYPE_MAP = {
@@ -45,16 +59,167 @@ ENTITY_TYPE_MAP = {
 }
 
 
+# Bound parameters per IN (...) list; SQLite builds before 3.32 allow 999
+SQLITE_MAX_VARIABLES = 900
+
+
+async def _select_in(db, query: str, values: Sequence[Any]) -> List[Tuple]:
+    """
+    Run a SELECT whose `{placeholders}` is an IN list over `values`, in
+    chunks small enough for SQLite's bound-parameter limit.
+    """
+    rows: List[Tuple] = []
+    for start in range(0, len(values), SQLITE_MAX_VARIABLES):
+        chunk = tuple(values[start : start + SQLITE_MAX_VARIABLES])
+        async with db.execute(
+            query.format(placeholders=",".join("?" * len(chunk))), chunk
+        ) as cursor:
+            rows.extend(await cursor.fetchall())
+    return rows
+
+
+# Tables whose writes bump the curation version, with their journal uuid column
+CHANGE_TRACKED_TABLES = {
+    "journal_curation": "uuid",
+    "entity_curation_items": "journal_id",
+    "relationship_curation_items": "journal_id",
+}
+
+TRIGGER_EVENTS = (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD"))
+
+# Tables counted in curation_stats: (scope, status column, seconds to curate)
+STATS_TRACKED_TABLES = {
+    "journal_curation": (
+        "journal",
+        "overall_status",
+        "(julianday({row}.completed_at) - julianday({row}.created_at)) * 86400",
+    ),
+    "entity_curation_items": ("entity", "status", None),
+    "relationship_curation_items": ("relationship", "status", None),
+}
+
+# Item table, type column and event stage of each bulk curation phase
+BULK_PHASES = {
+    "entity": ("entity_curation_items", "entity_type", "entities"),
+    "relationship": (
+        "relationship_curation_items",
+        "relationship_type",
+        "relationships",
+    ),
+}
+
+# Hours since the oldest pending journal was queued; one index seek per status
+OLDEST_PENDING_AGE_QUERY = """
+    SELECT (julianday('now') - julianday(MIN(oldest))) * 24 FROM (
+        SELECT MIN(created_at) AS oldest FROM journal_curation
+        WHERE overall_status = 'PENDING_ENTITIES'
+        UNION ALL
+        SELECT MIN(created_at) FROM journal_curation
+        WHERE overall_status = 'ENTITIES_DONE'
+        UNION ALL
+        SELECT MIN(created_at) FROM journal_curation
+        WHERE overall_status = 'PENDING_RELATIONS'
+    )
+"""
+
+
+def _stats_delta(table: str, row: str, sign: str) -> str:
+    """Trigger statement adding (sign +) or removing (sign -) `row` in curation_stats"""
+    scope, status, seconds = STATS_TRACKED_TABLES[table]
+    timed_sql, seconds_sql = "0", "0"
+    if seconds:
+        timed_sql = f"({seconds.format(row=row)} IS NOT NULL)"
+        seconds_sql = f"COALESCE({seconds.format(row=row)}, 0)"
+    return f"""
+        INSERT INTO curation_stats (scope, status, count, timed, curate_seconds)
+        VALUES (
+            '{scope}', {row}.{status}, {sign}1, {sign}{timed_sql}, {sign}{seconds_sql}
+        )
+        ON CONFLICT (scope, status) DO UPDATE SET
+            count = count + excluded.count,
+            timed = timed + excluded.timed,
+            curate_seconds = curate_seconds + excluded.curate_seconds;
+    """
+
+
+# Pending journals, newest first; (created_at, id) is the pagination key
+PENDING_JOURNALS_QUERY = """
+    SELECT id, uuid, journal_text, created_at, overall_status FROM journal_curation
+    WHERE overall_status != 'COMPLETED' {where}
+    ORDER BY created_at DESC, id DESC
+"""
+
+
+def _encode_cursor(created_at: str, row_id: int) -> str:
+    """Opaque pagination cursor pointing after a journal_curation row"""
+    return base64.urlsafe_b64encode(f"{created_at}|{row_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, int]:
+    """(created_at, id) from a cursor returned by get_pending_curation_page"""
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, row_id = decoded.split("|")
+        return created_at, int(row_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Invalid pagination cursor: {cursor}")
+
+
+def _span_row(
+    span: Span, journal_uuid: str, owner_uuid: str
+) -> Tuple[str, str, str, int, int, str, str]:
+    """span_curation_items row for a span of an entity or relationship"""
+    return (
+        str(span.uuid),
+        journal_uuid,
+        owner_uuid,
+        span.start,
+        span.end,
+        span.text,
+        span.created_at.isoformat(),
+    )
+
+
+def _span_data(row: Tuple) -> Dict[str, Any]:
+    """Span fields (as Span.model_dump would give them) from a (uuid, start_pos,
+    end_pos, text, created_at) row, without validating a model"""
+    return {
+        "partition": PartitionType.LEXICAL.value,
+        "uuid": row[0],
+        "created_at": row[4],
+        "type": LexicalType.SPAN.value,
+        "text": row[3],
+        "start": row[1],
+        "end": row[2],
+    }
+
+
+def _workflow_item_rows(
+    workflow_id: str, items: List[Dict[str, Any]]
+) -> List[Tuple[str, str, Any]]:
+    """(uuid, workflow_id, original_data_json) rows for a workflow's curation items"""
+    rows = []
+    for item in items:
+        original = item.get("original_data_json")
+        if isinstance(original, dict):
+            original = json.dumps(original)
+        rows.append((item.get("uuid", str(uuid4())), workflow_id, original))
+    return rows
+
+
 class CurationManager:
     """Manages the human-in-the-loop curation queue using SQLite"""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, readers: int = 4, busy_timeout_ms: int = 5000):
         self.db_path = db_path
         self.ENTITY_TYPE_MAP = ENTITY_TYPE_MAP
+        # Connections are opened once (WAL mode) and shared by every call
+        self._pool = SQLitePool(db_path, readers=readers, busy_timeout_ms=busy_timeout_ms)
 
     async def initialize(self):
-        """Create tables if they don't exist"""
-        async with aiosqlite.connect(self.db_path) as db:
+        """Open the connection pool and create tables if they don't exist"""
+        await self._pool.open()
+        async with self._pool.write() as db:
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS journal_curation (
@@ -62,12 +227,14 @@ class CurationManager:
                     uuid TEXT,
                     journal_text TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    overall_status TEXT DEFAULT 'PENDING_ENTITIES'
+                    overall_status TEXT DEFAULT 'PENDING_ENTITIES',
                     -- PENDING_ENTITIES, ENTITIES_DONE, PENDING_RELATIONS, COMPLETED
+                    workflow_id TEXT,
+                    -- Temporal workflow to signal when a curation phase completes
+                    completed_at TIMESTAMP
                 )
             """
             )
-
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS entity_curation_items (
@@ -75,6 +242,7 @@ class CurationManager:
                     uuid TEXT,
                     journal_id TEXT,
                     entity_type TEXT,
+                    name TEXT,  -- curated name once accepted, else the extracted one
                     original_data_json TEXT,  -- NULL for user-added entities
                     curated_data_json TEXT,   -- Always present for ACCEPTED
                     status TEXT DEFAULT 'PENDING',  -- PENDING, ACCEPTED, REJECTED
@@ -93,6 +261,8 @@ class CurationManager:
                     journal_id TEXT,
                     kind TEXT NOT NULL DEFAULT 'relation',
                     relationship_type TEXT,
+                    source_uuid TEXT,  -- NULL for feelings
+                    target_uuid TEXT,
                     original_data_json TEXT,  -- NULL for user-added
                     curated_data_json TEXT,
                     status TEXT DEFAULT 'PENDING',
@@ -110,7 +280,9 @@ class CurationManager:
                     uuid TEXT,
                     journal_id TEXT,
                     owner_uuid TEXT, -- entity_curation_items.uuid or relationship_curation_items.uuid
-                    span_data_json TEXT,
+                    start_pos INTEGER NOT NULL,
+                    end_pos INTEGER NOT NULL,
+                    text TEXT NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (journal_id) REFERENCES journal_curation (uuid)
                 )
@@ -168,6 +340,89 @@ class CurationManager:
             """
             )
 
+            # Change counter for the journal curation tables (ETags, deltas)
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS curation_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL
+                )
+            """
+            )
+            await db.execute(
+                "INSERT OR IGNORE INTO curation_version (id, version) VALUES (1, 0)"
+            )
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS journal_curation_versions (
+                    journal_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL  -- curation_version of its last change
+                )
+            """
+            )
+            await db.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_journal_curation_versions_version
+                ON journal_curation_versions (version)
+            """
+            )
+            for table, column in CHANGE_TRACKED_TABLES.items():
+                for event, row in TRIGGER_EVENTS:
+                    await db.execute(
+                        f"""
+                        CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_version
+                        AFTER {event} ON {table}
+                        BEGIN
+                            UPDATE curation_version SET version = version + 1
+                            WHERE id = 1;
+                            INSERT INTO journal_curation_versions (journal_id, version)
+                            SELECT {row}.{column}, version FROM curation_version
+                            WHERE id = 1 AND {row}.{column} IS NOT NULL
+                            ON CONFLICT (journal_id)
+                            DO UPDATE SET version = excluded.version;
+                        END
+                    """
+                    )
+
+            # Status counts for get_curation_stats, kept current by triggers
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS curation_stats (
+                    scope TEXT NOT NULL,  -- journal, entity, relationship
+                    status TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    -- journals only: rows with a completed_at, and the sum of
+                    -- their created_at -> completed_at
+                    timed INTEGER NOT NULL DEFAULT 0,
+                    curate_seconds REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (scope, status)
+                )
+            """
+            )
+
+            # Change feed for the push endpoint, written with each change
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS curation_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    -- items_queued, item_reviewed, stage_completed,
+                    -- notification_created, notification_updated
+                    stage TEXT,
+                    workflow_id TEXT,
+                    journal_id TEXT,
+                    data_json TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """
+            )
+            await db.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_curation_events_created_at
+                ON curation_events (created_at)
+            """
+            )
+
             # Concept extraction curation (workflow-level tracking)
             await db.execute(
                 """
@@ -281,6 +536,16 @@ class CurationManager:
                 ON inbox_classification_items (workflow_id, status)
             """
             )
+            # Inbox workflows finished early, read by the workflow's fallback check
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS inbox_workflow_curation (
+                    workflow_id TEXT PRIMARY KEY,
+                    overall_status TEXT DEFAULT 'PENDING' CHECK (overall_status IN ('PENDING', 'COMPLETED')),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """
+            )
 
             # Notifications (workflow_started, curation_pending, workflow_completed, workflow_failed)
             await db.execute(
@@ -314,27 +579,157 @@ class CurationManager:
             )
 
             await db.commit()
+            # Bring databases created by older versions up to date
+            await migrate(db)
+            # Created after migrating, as they need the latest columns
+            for table, (_, status, seconds) in STATS_TRACKED_TABLES.items():
+                changed = f"OLD.{status} IS NOT NEW.{status}"
+                if seconds:
+                    changed += " OR OLD.completed_at IS NOT NEW.completed_at"
+                await db.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_insert_stats
+                    AFTER INSERT ON {table}
+                    BEGIN {_stats_delta(table, "NEW", "+")} END
+                """
+                )
+                await db.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_update_stats
+                    AFTER UPDATE ON {table} WHEN {changed}
+                    BEGIN
+                        {_stats_delta(table, "OLD", "-")}
+                        {_stats_delta(table, "NEW", "+")}
+                    END
+                """
+                )
+                await db.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_delete_stats
+                    AFTER DELETE ON {table}
+                    BEGIN {_stats_delta(table, "OLD", "-")} END
+                """
+                )
+
+    async def close(self) -> None:
+        """Close the connection pool"""
+        await self._pool.close()
+
+    def add_write_listener(self, callback: Callable[[], None]) -> None:
+        """Call `callback` after every write committed by this process"""
+        self._pool.add_write_listener(callback)
+
+    # ===== CURATION EVENTS =====
+
+    async def _record_event(
+        self,
+        db,
+        kind: str,
+        stage: Optional[str],
+        workflow_id: Optional[str] = None,
+        journal_id: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Append an event in the caller's write transaction"""
+        await db.execute(
+            """
+            INSERT INTO curation_events
+            (kind, stage, workflow_id, journal_id, data_json)
+            VALUES (?, ?, COALESCE(?, (
+                SELECT workflow_id FROM journal_curation WHERE uuid = ?
+            )), ?, ?)
+        """,
+            (
+                kind,
+                stage,
+                workflow_id,
+                journal_id,
+                journal_id,
+                json.dumps(data) if data else None,
+            ),
+        )
+
+    async def get_curation_events(
+        self, after: int, limit: int = 500, until: Optional[int] = None
+    ) -> List[CurationEvent]:
+        """Events with after < id (<= until), oldest first"""
+        async with self._pool.read() as db:
+            rows = await db.execute_fetchall(
+                """
+                SELECT id, kind, stage, workflow_id, journal_id, data_json, created_at
+                FROM curation_events
+                WHERE id > ? AND (? IS NULL OR id <= ?)
+                ORDER BY id
+                LIMIT ?
+            """,
+                (after, until, until, limit),
+            )
+        return [
+            CurationEvent(
+                id=row[0],
+                kind=row[1],
+                stage=row[2],
+                workflow_id=row[3],
+                journal_id=row[4],
+                data=json.loads(row[5]) if row[5] else {},
+                created_at=row[6],
+            )
+            for row in rows
+        ]
+
+    async def get_event_id_range(self) -> Tuple[int, int]:
+        """(oldest retained event id, last event id ever written); 0 when none"""
+        async with self._pool.read() as db:
+            first = await db.execute_fetchall("SELECT MIN(id) FROM curation_events")
+            last = await db.execute_fetchall(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'curation_events'"
+            )
+        return (first[0][0] or 0), (last[0][0] if last else 0)
+
+    async def prune_curation_events(self, older_than: datetime) -> int:
+        """Delete events created before `older_than` (UTC)"""
+        async with self._pool.write() as db:
+            cursor = await db.execute(
+                "DELETE FROM curation_events WHERE created_at < ?",
+                (older_than.strftime("%Y-%m-%d %H:%M:%S"),),
+            )
+            await db.commit()
+            return cursor.rowcount
 
     # ===== JOURNAL MANAGEMENT =====
 
     async def create_journal_for_curation(
-        self, journal_uuid: str, journal_text: str
+        self, journal_uuid: str, journal_text: str, workflow_id: Optional[str] = None
     ) -> None:
         """Create a new journal entry for curation"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             await db.execute(
                 """
                 INSERT INTO journal_curation 
-                (uuid, journal_text, overall_status) 
-                VALUES (?, ?, 'PENDING_ENTITIES')
+                (uuid, journal_text, overall_status, workflow_id) 
+                VALUES (?, ?, 'PENDING_ENTITIES', ?)
             """,
-                (journal_uuid, journal_text),
+                (journal_uuid, journal_text, workflow_id),
             )
             await db.commit()
 
+    async def get_journal_workflow_id(self, journal_uuid: str) -> Optional[str]:
+        """Get the Temporal workflow processing a journal"""
+        async with self._pool.read() as db:
+            async with db.execute(
+                """
+                SELECT workflow_id 
+                FROM journal_curation 
+                WHERE uuid = ?
+            """,
+                (journal_uuid,),
+            ) as cursor:
+                row = await cursor.fetchone()
+                return row[0] if row else None
+
     async def get_journal_status(self, journal_uuid: str) -> Optional[str]:
         """Get the overall status of a journal"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT overall_status 
@@ -348,60 +743,86 @@ class CurationManager:
 
     async def update_journal_status(self, journal_uuid: str, status: str) -> None:
         """Update the overall status of a journal"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             await db.execute(
                 """
-                UPDATE journal_curation 
-                SET overall_status = ? 
+                UPDATE journal_curation
+                SET overall_status = ?,
+                    completed_at = CASE WHEN ? = 'COMPLETED'
+                        THEN COALESCE(completed_at, CURRENT_TIMESTAMP) END
                 WHERE uuid = ?
             """,
-                (status, journal_uuid),
+                (status, status, journal_uuid),
             )
+            stage = {"ENTITIES_DONE": "entities", "COMPLETED": "relationships"}.get(
+                status
+            )
+            if stage:
+                await self._record_event(
+                    db, STAGE_COMPLETED, stage, journal_id=journal_uuid
+                )
             await db.commit()
 
     # ===== ENTITY CURATION =====
 
     async def queue_entities_for_curation(
-        self, journal_uuid: str, journal_text: str, entities: List[EntityMapping]
+        self,
+        journal_uuid: str,
+        journal_text: str,
+        entities: List[EntityMapping],
+        workflow_id: Optional[str] = None,
     ) -> None:
-        """Add entities to curation queue"""
-        # First ensure journal exists
-        await self.create_journal_for_curation(journal_uuid, journal_text)
-
-        async with aiosqlite.connect(self.db_path) as db:
-            for entity_spans in entities:
-                entity = entity_spans.entity
-
-                # Entity should always be a proper domain entity with uuid
-                # If it doesn't have uuid, that's a serious error that should be caught earlier
+        """Add a journal and its entities (with spans) to the curation queue"""
+        entity_rows = [
+            (
+                str(entity_spans.entity.uuid),
+                journal_uuid,
+                entity_spans.entity.type,
+                entity_spans.entity.name,
+                entity_spans.entity.model_dump_json(),
+            )
+            for entity_spans in entities
+        ]
+        span_rows = [
+            _span_row(span, journal_uuid, str(entity_spans.entity.uuid))
+            for entity_spans in entities
+            for span in entity_spans.spans
+        ]
 
-                await db.execute(
-                    """
-                    INSERT INTO entity_curation_items 
-                    (uuid, journal_id, entity_type, original_data_json, status, is_user_added) 
-                    VALUES (?, ?, ?, ?, 'PENDING', FALSE)
-                """,
-                    (
-                        str(entity.uuid),
-                        journal_uuid,
-                        entity.type,
-                        entity.model_dump_json(),
-                    ),
-                )
-                for span in entity_spans.spans:
-                    await db.execute(
-                        """
-                        INSERT INTO span_curation_items
-                        (uuid, journal_id, owner_uuid, span_data_json)
-                        VALUES (?, ?, ?, ?)
-                    """,
-                        (
-                            str(span.uuid),
-                            journal_uuid,
-                            str(entity.uuid),
-                            span.model_dump_json(),
-                        ),
-                    )
+        # Journal, entities and spans are written in one transaction
+        async with self._pool.write() as db:
+            await db.execute(
+                """
+                INSERT INTO journal_curation 
+                (uuid, journal_text, overall_status, workflow_id) 
+                VALUES (?, ?, 'PENDING_ENTITIES', ?)
+            """,
+                (journal_uuid, journal_text, workflow_id),
+            )
+            await db.executemany(
+                """
+                INSERT INTO entity_curation_items 
+                (uuid, journal_id, entity_type, name, original_data_json, status, is_user_added) 
+                VALUES (?, ?, ?, ?, ?, 'PENDING', FALSE)
+            """,
+                entity_rows,
+            )
+            await db.executemany(
+                """
+                INSERT INTO span_curation_items
+                (uuid, journal_id, owner_uuid, start_pos, end_pos, text, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                span_rows,
+            )
+            await self._record_event(
+                db,
+                ITEMS_QUEUED,
+                "entities",
+                workflow_id,
+                journal_uuid,
+                data={"count": len(entity_rows)},
+            )
             await db.commit()
 
     async def accept_entity(
@@ -412,22 +833,30 @@ class CurationManager:
         is_user_added: bool = False,
     ) -> str:
         """Accept an entity with optional modifications"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             if is_user_added:
                 new_uuid = str(uuid4())
                 await db.execute(
                     """
                     INSERT INTO entity_curation_items 
-                    (uuid, journal_id, entity_type, curated_data_json, status, is_user_added) 
-                    VALUES (?, ?, ?, ?, 'ACCEPTED', TRUE)
+                    (uuid, journal_id, entity_type, name, curated_data_json, status, is_user_added) 
+                    VALUES (?, ?, ?, ?, ?, 'ACCEPTED', TRUE)
                 """,
                     (
                         new_uuid,
                         journal_uuid,
                         curated_data.get("type", "UNKNOWN"),
+                        curated_data.get("name"),
                         json.dumps(curated_data),
                     ),
                 )
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "entities",
+                    journal_id=journal_uuid,
+                    data={"item_id": new_uuid, "action": "added"},
+                )
                 await db.commit()
                 return new_uuid
             else:
@@ -435,21 +864,31 @@ class CurationManager:
                 cursor = await db.execute(
                     """
                     UPDATE entity_curation_items 
-                    SET curated_data_json = ?, status = 'ACCEPTED'
+                    SET curated_data_json = ?, status = 'ACCEPTED',
+                        name = COALESCE(?, name)
                     WHERE uuid = ? AND journal_id = ?
                 """,
                     (
                         json.dumps(curated_data, default=lambda o: o.isoformat()),
+                        curated_data.get("name"),
                         entity_uuid,
                         journal_uuid,
                     ),
                 )
+                if cursor.rowcount > 0:
+                    await self._record_event(
+                        db,
+                        ITEM_REVIEWED,
+                        "entities",
+                        journal_id=journal_uuid,
+                        data={"item_id": entity_uuid, "action": "accepted"},
+                    )
                 await db.commit()
                 return entity_uuid if cursor.rowcount > 0 else ""
 
     async def reject_entity(self, journal_uuid: str, entity_uuid: str) -> bool:
         """Reject an entity"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             cursor = await db.execute(
                 """
                 UPDATE entity_curation_items 
@@ -458,6 +897,14 @@ class CurationManager:
             """,
                 (entity_uuid, journal_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "entities",
+                    journal_id=journal_uuid,
+                    data={"item_id": entity_uuid, "action": "rejected"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
@@ -465,7 +912,7 @@ class CurationManager:
         self, journal_uuid: str
     ) -> List[EntityMapping]:
         """Get all accepted entities for a journal with their spans"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, curated_data_json
@@ -476,33 +923,25 @@ class CurationManager:
             ) as cursor:
                 entity_rows = await cursor.fetchall()
 
-            results = []
-            for entity_uuid, entity_json in entity_rows:
-                entity_data = json.loads(entity_json)
-                entity_type = entity_data.get("type")
-                EntityClass = ENTITY_TYPE_MAP.get(entity_type)
-                if not EntityClass:
-                    # skipping unknown entity type
-                    continue
-
-                entity = EntityClass.model_validate(entity_data)  # type: ignore[attr-defined]
+            spans_by_owner = await self._fetch_spans(db, [row[0] for row in entity_rows])
 
-                async with db.execute(
-                    """
-                    SELECT span_data_json
-                    FROM span_curation_items
-                    WHERE owner_uuid = ?
-                """,
-                    (entity_uuid,),
-                ) as span_cursor:
-                    span_rows = await span_cursor.fetchall()
-                    spans = [
-                        Span.model_validate(json.loads(row[0])) for row in span_rows
-                    ]
+        results = []
+        for entity_uuid, entity_json in entity_rows:
+            entity_data = json.loads(entity_json)
+            entity_type = entity_data.get("type")
+            EntityClass = ENTITY_TYPE_MAP.get(entity_type)
+            if not EntityClass:
+                # skipping unknown entity type
+                continue
 
-                results.append(EntityMapping(entity, spans))
+            entity = EntityClass.model_validate(entity_data)  # type: ignore[attr-defined]
+            spans = [
+                Span.model_validate(span)
+                for span in spans_by_owner.get(entity_uuid, [])
+            ]
+            results.append(EntityMapping(entity, spans))
 
-            return results
+        return results
 
     async def complete_entity_phase(self, journal_uuid: str) -> None:
         """Mark entity curation phase as complete and move to relationship phase"""
@@ -514,64 +953,84 @@ class CurationManager:
         self, journal_uuid: str, items: List[CuratableMapping]
     ) -> None:
         """Add relationships and feelings to curation queue"""
-        await self.update_journal_status(journal_uuid, "PENDING_RELATIONS")
-
-        async with aiosqlite.connect(self.db_path) as db:
-            for item in items:
-                data = item.data
-                spans = item.spans
-                contexts = item.context
-
-                # Determine relationship_type based on kind
-                if item.kind in ["relation", "concept_relation"]:
-                    relationship_type = data.type
-                else:  # feeling_emotion, feeling_concept
-                    relationship_type = item.kind
-
-                await db.execute(
-                    """
-                    INSERT INTO relationship_curation_items 
-                    (uuid, journal_id, kind, relationship_type, original_data_json, status, is_user_added) 
-                    VALUES (?, ?, ?, ?, ?, 'PENDING', FALSE)
-                """,
+        relationship_rows = []
+        span_rows = []
+        context_rows = []
+        for item in items:
+            data = item.data
+            # Determine relationship_type based on kind
+            if item.kind in ["relation", "concept_relation"]:
+                relationship_type = data.type
+            else:  # feeling_emotion, feeling_concept
+                relationship_type = item.kind
+
+            relationship_rows.append(
+                (
+                    str(data.uuid),
+                    journal_uuid,
+                    item.kind,
+                    relationship_type,
+                    getattr(data, "source", None),
+                    getattr(data, "target", None),
+                    data.model_dump_json(),
+                )
+            )
+            span_rows.extend(
+                _span_row(span, journal_uuid, str(data.uuid)) for span in item.spans
+            )
+            if item.context and item.kind in ["relation", "concept_relation"]:
+                context_rows.extend(
                     (
-                        str(data.uuid),
                         journal_uuid,
-                        item.kind,
-                        relationship_type,
-                        data.model_dump_json(),
-                    ),
+                        str(data.uuid),
+                        context.entity_uuid,
+                        json.dumps(context.sub_type),
+                    )
+                    for context in item.context
                 )
 
-                for span in spans:
-                    await db.execute(
-                        """
-                        INSERT INTO span_curation_items
-                        (uuid, journal_id, owner_uuid, span_data_json)
-                        VALUES (?, ?, ?, ?)
-                    """,
-                        (
-                            str(span.uuid),
-                            journal_uuid,
-                            str(data.uuid),
-                            span.model_dump_json(),
-                        ),
-                    )
-                if contexts and item.kind in ["relation", "concept_relation"]:
-                    for context in contexts:
-                        await db.execute(
-                            """
-                            INSERT INTO relationship_context_items
-                            (journal_id, relationship_uuid, entity_uuid, sub_type_json)
-                            VALUES (?, ?, ?, ?)
-                        """,
-                            (
-                                journal_uuid,
-                                str(data.uuid),
-                                context.entity_uuid,
-                                json.dumps(context.sub_type),
-                            ),
-                        )
+        # Status change, items, spans and contexts are written in one transaction
+        async with self._pool.write() as db:
+            await db.execute(
+                """
+                UPDATE journal_curation 
+                SET overall_status = 'PENDING_RELATIONS' 
+                WHERE uuid = ?
+            """,
+                (journal_uuid,),
+            )
+            await db.executemany(
+                """
+                INSERT INTO relationship_curation_items 
+                (uuid, journal_id, kind, relationship_type, source_uuid, target_uuid,
+                 original_data_json, status, is_user_added) 
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'PENDING', FALSE)
+            """,
+                relationship_rows,
+            )
+            await db.executemany(
+                """
+                INSERT INTO span_curation_items
+                (uuid, journal_id, owner_uuid, start_pos, end_pos, text, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                span_rows,
+            )
+            await db.executemany(
+                """
+                INSERT INTO relationship_context_items
+                (journal_id, relationship_uuid, entity_uuid, sub_type_json)
+                VALUES (?, ?, ?, ?)
+            """,
+                context_rows,
+            )
+            await self._record_event(
+                db,
+                ITEMS_QUEUED,
+                "relationships",
+                journal_id=journal_uuid,
+                data={"count": len(relationship_rows)},
+            )
             await db.commit()
 
     async def accept_relationship(
@@ -582,22 +1041,32 @@ class CurationManager:
         is_user_added: bool = False,
     ) -> str:
         """Accept a relationship with optional modifications"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             if is_user_added:
                 new_uuid = str(uuid4())
                 await db.execute(
                     """
                     INSERT INTO relationship_curation_items 
-                    (uuid, journal_id, relationship_type, curated_data_json, status, is_user_added) 
-                    VALUES (?, ?, ?, ?, 'ACCEPTED', TRUE)
+                    (uuid, journal_id, relationship_type, source_uuid, target_uuid,
+                     curated_data_json, status, is_user_added) 
+                    VALUES (?, ?, ?, ?, ?, ?, 'ACCEPTED', TRUE)
                 """,
                     (
                         new_uuid,
                         journal_uuid,
                         curated_data.get("type", "UNKNOWN"),
+                        curated_data.get("source"),
+                        curated_data.get("target"),
                         json.dumps(curated_data),
                     ),
                 )
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "relationships",
+                    journal_id=journal_uuid,
+                    data={"item_id": new_uuid, "action": "added"},
+                )
                 await db.commit()
                 return new_uuid
             else:
@@ -605,11 +1074,27 @@ class CurationManager:
                 cursor = await db.execute(
                     """
                     UPDATE relationship_curation_items 
-                    SET curated_data_json = ?, status = 'ACCEPTED'
+                    SET curated_data_json = ?, status = 'ACCEPTED',
+                        source_uuid = COALESCE(?, source_uuid),
+                        target_uuid = COALESCE(?, target_uuid)
                     WHERE uuid = ? AND journal_id = ?
                 """,
-                    (json.dumps(curated_data), relationship_uuid, journal_uuid),
+                    (
+                        json.dumps(curated_data),
+                        curated_data.get("source"),
+                        curated_data.get("target"),
+                        relationship_uuid,
+                        journal_uuid,
+                    ),
                 )
+                if cursor.rowcount > 0:
+                    await self._record_event(
+                        db,
+                        ITEM_REVIEWED,
+                        "relationships",
+                        journal_id=journal_uuid,
+                        data={"item_id": relationship_uuid, "action": "accepted"},
+                    )
                 await db.commit()
                 return relationship_uuid if cursor.rowcount > 0 else ""
 
@@ -617,7 +1102,7 @@ class CurationManager:
         self, journal_uuid: str, relationship_uuid: str
     ) -> bool:
         """Reject a relationship"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             cursor = await db.execute(
                 """
                 UPDATE relationship_curation_items 
@@ -626,6 +1111,14 @@ class CurationManager:
             """,
                 (relationship_uuid, journal_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "relationships",
+                    journal_id=journal_uuid,
+                    data={"item_id": relationship_uuid, "action": "rejected"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
@@ -633,7 +1126,7 @@ class CurationManager:
         self, journal_uuid: str
     ) -> List[CuratableMapping]:
         """Get all accepted relationships and feelings for a journal with their spans"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, kind, curated_data_json
@@ -644,118 +1137,345 @@ class CurationManager:
             ) as cursor:
                 item_rows = await cursor.fetchall()
 
-            results = []
-            for item_uuid, kind, data_json in item_rows:
-                # Deserialize based on kind
-                data_dict = json.loads(data_json)
-                if kind == "relation":
-                    data = Relation.model_validate(data_dict)
-                elif kind == "concept_relation":
-                    from minerva_models import ConceptRelation
-
-                    data = ConceptRelation.model_validate(data_dict)
-                elif kind == "feeling_emotion":
-                    data = FeelingEmotion.model_validate(data_dict)
-                elif kind == "feeling_concept":
-                    data = FeelingConcept.model_validate(data_dict)
-                else:
-                    continue  # Skip unknown kinds
-
-                async with db.execute(
-                    """
-                    SELECT span_data_json
-                    FROM span_curation_items
-                    WHERE owner_uuid = ?
-                """,
-                    (item_uuid,),
-                ) as span_cursor:
-                    span_rows = await span_cursor.fetchall()
-                    spans = [
-                        Span.model_validate(json.loads(row[0])) for row in span_rows
-                    ]
-
-                # Only add context for relation kinds
-                contexts = None
-                if kind in ["relation", "concept_relation"]:
-                    async with db.execute(
-                        """
-                        SELECT entity_uuid, sub_type_json
-                        FROM relationship_context_items
-                        WHERE relationship_uuid = ?
-                    """,
-                        (item_uuid,),
-                    ) as context_cursor:
-                        context_rows = await context_cursor.fetchall()
-                        contexts = (
-                            [
-                                RelationshipContext(
-                                    entity_uuid=row[0], sub_type=json.loads(row[1])
-                                )
-                                for row in context_rows
-                            ]
-                            if context_rows
-                            else None
-                        )
+            item_uuids = [row[0] for row in item_rows]
+            spans_by_owner = await self._fetch_spans(db, item_uuids)
+            contexts_by_relationship = await self._fetch_contexts(
+                db,
+                [
+                    row[0]
+                    for row in item_rows
+                    if row[1] in ["relation", "concept_relation"]
+                ],
+            )
 
-                results.append(
-                    CuratableMapping(
-                        kind=kind, data=data, spans=spans, context=contexts
-                    )
-                )
-            return results
+        results = []
+        for item_uuid, kind, data_json in item_rows:
+            # Deserialize based on kind
+            data_dict = json.loads(data_json)
+            if kind == "relation":
+                data = Relation.model_validate(data_dict)
+            elif kind == "concept_relation":
+                from minerva_models import ConceptRelation
+
+                data = ConceptRelation.model_validate(data_dict)
+            elif kind == "feeling_emotion":
+                data = FeelingEmotion.model_validate(data_dict)
+            elif kind == "feeling_concept":
+                data = FeelingConcept.model_validate(data_dict)
+            else:
+                continue  # Skip unknown kinds
+
+            spans = [
+                Span.model_validate(span)
+                for span in spans_by_owner.get(item_uuid, [])
+            ]
+            # Only relation kinds have context
+            contexts = [
+                RelationshipContext(**context)
+                for context in contexts_by_relationship.get(item_uuid, [])
+            ] or None
+
+            results.append(
+                CuratableMapping(kind=kind, data=data, spans=spans, context=contexts)
+            )
+        return results
 
     async def complete_relationship_phase(self, journal_uuid: str) -> None:
         """Mark relationship curation phase as complete"""
         await self.update_journal_status(journal_uuid, "COMPLETED")
 
+    # ===== BULK CURATION =====
+
+    async def bulk_accept_all(
+        self, journal_uuid: str, phase: str = "entity", item_type: Optional[str] = None
+    ) -> int:
+        """
+        Accept every pending item of a phase as extracted.
+
+        Args:
+            journal_uuid: Journal whose items to accept
+            phase: "entity" or "relationship"
+            item_type: Only items of this entity or relationship type
+
+        Returns:
+            Number of items accepted
+        """
+        return await self._bulk_set_status(journal_uuid, phase, "ACCEPTED", item_type)
+
+    async def bulk_reject(
+        self, journal_uuid: str, phase: str = "entity", item_type: Optional[str] = None
+    ) -> int:
+        """Reject every pending item of a phase (see bulk_accept_all)"""
+        return await self._bulk_set_status(journal_uuid, phase, "REJECTED", item_type)
+
+    async def _bulk_set_status(
+        self, journal_uuid: str, phase: str, status: str, item_type: Optional[str]
+    ) -> int:
+        if phase not in BULK_PHASES:
+            raise ValueError(f"Phase must be one of {sorted(BULK_PHASES)}: {phase}")
+        table, type_column, stage = BULK_PHASES[phase]
+        async with self._pool.write() as db:
+            # Accepted as extracted: the original data becomes the curated data
+            cursor = await db.execute(
+                f"""
+                UPDATE {table}
+                SET status = ?,
+                    curated_data_json = CASE WHEN ? = 'ACCEPTED'
+                        THEN COALESCE(curated_data_json, original_data_json)
+                        ELSE curated_data_json END
+                WHERE journal_id = ? AND status = 'PENDING'
+                    AND (? IS NULL OR {type_column} = ?)
+            """,
+                (status, status, journal_uuid, item_type, item_type),
+            )
+            count = cursor.rowcount
+            if count:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    stage,
+                    journal_id=journal_uuid,
+                    data={"action": status.lower(), "count": count},
+                )
+            await db.commit()
+        return count
+
+    async def review_items(
+        self,
+        journal_uuid: str,
+        phase: str,
+        accepted: Dict[str, Dict[str, Any]],
+        rejected: Sequence[str],
+    ) -> Tuple[int, int, List[str]]:
+        """
+        Apply a batch of accept/reject decisions in one transaction.
+
+        Args:
+            journal_uuid: Journal the items belong to
+            phase: "entity" or "relationship"
+            accepted: Curated data by item uuid
+            rejected: Item uuids to reject
+
+        Returns:
+            (accepted, rejected) counts, and the item uuids not found in the
+            journal, which are skipped
+        """
+        if phase not in BULK_PHASES:
+            raise ValueError(f"Phase must be one of {sorted(BULK_PHASES)}: {phase}")
+        table, _, stage = BULK_PHASES[phase]
+        item_ids = list(accepted) + [i for i in rejected if i not in accepted]
+        async with self._pool.write() as db:
+            rows = await _select_in(
+                db,
+                f"SELECT uuid, journal_id FROM {table}"
+                " WHERE uuid IN ({placeholders})",
+                item_ids,
+            )
+            found = {uuid for uuid, journal_id in rows if journal_id == journal_uuid}
+
+            accept_rows = []
+            for item_id, curated_data in accepted.items():
+                if item_id not in found:
+                    continue
+                curated_data = {**curated_data, "uuid": item_id}
+                curated_json = json.dumps(curated_data, default=lambda o: o.isoformat())
+                if phase == "entity":
+                    accept_rows.append(
+                        (curated_json, curated_data.get("name"), item_id, journal_uuid)
+                    )
+                else:
+                    accept_rows.append(
+                        (
+                            curated_json,
+                            curated_data.get("source"),
+                            curated_data.get("target"),
+                            item_id,
+                            journal_uuid,
+                        )
+                    )
+            reject_rows = [
+                (item_id, journal_uuid)
+                for item_id in rejected
+                if item_id in found and item_id not in accepted
+            ]
+
+            if phase == "entity":
+                accept_sql = """
+                    UPDATE entity_curation_items
+                    SET curated_data_json = ?, status = 'ACCEPTED',
+                        name = COALESCE(?, name)
+                    WHERE uuid = ? AND journal_id = ?
+                """
+            else:
+                accept_sql = """
+                    UPDATE relationship_curation_items
+                    SET curated_data_json = ?, status = 'ACCEPTED',
+                        source_uuid = COALESCE(?, source_uuid),
+                        target_uuid = COALESCE(?, target_uuid)
+                    WHERE uuid = ? AND journal_id = ?
+                """
+            await db.executemany(accept_sql, accept_rows)
+            await db.executemany(
+                f"""
+                UPDATE {table} SET status = 'REJECTED'
+                WHERE uuid = ? AND journal_id = ?
+            """,
+                reject_rows,
+            )
+            if accept_rows or reject_rows:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    stage,
+                    journal_id=journal_uuid,
+                    data={
+                        "action": "batch",
+                        "accepted": len(accept_rows),
+                        "rejected": len(reject_rows),
+                    },
+                )
+            await db.commit()
+        not_found = [item_id for item_id in item_ids if item_id not in found]
+        return len(accept_rows), len(reject_rows), not_found
+
     # ===== DASHBOARD API HELPERS =====
 
     async def get_all_pending_curation_tasks(self) -> Dict[str, JournalEntryCuration]:
         """Get all pending curation tasks for the dashboard, grouped by journalentry"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Fetch journal entries
-            journal_curations = await self._fetch_journal_entries(db)
-            if not journal_curations:
-                return {}
-
-            journal_ids = tuple(journal_curations.keys())
-
-            # Process entity tasks
-            entity_tasks = await self._fetch_entity_tasks(db, journal_ids)
-            if entity_tasks:
-                await self._enrich_entity_tasks_with_spans(db, entity_tasks)
-                self._add_tasks_to_journal_curations(journal_curations, entity_tasks)
-
-            # Process relationship tasks
-            relationship_tasks = await self._fetch_relationship_tasks(db, journal_ids)
-            if relationship_tasks:
-                await self._enrich_relationship_tasks_with_data(db, relationship_tasks)
-                self._add_tasks_to_journal_curations(
-                    journal_curations, relationship_tasks
-                )
+        async with self._pool.read() as db:
+            journal_rows = await db.execute_fetchall(
+                PENDING_JOURNALS_QUERY.format(where="")
+            )
+            return await self._fetch_pending_journals(db, journal_rows)
 
-            return journal_curations
+    async def get_pending_curation_page(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[Dict[str, JournalEntryCuration], Optional[str]]:
+        """
+        Get one page of pending journals (newest first) with their tasks.
 
-    async def _fetch_journal_entries(self, db) -> Dict[str, JournalEntryCuration]:
-        """Fetch journal entries from database."""
-        async with db.execute(
+        Returns:
+            The journals, and the cursor for the next page (None on the last one)
+        """
+        where, params = "", ()
+        if cursor:
+            created_at, row_id = _decode_cursor(cursor)
+            where = "AND (created_at < ? OR (created_at = ? AND id < ?))"
+            params = (created_at, created_at, row_id)
+
+        async with self._pool.read() as db:
+            journal_rows = await db.execute_fetchall(
+                PENDING_JOURNALS_QUERY.format(where=where) + " LIMIT ?",
+                (*params, limit + 1),
+            )
+            next_cursor = None
+            if len(journal_rows) > limit:
+                journal_rows = journal_rows[:limit]
+                next_cursor = _encode_cursor(journal_rows[-1][3], journal_rows[-1][0])
+            return await self._fetch_pending_journals(db, journal_rows), next_cursor
+
+    async def get_pending_curation_summary(self) -> List[JournalCurationSummary]:
+        """Pending journals with their pending task counts, without text or tasks"""
+        async with self._pool.read() as db:
+            rows = await db.execute_fetchall(
+                """
+                SELECT j.uuid, j.created_at, j.overall_status,
+                    (SELECT COUNT(*) FROM entity_curation_items e
+                     WHERE e.journal_id = j.uuid AND e.status = 'PENDING'),
+                    (SELECT COUNT(*) FROM relationship_curation_items r
+                     WHERE r.journal_id = j.uuid AND r.status = 'PENDING')
+                FROM journal_curation j
+                WHERE j.overall_status != 'COMPLETED'
+                ORDER BY j.created_at DESC, j.id DESC
             """
-            SELECT uuid, journal_text, created_at, overall_status FROM journal_curation
-            WHERE overall_status != 'COMPLETED' ORDER BY created_at DESC
+            )
+        return [
+            JournalCurationSummary(
+                journal_id=row[0],
+                date=datetime.strptime(row[1], "%Y-%m-%d %H:%M:%S").date(),
+                phase="relationships" if row[2] == "PENDING_RELATIONS" else "entities",
+                pending_entities=row[3],
+                pending_relationships=row[4],
+            )
+            for row in rows
+        ]
+
+    async def get_curation_version(self) -> int:
+        """Change counter of the journal curation tables, bumped on every write"""
+        async with self._pool.read() as db:
+            rows = await db.execute_fetchall(
+                "SELECT version FROM curation_version WHERE id = 1"
+            )
+        return rows[0][0] if rows else 0
+
+    async def get_curation_changes(
+        self, since: int
+    ) -> Tuple[Dict[str, JournalEntryCuration], List[str]]:
         """
-        ) as cursor:
-            journal_rows = await cursor.fetchall()
+        Journals changed after curation version `since`.
 
-        if not journal_rows:
+        Returns:
+            The changed journals that are still pending (with all their
+            pending tasks), and the uuids of changed journals that are no
+            longer pending (completed or deleted)
+        """
+        async with self._pool.read() as db:
+            changed = [
+                row[0]
+                for row in await db.execute_fetchall(
+                    """
+                    SELECT journal_id FROM journal_curation_versions
+                    WHERE version > ?
+                """,
+                    (since,),
+                )
+            ]
+            if not changed:
+                return {}, []
+            journal_rows = await _select_in(
+                db,
+                PENDING_JOURNALS_QUERY.format(where="AND uuid IN ({placeholders})"),
+                changed,
+            )
+            journal_rows.sort(key=lambda row: (row[3], row[0]), reverse=True)
+            journals = await self._fetch_pending_journals(db, journal_rows)
+        return journals, [uuid for uuid in changed if uuid not in journals]
+
+    async def _fetch_pending_journals(
+        self, db, journal_rows: Sequence[Tuple]
+    ) -> Dict[str, JournalEntryCuration]:
+        """Build the curation view of pending journal rows with their tasks."""
+        journal_curations = self._journal_entries_from_rows(journal_rows)
+        if not journal_curations:
             return {}
 
+        journal_ids = tuple(journal_curations.keys())
+
+        # Process entity tasks
+        entity_tasks = await self._fetch_entity_tasks(db, journal_ids)
+        if entity_tasks:
+            await self._enrich_entity_tasks_with_spans(db, entity_tasks)
+            self._add_tasks_to_journal_curations(journal_curations, entity_tasks)
+
+        # Process relationship tasks
+        relationship_tasks = await self._fetch_relationship_tasks(db, journal_ids)
+        if relationship_tasks:
+            await self._enrich_relationship_tasks_with_data(db, relationship_tasks)
+            self._add_tasks_to_journal_curations(journal_curations, relationship_tasks)
+
+        return journal_curations
+
+    def _journal_entries_from_rows(
+        self, journal_rows: Sequence[Tuple]
+    ) -> Dict[str, JournalEntryCuration]:
+        """Journal entries from rows of PENDING_JOURNALS_QUERY."""
         return {
-            row[0]: JournalEntryCuration(
-                journal_id=row[0],
-                date=datetime.strptime(row[2], "%Y-%m-%d %H:%M:%S").date(),
-                entry_text=row[1],
+            row[1]: JournalEntryCuration(
+                journal_id=row[1],
+                date=datetime.strptime(row[3], "%Y-%m-%d %H:%M:%S").date(),
+                entry_text=row[2],
                 phase=(
-                    "relationships" if row[3] == "PENDING_RELATIONS" else "entities"
+                    "relationships" if row[4] == "PENDING_RELATIONS" else "entities"
                 ),
             )
             for row in journal_rows
@@ -765,36 +1485,31 @@ class CurationManager:
         self, db, journal_ids: tuple
     ) -> Dict[str, CurationTask]:
         """Fetch entity tasks from database."""
-        async with db.execute(
-            f"""
+        entity_rows = await _select_in(
+            db,
+            """
             SELECT uuid, journal_id, created_at, original_data_json
             FROM entity_curation_items
-            WHERE journal_id IN ({','.join('?' for _ in journal_ids)}) AND status = 'PENDING'
+            WHERE journal_id IN ({placeholders}) AND status = 'PENDING'
         """,
             journal_ids,
-        ) as cursor:
-            entity_rows = await cursor.fetchall()
+        )
 
         tasks = {}
         for row in entity_rows:
+            # Stored with model_dump_json when queued, so already a full entity
             entity_data = json.loads(row[3])
-            entity_type = entity_data.get("type")
-            EntityClass = ENTITY_TYPE_MAP.get(entity_type)
-
-            if not EntityClass:
+            if entity_data.get("type") not in ENTITY_TYPE_MAP:
                 # Skip unknown entity types
                 continue
 
-            # Deserialize to proper entity type
-            entity = EntityClass.model_validate(entity_data)
-
             tasks[row[0]] = CurationTask(
                 id=row[0],
                 journal_id=row[1],
                 type="entity",
                 status="pending",
                 created_at=datetime.strptime(row[2], "%Y-%m-%d %H:%M:%S"),
-                data=entity.model_dump(),  # Use the properly deserialized entity
+                data=entity_data,
             )
 
         return tasks
@@ -803,15 +1518,15 @@ class CurationManager:
         self, db, journal_ids: tuple
     ) -> Dict[str, CurationTask]:
         """Fetch relationship tasks from database."""
-        async with db.execute(
-            f"""
+        relationship_rows = await _select_in(
+            db,
+            """
             SELECT uuid, journal_id, created_at, original_data_json
             FROM relationship_curation_items
-            WHERE journal_id IN ({','.join('?' for _ in journal_ids)}) AND status = 'PENDING'
+            WHERE journal_id IN ({placeholders}) AND status = 'PENDING'
         """,
             journal_ids,
-        ) as cursor:
-            relationship_rows = await cursor.fetchall()
+        )
 
         return {
             row[0]: CurationTask(
@@ -825,72 +1540,65 @@ class CurationManager:
             for row in relationship_rows
         }
 
+    async def _fetch_spans(
+        self, db, owner_uuids: Sequence[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Span data of many entity/relationship items, grouped by owner uuid."""
+        rows = await _select_in(
+            db,
+            """
+            SELECT owner_uuid, uuid, start_pos, end_pos, text, created_at
+            FROM span_curation_items
+            WHERE owner_uuid IN ({placeholders})
+            ORDER BY id
+        """,
+            owner_uuids,
+        )
+        spans: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            spans.setdefault(row[0], []).append(_span_data(row[1:]))
+        return spans
+
+    async def _fetch_contexts(
+        self, db, relationship_uuids: Sequence[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Context entities of many relationship items, grouped by relationship uuid."""
+        rows = await _select_in(
+            db,
+            """
+            SELECT relationship_uuid, entity_uuid, sub_type_json
+            FROM relationship_context_items
+            WHERE relationship_uuid IN ({placeholders})
+            ORDER BY id
+        """,
+            relationship_uuids,
+        )
+        contexts: Dict[str, List[Dict[str, Any]]] = {}
+        for relationship_uuid, entity_uuid, sub_type_json in rows:
+            contexts.setdefault(relationship_uuid, []).append(
+                {"entity_uuid": entity_uuid, "sub_type": json.loads(sub_type_json)}
+            )
+        return contexts
+
     async def _enrich_entity_tasks_with_spans(
         self, db, entity_tasks: Dict[str, CurationTask]
     ):
         """Add span data to entity tasks."""
-        entity_uuids = tuple(entity_tasks.keys())
-        async with db.execute(
-            f"""
-            SELECT owner_uuid, span_data_json FROM span_curation_items
-            WHERE owner_uuid IN ({','.join('?' for _ in entity_uuids)})
-        """,
-            entity_uuids,
-        ) as cursor:
-            for owner_uuid, span_json in await cursor.fetchall():
-                if "spans" not in entity_tasks[owner_uuid].data:
-                    entity_tasks[owner_uuid].data["spans"] = []
-                entity_tasks[owner_uuid].data["spans"].append(json.loads(span_json))
+        spans = await self._fetch_spans(db, tuple(entity_tasks.keys()))
+        for owner_uuid, owner_spans in spans.items():
+            entity_tasks[owner_uuid].data["spans"] = owner_spans
 
     async def _enrich_relationship_tasks_with_data(
         self, db, relationship_tasks: Dict[str, CurationTask]
     ):
         """Add span and context data to relationship tasks."""
         rel_uuids = tuple(relationship_tasks.keys())
-
-        # Add spans
-        await self._add_spans_to_tasks(db, relationship_tasks, rel_uuids)
-
-        # Add context
-        await self._add_context_to_relationship_tasks(db, relationship_tasks, rel_uuids)
-
-    async def _add_spans_to_tasks(
-        self, db, tasks: Dict[str, CurationTask], uuids: tuple
-    ):
-        """Add span data to tasks."""
-        async with db.execute(
-            f"""
-            SELECT owner_uuid, span_data_json FROM span_curation_items
-            WHERE owner_uuid IN ({','.join('?' for _ in uuids)})
-        """,
-            uuids,
-        ) as cursor:
-            for owner_uuid, span_json in await cursor.fetchall():
-                if "spans" not in tasks[owner_uuid].data:
-                    tasks[owner_uuid].data["spans"] = []
-                tasks[owner_uuid].data["spans"].append(json.loads(span_json))
-
-    async def _add_context_to_relationship_tasks(
-        self, db, relationship_tasks: Dict[str, CurationTask], rel_uuids: tuple
-    ):
-        """Add context data to relationship tasks."""
-        async with db.execute(
-            f"""
-            SELECT relationship_uuid, entity_uuid, sub_type_json
-            FROM relationship_context_items
-            WHERE relationship_uuid IN ({','.join('?' for _ in rel_uuids)})
-        """,
-            rel_uuids,
-        ) as cursor:
-            for rel_uuid, entity_uuid, sub_type_json in await cursor.fetchall():
-                if "context" not in relationship_tasks[rel_uuid].data:
-                    relationship_tasks[rel_uuid].data["context"] = []
-                relationship_tasks[rel_uuid].data["context"].append(
-                    {
-                        "entity_uuid": entity_uuid,
-                        "sub_type": json.loads(sub_type_json),
-                    }
-                )
+        spans = await self._fetch_spans(db, rel_uuids)
+        for owner_uuid, owner_spans in spans.items():
+            relationship_tasks[owner_uuid].data["spans"] = owner_spans
+        contexts = await self._fetch_contexts(db, rel_uuids)
+        for rel_uuid, rel_contexts in contexts.items():
+            relationship_tasks[rel_uuid].data["context"] = rel_contexts
 
     def _add_tasks_to_journal_curations(
         self,
@@ -902,92 +1610,65 @@ class CurationManager:
             journal_curations[task.journal_id].tasks[task.id] = task
 
     async def get_curation_stats(self) -> CurationStats:
-        """Get overall curation statistics for the dashboard"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Journal stats
-            async with db.execute(
-                """
-                SELECT overall_status, COUNT(*)
-                FROM journal_curation
-                GROUP BY overall_status
-            """
-            ) as cursor:
-                journal_rows = await cursor.fetchall()
-            journal_counts: Dict[str, int] = dict(tuple(row) for row in journal_rows)
-
-            total_journals = sum(journal_counts.values())
-            pending_entities_journals = journal_counts.get("PENDING_ENTITIES", 0)
-            pending_relations_journals = journal_counts.get(
-                "PENDING_RELATIONS", 0
-            ) + journal_counts.get("ENTITIES_DONE", 0)
-            completed_journals = journal_counts.get("COMPLETED", 0)
-
-            # Entity stats
-            async with db.execute(
-                """
-                SELECT status, COUNT(*)
-                FROM entity_curation_items
-                GROUP BY status
-            """
-            ) as cursor:
-                entity_rows = await cursor.fetchall()
-            entity_counts: Dict[str, int] = dict(tuple(row) for row in entity_rows)
-
-            entities_accepted = entity_counts.get("ACCEPTED", 0)
-            entities_rejected = entity_counts.get("REJECTED", 0)
-            entities_pending = entity_counts.get("PENDING", 0)
-            total_entities = entities_accepted + entities_rejected + entities_pending
-            entity_acceptance_rate = (
-                (entities_accepted / (entities_accepted + entities_rejected))
-                if (entities_accepted + entities_rejected) > 0
-                else 0.0
-            )
-
-            entity_stats = CurationEntityStats(
-                total_extracted=total_entities,
-                accepted=entities_accepted,
-                rejected=entities_rejected,
-                pending=entities_pending,
-                acceptance_rate=entity_acceptance_rate,
-            )
-
-            # Relationship stats
-            async with db.execute(
-                """
-                SELECT status, COUNT(*)
-                FROM relationship_curation_items
-                GROUP BY status
-            """
-            ) as cursor:
-                rel_rows = await cursor.fetchall()
-            rel_counts: Dict[str, int] = dict(tuple(row) for row in rel_rows)
-
-            rels_accepted = rel_counts.get("ACCEPTED", 0)
-            rels_rejected = rel_counts.get("REJECTED", 0)
-            rels_pending = rel_counts.get("PENDING", 0)
-            total_rels = rels_accepted + rels_rejected + rels_pending
-            rel_acceptance_rate = (
-                (rels_accepted / (rels_accepted + rels_rejected))
-                if (rels_accepted + rels_rejected) > 0
-                else 0.0
-            )
-
-            relationship_stats = CurationRelationshipStats(
-                total_extracted=total_rels,
-                accepted=rels_accepted,
-                rejected=rels_rejected,
-                pending=rels_pending,
-                acceptance_rate=rel_acceptance_rate,
-            )
+        """
+        Get overall curation statistics for the dashboard.
 
-            return CurationStats(
-                total_journals=total_journals,
-                pending_entities=pending_entities_journals,
-                pending_relationships=pending_relations_journals,
-                completed=completed_journals,
-                entity_stats=entity_stats,
-                relationship_stats=relationship_stats,
+        Counts come from curation_stats, which triggers keep current, so the
+        cost does not grow with history; the oldest pending journal is an
+        index seek per pending status.
+        """
+        async with self._pool.read() as db:
+            rows = await db.execute_fetchall(
+                "SELECT scope, status, count, timed, curate_seconds FROM curation_stats"
             )
+            oldest_pending_age_hours = (
+                await db.execute_fetchall(OLDEST_PENDING_AGE_QUERY)
+            )[0][0]
+
+        counts: Dict[str, Dict[str, int]] = {}
+        timed, curate_seconds = 0, 0.0
+        for scope, status, count, status_timed, seconds in rows:
+            counts.setdefault(scope, {})[status] = count
+            if scope == "journal" and status == "COMPLETED":
+                timed, curate_seconds = status_timed, seconds
+
+        # Journal stats
+        journal_counts = counts.get("journal", {})
+        completed_journals = journal_counts.get("COMPLETED", 0)
+        avg_processing_time_minutes = (
+            curate_seconds / timed / 60 if timed else 0.0
+        )
+
+        return CurationStats(
+            total_journals=sum(journal_counts.values()),
+            pending_entities=journal_counts.get("PENDING_ENTITIES", 0),
+            pending_relationships=journal_counts.get("PENDING_RELATIONS", 0)
+            + journal_counts.get("ENTITIES_DONE", 0),
+            completed=completed_journals,
+            oldest_pending_age_hours=round(oldest_pending_age_hours or 0.0, 2),
+            avg_processing_time_minutes=round(avg_processing_time_minutes, 2),
+            entity_stats=CurationEntityStats(
+                **self._item_stats(counts.get("entity", {}))
+            ),
+            relationship_stats=CurationRelationshipStats(
+                **self._item_stats(counts.get("relationship", {}))
+            ),
+        )
+
+    @staticmethod
+    def _item_stats(status_counts: Dict[str, int]) -> Dict[str, Any]:
+        """Item stats fields from per-status counts"""
+        accepted = status_counts.get("ACCEPTED", 0)
+        rejected = status_counts.get("REJECTED", 0)
+        pending = status_counts.get("PENDING", 0)
+        reviewed = accepted + rejected
+        return {
+            "total_extracted": accepted + rejected + pending,
+            "accepted": accepted,
+            "rejected": rejected,
+            "pending": pending,
+            "acceptance_rate": accepted / reviewed if reviewed > 0 else 0.0,
+        }
 
     # ===== QUOTE PARSING CURATION =====
 
@@ -999,7 +1680,7 @@ class CurationManager:
         content_author: Optional[str] = None,
     ) -> None:
         """Create a quote workflow row."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             await db.execute(
                 """
                 INSERT INTO quote_workflow_curation
@@ -1014,25 +1695,27 @@ class CurationManager:
         self, workflow_id: str, items: List[Dict[str, Any]]
     ) -> None:
         """Add quote items to curation queue. Each item: {uuid, original_data_json} (Quote as JSON)."""
-        async with aiosqlite.connect(self.db_path) as db:
-            for item in items:
-                item_uuid = item.get("uuid", str(uuid4()))
-                original = item.get("original_data_json")
-                if isinstance(original, dict):
-                    original = json.dumps(original)
-                await db.execute(
-                    """
-                    INSERT INTO quote_curation_items
-                    (uuid, workflow_id, original_data_json, status)
-                    VALUES (?, ?, ?, 'PENDING')
-                    """,
-                    (item_uuid, workflow_id, original),
-                )
+        async with self._pool.write() as db:
+            await db.executemany(
+                """
+                INSERT INTO quote_curation_items
+                (uuid, workflow_id, original_data_json, status)
+                VALUES (?, ?, ?, 'PENDING')
+                """,
+                _workflow_item_rows(workflow_id, items),
+            )
+            await self._record_event(
+                db,
+                ITEMS_QUEUED,
+                "quotes",
+                workflow_id,
+                data={"count": len(items)},
+            )
             await db.commit()
 
     async def get_quote_pending_count(self, workflow_id: str) -> int:
         """Return count of pending quote items for a workflow."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT COUNT(*) FROM quote_curation_items
@@ -1047,7 +1730,7 @@ class CurationManager:
         self, workflow_id: str
     ) -> List[Dict[str, Any]]:
         """Return all accepted quote items (original or curated JSON)."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, original_data_json, curated_data_json
@@ -1071,7 +1754,7 @@ class CurationManager:
         curated_data: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """Accept a quote item. curated_data is the final Quote-like dict."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             curated_json = json.dumps(curated_data) if curated_data else None
             cursor = await db.execute(
                 """
@@ -1081,12 +1764,20 @@ class CurationManager:
                 """,
                 (curated_json, datetime.utcnow().isoformat(), workflow_id, item_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "quotes",
+                    workflow_id=workflow_id,
+                    data={"item_id": item_uuid, "action": "accepted"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
     async def reject_quote_item(self, workflow_id: str, item_uuid: str) -> bool:
         """Reject a quote item."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             cursor = await db.execute(
                 """
                 UPDATE quote_curation_items
@@ -1095,12 +1786,20 @@ class CurationManager:
                 """,
                 (datetime.utcnow().isoformat(), workflow_id, item_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "quotes",
+                    workflow_id=workflow_id,
+                    data={"item_id": item_uuid, "action": "rejected"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
     async def get_pending_quote_workflows(self) -> List[Dict[str, Any]]:
         """Return list of quote workflows with PENDING overall_status."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT workflow_id, file_path, content_title, content_author, created_at
@@ -1125,7 +1824,7 @@ class CurationManager:
         self, workflow_id: str
     ) -> List[Dict[str, Any]]:
         """Return all quote curation items for a workflow."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, original_data_json, curated_data_json, status, created_at
@@ -1149,7 +1848,7 @@ class CurationManager:
 
     async def complete_quote_workflow(self, workflow_id: str) -> None:
         """Mark quote workflow as completed."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             await db.execute(
                 """
                 UPDATE quote_workflow_curation SET overall_status = 'COMPLETED'
@@ -1157,13 +1856,18 @@ class CurationManager:
                 """,
                 (workflow_id,),
             )
+            await self._record_event(db, STAGE_COMPLETED, "quotes", workflow_id)
             await db.commit()
 
+    async def is_quote_workflow_completed(self, workflow_id: str) -> bool:
+        """Whether the quote workflow was marked completed."""
+        return await self._workflow_completed("quote_workflow_curation", workflow_id)
+
     # ===== CONCEPT EXTRACTION CURATION =====
 
     async def create_concept_workflow(self, workflow_id: str, content_uuid: str) -> None:
         """Create a concept workflow row."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             await db.execute(
                 """
                 INSERT INTO concept_workflow_curation
@@ -1178,45 +1882,49 @@ class CurationManager:
         self, workflow_id: str, concept_items: List[Dict[str, Any]]
     ) -> None:
         """Add concept items to curation queue. Each: {uuid, original_data_json}."""
-        async with aiosqlite.connect(self.db_path) as db:
-            for item in concept_items:
-                item_uuid = item.get("uuid", str(uuid4()))
-                orig = item.get("original_data_json")
-                if isinstance(orig, dict):
-                    orig = json.dumps(orig)
-                await db.execute(
-                    """
-                    INSERT INTO concept_curation_items
-                    (uuid, workflow_id, original_data_json, status)
-                    VALUES (?, ?, ?, 'PENDING')
-                    """,
-                    (item_uuid, workflow_id, orig),
-                )
+        async with self._pool.write() as db:
+            await db.executemany(
+                """
+                INSERT INTO concept_curation_items
+                (uuid, workflow_id, original_data_json, status)
+                VALUES (?, ?, ?, 'PENDING')
+                """,
+                _workflow_item_rows(workflow_id, concept_items),
+            )
+            await self._record_event(
+                db,
+                ITEMS_QUEUED,
+                "concepts",
+                workflow_id,
+                data={"count": len(concept_items)},
+            )
             await db.commit()
 
     async def queue_concept_relation_curation_items(
         self, workflow_id: str, relation_items: List[Dict[str, Any]]
     ) -> None:
         """Add concept relation items to curation queue."""
-        async with aiosqlite.connect(self.db_path) as db:
-            for item in relation_items:
-                item_uuid = item.get("uuid", str(uuid4()))
-                orig = item.get("original_data_json")
-                if isinstance(orig, dict):
-                    orig = json.dumps(orig)
-                await db.execute(
-                    """
-                    INSERT INTO concept_relation_curation_items
-                    (uuid, workflow_id, original_data_json, status)
-                    VALUES (?, ?, ?, 'PENDING')
-                    """,
-                    (item_uuid, workflow_id, orig),
-                )
+        async with self._pool.write() as db:
+            await db.executemany(
+                """
+                INSERT INTO concept_relation_curation_items
+                (uuid, workflow_id, original_data_json, status)
+                VALUES (?, ?, ?, 'PENDING')
+                """,
+                _workflow_item_rows(workflow_id, relation_items),
+            )
+            await self._record_event(
+                db,
+                ITEMS_QUEUED,
+                "concept_relations",
+                workflow_id,
+                data={"count": len(relation_items)},
+            )
             await db.commit()
 
     async def get_concept_pending_count(self, workflow_id: str) -> int:
         """Return count of pending concept + relation items."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT (SELECT COUNT(*) FROM concept_curation_items WHERE workflow_id = ? AND status = 'PENDING')
@@ -1231,7 +1939,7 @@ class CurationManager:
         self, workflow_id: str
     ) -> List[Dict[str, Any]]:
         """Return all accepted concept items (curated or original JSON)."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, original_data_json, curated_data_json
@@ -1252,7 +1960,7 @@ class CurationManager:
         self, workflow_id: str
     ) -> List[Dict[str, Any]]:
         """Return all accepted concept relation items."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, original_data_json, curated_data_json
@@ -1273,7 +1981,7 @@ class CurationManager:
         self, workflow_id: str, item_uuid: str, curated_data: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Accept a concept item."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             curated_json = json.dumps(curated_data) if curated_data else None
             cursor = await db.execute(
                 """
@@ -1283,12 +1991,20 @@ class CurationManager:
                 """,
                 (curated_json, datetime.utcnow().isoformat(), workflow_id, item_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "concepts",
+                    workflow_id=workflow_id,
+                    data={"item_id": item_uuid, "action": "accepted"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
     async def reject_concept_item(self, workflow_id: str, item_uuid: str) -> bool:
         """Reject a concept item."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             cursor = await db.execute(
                 """
                 UPDATE concept_curation_items
@@ -1297,6 +2013,14 @@ class CurationManager:
                 """,
                 (datetime.utcnow().isoformat(), workflow_id, item_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "concepts",
+                    workflow_id=workflow_id,
+                    data={"item_id": item_uuid, "action": "rejected"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
@@ -1304,7 +2028,7 @@ class CurationManager:
         self, workflow_id: str, item_uuid: str, curated_data: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Accept a concept relation item."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             curated_json = json.dumps(curated_data) if curated_data else None
             cursor = await db.execute(
                 """
@@ -1314,6 +2038,14 @@ class CurationManager:
                 """,
                 (curated_json, datetime.utcnow().isoformat(), workflow_id, item_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "concept_relations",
+                    workflow_id=workflow_id,
+                    data={"item_id": item_uuid, "action": "accepted"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
@@ -1321,7 +2053,7 @@ class CurationManager:
         self, workflow_id: str, item_uuid: str
     ) -> bool:
         """Reject a concept relation item."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             cursor = await db.execute(
                 """
                 UPDATE concept_relation_curation_items
@@ -1330,12 +2062,20 @@ class CurationManager:
                 """,
                 (datetime.utcnow().isoformat(), workflow_id, item_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "concept_relations",
+                    workflow_id=workflow_id,
+                    data={"item_id": item_uuid, "action": "rejected"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
     async def get_pending_concept_workflows(self) -> List[Dict[str, Any]]:
         """Return list of concept workflows not COMPLETED."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT workflow_id, content_uuid, overall_status, created_at
@@ -1354,7 +2094,7 @@ class CurationManager:
         self, workflow_id: str
     ) -> List[Dict[str, Any]]:
         """Return all concept curation items for a workflow."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, original_data_json, curated_data_json, status, created_at
@@ -1380,7 +2120,7 @@ class CurationManager:
         self, workflow_id: str
     ) -> List[Dict[str, Any]]:
         """Return all concept relation curation items for a workflow."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, original_data_json, curated_data_json, status, created_at
@@ -1404,7 +2144,7 @@ class CurationManager:
 
     async def complete_concept_workflow(self, workflow_id: str) -> None:
         """Mark concept workflow as completed."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             await db.execute(
                 """
                 UPDATE concept_workflow_curation SET overall_status = 'COMPLETED'
@@ -1412,38 +2152,61 @@ class CurationManager:
                 """,
                 (workflow_id,),
             )
+            await self._record_event(db, STAGE_COMPLETED, "concepts", workflow_id)
             await db.commit()
 
+    async def is_concept_workflow_completed(self, workflow_id: str) -> bool:
+        """Whether the concept workflow was marked completed."""
+        return await self._workflow_completed("concept_workflow_curation", workflow_id)
+
     # ===== INBOX CLASSIFICATION CURATION =====
 
     async def queue_inbox_classification_items(
         self, workflow_id: str, items: List[Dict[str, Any]]
     ) -> None:
         """Add inbox classification items to curation queue. Each item: {uuid, source_path, target_folder, note_title, reason}."""
-        async with aiosqlite.connect(self.db_path) as db:
-            for item in items:
-                item_uuid = item.get("uuid", str(uuid4()))
-                original = {
-                    "source_path": item["source_path"],
-                    "target_folder": item["target_folder"],
-                    "note_title": item.get("note_title", ""),
-                    "reason": item.get("reason", ""),
-                }
-                await db.execute(
-                    """
-                    INSERT INTO inbox_classification_items
-                    (uuid, workflow_id, original_data_json, status)
-                    VALUES (?, ?, ?, 'PENDING')
-                    """,
-                    (item_uuid, workflow_id, json.dumps(original)),
-                )
+        rows = [
+            (
+                item.get("uuid", str(uuid4())),
+                workflow_id,
+                json.dumps(
+                    {
+                        "source_path": item["source_path"],
+                        "target_folder": item["target_folder"],
+                        "note_title": item.get("note_title", ""),
+                        "reason": item.get("reason", ""),
+                    }
+                ),
+            )
+            for item in items
+        ]
+        async with self._pool.write() as db:
+            await db.executemany(
+                """
+                INSERT INTO inbox_classification_items
+                (uuid, workflow_id, original_data_json, status)
+                VALUES (?, ?, ?, 'PENDING')
+                """,
+                rows,
+            )
+            await db.execute(
+                "INSERT OR IGNORE INTO inbox_workflow_curation (workflow_id) VALUES (?)",
+                (workflow_id,),
+            )
+            await self._record_event(
+                db,
+                ITEMS_QUEUED,
+                "inbox",
+                workflow_id,
+                data={"count": len(rows)},
+            )
             await db.commit()
 
     async def get_inbox_classification_pending_count(
         self, workflow_id: str
     ) -> int:
         """Return count of pending items for a workflow."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT COUNT(*) FROM inbox_classification_items
@@ -1458,7 +2221,7 @@ class CurationManager:
         self, workflow_id: str
     ) -> List[Dict[str, Any]]:
         """Return all accepted items with final source_path and target_folder for execution."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, original_data_json, curated_data_json
@@ -1491,7 +2254,7 @@ class CurationManager:
         curated_data: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """Accept an inbox classification item. curated_data may include edited_target_folder."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             curated_json = json.dumps(curated_data or {}) if curated_data else None
             cursor = await db.execute(
                 """
@@ -1501,6 +2264,14 @@ class CurationManager:
                 """,
                 (curated_json, datetime.utcnow().isoformat(), workflow_id, item_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "inbox",
+                    workflow_id=workflow_id,
+                    data={"item_id": item_uuid, "action": "accepted"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
@@ -1508,7 +2279,7 @@ class CurationManager:
         self, workflow_id: str, item_uuid: str
     ) -> bool:
         """Reject an inbox classification item."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             cursor = await db.execute(
                 """
                 UPDATE inbox_classification_items
@@ -1517,17 +2288,59 @@ class CurationManager:
                 """,
                 (datetime.utcnow().isoformat(), workflow_id, item_uuid),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    ITEM_REVIEWED,
+                    "inbox",
+                    workflow_id=workflow_id,
+                    data={"item_id": item_uuid, "action": "rejected"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
+    async def complete_inbox_workflow(self, workflow_id: str) -> None:
+        """Mark inbox workflow as completed; items still pending stay in the inbox."""
+        async with self._pool.write() as db:
+            await db.execute(
+                """
+                INSERT INTO inbox_workflow_curation (workflow_id, overall_status)
+                VALUES (?, 'COMPLETED')
+                ON CONFLICT (workflow_id) DO UPDATE SET overall_status = 'COMPLETED'
+                """,
+                (workflow_id,),
+            )
+            await self._record_event(db, STAGE_COMPLETED, "inbox", workflow_id)
+            await db.commit()
+
+    async def is_inbox_workflow_completed(self, workflow_id: str) -> bool:
+        """Whether the inbox workflow was marked completed."""
+        return await self._workflow_completed("inbox_workflow_curation", workflow_id)
+
+    async def _workflow_completed(self, table: str, workflow_id: str) -> bool:
+        """Whether `table` holds a COMPLETED row for the workflow"""
+        async with self._pool.read() as db:
+            async with db.execute(
+                f"""
+                SELECT 1 FROM {table}
+                WHERE workflow_id = ? AND overall_status = 'COMPLETED'
+                """,
+                (workflow_id,),
+            ) as cursor:
+                return await cursor.fetchone() is not None
+
     async def get_pending_inbox_workflow_ids(self) -> List[str]:
-        """Return workflow_ids that have at least one PENDING inbox item."""
-        async with aiosqlite.connect(self.db_path) as db:
+        """Return workflow_ids not completed yet with at least one PENDING item."""
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT DISTINCT workflow_id
                 FROM inbox_classification_items
                 WHERE status = 'PENDING'
+                    AND workflow_id NOT IN (
+                        SELECT workflow_id FROM inbox_workflow_curation
+                        WHERE overall_status = 'COMPLETED'
+                    )
                 ORDER BY workflow_id
                 """
             ) as cursor:
@@ -1538,7 +2351,7 @@ class CurationManager:
         self, workflow_id: str
     ) -> List[Dict[str, Any]]:
         """Return all inbox classification items for a workflow."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             async with db.execute(
                 """
                 SELECT uuid, original_data_json, curated_data_json, status, created_at
@@ -1574,8 +2387,8 @@ class CurationManager:
         """Create a notification. Returns notification uuid."""
         n_uuid = str(uuid4())
         payload_json = json.dumps(payload) if payload else None
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
+        async with self._pool.write() as db:
+            cursor = await db.execute(
                 """
                 INSERT INTO notifications
                 (uuid, workflow_id, workflow_type, notification_type, title, message, payload_json)
@@ -1591,6 +2404,19 @@ class CurationManager:
                     payload_json,
                 ),
             )
+            await self._record_event(
+                db,
+                NOTIFICATION_CREATED,
+                None,
+                workflow_id,
+                data={
+                    "id": cursor.lastrowid,
+                    "uuid": n_uuid,
+                    "workflow_type": workflow_type,
+                    "notification_type": notification_type,
+                    "title": title,
+                },
+            )
             await db.commit()
         return n_uuid
 
@@ -1601,7 +2427,7 @@ class CurationManager:
         offset: int = 0,
     ) -> Tuple[List[Dict[str, Any]], int]:
         """Return (notifications, total_count). When limit=0, notifications list is empty but total is set."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.read() as db:
             where = "WHERE read_at IS NULL" if unread_only else ""
             count_sql = f"SELECT COUNT(*) FROM notifications {where}"
             async with db.execute(count_sql) as cursor:
@@ -1639,35 +2465,95 @@ class CurationManager:
 
     async def mark_notification_read(self, notification_id: int) -> bool:
         """Mark a notification as read by id."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             cursor = await db.execute(
                 """
                 UPDATE notifications SET read_at = ? WHERE id = ?
                 """,
                 (datetime.utcnow().isoformat(), notification_id),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    NOTIFICATION_UPDATED,
+                    None,
+                    data={"id": notification_id, "change": "read"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
     async def mark_notification_dismissed(self, notification_id: int) -> bool:
         """Mark a notification as dismissed by id."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
             cursor = await db.execute(
                 """
                 UPDATE notifications SET dismissed_at = ? WHERE id = ?
                 """,
                 (datetime.utcnow().isoformat(), notification_id),
             )
+            if cursor.rowcount > 0:
+                await self._record_event(
+                    db,
+                    NOTIFICATION_UPDATED,
+                    None,
+                    data={"id": notification_id, "change": "dismissed"},
+                )
             await db.commit()
             return cursor.rowcount > 0
 
+    # ===== ARCHIVAL =====
+
+    async def archive_completed(
+        self, archive_path: str, older_than: datetime
+    ) -> Dict[str, int]:
+        """
+        Move journals and quote/concept workflows completed before
+        `older_than` (UTC), with all their rows, to the archive database.
+
+        Returns:
+            Archived count per kind, plus the total rows moved
+        """
+        cutoff = older_than.strftime("%Y-%m-%d %H:%M:%S")
+        archived = {kind: 0 for kind in curation_archive.ARCHIVABLE_QUERIES}
+        archived["rows"] = 0
+        for kind in curation_archive.ARCHIVABLE_QUERIES:
+            while True:
+                # One batch per write, so other writers are not held up
+                async with self._pool.write() as db:
+                    await db.execute(
+                        f"ATTACH DATABASE ? AS {curation_archive.ARCHIVE_SCHEMA}",
+                        (archive_path,),
+                    )
+                    try:
+                        parents, rows = await curation_archive.archive_batch(
+                            db, kind, cutoff
+                        )
+                    finally:
+                        if db.in_transaction:
+                            await db.rollback()
+                        await db.execute(
+                            f"DETACH DATABASE {curation_archive.ARCHIVE_SCHEMA}"
+                        )
+                archived[kind] += parents
+                archived["rows"] += rows
+                if parents < curation_archive.ARCHIVE_BATCH:
+                    break
+        return archived
+
+    async def compact(self, vacuum_pages: int = curation_archive.VACUUM_PAGES) -> int:
+        """Free unused pages and refresh planner statistics; returns pages freed"""
+        async with self._pool.write() as db:
+            return await curation_archive.compact(db, vacuum_pages)
+
     async def clear_all(self):
         """Wipe all rows from every table."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.write() as db:
+            await db.execute("DELETE FROM curation_events")
             await db.execute("DELETE FROM notifications")
             await db.execute("DELETE FROM quote_curation_items")
             await db.execute("DELETE FROM quote_workflow_curation")
             await db.execute("DELETE FROM inbox_classification_items")
+            await db.execute("DELETE FROM inbox_workflow_curation")
             await db.execute("DELETE FROM relationship_context_items")
             await db.execute("DELETE FROM span_curation_items")
             await db.execute("DELETE FROM relationship_curation_items")
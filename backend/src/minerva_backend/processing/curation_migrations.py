@@ -0,0 +1,172 @@
+"""
+Curation DB Migrations for Minerva
+Versioned schema changes for the curation DB, applied in order by
+CurationManager.initialize and recorded in PRAGMA user_version.
+
+CurationManager creates missing tables with the latest schema, so every
+migration checks what is already there and only changes databases created
+by older versions. Each migration runs in its own transaction.
+"""
+
+import logging
+from typing import Awaitable, Callable, List, Set, Tuple
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+async def _columns(db: aiosqlite.Connection, table: str) -> Set[str]:
+    return {row[1] for row in await db.execute_fetchall(f"PRAGMA table_info({table})")}
+
+
+async def add_journal_workflow_id(db: aiosqlite.Connection) -> None:
+    """Temporal workflow to signal when a journal's curation phase completes."""
+    if "workflow_id" not in await _columns(db, "journal_curation"):
+        await db.execute("ALTER TABLE journal_curation ADD COLUMN workflow_id TEXT")
+
+
+async def add_typed_curation_columns(db: aiosqlite.Connection) -> None:
+    """
+    Spans as (start_pos, end_pos, text) columns instead of span_data_json,
+    entity names and relationship endpoints as indexed columns.
+    """
+    if "name" not in await _columns(db, "entity_curation_items"):
+        await db.execute("ALTER TABLE entity_curation_items ADD COLUMN name TEXT")
+        await db.execute(
+            """
+            UPDATE entity_curation_items SET name = json_extract(
+                COALESCE(curated_data_json, original_data_json), '$.name'
+            )
+        """
+        )
+
+    if "source_uuid" not in await _columns(db, "relationship_curation_items"):
+        await db.execute(
+            "ALTER TABLE relationship_curation_items ADD COLUMN source_uuid TEXT"
+        )
+        await db.execute(
+            "ALTER TABLE relationship_curation_items ADD COLUMN target_uuid TEXT"
+        )
+        await db.execute(
+            """
+            UPDATE relationship_curation_items SET
+                source_uuid = json_extract(
+                    COALESCE(curated_data_json, original_data_json), '$.source'
+                ),
+                target_uuid = json_extract(
+                    COALESCE(curated_data_json, original_data_json), '$.target'
+                )
+        """
+        )
+
+    if "span_data_json" in await _columns(db, "span_curation_items"):
+        # SQLite can't change column types in place: rebuild the table
+        await db.execute(
+            """
+            CREATE TABLE span_curation_items_typed (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                uuid TEXT,
+                journal_id TEXT,
+                owner_uuid TEXT,
+                start_pos INTEGER NOT NULL,
+                end_pos INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (journal_id) REFERENCES journal_curation (uuid)
+            )
+        """
+        )
+        await db.execute(
+            """
+            INSERT INTO span_curation_items_typed
+            (id, uuid, journal_id, owner_uuid, start_pos, end_pos, text, created_at)
+            SELECT id, uuid, journal_id, owner_uuid,
+                json_extract(span_data_json, '$.start'),
+                json_extract(span_data_json, '$.end'),
+                json_extract(span_data_json, '$.text'),
+                COALESCE(json_extract(span_data_json, '$.created_at'), created_at)
+            FROM span_curation_items
+        """
+        )
+        await db.execute("DROP TABLE span_curation_items")
+        await db.execute(
+            "ALTER TABLE span_curation_items_typed RENAME TO span_curation_items"
+        )
+        await db.execute(
+            "CREATE INDEX idx_span_items_owner ON span_curation_items (owner_uuid)"
+        )
+
+    await db.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_entity_items_type_name
+        ON entity_curation_items (entity_type, name)
+    """
+    )
+    await db.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_relationship_items_source_target
+        ON relationship_curation_items (source_uuid, target_uuid)
+    """
+    )
+
+
+async def add_curation_stats(db: aiosqlite.Connection) -> None:
+    """
+    Journal completion times, and curation_stats counts for the rows that
+    existed before its triggers.
+    """
+    if "completed_at" not in await _columns(db, "journal_curation"):
+        await db.execute(
+            "ALTER TABLE journal_curation ADD COLUMN completed_at TIMESTAMP"
+        )
+    await db.execute("DELETE FROM curation_stats")
+    await db.execute(
+        """
+        INSERT INTO curation_stats (scope, status, count, timed, curate_seconds)
+        SELECT 'journal', overall_status, COUNT(*), COUNT(completed_at), COALESCE(
+            SUM((julianday(completed_at) - julianday(created_at)) * 86400), 0
+        )
+        FROM journal_curation GROUP BY overall_status
+        UNION ALL
+        SELECT 'entity', status, COUNT(*), 0, 0
+        FROM entity_curation_items GROUP BY status
+        UNION ALL
+        SELECT 'relationship', status, COUNT(*), 0, 0
+        FROM relationship_curation_items GROUP BY status
+    """
+    )
+
+
+# (version, migration) in order; append new ones, never edit applied ones
+MIGRATIONS: List[Tuple[int, Callable[[aiosqlite.Connection], Awaitable[None]]]] = [
+    (1, add_journal_workflow_id),
+    (2, add_typed_curation_columns),
+    (3, add_curation_stats),
+]
+
+
+async def migrate(db: aiosqlite.Connection) -> int:
+    """
+    Apply the migrations newer than the database's user_version.
+
+    Returns:
+        The schema version after migrating
+    """
+    if db.in_transaction:
+        await db.commit()
+    version = (await db.execute_fetchall("PRAGMA user_version"))[0][0]
+    for target, migration in MIGRATIONS:
+        if target <= version:
+            continue
+        await db.execute("BEGIN")
+        try:
+            await migration(db)
+            await db.execute(f"PRAGMA user_version = {target}")
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        logger.info(f"Curation DB migrated to version {target}: {migration.__name__}")
+        version = target
+    return version
@@ -0,0 +1,62 @@
+"""
+Curation Signals for Minerva
+Human-in-the-loop stages wait for a Temporal signal sent by the curation API
+instead of polling the curation DB from a long-running activity.
+
+The workflow blocks on workflow.wait_condition (no worker slot held); once
+signalled, a short activity fetches the accepted items. In case a signal is
+lost (e.g. Temporal was unreachable when the API sent it) the curation DB is
+re-checked every CURATION_RECHECK_INTERVAL.
+"""
+
+import asyncio
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from temporalio import workflow
+from temporalio.exceptions import ApplicationError
+
+# Signal names, sent by the curation API
+ENTITY_CURATION_COMPLETE = "entity_curation_complete"
+RELATIONSHIP_CURATION_COMPLETE = "relationship_curation_complete"
+CURATION_COMPLETE = "curation_complete"
+
+# The user has this long to finish a curation stage
+CURATION_TIMEOUT = timedelta(days=7)
+CURATION_RECHECK_INTERVAL = timedelta(hours=1)
+
+# Options for the short activities that read the curation DB
+CURATION_ACTIVITY_TIMEOUT = timedelta(minutes=1)
+
+
+async def wait_for_curation(
+    signalled: Callable[[], bool],
+    is_done: Callable[[], Awaitable[bool]],
+    stage: str,
+) -> None:
+    """
+    Wait (inside a workflow) until a curation stage is complete.
+
+    Args:
+        signalled: Returns True once the completion signal has arrived
+        is_done: Runs an activity checking the curation DB (fallback)
+        stage: Stage name for the timeout error
+
+    Raises:
+        ApplicationError: If the stage is not completed within CURATION_TIMEOUT
+    """
+    deadline = workflow.now() + CURATION_TIMEOUT
+    while not signalled():
+        remaining = deadline - workflow.now()
+        if remaining <= timedelta(0):
+            raise ApplicationError(
+                f"{stage} curation not completed within {CURATION_TIMEOUT.days} days",
+                non_retryable=True,
+            )
+        try:
+            await workflow.wait_condition(
+                signalled, timeout=min(remaining, CURATION_RECHECK_INTERVAL)
+            )
+        except asyncio.TimeoutError:
+            if await is_done():
+                return
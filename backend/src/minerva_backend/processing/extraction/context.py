@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 from minerva_models import JournalEntry
+from minerva_backend.graph.services.hybrid_search_service import HybridSearchService
 from minerva_backend.graph.services.knowledge_graph_service import KnowledgeGraphService
 from minerva_backend.processing.models import EntityMapping
 
@@ -15,6 +16,7 @@ class ExtractionContext:
     kg_service: KnowledgeGraphService
     people_context: Optional[Dict[str, str]] = None
     extracted_entities: Optional[List[EntityMapping]] = None
+    hybrid_search: Optional[HybridSearchService] = None
 
     def __post_init__(self):
         if self.extracted_entities is None:
@@ -23,11 +23,13 @@ class EntityExtractionOrchestrator:
         span_processing_service: SpanProcessingService,
         processors: List[EntityProcessorStrategy],
         kg_service,
+        hybrid_search_service=None,
     ):
         self.obsidian_service = obsidian_service
         self.span_processing_service = span_processing_service
         self.processors = {processor.entity_type: processor for processor in processors}
         self.kg_service = kg_service
+        self.hybrid_search_service = hybrid_search_service
         self.logger = get_logger("minerva_backend.processing.extraction.orchestrator")
         self.performance_logger = get_performance_logger()
 
@@ -149,4 +151,5 @@ class EntityExtractionOrchestrator:
             journal_entry=journal_entry,
             obsidian_entities=obsidian_entities,
             kg_service=self.kg_service,
+            hybrid_search=self.hybrid_search_service,
         )
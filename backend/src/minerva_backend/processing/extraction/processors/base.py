@@ -4,6 +4,10 @@ from typing import Any, Callable, Dict, List
 from minerva_backend.processing.extraction.context import ExtractionContext
 from minerva_backend.processing.models import EntityMapping
 
+# Similitud vectorial mínima de un concepto relevante, como en
+# ConceptRepository.find_relevant_concepts
+RELEVANT_CONCEPT_THRESHOLD = 0.6
+
 
 class EntityProcessorStrategy(ABC):
     """Interfaz base para procesadores de entidades."""
@@ -35,6 +39,36 @@ class BaseEntityProcessor(EntityProcessorStrategy):
         self.span_service = span_service
         self.obsidian_service = obsidian_service
 
+    async def _find_relevant_concepts(
+        self, context: ExtractionContext, limit: int = 5
+    ) -> List[Any]:
+        """Conceptos relevantes para la entrada: búsqueda híbrida si está disponible, si no vectorial."""
+        concept_repository = self.entity_repositories["Concept"]
+        entry_text = context.journal_entry.entry_text
+
+        if context.hybrid_search is None:
+            return await concept_repository.find_relevant_concepts(
+                entry_text, limit=limit
+            )
+
+        # Los [[Links]] de la entrada anclan el boost por proximidad en el grafo
+        linked_uuids = [
+            entity_data.entity_id
+            for entity_data in context.obsidian_entities.get("db_entities", [])
+        ]
+        results = await context.hybrid_search.search(
+            entry_text,
+            labels=["Concept"],
+            limit=limit,
+            journal_uuid=context.journal_entry.uuid,
+            anchor_uuids=linked_uuids,
+            min_vector_score=RELEVANT_CONCEPT_THRESHOLD,
+        )
+        return [
+            concept_repository._properties_to_node(result.properties)
+            for result in results
+        ]
+
     async def _process_and_deduplicate_entities(
         self,
         llm_entities: List[Any],
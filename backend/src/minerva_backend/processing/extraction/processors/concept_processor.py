@@ -131,9 +131,7 @@ class ConceptProcessor(BaseEntityProcessor):
                         linked_concepts.append(concept)
 
             # 2. Get RAG concepts (limit 10)
-            rag_concepts = await self.concept_repository.find_relevant_concepts(
-                context.journal_entry.entry_text, limit=10
-            )
+            rag_concepts = await self._find_relevant_concepts(context, limit=10)
 
             # 3. Get recent concepts (limit 10)
             recent_concepts = self.concept_repository.get_concepts_with_recent_mentions(
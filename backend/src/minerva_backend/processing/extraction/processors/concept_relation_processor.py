@@ -226,9 +226,7 @@ class ConceptRelationProcessor(BaseEntityProcessor):
         ]
 
         # Get RAG concepts (limit 10)
-        rag_concepts = await self.concept_repository.find_relevant_concepts(
-            context.journal_entry.entry_text, limit=10
-        )
+        rag_concepts = await self._find_relevant_concepts(context, limit=10)
         rag_formatted = [
             {
                 "name": c.title,
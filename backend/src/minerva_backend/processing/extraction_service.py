@@ -1,9 +1,10 @@
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from minerva_backend.graph.db import Neo4jConnection
 from minerva_models import JournalEntry
 from minerva_backend.graph.repositories.base import BaseRepository
+from minerva_backend.graph.services.hybrid_search_service import HybridSearchService
 from minerva_backend.graph.services.knowledge_graph_service import KnowledgeGraphService
 from minerva_backend.obsidian.obsidian_service import ObsidianService
 from minerva_backend.processing.extraction.orchestrator import (
@@ -28,11 +29,13 @@ class ExtractionService:
         obsidian_service: ObsidianService,
         kg_service: KnowledgeGraphService,
         entity_repositories: Dict[str, BaseRepository],
+        hybrid_search_service: Optional[HybridSearchService] = None,
     ):
         self.llm_service = llm_service
         self.connection = connection
         self.obsidian_service = obsidian_service
         self.kg_service = kg_service
+        self.hybrid_search_service = hybrid_search_service
         self.logger = get_logger("minerva_backend.processing.extraction_service")
         self.performance_logger = get_performance_logger()
 
@@ -56,6 +59,7 @@ class ExtractionService:
             span_processing_service=self.span_processing_service,
             processors=processors,
             kg_service=self.kg_service,
+            hybrid_search_service=self.hybrid_search_service,
         )
 
     async def extract_entities(
@@ -146,6 +150,7 @@ class ExtractionService:
                 journal_entry=journal_entry,
                 obsidian_entities=obsidian_entities,
                 kg_service=self.kg_service,
+                hybrid_search=self.hybrid_search_service,
             )
             context.add_entities(curated_entities)
 
@@ -231,6 +236,7 @@ class ExtractionService:
                 journal_entry=journal_entry,
                 obsidian_entities=obsidian_entities,
                 kg_service=self.kg_service,
+                hybrid_search=self.hybrid_search_service,
             )
             context.add_entities(entities)
 
@@ -1,26 +1,40 @@
 """Temporal workflow for classifying Obsidian inbox notes and moving them after human approval."""
 
-import asyncio
 import os
 import shutil
 import time
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 from temporalio import activity, workflow
 from temporalio.common import RetryPolicy
 
+from minerva_backend.processing.curation_signals import (
+    CURATION_ACTIVITY_TIMEOUT,
+    CURATION_COMPLETE,
+    wait_for_curation,
+)
+
+if TYPE_CHECKING:
+    from minerva_backend.containers import Container
+
 
 
 # ===== ACTIVITIES =====
 
 
 class InboxClassificationActivities:
+    """Inbox classification activities, bound to the worker's Container."""
+
+    def __init__(self, container: "Container"):
+        self.container = container
+
     @activity.defn
     async def emit_notification(
+        self,
         workflow_id: str,
         workflow_type: str,
         notification_type: str,
@@ -29,10 +43,7 @@ class InboxClassificationActivities:
         payload: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Write a notification to the curation DB (for UI display)."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        await container.curation_manager().create_notification(
+        await self.container.curation_manager().create_notification(
             workflow_id=workflow_id,
             workflow_type=workflow_type,
             notification_type=notification_type,
@@ -42,7 +53,9 @@ class InboxClassificationActivities:
         )
 
     @activity.defn
-    async def scan_inbox(inbox_path: str, vault_path: str) -> List[Dict[str, Any]]:
+    async def scan_inbox(
+        self, inbox_path: str, vault_path: str
+    ) -> List[Dict[str, Any]]:
         """List all markdown files in the inbox folder. Returns list of {source_path, note_title}."""
         root = Path(vault_path).resolve()
         inbox = (root / inbox_path.lstrip("/")).resolve()
@@ -65,6 +78,7 @@ class InboxClassificationActivities:
 
     @activity.defn
     async def classify_notes_llm(
+        self,
         files: List[Dict[str, Any]],
         vault_path: str,
         folder_structure: str,
@@ -136,7 +150,9 @@ class InboxClassificationActivities:
         return results
 
     @activity.defn
-    async def get_vault_folder_structure(vault_path: str, max_depth: int = 2) -> str:
+    async def get_vault_folder_structure(
+        self, vault_path: str, max_depth: int = 2
+    ) -> str:
         """Return a text listing of vault folders (for LLM context)."""
         root = Path(vault_path).resolve()
         lines = []
@@ -154,35 +170,36 @@ class InboxClassificationActivities:
 
     @activity.defn
     async def submit_classification_curation(
-        workflow_id: str, classifications: List[Dict[str, Any]]
+        self, workflow_id: str, classifications: List[Dict[str, Any]]
     ) -> None:
         """Write classification suggestions to curation DB."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        await container.curation_manager().queue_inbox_classification_items(
+        await self.container.curation_manager().queue_inbox_classification_items(
             workflow_id, classifications
         )
 
     @activity.defn
-    async def wait_for_classification_curation(workflow_id: str) -> List[Dict[str, Any]]:
-        """Poll until all items are approved/rejected; return approved moves."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        while True:
-            pending = await container.curation_manager().get_inbox_classification_pending_count(
-                workflow_id
-            )
-            if pending == 0:
-                return await container.curation_manager().get_approved_inbox_classification_items(
-                    workflow_id
-                )
-            activity.heartbeat()
-            await asyncio.sleep(30)
+    async def get_classification_pending_count(self, workflow_id: str) -> int:
+        """Classifications still awaited (0 once completed), checked without a signal."""
+        curation_manager = self.container.curation_manager()
+        # Completed early from the API: the remaining items are not waited for
+        if await curation_manager.is_inbox_workflow_completed(workflow_id):
+            return 0
+        return await curation_manager.get_inbox_classification_pending_count(
+            workflow_id
+        )
+
+    @activity.defn
+    async def get_approved_classifications(
+        self, workflow_id: str
+    ) -> List[Dict[str, Any]]:
+        """Approved moves, once every classification has been reviewed."""
+        return await self.container.curation_manager().get_approved_inbox_classification_items(
+            workflow_id
+        )
 
     @activity.defn
     async def execute_moves(
+        self,
         approved_moves: List[Dict[str, Any]], vault_path: str, workflow_id: Optional[str] = None
     ) -> None:
         """Move files from inbox to target folders. Creates target dirs if needed."""
@@ -196,9 +213,7 @@ class InboxClassificationActivities:
                 shutil.move(str(src), str(dest))
                 activity.logger.info(f"Moved {move['source_path']} -> {move['target_folder']}/{src.name}")
         if workflow_id:
-            from minerva_backend.containers import Container
-            container = Container()
-            await container.curation_manager().create_notification(
+            await self.container.curation_manager().create_notification(
                 workflow_id=workflow_id,
                 workflow_type="inbox_classification",
                 notification_type="workflow_completed",
@@ -215,15 +230,32 @@ class InboxClassificationActivities:
 class InboxClassificationWorkflow:
     """Classify notes in the Obsidian inbox and move them after human approval."""
 
+    def __init__(self):
+        self.curation_complete = False
+
+    @workflow.signal(name=CURATION_COMPLETE)
+    def complete_curation(self) -> None:
+        """Sent by the curation API once every classification has been reviewed."""
+        self.curation_complete = True
+
+    async def _no_classifications_pending(self, workflow_id: str) -> bool:
+        pending = await workflow.execute_activity_method(
+            InboxClassificationActivities.get_classification_pending_count,
+            args=[workflow_id],
+            start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
+        )
+        return pending == 0
+
     @workflow.run
     async def run(self, inbox_path: str) -> Dict[str, Any]:
         from minerva_backend.config import settings
 
         vault_path = settings.OBSIDIAN_VAULT_PATH
-        workflow_id = f"inbox-{int(time.time())}"
+        # Curation rows are keyed by the Temporal id so the API can signal back
+        workflow_id = workflow.info().workflow_id
 
         # 1. Scan inbox
-        files = await workflow.execute_activity(
+        files = await workflow.execute_activity_method(
             InboxClassificationActivities.scan_inbox,
             args=[inbox_path, vault_path],
             start_to_close_timeout=timedelta(minutes=5),
@@ -232,7 +264,7 @@ class InboxClassificationWorkflow:
             return {"workflow_id": workflow_id, "status": "completed", "moved": 0, "message": "No markdown files in inbox"}
 
         # 2. Get folder structure for LLM context
-        folder_structure = await workflow.execute_activity(
+        folder_structure = await workflow.execute_activity_method(
             InboxClassificationActivities.get_vault_folder_structure,
             args=[vault_path],
             start_to_close_timeout=timedelta(minutes=2),
@@ -245,7 +277,7 @@ class InboxClassificationWorkflow:
             backoff_coefficient=2.0,
             maximum_interval=timedelta(minutes=2),
         )
-        classifications = await workflow.execute_activity(
+        classifications = await workflow.execute_activity_method(
             InboxClassificationActivities.classify_notes_llm,
             args=[files, vault_path, folder_structure],
             start_to_close_timeout=timedelta(minutes=15),
@@ -253,21 +285,25 @@ class InboxClassificationWorkflow:
         )
 
         # 4. Submit to curation and wait for human approval
-        await workflow.execute_activity(
+        await workflow.execute_activity_method(
             InboxClassificationActivities.submit_classification_curation,
             args=[workflow_id, classifications],
             start_to_close_timeout=timedelta(minutes=2),
         )
-        approved = await workflow.execute_activity(
-            InboxClassificationActivities.wait_for_classification_curation,
+        await wait_for_curation(
+            lambda: self.curation_complete,
+            lambda: self._no_classifications_pending(workflow_id),
+            "Inbox classification",
+        )
+        approved = await workflow.execute_activity_method(
+            InboxClassificationActivities.get_approved_classifications,
             args=[workflow_id],
-            schedule_to_close_timeout=timedelta(days=7),
-            heartbeat_timeout=timedelta(minutes=2),
+            start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
         )
 
         # 5. Execute moves
         if approved:
-            await workflow.execute_activity(
+            await workflow.execute_activity_method(
                 InboxClassificationActivities.execute_moves,
                 args=[approved, vault_path, workflow_id],
                 start_to_close_timeout=timedelta(minutes=10),
@@ -57,6 +57,18 @@ class JournalEntryCuration(BaseModel):
     )
 
 
+class JournalCurationSummary(BaseModel):
+    """Pending journal without its text or tasks, for cheap dashboard polling."""
+
+    journal_id: str = Field(..., description="Associated journal entry ID")
+    date: date_type = Field(..., description="Journal entry date")
+    phase: Literal["entities", "relationships"] = Field(..., description="Phase")
+    pending_entities: int = Field(default=0, description="Entities awaiting review")
+    pending_relationships: int = Field(
+        default=0, description="Relationships awaiting review"
+    )
+
+
 class CurationEntityStats(BaseModel):
     """Entity curation statistics."""
 
@@ -92,6 +104,12 @@ class CurationStats(BaseModel):
         default=0, description="Journals pending relationship curation"
     )
     completed: int = Field(default=0, description="Completed journals")
+    oldest_pending_age_hours: float = Field(
+        default=0.0, description="Hours the oldest pending journal has waited"
+    )
+    avg_processing_time_minutes: float = Field(
+        default=0.0, description="Average minutes from queueing to completion"
+    )
     entity_stats: CurationEntityStats = Field(default_factory=CurationEntityStats)
     relationship_stats: CurationRelationshipStats = Field(
         default_factory=CurationRelationshipStats
@@ -1,18 +1,25 @@
 """Temporal workflow for parsing quotes from markdown and writing to Neo4j after human curation."""
 
-import asyncio
 import os
 import re
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import uuid4
 
 from temporalio import activity, workflow
 from temporalio.common import RetryPolicy
 
 from minerva_models import Content, Person, Quote, ResourceType, ResourceStatus
+from minerva_backend.processing.curation_signals import (
+    CURATION_ACTIVITY_TIMEOUT,
+    CURATION_COMPLETE,
+    wait_for_curation,
+)
+
+if TYPE_CHECKING:
+    from minerva_backend.containers import Container
 
 
 def _parse_quotes_from_content(content: str) -> List[Dict[str, Any]]:
@@ -44,8 +51,14 @@ def _parse_quotes_from_content(content: str) -> List[Dict[str, Any]]:
 
 
 class QuoteParsingActivities:
+    """Quote parsing activities, bound to the worker's Container."""
+
+    def __init__(self, container: "Container"):
+        self.container = container
+
     @activity.defn
     async def emit_notification(
+        self,
         workflow_id: str,
         workflow_type: str,
         notification_type: str,
@@ -54,10 +67,7 @@ class QuoteParsingActivities:
         payload: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Write a notification to the curation DB (for UI display)."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        await container.curation_manager().create_notification(
+        await self.container.curation_manager().create_notification(
             workflow_id=workflow_id,
             workflow_type=workflow_type,
             notification_type=notification_type,
@@ -67,7 +77,7 @@ class QuoteParsingActivities:
         )
 
     @activity.defn
-    async def scan_markdown_file(file_path: str, vault_path: str) -> str:
+    async def scan_markdown_file(self, file_path: str, vault_path: str) -> str:
         """Read markdown file content. file_path is relative to vault."""
         full = Path(vault_path).resolve() / file_path.lstrip("/")
         if not full.is_file():
@@ -76,7 +86,7 @@ class QuoteParsingActivities:
 
     @activity.defn
     async def parse_quotes_and_summary(
-        file_content: str, author: str, title: str
+        self, file_content: str, author: str, title: str
     ) -> Dict[str, Any]:
         """Parse '# Citas' section and generate summary/short summary via LLM. Returns quotes, summary, summary_short."""
         from langchain.chat_models import init_chat_model
@@ -115,7 +125,7 @@ class QuoteParsingActivities:
 
     @activity.defn
     async def enrich_with_web_search(
-        author: str, title: str, summary: str, summary_short: str
+        self, author: str, title: str, summary: str, summary_short: str
     ) -> Dict[str, Any]:
         """Optional enrichment. Stub: return same summaries; can plug zettel web_search_utils later."""
         return {
@@ -127,6 +137,7 @@ class QuoteParsingActivities:
 
     @activity.defn
     async def submit_quote_curation(
+        self,
         workflow_id: str,
         file_path: str,
         content_title: str,
@@ -134,17 +145,14 @@ class QuoteParsingActivities:
         quotes: List[Dict[str, Any]],
     ) -> None:
         """Write workflow row and quote items to curation DB."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        await container.curation_manager().create_quote_workflow(
+        await self.container.curation_manager().create_quote_workflow(
             workflow_id, file_path, content_title, content_author
         )
         items = [
             {"uuid": str(uuid4()), "original_data_json": q} for q in quotes
         ]
-        await container.curation_manager().queue_quote_curation_items(workflow_id, items)
-        await container.curation_manager().create_notification(
+        await self.container.curation_manager().queue_quote_curation_items(workflow_id, items)
+        await self.container.curation_manager().create_notification(
             workflow_id=workflow_id,
             workflow_type="quote_parsing",
             notification_type="curation_pending",
@@ -154,24 +162,24 @@ class QuoteParsingActivities:
         )
 
     @activity.defn
-    async def wait_for_quote_curation(workflow_id: str) -> List[Dict[str, Any]]:
-        """Poll until all quote items approved/rejected; return approved items."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        while True:
-            pending = await container.curation_manager().get_quote_pending_count(
-                workflow_id
-            )
-            if pending == 0:
-                return await container.curation_manager().get_approved_quote_items(
-                    workflow_id
-                )
-            activity.heartbeat()
-            await asyncio.sleep(30)
+    async def get_quote_pending_count(self, workflow_id: str) -> int:
+        """Quote items still awaited (0 once completed), checked without a signal."""
+        curation_manager = self.container.curation_manager()
+        # Completed early from the API: the remaining items are not waited for
+        if await curation_manager.is_quote_workflow_completed(workflow_id):
+            return 0
+        return await curation_manager.get_quote_pending_count(workflow_id)
+
+    @activity.defn
+    async def get_approved_quotes(self, workflow_id: str) -> List[Dict[str, Any]]:
+        """Quote items the user approved, once curation is complete."""
+        return await self.container.curation_manager().get_approved_quote_items(
+            workflow_id
+        )
 
     @activity.defn
     async def write_quotes_to_graph(
+        self,
         workflow_id: str,
         approved_quotes: List[Dict[str, Any]],
         content_author: str,
@@ -180,12 +188,9 @@ class QuoteParsingActivities:
         summary_short: str,
     ) -> Dict[str, Any]:
         """Create Content, Person (if needed), AUTHORED_BY, Quote nodes, QUOTED_IN."""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        content_repo = container.content_repository()
-        person_repo = container.person_repository()
-        quote_repo = container.quote_repository()
+        content_repo = self.container.content_repository()
+        person_repo = self.container.person_repository()
+        quote_repo = self.container.quote_repository()
 
         # Find or create author
         persons = await person_repo.search_by_name_partial(content_author)
@@ -230,7 +235,7 @@ class QuoteParsingActivities:
         if quote_objs:
             await quote_repo.create_quotes_for_content(quote_objs, content_uuid)
 
-        await container.curation_manager().complete_quote_workflow(workflow_id)
+        await self.container.curation_manager().complete_quote_workflow(workflow_id)
         return {"content_uuid": content_uuid, "quotes_count": len(approved_quotes)}
 
 
@@ -238,6 +243,22 @@ class QuoteParsingActivities:
 class QuoteParsingWorkflow:
     """Parse quotes from markdown and write to Neo4j after human curation."""
 
+    def __init__(self):
+        self.curation_complete = False
+
+    @workflow.signal(name=CURATION_COMPLETE)
+    def complete_curation(self) -> None:
+        """Sent by the curation API once every quote has been reviewed."""
+        self.curation_complete = True
+
+    async def _no_quotes_pending(self, workflow_id: str) -> bool:
+        pending = await workflow.execute_activity_method(
+            QuoteParsingActivities.get_quote_pending_count,
+            args=[workflow_id],
+            start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
+        )
+        return pending == 0
+
     @workflow.run
     async def run(self, input_payload: Dict[str, Any]) -> Dict[str, Any]:
         from minerva_backend.config import settings
@@ -246,9 +267,10 @@ class QuoteParsingWorkflow:
         author = input_payload["author"]
         title = input_payload["title"]
         vault_path = settings.OBSIDIAN_VAULT_PATH
-        workflow_id = f"quote-{uuid4().hex[:12]}"
+        # Curation rows are keyed by the Temporal id so the API can signal back
+        workflow_id = workflow.info().workflow_id
 
-        await workflow.execute_activity(
+        await workflow.execute_activity_method(
             QuoteParsingActivities.emit_notification,
             args=[
                 workflow_id,
@@ -260,7 +282,7 @@ class QuoteParsingWorkflow:
             ],
             start_to_close_timeout=timedelta(seconds=30),
         )
-        content = await workflow.execute_activity(
+        content = await workflow.execute_activity_method(
             QuoteParsingActivities.scan_markdown_file,
             args=[file_path, vault_path],
             start_to_close_timeout=timedelta(minutes=5),
@@ -272,13 +294,13 @@ class QuoteParsingWorkflow:
             backoff_coefficient=2.0,
             maximum_interval=timedelta(minutes=2),
         )
-        parsed = await workflow.execute_activity(
+        parsed = await workflow.execute_activity_method(
             QuoteParsingActivities.parse_quotes_and_summary,
             args=[content, author, title],
             start_to_close_timeout=timedelta(minutes=10),
             retry_policy=llm_retry,
         )
-        enrichment = await workflow.execute_activity(
+        enrichment = await workflow.execute_activity_method(
             QuoteParsingActivities.enrich_with_web_search,
             args=[
                 parsed["author"],
@@ -291,7 +313,7 @@ class QuoteParsingWorkflow:
         summary = enrichment.get("summary") or parsed["summary"]
         summary_short = enrichment.get("summary_short") or parsed["summary_short"]
 
-        await workflow.execute_activity(
+        await workflow.execute_activity_method(
             QuoteParsingActivities.submit_quote_curation,
             args=[
                 workflow_id,
@@ -302,15 +324,21 @@ class QuoteParsingWorkflow:
             ],
             start_to_close_timeout=timedelta(minutes=2),
         )
-        approved = await workflow.execute_activity(
-            QuoteParsingActivities.wait_for_quote_curation,
-            args=[workflow_id],
-            schedule_to_close_timeout=timedelta(days=7),
-            heartbeat_timeout=timedelta(minutes=2),
-        )
+        approved: List[Dict[str, Any]] = []
+        if parsed["quotes"]:
+            await wait_for_curation(
+                lambda: self.curation_complete,
+                lambda: self._no_quotes_pending(workflow_id),
+                "Quote",
+            )
+            approved = await workflow.execute_activity_method(
+                QuoteParsingActivities.get_approved_quotes,
+                args=[workflow_id],
+                start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
+            )
 
         if approved:
-            result = await workflow.execute_activity(
+            result = await workflow.execute_activity_method(
                 QuoteParsingActivities.write_quotes_to_graph,
                 args=[
                     workflow_id,
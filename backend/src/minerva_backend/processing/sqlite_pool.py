@@ -0,0 +1,147 @@
+"""
+SQLite Pool for Minerva
+Long-lived aiosqlite connections for the curation DB: one writer and a
+small pool of readers, opened once and reused for every call.
+
+The database runs in WAL mode so readers never block the writer (or each
+other), and the API process and the Temporal worker can use the same file
+concurrently. Writes within one process are serialized through the single
+writer connection; writes from another process wait up to busy_timeout_ms
+instead of failing with "database is locked". Each connection keeps its
+own prepared-statement cache, so repeated queries skip re-parsing.
+
+The pool must be closed: aiosqlite connection threads keep the process
+alive until then.
+"""
+
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List, Optional
+
+import aiosqlite
+
+# Page cache per connection (negative = KiB) and memory-mapped I/O size
+CACHE_SIZE_KIB = 16 * 1024
+MMAP_SIZE = 256 * 1024 * 1024
+# Prepared statements kept per connection (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+
+
+class SQLitePool:
+    """One writer and `readers` reader connections to a SQLite database."""
+
+    def __init__(self, db_path: str, readers: int = 4, busy_timeout_ms: int = 5000):
+        self.db_path = db_path
+        # Every connection to :memory: is a separate database; share the writer
+        self.readers = 0 if db_path == ":memory:" else max(0, readers)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: "asyncio.Queue[aiosqlite.Connection]" = asyncio.Queue()
+        self._write_listeners: List[Callable[[], None]] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+
+    def add_write_listener(self, callback: Callable[[], None]) -> None:
+        """Call `callback` after every successful write() block (post-commit)."""
+        self._write_listeners.append(callback)
+
+    async def open(self) -> None:
+        """Open the connections and switch the database to WAL mode."""
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+            writer = await self._connect()
+            try:
+                await writer.execute_fetchall("PRAGMA journal_mode = WAL")
+                for _ in range(self.readers):
+                    reader = await self._connect()
+                    await reader.execute_fetchall("PRAGMA query_only = ON")
+                    self._readers.append(reader)
+                    self._idle_readers.put_nowait(reader)
+            except Exception:
+                await writer.close()
+                await self._close_readers()
+                raise
+            self._writer = writer
+
+    async def close(self) -> None:
+        """Close every connection."""
+        async with self._open_lock:
+            async with self._write_lock:
+                if self._writer is not None:
+                    await self._writer.close()
+                    self._writer = None
+            await self._close_readers()
+
+    async def _close_readers(self) -> None:
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+        self._idle_readers = asyncio.Queue()
+
+    def _check_open(self) -> aiosqlite.Connection:
+        if self._writer is None:
+            raise RuntimeError(f"SQLite pool for {self.db_path} is not open")
+        return self._writer
+
+    async def _connect(self) -> aiosqlite.Connection:
+        db = await aiosqlite.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        # Fetch PRAGMA results so no statement stays open holding a lock
+        for pragma in (
+            f"busy_timeout = {int(self.busy_timeout_ms)}",
+            "synchronous = NORMAL",
+            f"cache_size = -{CACHE_SIZE_KIB}",
+            f"mmap_size = {MMAP_SIZE}",
+            "temp_store = MEMORY",
+        ):
+            await db.execute_fetchall(f"PRAGMA {pragma}")
+        return db
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Exclusive use of the writer connection. A transaction left open by
+        the caller is committed on exit and rolled back on error.
+        """
+        self._check_open()
+        async with self._write_lock:
+            db = self._check_open()
+            try:
+                yield db
+            except BaseException:
+                if db.in_transaction:
+                    await db.rollback()
+                raise
+            if db.in_transaction:
+                await db.commit()
+        for callback in self._write_listeners:
+            callback()
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """A reader connection (read-only), or the writer if there are none."""
+        self._check_open()
+        if not self.readers:
+            async with self.write() as db:
+                yield db
+            return
+        db = await self._idle_readers.get()
+        try:
+            yield db
+        finally:
+            if db.in_transaction:
+                try:
+                    await db.rollback()
+                except sqlite3.Error:
+                    pass
+            self._idle_readers.put_nowait(db)
@@ -1,7 +1,8 @@
 import asyncio
+import logging
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict
 from temporalio import activity, workflow
@@ -10,6 +11,12 @@ from temporalio.common import RetryPolicy
 from temporalio.worker import Worker
 
 from minerva_models import JournalEntry
+from minerva_backend.processing.curation_signals import (
+    CURATION_ACTIVITY_TIMEOUT,
+    ENTITY_CURATION_COMPLETE,
+    RELATIONSHIP_CURATION_COMPLETE,
+    wait_for_curation,
+)
 from minerva_backend.processing.models import CuratableMapping, EntityMapping
 from minerva_backend.processing.temporal_converter import create_custom_data_converter
 from minerva_backend.processing.inbox_classification_workflow import (
@@ -25,6 +32,11 @@ from minerva_backend.processing.concept_extraction_workflow import (
     ConceptExtractionActivities,
 )
 
+if TYPE_CHECKING:
+    from minerva_backend.containers import Container
+
+logger = logging.getLogger(__name__)
+
 
 class PipelineStage(str, Enum):
     SUBMITTED = "SUBMITTED"
@@ -56,14 +68,23 @@ class PipelineState(BaseModel):
 
 
 class PipelineActivities:
+    """
+    Journal pipeline activities. One instance is registered with the worker
+    and holds its initialized Container, so every activity run reuses the
+    same Neo4j driver, LLM service and vault index instead of building new
+    singletons.
+    """
+
+    def __init__(self, container: "Container"):
+        self.container = container
+
     @activity.defn
-    async def extract_entities(journal_entry: JournalEntry) -> List[EntityMapping]:
+    async def extract_entities(
+        self, journal_entry: JournalEntry
+    ) -> List[EntityMapping]:
         """Extract entities with error handling to prevent large error payloads"""
-        from minerva_backend.containers import Container
-
         try:
-            container = Container()
-            return await container.extraction_service().extract_entities(journal_entry)
+            return await self.container.extraction_service().extract_entities(journal_entry)
         except Exception as e:
             # Log full error details but raise truncated error for Temporal
             error_msg = str(e)[:200] + "..." if len(str(e)) > 200 else str(e)
@@ -72,14 +93,11 @@ class PipelineActivities:
 
     @activity.defn
     async def extract_feelings(
-        journal_entry: JournalEntry, curated_entities: List[EntityMapping]
+        self, journal_entry: JournalEntry, curated_entities: List[EntityMapping]
     ) -> List[CuratableMapping]:
         """Extract feelings using curated entities with error handling"""
-        from minerva_backend.containers import Container
-
         try:
-            container = Container()
-            return await container.extraction_service().extract_feelings(
+            return await self.container.extraction_service().extract_feelings(
                 journal_entry, curated_entities
             )
         except Exception as e:
@@ -90,14 +108,11 @@ class PipelineActivities:
 
     @activity.defn
     async def extract_relationships(
-        journal_entry: JournalEntry, entities: List[EntityMapping]
+        self, journal_entry: JournalEntry, entities: List[EntityMapping]
     ) -> List[CuratableMapping]:
         """Extract relationships between entities with error handling"""
-        from minerva_backend.containers import Container
-
         try:
-            container = Container()
-            return await container.extraction_service().extract_relationships(
+            return await self.container.extraction_service().extract_relationships(
                 journal_entry, entities
             )
         except Exception as e:
@@ -110,11 +125,9 @@ class PipelineActivities:
 
     @activity.defn
     async def submit_entity_curation(
-        journal_entry: JournalEntry, entities_spans: List[EntityMapping]
+        self, journal_entry: JournalEntry, entities_spans: List[EntityMapping]
     ) -> None:
         """Human-in-the-loop: Wait for user to curate entities"""
-        from minerva_backend.containers import Container
-
         # Fail-fast validation: ensure entities_spans is properly typed
         if not isinstance(entities_spans, list):
             raise RuntimeError(
@@ -146,80 +159,60 @@ class PipelineActivities:
                 f"DEBUG: entities_spans[{i}] = {type(entity_mapping)}, entity = {type(entity)}, uuid = {getattr(entity, 'uuid', 'MISSING')}"
             )
 
-        container = Container()
         # Add to curation queue
-        await container.curation_manager().queue_entities_for_curation(
-            journal_entry.uuid, journal_entry.entry_text or "", entities_spans
+        await self.container.curation_manager().queue_entities_for_curation(
+            journal_entry.uuid,
+            journal_entry.entry_text or "",
+            entities_spans,
+            workflow_id=activity.info().workflow_id,
         )
 
     @activity.defn
-    async def wait_for_entity_curation(
-        journal_entry: JournalEntry,
-    ) -> List[EntityMapping]:
-        """Human-in-the-loop: Wait for user to curate entities"""
-        from minerva_backend.containers import Container
+    async def get_journal_curation_status(
+        self, journal_entry: JournalEntry
+    ) -> Optional[str]:
+        """Curation status of a journal, checked when no signal has arrived"""
+        return await self.container.curation_manager().get_journal_status(
+            journal_entry.uuid
+        )
 
-        container = Container()
-        # Poll until user completes curation (with heartbeat to keep workflow alive)
-        while True:
-            result = await container.curation_manager().get_journal_status(
-                journal_entry.uuid
-            )
-            if result and result == "ENTITIES_DONE":
-                return (
-                    await container.curation_manager().get_accepted_entities_with_spans(
-                        journal_entry.uuid
-                    )
-                )
-            # Temporal heartbeat to prevent timeout
-            activity.heartbeat()
-            await asyncio.sleep(30)  # Check every 30 seconds
+    @activity.defn
+    async def get_curated_entities(
+        self, journal_entry: JournalEntry
+    ) -> List[EntityMapping]:
+        """Entities the user accepted, once entity curation is complete"""
+        return await self.container.curation_manager().get_accepted_entities_with_spans(
+            journal_entry.uuid
+        )
 
     @activity.defn
     async def submit_relationship_curation(
-        journal_entry: JournalEntry, items: List[CuratableMapping]
+        self, journal_entry: JournalEntry, items: List[CuratableMapping]
     ) -> None:
         """Human-in-the-loop: Wait for user to curate relations and feelings"""
-        from minerva_backend.containers import Container
-
-        container = Container()
         # Add to curation queue
-        await container.curation_manager().queue_relationships_for_curation(
+        await self.container.curation_manager().queue_relationships_for_curation(
             journal_entry.uuid, items
         )
 
     @activity.defn
-    async def wait_for_relationship_curation(
-        journal_entry: JournalEntry,
+    async def get_curated_relationships(
+        self, journal_entry: JournalEntry
     ) -> List[CuratableMapping]:
-        """Human-in-the-loop: Wait for user to curate relations and feelings"""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        # Poll until user completes curation (with heartbeat to keep workflow alive)
-        while True:
-            result = await container.curation_manager().get_journal_status(
-                journal_entry.uuid
-            )
-            if result and result == "COMPLETED":
-                return await container.curation_manager().get_accepted_relationships_with_spans(
-                    journal_entry.uuid
-                )
-            # Temporal heartbeat to prevent timeout
-            activity.heartbeat()
-            await asyncio.sleep(30)  # Check every 30 seconds
+        """Relations and feelings the user accepted, once curation is complete"""
+        return await self.container.curation_manager().get_accepted_relationships_with_spans(
+            journal_entry.uuid
+        )
 
     @activity.defn
     async def write_to_knowledge_graph(
+        self,
         journal_entry: JournalEntry,
         entities: List[EntityMapping],
         relationships: List[CuratableMapping],
     ) -> bool:
         """Final stage: Write curated data to Neo4j"""
-        from minerva_backend.containers import Container
-
-        container = Container()
-        await container.kg_service().add_journal_entry(
+        await self.container.kg_service().add_journal_entry(
             journal_entry, entities, relationships
         )
         return True
@@ -234,6 +227,8 @@ class JournalProcessingWorkflow:
 
     def __init__(self):
         self.state = PipelineState(stage=PipelineStage.SUBMITTED)
+        self.entity_curation_complete = False
+        self.relationship_curation_complete = False
 
     @workflow.run
     async def run(self, journal_entry: JournalEntry) -> PipelineState:
@@ -250,7 +245,7 @@ class JournalProcessingWorkflow:
         try:
             # Stage 1-2: Entity Extraction (LLM)
             self.state.stage = PipelineStage.ENTITY_PROCESSING
-            self.state.entities_extracted = await workflow.execute_activity(
+            self.state.entities_extracted = await workflow.execute_activity_method(
                 PipelineActivities.extract_entities,
                 args=[journal_entry],
                 start_to_close_timeout=timedelta(
@@ -261,25 +256,29 @@ class JournalProcessingWorkflow:
 
             # Stage 3.0: Submit Entities for curation
             self.state.stage = PipelineStage.SUBMIT_ENTITY_CURATION
-            await workflow.execute_activity(
+            await workflow.execute_activity_method(
                 PipelineActivities.submit_entity_curation,
                 args=[journal_entry, self.state.entities_extracted],
                 start_to_close_timeout=timedelta(minutes=1),
                 schedule_to_close_timeout=timedelta(minutes=5),
             )
 
-            # Stage 3: Entity Curation (Human)
+            # Stage 3: Entity Curation (Human) - resumed by the curation API
             self.state.stage = PipelineStage.WAIT_ENTITY_CURATION
-            self.state.entities_curated = await workflow.execute_activity(
-                PipelineActivities.wait_for_entity_curation,
+            await wait_for_curation(
+                lambda: self.entity_curation_complete,
+                lambda: self._journal_status_is(journal_entry, "ENTITIES_DONE"),
+                "Entity",
+            )
+            self.state.entities_curated = await workflow.execute_activity_method(
+                PipelineActivities.get_curated_entities,
                 args=[journal_entry],
-                schedule_to_close_timeout=timedelta(days=7),  # User has 7 days
-                heartbeat_timeout=timedelta(minutes=2),  # Heartbeat every 2 min
+                start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
             )
 
             # Stage 4: Feelings Extraction (LLM)
             self.state.stage = PipelineStage.RELATION_PROCESSING
-            self.state.feelings_extracted = await workflow.execute_activity(
+            self.state.feelings_extracted = await workflow.execute_activity_method(
                 PipelineActivities.extract_feelings,
                 args=[journal_entry, self.state.entities_curated],
                 start_to_close_timeout=timedelta(minutes=60),
@@ -287,7 +286,7 @@ class JournalProcessingWorkflow:
             )
 
             # Stage 5: Relationship Extraction (LLM)
-            self.state.relationships_extracted = await workflow.execute_activity(
+            self.state.relationships_extracted = await workflow.execute_activity_method(
                 PipelineActivities.extract_relationships,
                 args=[journal_entry, self.state.entities_curated],
                 start_to_close_timeout=timedelta(minutes=60),
@@ -299,7 +298,7 @@ class JournalProcessingWorkflow:
             combined_items = (
                 self.state.feelings_extracted + self.state.relationships_extracted
             )
-            await workflow.execute_activity(
+            await workflow.execute_activity_method(
                 PipelineActivities.submit_relationship_curation,
                 args=[journal_entry, combined_items],
                 start_to_close_timeout=timedelta(minutes=1),
@@ -308,16 +307,20 @@ class JournalProcessingWorkflow:
 
             # Stage 7: Relationship and Feelings Curation (Human)
             self.state.stage = PipelineStage.WAIT_RELATION_CURATION
-            self.state.relationships_curated = await workflow.execute_activity(
-                PipelineActivities.wait_for_relationship_curation,
+            await wait_for_curation(
+                lambda: self.relationship_curation_complete,
+                lambda: self._journal_status_is(journal_entry, "COMPLETED"),
+                "Relationship",
+            )
+            self.state.relationships_curated = await workflow.execute_activity_method(
+                PipelineActivities.get_curated_relationships,
                 args=[journal_entry],
-                schedule_to_close_timeout=timedelta(days=7),
-                heartbeat_timeout=timedelta(minutes=2),
+                start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
             )
 
             # Stage 8: Database Write
             self.state.stage = PipelineStage.DB_WRITE
-            success = await workflow.execute_activity(
+            success = await workflow.execute_activity_method(
                 PipelineActivities.write_to_knowledge_graph,
                 args=[
                     journal_entry,
@@ -340,6 +343,24 @@ class JournalProcessingWorkflow:
 
         return self.state
 
+    async def _journal_status_is(self, journal_entry: JournalEntry, status: str) -> bool:
+        current = await workflow.execute_activity_method(
+            PipelineActivities.get_journal_curation_status,
+            args=[journal_entry],
+            start_to_close_timeout=CURATION_ACTIVITY_TIMEOUT,
+        )
+        return current == status
+
+    @workflow.signal(name=ENTITY_CURATION_COMPLETE)
+    def complete_entity_curation(self) -> None:
+        """Sent by the curation API when the user finishes entity curation"""
+        self.entity_curation_complete = True
+
+    @workflow.signal(name=RELATIONSHIP_CURATION_COMPLETE)
+    def complete_relationship_curation(self) -> None:
+        """Sent by the curation API when the user finishes relationship curation"""
+        self.relationship_curation_complete = True
+
     @workflow.query
     def get_state(self) -> PipelineState:
         """Query current pipeline state without affecting workflow"""
@@ -412,6 +433,22 @@ class PipelineOrchestrator:
         except Exception:
             return False
 
+    async def signal_workflow(self, workflow_id: str, signal: str) -> bool:
+        """
+        Send a signal to a running workflow. Returns False if it could not be
+        delivered (workflow finished, unknown or Temporal unreachable); waiting
+        workflows re-check the curation DB periodically, so this is not fatal.
+        """
+        if not self.client:
+            return False
+        try:
+            handle = self.client.get_workflow_handle(workflow_id)
+            await handle.signal(signal)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not signal {signal} to {workflow_id}: {e}")
+            return False
+
     async def health_check(self) -> bool:
         """Check if Temporal service is healthy"""
         if not self.client:
@@ -429,11 +466,28 @@ class PipelineOrchestrator:
 async def run_worker():
     """Start the Temporal worker that executes activities"""
     from minerva_backend.config import settings
+    from minerva_backend.containers import Container, initialize_async_services
+    from minerva_backend.graph.services.sentence_splitter import (
+        warm_up_sentence_splitter,
+    )
+
+    # One initialized container for the worker's lifetime: activities share
+    # its Neo4j driver pool, LLM client and vault cache
+    container = Container()
+    await initialize_async_services(container)
+
+    # Load tokenizer models before the first journal write needs them
+    await warm_up_sentence_splitter()
 
     client = await Client.connect(
         settings.TEMPORAL_URI, data_converter=create_custom_data_converter()
     )
 
+    pipeline = PipelineActivities(container)
+    inbox = InboxClassificationActivities(container)
+    quotes = QuoteParsingActivities(container)
+    concepts = ConceptExtractionActivities(container)
+
     worker = Worker(
         client,
         task_queue="minerva-pipeline",
@@ -443,43 +497,51 @@ async def run_worker():
             QuoteParsingWorkflow,
         ],
         activities=[
-            PipelineActivities.extract_entities,
-            PipelineActivities.extract_feelings,
-            PipelineActivities.extract_relationships,
-            PipelineActivities.submit_entity_curation,
-            PipelineActivities.wait_for_entity_curation,
-            PipelineActivities.submit_relationship_curation,
-            PipelineActivities.wait_for_relationship_curation,
-            PipelineActivities.write_to_knowledge_graph,
-            InboxClassificationActivities.scan_inbox,
-            InboxClassificationActivities.get_vault_folder_structure,
-            InboxClassificationActivities.classify_notes_llm,
-            InboxClassificationActivities.submit_classification_curation,
-            InboxClassificationActivities.wait_for_classification_curation,
-            InboxClassificationActivities.execute_moves,
-            QuoteParsingActivities.scan_markdown_file,
-            QuoteParsingActivities.parse_quotes_and_summary,
-            QuoteParsingActivities.enrich_with_web_search,
-            QuoteParsingActivities.submit_quote_curation,
-            QuoteParsingActivities.wait_for_quote_curation,
-            QuoteParsingActivities.write_quotes_to_graph,
-            ConceptExtractionActivities.load_content_and_quotes,
-            ConceptExtractionActivities.extract_candidate_concepts,
-            ConceptExtractionActivities.detect_duplicates,
-            ConceptExtractionActivities.discover_relations,
-            ConceptExtractionActivities.self_critique,
-            ConceptExtractionActivities.refine_extraction,
-            ConceptExtractionActivities.submit_concept_curation,
-            ConceptExtractionActivities.wait_for_concept_curation,
-            ConceptExtractionActivities.write_concepts_to_graph,
-            ConceptExtractionActivities.create_obsidian_files,
-            ConceptExtractionActivities.mark_content_processed,
+            pipeline.extract_entities,
+            pipeline.extract_feelings,
+            pipeline.extract_relationships,
+            pipeline.submit_entity_curation,
+            pipeline.get_journal_curation_status,
+            pipeline.get_curated_entities,
+            pipeline.submit_relationship_curation,
+            pipeline.get_curated_relationships,
+            pipeline.write_to_knowledge_graph,
+            inbox.scan_inbox,
+            inbox.get_vault_folder_structure,
+            inbox.classify_notes_llm,
+            inbox.submit_classification_curation,
+            inbox.get_classification_pending_count,
+            inbox.get_approved_classifications,
+            inbox.execute_moves,
+            quotes.scan_markdown_file,
+            quotes.parse_quotes_and_summary,
+            quotes.enrich_with_web_search,
+            quotes.submit_quote_curation,
+            quotes.get_quote_pending_count,
+            quotes.get_approved_quotes,
+            quotes.write_quotes_to_graph,
+            concepts.load_content_and_quotes,
+            concepts.extract_candidate_concepts,
+            concepts.detect_duplicates,
+            concepts.discover_relations,
+            concepts.self_critique,
+            concepts.refine_extraction,
+            concepts.submit_concept_curation,
+            concepts.get_concept_pending_count,
+            concepts.get_approved_concepts,
+            concepts.write_concepts_to_graph,
+            concepts.create_obsidian_files,
+            concepts.mark_content_processed,
         ],
         debug_mode=True,
     )
 
     print("[START] Minerva pipeline worker started...")
-    await worker.run()
+    try:
+        await worker.run()
+    finally:
+        await container.db_connection().close_async()
+        await container.curation_manager().close()
 
 
 if __name__ == "__main__":
@@ -137,7 +137,12 @@ def mock_curation_manager():
     """Mock curation manager for unit testing."""
     mock_manager = Mock(spec=CurationManager)
     mock_manager.initialize = AsyncMock()
+    mock_manager.close = AsyncMock()
     mock_manager.get_all_pending_curation_tasks = AsyncMock(return_value=[])
+    mock_manager.get_pending_curation_page = AsyncMock(return_value=({}, None))
+    mock_manager.get_pending_curation_summary = AsyncMock(return_value=[])
+    mock_manager.get_curation_version = AsyncMock(return_value=1)
+    mock_manager.get_curation_changes = AsyncMock(return_value=({}, []))
     # Import CurationStats for proper mocking
     from minerva_backend.processing.models import CurationStats
     mock_manager.get_curation_stats = AsyncMock(return_value=CurationStats(
@@ -155,8 +160,12 @@ def mock_curation_manager():
     mock_manager.reject_entity = AsyncMock(return_value=True)
     mock_manager.accept_relationship = AsyncMock(return_value="new_uuid_456")
     mock_manager.reject_relationship = AsyncMock(return_value=True)
+    mock_manager.bulk_accept_all = AsyncMock(return_value=0)
+    mock_manager.bulk_reject = AsyncMock(return_value=0)
+    mock_manager.review_items = AsyncMock(return_value=(0, 0, []))
     mock_manager.complete_entity_phase = AsyncMock()
     mock_manager.complete_relationship_phase = AsyncMock()
+    mock_manager.get_journal_workflow_id = AsyncMock(return_value="test-workflow-id")
     return mock_manager
 
 
@@ -171,6 +180,7 @@ def mock_pipeline_orchestrator():
         "stage": "DB_WRITE",
         "created_at": "2024-01-15T10:00:00Z"
     })
+    mock_orchestrator.signal_workflow = AsyncMock(return_value=True)
     return mock_orchestrator
 
 
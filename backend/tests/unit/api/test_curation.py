@@ -130,6 +130,101 @@ class TestPendingCuration:
         data = response.json()
         assert "error" in data
 
+    def test_get_pending_curation_not_modified(self, client, mock_curation_manager):
+        """A request with the current ETag gets 304 without loading tasks."""
+        # Arrange
+        mock_curation_manager.get_curation_version.return_value = 7
+
+        # Act
+        response = client.get(
+            "/api/curation/pending", headers={"If-None-Match": 'W/"7"'}
+        )
+
+        # Assert
+        assert response.status_code == 304
+        assert response.headers["ETag"] == 'W/"7"'
+        mock_curation_manager.get_all_pending_curation_tasks.assert_not_called()
+
+    def test_get_pending_curation_page(self, client, mock_curation_manager):
+        """limit/cursor return one page and the cursor for the next."""
+        # Arrange
+        mock_curation_manager.get_curation_version.return_value = 7
+        mock_curation_manager.get_pending_curation_page.return_value = ({}, "next")
+
+        # Act
+        response = client.get("/api/curation/pending?limit=10&cursor=abc")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["ETag"] == 'W/"7"'
+        data = response.json()
+        assert data["next_cursor"] == "next"
+        assert data["version"] == 7
+        mock_curation_manager.get_pending_curation_page.assert_called_once_with(
+            10, "abc"
+        )
+
+    def test_get_pending_curation_summary(self, client, mock_curation_manager):
+        """The summary lists pending task counts per journal."""
+        # Arrange
+        from minerva_backend.processing.models import JournalCurationSummary
+
+        mock_curation_manager.get_pending_curation_summary.return_value = [
+            JournalCurationSummary(
+                journal_id="journal_1",
+                date="2025-09-29",
+                phase="entities",
+                pending_entities=3,
+            )
+        ]
+
+        # Act
+        response = client.get("/api/curation/pending/summary")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["journals"][0]["pending_entities"] == 3
+        assert "entry_text" not in data["journals"][0]
+
+    def test_get_curation_changes(self, client, mock_curation_manager):
+        """Changes since a version list changed and removed journals."""
+        # Arrange
+        mock_curation_manager.get_curation_version.return_value = 9
+        mock_curation_manager.get_curation_changes.return_value = ({}, ["journal_1"])
+
+        # Act
+        response = client.get("/api/curation/changes?since=4")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["version"] == 9
+        assert data["removed"] == ["journal_1"]
+        mock_curation_manager.get_curation_changes.assert_called_once_with(4)
+
+    def test_get_curation_changes_up_to_date(self, client, mock_curation_manager):
+        """No query is run when the client already has the current version."""
+        # Arrange
+        mock_curation_manager.get_curation_version.return_value = 9
+
+        # Act
+        response = client.get("/api/curation/changes?since=9")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["journal_entries"] == {}
+        mock_curation_manager.get_curation_changes.assert_not_called()
+
+    def test_stream_curation_events_rejects_unknown_kinds(self, client):
+        """Unknown event kinds are a validation error, not an empty stream."""
+        # Act
+        response = client.get("/api/curation/events?kinds=bogus")
+
+        # Assert
+        assert response.status_code == 400
+        assert "bogus" in response.json()["error"]["message"]
+
 
 class TestEntityCuration:
     """Test entity curation endpoints."""
@@ -151,6 +246,26 @@ class TestEntityCuration:
         assert data["journal_id"] == journal_id
         assert data["data"]["phase"] == "entity"
         assert data["data"]["status"] == "completed"
+
+    def test_complete_entity_curation_signals_workflow(
+        self, client, mock_curation_manager, mock_pipeline_orchestrator
+    ):
+        """Completing entity curation resumes the journal's workflow."""
+        # Arrange
+        journal_id = "test_journal_123"
+
+        # Act
+        response = client.post(f"/api/curation/entities/{journal_id}/complete")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["workflow_id"] == "test-workflow-id"
+        assert data["data"]["signalled"] is True
+        mock_curation_manager.get_journal_workflow_id.assert_awaited_once_with(journal_id)
+        mock_pipeline_orchestrator.signal_workflow.assert_awaited_once_with(
+            "test-workflow-id", "entity_curation_complete"
+        )
     
     def test_complete_entity_curation_invalid_id(self, client, mock_curation_manager):
         """Test entity curation completion with invalid journal ID."""
@@ -355,6 +470,7 @@ class TestBulkOperations:
         # Arrange
         journal_id = "test_journal_123"
         phase = "entity"
+        mock_curation_manager.bulk_accept_all.return_value = 12
         
         # Act
         response = client.post(f"/api/curation/bulk/accept-all/{journal_id}?phase={phase}")
@@ -365,7 +481,10 @@ class TestBulkOperations:
         assert data["success"] is True
         assert "Bulk accepted" in data["message"]
         assert data["data"]["phase"] == phase
-        assert data["data"]["accepted_count"] == 0  # Currently returns 0 as placeholder
+        assert data["data"]["accepted_count"] == 12
+        mock_curation_manager.bulk_accept_all.assert_called_once_with(
+            journal_id, phase, None
+        )
     
     def test_bulk_accept_all_relationships_success(self, client, mock_curation_manager):
         """Test successful bulk accept all relationships."""
@@ -397,6 +516,84 @@ class TestBulkOperations:
         # The error response format may vary, check for error content
         assert "error" in data or "detail" in data
 
+    def test_bulk_reject_all_by_type(self, client, mock_curation_manager):
+        """Test bulk reject limited to one entity type."""
+        # Arrange
+        journal_id = "test_journal_123"
+        mock_curation_manager.bulk_reject.return_value = 3
+
+        # Act
+        response = client.post(
+            f"/api/curation/bulk/reject-all/{journal_id}?item_type=Emotion"
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["data"]["rejected_count"] == 3
+        mock_curation_manager.bulk_reject.assert_called_once_with(
+            journal_id, "entity", "Emotion"
+        )
+
+    def test_bulk_review_decisions(self, client, mock_curation_manager):
+        """Test a batch of decisions is passed to the manager in one call."""
+        # Arrange
+        journal_id = "test_journal_123"
+        mock_curation_manager.review_items.return_value = (1, 1, ["missing"])
+
+        # Act
+        response = client.post(
+            f"/api/curation/bulk/review/{journal_id}?phase=relationship",
+            json={
+                "decisions": [
+                    {"item_id": "r-1", "action": "accept", "curated_data": {"type": "X"}},
+                    {"item_id": "r-2", "action": "reject"},
+                    {"item_id": "missing", "action": "reject"},
+                ]
+            },
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert (data["accepted_count"], data["rejected_count"]) == (1, 1)
+        assert data["not_found"] == ["missing"]
+        mock_curation_manager.review_items.assert_called_once_with(
+            journal_id, "relationship", {"r-1": {"type": "X"}}, ["r-2", "missing"]
+        )
+
+    def test_bulk_review_requires_decisions(self, client, mock_curation_manager):
+        """Test an empty batch is rejected."""
+        response = client.post(
+            "/api/curation/bulk/review/test_journal_123", json={"decisions": []}
+        )
+
+        assert response.status_code == 422
+
+
+class TestWorkflowCompletion:
+    """Test early completion of quote, concept and inbox workflows."""
+
+    def test_complete_inbox_records_completion_before_signalling(
+        self, client, mock_curation_manager, mock_pipeline_orchestrator
+    ):
+        """The completion is stored, so a lost signal is caught by the re-check."""
+        calls = []
+        mock_curation_manager.complete_inbox_workflow = AsyncMock(
+            side_effect=lambda workflow_id: calls.append("complete")
+        )
+        mock_pipeline_orchestrator.signal_workflow.side_effect = (
+            lambda workflow_id, signal: calls.append("signal") or False
+        )
+
+        response = client.post("/api/curation/inbox/inbox-1/complete")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["signalled"] is False
+        mock_curation_manager.complete_inbox_workflow.assert_awaited_once_with(
+            "inbox-1"
+        )
+        assert calls == ["complete", "signal"]
+
 
 class TestCurationEndpoints:
     """Test curation endpoint functionality."""
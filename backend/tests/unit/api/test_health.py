@@ -211,7 +211,8 @@ class TestCurationHealth:
         mock_curation_manager.get_curation_stats.return_value = CurationStats(
             pending_entities=100,
             pending_relationships=50,
-            completed=2
+            completed=2,
+            oldest_pending_age_hours=100.0
         )
         
         # Act
@@ -226,8 +227,8 @@ class TestCurationHealth:
         # Check recommendations
         recommendations = data["recommendations"]
         assert any("backlog" in rec.lower() for rec in recommendations)
-        # Note: "oldest" recommendations are disabled in current implementation
-        # as oldest_pending_age_hours is not available in CurationStats model
+        assert any("3 days" in rec for rec in recommendations)
+        assert data["statistics"]["oldest_pending_age_hours"] == 100.0
     
     def test_curation_health_exception(self, client, mock_curation_manager):
         """Test curation health check when exception occurs."""
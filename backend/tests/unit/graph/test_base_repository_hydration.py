@@ -0,0 +1,166 @@
+"""
+Unit tests for BaseRepository node hydration.
+
+Tests the precomputed field converters and the trusted (model_construct) path.
+"""
+
+from datetime import date, datetime, timedelta
+
+import neo4j
+import pytest
+
+from minerva_backend.graph.repositories.base import (
+    get_enum_converters,
+    get_field_converters,
+)
+from minerva_backend.graph.repositories.concept_repository import ConceptRepository
+from minerva_backend.graph.repositories.event_repository import EventRepository
+from minerva_backend.graph.repositories.person_repository import PersonRepository
+from minerva_models import Concept, EntityType, Event, PartitionType, Person
+
+
+@pytest.fixture
+def concept_properties():
+    """Concept properties as returned by Neo4j."""
+    return {
+        "uuid": "concept-uuid-1",
+        "name": "existentialism",
+        "title": "Existentialism",
+        "concept": "A philosophical concept about existence",
+        "analysis": "Philosophical concept",
+        "summary_short": "Philosophical concept",
+        "summary": "A philosophical concept about existence",
+        "partition": "DOMAIN",
+        "type": "Concept",
+        "created_at": "2025-09-08T10:15:30Z",
+        "updated_at": "2025-09-09T11:00:00",
+    }
+
+
+class TestFieldConverters:
+    """Test converter precomputation."""
+
+    def test_converters_only_cover_temporal_fields(self):
+        """Only datetime/date/timedelta fields get converters."""
+        converters = get_field_converters(Event)
+
+        assert set(converters) == {"created_at", "date", "duration"}
+
+    def test_enum_converters_cover_type_and_partition(self):
+        """Enum-typed fields get converters for the trusted path."""
+        converters = get_enum_converters(Concept)
+
+        assert set(converters) == {"type", "partition"}
+
+    def test_converters_are_cached_per_class(self):
+        """Converters are computed once per entity class."""
+        assert get_field_converters(Person) is get_field_converters(Person)
+
+    def test_date_field_gets_date_converter(self):
+        """Person.birth_date is converted to a date, not a datetime."""
+        repo = PersonRepository(connection=None, llm_service=None)
+        person = repo._properties_to_node(
+            {
+                "name": "Ana",
+                "summary_short": "Ana",
+                "summary": "Una persona llamada Ana",
+                "birth_date": neo4j.time.Date(1990, 5, 17),
+            }
+        )
+
+        assert person.birth_date == date(1990, 5, 17)
+
+
+class TestPropertiesToNode:
+    """Test hydration of Neo4j properties into Pydantic nodes."""
+
+    def test_iso_strings_are_parsed(self, concept_properties):
+        """ISO datetime strings become timezone-aware datetimes."""
+        repo = ConceptRepository(connection=None, llm_service=None)
+        concept = repo._properties_to_node(concept_properties)
+
+        assert isinstance(concept, Concept)
+        assert concept.created_at == datetime.fromisoformat("2025-09-08T10:15:30+00:00")
+
+    def test_neo4j_temporal_types_are_converted(self):
+        """Neo4j DateTime and duration strings are converted natively."""
+        repo = EventRepository(connection=None, llm_service=None)
+        event = repo._properties_to_node(
+            {
+                "name": "Reunión",
+                "summary_short": "Reunión",
+                "summary": "Reunión de equipo",
+                "category": "trabajo",
+                "date": neo4j.time.DateTime(2025, 9, 8, 10, 0, 0),
+                "duration": "1:30",
+                "created_at": neo4j.time.DateTime(2025, 9, 8, 10, 15, 30),
+            }
+        )
+
+        assert event.date == datetime(2025, 9, 8, 10, 0, 0)
+        assert event.duration == timedelta(hours=1, minutes=30)
+        assert event.created_at == datetime(2025, 9, 8, 10, 15, 30)
+
+    def test_trusted_read_skips_validation(self, concept_properties):
+        """Trusted reads build the node with model_construct."""
+        repo = ConceptRepository(connection=None, llm_service=None)
+        concept = repo._properties_to_node(concept_properties, trusted=True)
+
+        assert isinstance(concept, Concept)
+        assert concept.name == "existentialism"
+        assert isinstance(concept.created_at, datetime)
+        assert concept.embedding is None
+
+    def test_trusted_reads_class_default(self, concept_properties):
+        """Repositories can opt into trusted reads by default."""
+        repo = ConceptRepository(connection=None, llm_service=None)
+        repo.trusted_reads = True
+
+        concept = repo._properties_to_node(dict(concept_properties, summary=None))
+
+        # No validation error even though summary is required
+        assert concept.summary is None
+
+    def test_concept_repository_reads_are_trusted(self):
+        """Concept nodes are only written by Minerva, so reads skip validation."""
+        assert ConceptRepository.trusted_reads is True
+        assert PersonRepository.trusted_reads is False
+
+    @pytest.mark.parametrize("missing", [(), ("partition", "type")])
+    def test_trusted_read_matches_validated_enums(self, concept_properties, missing):
+        """Trusted and validated reads agree on type and partition values."""
+        repo = ConceptRepository(connection=None, llm_service=None)
+        properties = {
+            key: value
+            for key, value in concept_properties.items()
+            if key not in missing
+        }
+
+        trusted = repo._properties_to_node(dict(properties), trusted=True)
+        validated = repo._properties_to_node(dict(properties), trusted=False)
+
+        assert trusted.partition == validated.partition == PartitionType.DOMAIN.value
+        assert trusted.type == validated.type == EntityType.CONCEPT.value
+
+    def test_trusted_read_coerces_enum_members(self, concept_properties):
+        """Enum members are stored as their values, as with use_enum_values."""
+        repo = ConceptRepository(connection=None, llm_service=None)
+        concept = repo._properties_to_node(
+            dict(concept_properties, partition=PartitionType.DOMAIN),
+            trusted=True,
+        )
+
+        assert type(concept.partition) is str
+        assert concept.partition == "DOMAIN"
+
+    @pytest.mark.parametrize(
+        "field, value", [("partition", "LEXICAL"), ("type", "Person")]
+    )
+    def test_trusted_read_rejects_invalid_enum(self, concept_properties, field, value):
+        """A trusted read still rejects a wrong type or partition."""
+        repo = ConceptRepository(connection=None, llm_service=None)
+
+        with pytest.raises(ValueError):
+            repo._properties_to_node(
+                dict(concept_properties, **{field: value}), trusted=True
+            )
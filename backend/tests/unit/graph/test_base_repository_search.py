@@ -0,0 +1,124 @@
+"""
+Unit tests for BaseRepository full-text search.
+
+Tests the ranked full-text index query and the fallback substring scan.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import neo4j
+import pytest
+
+from minerva_backend.graph.repositories.base import to_fulltext_query
+from minerva_backend.graph.repositories.concept_repository import ConceptRepository
+
+
+class AsyncRecords:
+    """Minimal async iterable standing in for a neo4j AsyncResult."""
+
+    def __init__(self, records):
+        self._records = records
+
+    def __aiter__(self):
+        self._iter = iter(self._records)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.fixture
+def mock_session():
+    return AsyncMock()
+
+
+@pytest.fixture
+def concept_repository(mock_session):
+    """ConceptRepository backed by a mocked session."""
+    connection = MagicMock()
+    context_manager = AsyncMock()
+    context_manager.__aenter__ = AsyncMock(return_value=mock_session)
+    context_manager.__aexit__ = AsyncMock(return_value=None)
+    connection.session_async = MagicMock(return_value=context_manager)
+    return ConceptRepository(connection=connection, llm_service=MagicMock())
+
+
+def concept_record():
+    return {
+        "e": {
+            "uuid": "concept-uuid-1",
+            "name": "libertad",
+            "title": "Libertad",
+            "concept": "Capacidad de elegir",
+            "analysis": "Concepto filosófico",
+            "summary_short": "Capacidad de elegir",
+            "summary": "La capacidad de actuar según la propia voluntad",
+        },
+        "score": 2.5,
+    }
+
+
+class TestFulltextQuery:
+    """Test Lucene query escaping."""
+
+    def test_special_characters_are_escaped(self):
+        assert to_fulltext_query("ser (o no) ser?") == r"ser \(o no\) ser\?"
+
+    def test_boolean_operators_are_plain_words(self):
+        assert to_fulltext_query("perro AND gato") == "perro and gato"
+        assert to_fulltext_query("NOT yo OR tú") == "not yo or tú"
+        assert to_fulltext_query("ANDES ORACLE") == "ANDES ORACLE"
+
+    def test_blank_term(self):
+        assert to_fulltext_query("   ") == ""
+
+
+class TestSearchByText:
+    """Test search_by_text against the full-text index."""
+
+    @pytest.mark.asyncio
+    async def test_uses_fulltext_index(self, concept_repository, mock_session):
+        mock_session.run.return_value = AsyncRecords([concept_record()])
+
+        result = await concept_repository.search_by_text("libertad", limit=5)
+
+        assert [c.name for c in result] == ["libertad"]
+        query = mock_session.run.call_args[0][0]
+        kwargs = mock_session.run.call_args[1]
+        assert "db.index.fulltext.queryNodes" in query
+        assert kwargs["index_name"] == "concept_fulltext_index"
+        assert kwargs["fulltext_query"] == "libertad"
+        assert kwargs["limit"] == 5
+
+    @pytest.mark.asyncio
+    async def test_blank_term_skips_query(self, concept_repository, mock_session):
+        assert await concept_repository.search_by_text("  ") == []
+        mock_session.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_index_missing(
+        self, concept_repository, mock_session
+    ):
+        missing = neo4j.exceptions.ClientError(
+            "There is no such fulltext schema index: concept_fulltext_index"
+        )
+        mock_session.run.side_effect = [missing, AsyncRecords([concept_record()])]
+
+        result = await concept_repository.search_by_text("libertad")
+
+        assert len(result) == 1
+        fallback_query = mock_session.run.call_args[0][0]
+        assert "CONTAINS" in fallback_query
+        assert "embedding" not in mock_session.run.call_args[1]["fields"]
+
+    @pytest.mark.asyncio
+    async def test_other_client_errors_propagate(
+        self, concept_repository, mock_session
+    ):
+        mock_session.run.side_effect = neo4j.exceptions.ClientError("Syntax error")
+
+        with pytest.raises(neo4j.exceptions.ClientError):
+            await concept_repository.search_by_text("libertad")
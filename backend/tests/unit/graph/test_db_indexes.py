@@ -0,0 +1,176 @@
+"""
+Unit tests for Neo4jConnection schema setup.
+
+Tests that schema state is read once with SHOW INDEXES, that DDL only runs
+for missing indexes, that vector indexes are sized for the embedding model
+and that emotion types are upserted in one query and cached.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from minerva_backend.config import Settings
+from minerva_backend.graph import db
+from minerva_backend.graph.db import (
+    FULLTEXT_INDEXES,
+    TEMPORAL_INDEXES,
+    VECTOR_INDEX_LABELS,
+    Neo4jConnection,
+    fulltext_index_name,
+    vector_index_name,
+)
+
+ALL_INDEX_NAMES = (
+    [vector_index_name(label) for label in VECTOR_INDEX_LABELS]
+    + [fulltext_index_name(label) for label in FULLTEXT_INDEXES]
+    + [name for name, _, _ in TEMPORAL_INDEXES]
+)
+
+
+class AsyncRecords:
+    """Minimal async iterable standing in for a neo4j AsyncResult."""
+
+    def __init__(self, records):
+        self._records = records
+
+    def __aiter__(self):
+        self._iter = iter(self._records)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def index_record(name, dimensions=None):
+    options = {"indexConfig": {"vector.dimensions": dimensions}} if dimensions else {}
+    return {
+        "name": name,
+        "type": "VECTOR" if dimensions else "RANGE",
+        "labelsOrTypes": ["Node"],
+        "properties": ["embedding"],
+        "options": options,
+    }
+
+
+@pytest.fixture(autouse=True)
+def empty_schema_cache(monkeypatch):
+    monkeypatch.setattr(db, "_schema_cache", {})
+
+
+def make_connection(existing, vector_dimensions=1024):
+    """Neo4jConnection whose session answers SHOW INDEXES with `existing`."""
+    connection = Neo4jConnection(
+        uri="bolt://test",
+        user="neo4j",
+        password="test",
+        vector_dimensions=vector_dimensions,
+    )
+    session = AsyncMock()
+
+    async def run(query, parameters=None, **kwargs):
+        if query.startswith("SHOW INDEXES"):
+            return AsyncRecords(existing)
+        return AsyncMock()
+
+    session.run = AsyncMock(side_effect=run)
+    context_manager = AsyncMock()
+    context_manager.__aenter__ = AsyncMock(return_value=session)
+    context_manager.__aexit__ = AsyncMock(return_value=None)
+    connection.session_async = MagicMock(return_value=context_manager)
+    return connection, session
+
+
+def executed(session):
+    return [call.args[0] for call in session.run.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_only_creates_missing_indexes():
+    """Indexes listed by SHOW INDEXES get no DDL; missing ones are created."""
+    present = [n for n in ALL_INDEX_NAMES if n != "person_embeddings_index"]
+    connection, session = make_connection([index_record(n) for n in present])
+
+    created = await connection.ensure_indexes()
+
+    queries = executed(session)
+    assert created == ["person_embeddings_index"]
+    assert len(queries) == 2
+    assert queries[0].startswith("SHOW INDEXES")
+    assert "CREATE VECTOR INDEX person_embeddings_index" in queries[1]
+    assert connection.session_async.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_reuses_cached_schema():
+    """A second connection to the same database skips SHOW INDEXES and DDL."""
+    first, first_session = make_connection([])
+    await first.ensure_indexes()
+    assert len(executed(first_session)) == 1 + len(ALL_INDEX_NAMES)
+
+    second, second_session = make_connection([])
+    created = await second.ensure_indexes()
+
+    assert created == []
+    assert second.session_async.call_count == 0
+    assert executed(second_session) == []
+
+
+@pytest.mark.asyncio
+async def test_vector_indexes_sized_for_embedding_model(monkeypatch):
+    """DDL uses the configured dimensions and existing mismatches are reported."""
+    warning = MagicMock()
+    monkeypatch.setattr(db.logger, "warning", warning)
+    existing = [index_record("concept_embeddings_index", dimensions=1024)]
+    connection, session = make_connection(existing, vector_dimensions=768)
+
+    await connection.ensure_indexes()
+
+    person_ddl = next(
+        q for q in executed(session) if "person_embeddings_index" in q
+    )
+    assert "`vector.dimensions`: 768" in person_ddl
+    (message,), _ = warning.call_args
+    assert "concept_embeddings_index has 1024 dimensions" in message
+
+
+def test_embedding_dimensions_from_model_name():
+    """Known models map to their output size; an explicit size wins."""
+    nomic = Settings(EMBEDDING_MODEL="nomic-embed-text:v1.5")
+    assert nomic.embedding_dimensions() == 768
+    assert (
+        Settings(
+            EMBEDDING_MODEL="custom-embedder", EMBEDDING_DIMENSIONS=512
+        ).embedding_dimensions()
+        == 512
+    )
+    with pytest.raises(ValueError):
+        Settings(EMBEDDING_MODEL="custom-embedder").embedding_dimensions()
+
+
+@pytest.mark.asyncio
+async def test_init_emotion_types_upserts_once_and_caches(monkeypatch):
+    """All emotions go through one UNWIND query; later calls hit the cache."""
+    monkeypatch.setattr(db, "_emotion_types_cache", {})
+    connection, session = make_connection([])
+    session.run = AsyncMock(
+        return_value=AsyncRecords(
+            [{"name": "joy", "uuid": "u1"}, {"name": "anger", "uuid": "u2"}]
+        )
+    )
+    cached = connection.emotion_types
+
+    first = await connection.init_emotion_types()
+    second = await Neo4jConnection(
+        uri="bolt://test", user="neo4j", password="test"
+    ).init_emotion_types()
+
+    assert first == {"joy": "u1", "anger": "u2"}
+    assert second is first is cached
+    session.run.assert_awaited_once()
+    query, parameters = session.run.await_args.args
+    assert "UNWIND $names AS name" in query
+    assert "joy" in parameters["names"]
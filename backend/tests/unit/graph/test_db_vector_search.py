@@ -0,0 +1,112 @@
+"""
+Unit tests for Neo4jConnection vector search.
+
+Tests the multi-label single round-trip query and its query text cache.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from minerva_backend.graph.db import (
+    VECTOR_SEARCH_QUERY,
+    Neo4jConnection,
+    _vector_search_many_query,
+)
+
+
+class AsyncRecords:
+    """Minimal async iterable standing in for a neo4j AsyncResult."""
+
+    def __init__(self, records):
+        self._records = records
+
+    def __aiter__(self):
+        self._iter = iter(self._records)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.fixture
+def mock_session():
+    return AsyncMock()
+
+
+@pytest.fixture
+def connection(mock_session):
+    """Neo4jConnection whose sessions are mocked."""
+    connection = Neo4jConnection(uri="bolt://test", user="neo4j", password="test")
+    context_manager = AsyncMock()
+    context_manager.__aenter__ = AsyncMock(return_value=mock_session)
+    context_manager.__aexit__ = AsyncMock(return_value=None)
+    connection.session_async = MagicMock(return_value=context_manager)
+    return connection
+
+
+def test_vector_search_many_query_unions_every_label():
+    """Each label gets its own index branch inside one CALL {} subquery."""
+    query = _vector_search_many_query(("Person", "Concept"))
+
+    assert query.count("CALL {") == 1
+    assert query.count("UNION ALL") == 1
+    assert "'person_embeddings_index'" in query
+    assert "'concept_embeddings_index'" in query
+    assert "RETURN 'Concept' AS label, node, score" in query
+
+
+def test_vector_search_many_query_is_cached():
+    """The same label tuple yields the identical query string."""
+    assert _vector_search_many_query(("Place",)) is _vector_search_many_query(
+        ("Place",)
+    )
+
+
+def test_vector_search_many_query_rejects_invalid_labels():
+    """Labels are inlined, so anything but a plain identifier is refused."""
+    with pytest.raises(ValueError):
+        _vector_search_many_query(("Person') YIELD node",))
+
+
+@pytest.mark.asyncio
+async def test_vector_search_many_single_round_trip(connection, mock_session):
+    """All labels are searched with one session and one query."""
+    records = [
+        {"label": "Concept", "node": {"uuid": "c1"}, "score": 0.9},
+        {"label": "Person", "node": {"uuid": "p1"}, "score": 0.8},
+    ]
+    mock_session.run.return_value = AsyncRecords(records)
+
+    result = await connection.vector_search_many(
+        ["Person", "Concept", "Person"], [0.1, 0.2], k=5
+    )
+
+    assert result == records
+    connection.session_async.assert_called_once()
+    mock_session.run.assert_awaited_once()
+    query, params = mock_session.run.call_args[0]
+    assert query is _vector_search_many_query(("Person", "Concept"))
+    assert params == {"query_embedding": [0.1, 0.2], "k": 5, "threshold": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_vector_search_many_without_labels(connection, mock_session):
+    """No labels means no query."""
+    assert await connection.vector_search_many([], [0.1]) == []
+    mock_session.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_vector_search_binds_index_name(connection, mock_session):
+    """Single-label search reuses one constant query text."""
+    mock_session.run.return_value = AsyncRecords([])
+
+    await connection.vector_search("Concept", [0.1], limit=3)
+
+    query, params = mock_session.run.call_args[0]
+    assert query is VECTOR_SEARCH_QUERY
+    assert params["index_name"] == "concept_embeddings_index"
@@ -0,0 +1,181 @@
+"""
+Unit tests for per-label embedding storage.
+
+Tests Matryoshka truncation, float32 vector properties and how reduced labels
+change vector index DDL and vector search parameters.
+"""
+
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from minerva_backend.config import settings
+from minerva_backend.graph.db import Neo4jConnection, _vector_search_many_query
+from minerva_backend.graph.embedding_storage import (
+    EmbeddingStorage,
+    embedding_storage,
+    reduce_embedding,
+)
+
+
+class AsyncRecords:
+    """Minimal async iterable standing in for a neo4j AsyncResult."""
+
+    def __init__(self, records):
+        self._records = records
+
+    def __aiter__(self):
+        self._iter = iter(self._records)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.fixture
+def concept_256(monkeypatch):
+    """Concept embeddings truncated to 256 dimensions and stored as float32."""
+    monkeypatch.setattr(settings, "EMBEDDING_LABEL_DIMENSIONS", {"Concept": 256})
+    monkeypatch.setattr(settings, "EMBEDDING_LABEL_PRECISION", {"Concept": "float32"})
+
+
+@pytest.fixture
+def connection():
+    """Neo4jConnection whose sessions are mocked."""
+    connection = Neo4jConnection(
+        uri="bolt://test", user="neo4j", password="test", vector_dimensions=1024
+    )
+    session = AsyncMock()
+    session.run.return_value = AsyncRecords([])
+    context_manager = AsyncMock()
+    context_manager.__aenter__ = AsyncMock(return_value=session)
+    context_manager.__aexit__ = AsyncMock(return_value=None)
+    connection.session_async = MagicMock(return_value=context_manager)
+    connection.mock_session = session
+    return connection
+
+
+def test_reduce_embedding_truncates_and_renormalizes():
+    """The prefix is kept and scaled back to unit length."""
+    reduced = reduce_embedding([3.0, 4.0, 12.0], 2)
+
+    assert reduced == pytest.approx([0.6, 0.8])
+    assert math.isclose(sum(x * x for x in reduced), 1.0)
+    assert reduce_embedding([1.0, 0.0], 4) == [1.0, 0.0]
+
+
+def test_store_clause_only_for_float32():
+    """float64 labels keep the plain SET; float32 labels rewrite the property."""
+    assert EmbeddingStorage().store_clause("n") == ""
+    clause = EmbeddingStorage(precision="float32").store_clause("n")
+    assert "db.create.setNodeVectorProperty(n, 'embedding', n.embedding)" in clause
+    assert "WHERE n.embedding IS NOT NULL" in clause
+
+
+def test_embedding_storage_reads_settings(concept_256, monkeypatch):
+    """Labels not configured keep full float64 lists; bad precisions raise."""
+    assert embedding_storage("Concept") == EmbeddingStorage(256, "float32")
+    assert embedding_storage("Person") == EmbeddingStorage()
+
+    monkeypatch.setattr(settings, "EMBEDDING_LABEL_PRECISION", {"Person": "int8"})
+    with pytest.raises(ValueError):
+        embedding_storage("Person")
+
+
+def test_vector_index_sized_per_label(concept_256, connection):
+    """Reduced labels get a smaller vector index; others keep the model size."""
+    assert "`vector.dimensions`: 256" in connection._vector_index_query("Concept")
+    assert "`vector.dimensions`: 1024" in connection._vector_index_query("Person")
+
+
+@pytest.mark.asyncio
+async def test_vector_search_many_truncates_query_for_reduced_labels(
+    concept_256, connection
+):
+    """Reduced labels read a truncated query vector from their own parameter."""
+    embedding = [1.0] * 1024
+
+    await connection.vector_search_many(["Person", "Concept"], embedding, k=5)
+
+    query, params = connection.mock_session.run.call_args[0]
+    assert query is _vector_search_many_query(("Person", "Concept"), (None, 256))
+    assert "'person_embeddings_index', $k, $query_embedding)" in query
+    assert "'concept_embeddings_index', $k, $query_embedding_256)" in query
+    assert params["query_embedding"] is embedding
+    assert len(params["query_embedding_256"]) == 256
+
+
+def stored(element_id, size, full_size=None):
+    """A migration read record for a node with `size` stored dimensions."""
+    return {
+        "element_id": element_id,
+        "embedding": [1.0] * size,
+        "embedding_full": [1.0] * full_size if full_size else None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_migration_stages_swaps_then_rebuilds_index(concept_256, connection):
+    """Vectors are staged, swapped in keeping the original, then re-indexed."""
+    connection.ensure_indexes = AsyncMock(return_value=[])
+    connection._show_indexes = AsyncMock(
+        return_value={"concept_embeddings_index": {"dimensions": 1024}}
+    )
+    results = [
+        AsyncRecords(
+            [
+                stored("4:db:1", 1024),
+                stored("4:db:2", 128),
+                stored("4:db:3", 128, full_size=1024),
+            ]
+        ),
+        AsyncRecords([]),  # stage
+        AsyncRecords([]),  # swap
+        AsyncRecords([]),  # drop index
+    ]
+    for result in results:
+        result.consume = AsyncMock()
+    connection.mock_session.run.side_effect = results
+
+    counts = await connection.migrate_embedding_storage("Concept")
+
+    calls = [c.args for c in connection.mock_session.run.call_args_list]
+    read, stage, swap, drop = (args[0] for args in calls)
+    assert counts == {"rewritten": 2, "skipped": 1}
+    assert "elementId(n) AS element_id" in read
+    assert "SET n.embedding_staged = row.embedding" in stage
+    assert [len(row["embedding"]) for row in calls[1][1]["rows"]] == [256, 256]
+    assert drop == "DROP INDEX concept_embeddings_index IF EXISTS"
+    assert "n.embedding = n.embedding_staged" in swap
+    assert "n.embedding_full" in swap
+    assert "setNodeVectorProperty" in swap
+    assert calls[2][1] == {"element_ids": ["4:db:1", "4:db:3"]}
+    connection.ensure_indexes.assert_awaited_once_with(refresh=True)
+
+
+@pytest.mark.asyncio
+async def test_remove_full_embeddings(connection):
+    """Backups are removed in batches, matched by element id."""
+    results = [
+        AsyncRecords([{"element_id": f"4:db:{i}"} for i in range(3)]),
+        AsyncRecords([]),
+        AsyncRecords([]),
+    ]
+    for result in results:
+        result.consume = AsyncMock()
+    connection.mock_session.run.side_effect = results
+
+    removed = await connection.remove_full_embeddings("Concept", batch_size=2)
+
+    calls = [c.args for c in connection.mock_session.run.call_args_list]
+    assert removed == 3
+    assert "n.embedding_full IS NOT NULL" in calls[0][0]
+    assert "REMOVE n.embedding_full" in calls[1][0]
+    assert [args[1]["element_ids"] for args in calls[1:]] == [
+        ["4:db:0", "4:db:1"],
+        ["4:db:2"],
+    ]
@@ -0,0 +1,160 @@
+"""
+Unit tests for HybridSearchService.
+
+Tests reciprocal rank fusion, the query embedding cache and the graph boost.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from minerva_backend.graph.services.hybrid_search_service import (
+    RRF_K,
+    HybridSearchService,
+    reciprocal_rank_fusion,
+)
+
+
+def hit(uuid, score, label="Concept"):
+    return {
+        "label": label,
+        "node": {"uuid": uuid, "name": uuid, "embedding": [0.1]},
+        "score": score,
+        "element_id": f"4:db:{uuid}",
+    }
+
+
+class AsyncRecords:
+    """Async iterator over canned records, like a neo4j result."""
+
+    def __init__(self, records):
+        self._records = iter(records)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._records)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.fixture
+def connection():
+    connection = MagicMock()
+    connection.vector_search_many = AsyncMock(
+        return_value=[hit("a", 0.9), hit("b", 0.8), hit("c", 0.7)]
+    )
+    connection.fulltext_search = AsyncMock(return_value=[hit("b", 3.0), hit("c", 2.0)])
+    return connection
+
+
+@pytest.fixture
+def llm_service():
+    llm_service = MagicMock()
+    llm_service.create_embedding = AsyncMock(return_value=[0.1, 0.2])
+    return llm_service
+
+
+def test_reciprocal_rank_fusion():
+    """Items ranked by several signals outscore single-signal items."""
+    scores = reciprocal_rank_fusion([["a", "b"], ["b", "c"]])
+
+    assert scores["b"] == pytest.approx(1 / (RRF_K + 2) + 1 / (RRF_K + 1))
+    assert scores["b"] > scores["a"] > scores["c"]
+
+
+@pytest.mark.asyncio
+async def test_search_fuses_vector_and_fulltext(connection, llm_service):
+    """Results are ordered by fused score and keep per-signal ranks."""
+    service = HybridSearchService(connection, llm_service)
+
+    results = await service.search("libertad", labels=["Concept"], limit=2)
+
+    assert [r.uuid for r in results] == ["b", "c"]
+    assert results[0].vector_rank == 2
+    assert results[0].fulltext_rank == 1
+    assert "embedding" not in results[0].to_dict()["properties"]
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_is_cached(connection, llm_service):
+    """Repeated queries reuse the cached embedding."""
+    service = HybridSearchService(connection, llm_service)
+
+    await service.search("libertad", labels=["Concept"])
+    await service.search("libertad", labels=["Concept"])
+
+    llm_service.create_embedding.assert_awaited_once()
+    assert service.latency_percentiles()["total"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_graph_boost_promotes_nearby_candidates(connection, llm_service):
+    """Candidates close to the anchors are boosted above farther ones."""
+    service = HybridSearchService(connection, llm_service)
+    service._graph_distances = AsyncMock(return_value={"a": 0})
+
+    results = await service.search(
+        "libertad", labels=["Concept"], anchor_uuids=["linked-uuid"], graph_weight=2.0
+    )
+
+    assert results[0].uuid == "a"
+    assert results[0].graph_distance == 0
+    service._graph_distances.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_vector_signal_uses_one_query_for_all_labels(connection, llm_service):
+    """Vector candidates for every label come from a single call."""
+    connection.vector_search_many.return_value = [
+        hit("a", 0.9),
+        hit("p", 0.85, label="Person"),
+    ]
+    service = HybridSearchService(connection, llm_service)
+
+    results = await service.search("libertad", labels=["Concept", "Person"])
+
+    connection.vector_search_many.assert_awaited_once()
+    assert connection.fulltext_search.await_count == 2
+    person = next(r for r in results if r.uuid == "p")
+    assert person.label == "Person"
+    assert person.vector_rank == 1
+
+
+@pytest.mark.asyncio
+async def test_min_vector_score_drops_weak_candidates(connection, llm_service):
+    """Candidates below the vector cutoff, or found only by full text, go."""
+    connection.fulltext_search.return_value = [hit("b", 3.0), hit("d", 2.0)]
+    service = HybridSearchService(connection, llm_service)
+
+    results = await service.search(
+        "libertad", labels=["Concept"], min_vector_score=0.75
+    )
+
+    assert [r.uuid for r in results] == ["b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_graph_distances_match_candidates_by_element_id(connection, llm_service):
+    """Candidates are looked up by element id; no anchors, no anchor MATCH."""
+    session = MagicMock()
+    session.run = AsyncMock(
+        return_value=AsyncRecords([{"candidate_uuid": "a", "distance": 1}])
+    )
+    context_manager = AsyncMock()
+    context_manager.__aenter__ = AsyncMock(return_value=session)
+    connection.session_async = MagicMock(return_value=context_manager)
+    service = HybridSearchService(connection, llm_service)
+
+    results = await service.search(
+        "libertad", labels=["Concept"], journal_uuid="journal-1"
+    )
+
+    query = session.run.call_args[0][0]
+    params = session.run.call_args[1]
+    assert "elementId(c) = candidate.element_id" in query
+    assert "anchor" not in query
+    assert {"element_id": "4:db:a", "uuid": "a"} in params["candidates"]
+    assert next(r for r in results if r.uuid == "a").graph_distance == 1
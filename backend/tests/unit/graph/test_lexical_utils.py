@@ -7,9 +7,10 @@ Tests the lexical tree building and chunk insertion functionality.
 import pytest
 from unittest.mock import Mock, MagicMock, AsyncMock
 from datetime import datetime
+from minerva_backend.config import settings
 from minerva_backend.graph.services.lexical_utils import (
+    _build_balanced_tree,
     _prepare_chunk_data,
-    _separate_relationships_by_type,
     _log_creation_stats,
     _create_chunks,
     _create_relationships,
@@ -17,50 +18,49 @@ from minerva_backend.graph.services.lexical_utils import (
     _create_has_chunk_relationships,
     _create_sibling_relationships,
     _insert_chunks_and_relationships,
+    _text_leaf_count,
     build_and_insert_lexical_tree,
+    get_chunk_texts,
     SpanIndex
 )
-from minerva_backend.graph.models.documents import Chunk
-from minerva_backend.graph.models.base import PartitionType, LexicalType
+from minerva_backend.graph.services.sentence_splitter import RegexSentenceSplitter
+from minerva_models import JournalEntry, PartitionType, LexicalType
 
 
 class TestLexicalUtils:
     """Test lexical utility functions."""
 
+    @pytest.fixture
+    def sample_text(self):
+        return "This is the first chunk. This is the second chunk."
+
     @pytest.fixture
     def sample_chunks(self):
-        """Create sample chunks for testing."""
-        return [
-            Chunk(
-                uuid="chunk-1",
-                text="This is the first chunk.",
-                type=LexicalType.CHUNK.value,
-                partition=PartitionType.LEXICAL.value,
-                created_at=datetime(2024, 1, 15, 10, 0, 0)
-            ),
-            Chunk(
-                uuid="chunk-2", 
-                text="This is the second chunk.",
-                type=LexicalType.CHUNK.value,
-                partition=PartitionType.LEXICAL.value,
-                created_at=datetime(2024, 1, 15, 10, 1, 0)
-            )
-        ]
+        """Create sample chunk spans for testing."""
+        return [("chunk-1", 0, 24), ("chunk-2", 25, 50)]
 
     @pytest.fixture
     def sample_relationships(self):
-        """Create sample relationships for testing."""
-        return [
-            {"type": "CONTAINS", "parent": "parent-1", "child": "chunk-1"},
-            {"type": "CONTAINS", "parent": "parent-1", "child": "chunk-2"},
-            {"type": "NEXT_SIBLING", "parent": "chunk-1", "child": "chunk-2"},
-            {"type": "HAS_CHUNK", "parent": "journal-1", "child": "chunk-1"},
-            {"type": "HAS_CHUNK", "parent": "journal-1", "child": "chunk-2"},
-        ]
+        """Create sample relationships, grouped by type, for testing."""
+        return {
+            "contains": [
+                {"type": "CONTAINS", "parent": "parent-1", "child": "chunk-1"},
+                {"type": "CONTAINS", "parent": "parent-1", "child": "chunk-2"},
+            ],
+            "sibling": [
+                {"type": "NEXT_SIBLING", "parent": "chunk-1", "child": "chunk-2"},
+            ],
+            "has_chunk": [
+                {"type": "HAS_CHUNK", "parent": "journal-1", "child": "chunk-1"},
+                {"type": "HAS_CHUNK", "parent": "journal-1", "child": "chunk-2"},
+            ],
+        }
 
-    def test_prepare_chunk_data(self, sample_chunks):
+    def test_prepare_chunk_data(self, sample_text, sample_chunks):
         """Test preparing chunk data for Cypher insertion."""
-        result = _prepare_chunk_data(sample_chunks)
+        result = _prepare_chunk_data(
+            sample_text, sample_chunks, created_at=datetime(2024, 1, 15, 10, 0, 0)
+        )
         
         assert len(result) == 2
         assert result[0]["uuid"] == "chunk-1"
@@ -71,32 +71,41 @@ class TestLexicalUtils:
         
         assert result[1]["uuid"] == "chunk-2"
         assert result[1]["text"] == "This is the second chunk."
-        assert result[1]["created_at"] == "2024-01-15T10:01:00"
+        assert result[1]["created_at"] == "2024-01-15T10:00:00"
 
-    def test_separate_relationships_by_type(self, sample_relationships):
-        """Test separating relationships by type."""
-        result = _separate_relationships_by_type(sample_relationships)
-        
-        assert len(result["contains"]) == 2
-        assert len(result["sibling"]) == 1
-        assert len(result["has_chunk"]) == 2
-        
-        assert result["contains"][0]["type"] == "CONTAINS"
-        assert result["sibling"][0]["type"] == "NEXT_SIBLING"
-        assert result["has_chunk"][0]["type"] == "HAS_CHUNK"
+    def test_build_balanced_tree(self):
+        """Test building the chunk tree bottom-up over five sentences."""
+        span_index = SpanIndex()
+        spans = [(0, 10), (11, 20), (21, 30), (31, 40), (41, 50)]
 
-    def test_separate_relationships_empty(self):
-        """Test separating empty relationships list."""
-        result = _separate_relationships_by_type([])
-        
-        assert len(result["contains"]) == 0
-        assert len(result["sibling"]) == 0
-        assert len(result["has_chunk"]) == 0
+        chunks, groups = _build_balanced_tree("journal-1", spans, span_index)
+
+        # 5 leaves + 4 internal nodes for a binary tree
+        assert len(chunks) == 9
+        assert [c[1:] for c in chunks[:5]] == spans
+        root_uuid, root_start, root_end = chunks[-1]
+        assert (root_start, root_end) == (0, 50)
+        assert {"parent": "journal-1", "child": root_uuid, "type": "CONTAINS"} in groups["contains"]
+        assert len(groups["contains"]) == 2 * 4 + 1
+        assert len(groups["sibling"]) == 4
+        assert len(groups["has_chunk"]) == 9
+        assert len(span_index) == 9
+
+    def test_build_balanced_tree_single_sentence(self):
+        """A single sentence is the root itself."""
+        span_index = SpanIndex()
+
+        chunks, groups = _build_balanced_tree("journal-1", [(0, 10)], span_index)
+
+        assert len(chunks) == 1
+        assert groups["contains"] == [
+            {"parent": "journal-1", "child": chunks[0][0], "type": "CONTAINS"}
+        ]
+        assert groups["sibling"] == []
 
     def test_log_creation_stats(self, sample_chunks, sample_relationships, capsys):
         """Test logging creation statistics."""
-        relationship_groups = _separate_relationships_by_type(sample_relationships)
-        _log_creation_stats(sample_chunks, relationship_groups)
+        _log_creation_stats(sample_chunks, sample_relationships)
         
         captured = capsys.readouterr()
         assert "Creating 2 chunks" in captured.out
@@ -105,16 +114,16 @@ class TestLexicalUtils:
         assert "Creating 2 HAS_CHUNK relationships" in captured.out
 
     @pytest.mark.asyncio
-    async def test_create_chunks(self, sample_chunks):
+    async def test_create_chunks(self, sample_text, sample_chunks):
         """Test creating chunks in the database."""
         mock_session = AsyncMock()
         mock_result = Mock()
-        mock_consume = Mock()
+        mock_consume = AsyncMock()
         mock_consume.return_value.counters.nodes_created = 2
         mock_result.consume = mock_consume
         mock_session.run.return_value = mock_result
         
-        chunk_data = _prepare_chunk_data(sample_chunks)
+        chunk_data = _prepare_chunk_data(sample_text, sample_chunks)
         await _create_chunks(mock_session, chunk_data)
         
         # Verify session.run was called with correct query
@@ -125,19 +134,19 @@ class TestLexicalUtils:
         assert call_args[1]["chunks"] == chunk_data
         
         # Verify consume was called
-        mock_consume.assert_called_once()
+        mock_consume.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_create_contains_relationships(self, sample_relationships):
         """Test creating CONTAINS relationships."""
         mock_session = AsyncMock()
         mock_result = Mock()
-        mock_consume = Mock()
+        mock_consume = AsyncMock()
         mock_consume.return_value.counters.relationships_created = 2
         mock_result.consume = mock_consume
         mock_session.run.return_value = mock_result
         
-        contains_rels = [r for r in sample_relationships if r["type"] == "CONTAINS"]
+        contains_rels = sample_relationships["contains"]
         await _create_contains_relationships(mock_session, contains_rels)
         
         # Verify session.run was called with correct query
@@ -161,12 +170,12 @@ class TestLexicalUtils:
         """Test creating HAS_CHUNK relationships."""
         mock_session = AsyncMock()
         mock_result = Mock()
-        mock_consume = Mock()
+        mock_consume = AsyncMock()
         mock_consume.return_value.counters.relationships_created = 2
         mock_result.consume = mock_consume
         mock_session.run.return_value = mock_result
         
-        has_chunk_rels = [r for r in sample_relationships if r["type"] == "HAS_CHUNK"]
+        has_chunk_rels = sample_relationships["has_chunk"]
         await _create_has_chunk_relationships(mock_session, has_chunk_rels)
         
         # Verify session.run was called with correct query
@@ -181,12 +190,12 @@ class TestLexicalUtils:
         """Test creating NEXT_SIBLING relationships."""
         mock_session = AsyncMock()
         mock_result = Mock()
-        mock_consume = Mock()
+        mock_consume = AsyncMock()
         mock_consume.return_value.counters.relationships_created = 1
         mock_result.consume = mock_consume
         mock_session.run.return_value = mock_result
         
-        sibling_rels = [r for r in sample_relationships if r["type"] == "NEXT_SIBLING"]
+        sibling_rels = sample_relationships["sibling"]
         await _create_sibling_relationships(mock_session, sibling_rels)
         
         # Verify session.run was called with correct query
@@ -201,19 +210,20 @@ class TestLexicalUtils:
         """Test creating all relationship types."""
         mock_session = AsyncMock()
         mock_result = Mock()
-        mock_consume = Mock()
+        mock_consume = AsyncMock()
         mock_consume.return_value.counters.relationships_created = 1
         mock_result.consume = mock_consume
         mock_session.run.return_value = mock_result
 
-        relationship_groups = _separate_relationships_by_type(sample_relationships)
-        await _create_relationships(mock_session, relationship_groups)
+        await _create_relationships(mock_session, sample_relationships)
 
         # Should call session.run for each relationship type
         assert mock_session.run.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_insert_chunks_and_relationships(self, sample_chunks, sample_relationships):
+    async def test_insert_chunks_and_relationships(
+        self, sample_text, sample_chunks, sample_relationships
+    ):
         """Test the main function that orchestrates chunk and relationship creation."""
         mock_connection = Mock()
         mock_session = AsyncMock()
@@ -225,13 +235,16 @@ class TestLexicalUtils:
         mock_connection.session_async = Mock(return_value=mock_context_manager)
 
         mock_result = Mock()
-        mock_consume = Mock()
+        mock_consume = AsyncMock()
         mock_consume.return_value.counters.nodes_created = 2
         mock_consume.return_value.counters.relationships_created = 5
         mock_result.consume = mock_consume
         mock_session.run.return_value = mock_result
 
-        await _insert_chunks_and_relationships(mock_connection, sample_chunks, sample_relationships)
+        chunk_data = _prepare_chunk_data(sample_text, sample_chunks)
+        await _insert_chunks_and_relationships(
+            mock_connection, chunk_data, sample_relationships
+        )
 
         # Verify connection.session_async was called
         mock_connection.session_async.assert_called_once()
@@ -239,6 +252,107 @@ class TestLexicalUtils:
         # Verify session.run was called multiple times (chunks + relationships)
         assert mock_session.run.call_count >= 4  # 1 for chunks + 3 for relationship types
 
+    @pytest.mark.asyncio
+    async def test_build_and_insert_lexical_tree(self, monkeypatch):
+        """Build the tree with an injected splitter and check the span index."""
+        monkeypatch.setattr(settings, "CHUNK_TEXT_MODE", "leaves")
+        mock_connection = Mock()
+        mock_session = AsyncMock()
+        mock_context_manager = AsyncMock()
+        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
+        mock_connection.session_async = Mock(return_value=mock_context_manager)
+        mock_session.run.return_value = Mock(consume=AsyncMock())
+
+        journal_entry = JournalEntry(
+            uuid="journal-1",
+            date=datetime(2024, 1, 15).date(),
+            text="Primera frase. Segunda frase. Tercera frase.",
+            entry_text="Primera frase. Segunda frase. Tercera frase.",
+        )
+
+        span_index = await build_and_insert_lexical_tree(
+            mock_connection, journal_entry, splitter=RegexSentenceSplitter()
+        )
+
+        # Journal span + 3 sentences + 2 internal chunks
+        assert len(span_index) == 6
+        chunk_rows = mock_session.run.call_args_list[0][1]["chunks"]
+        assert [row["text"] for row in chunk_rows[:3]] == [
+            "Primera frase.",
+            "Segunda frase.",
+            "Tercera frase.",
+        ]
+        # With "leaves", internal chunks only carry offsets into the journal text
+        assert all("text" not in row for row in chunk_rows[3:])
+        assert [(row["start"], row["end"]) for row in chunk_rows[3:]] == [
+            (0, 29),
+            (0, 44),
+        ]
+
+    def test_text_leaf_count_modes(self, monkeypatch):
+        """Every chunk keeps its text by default; "leaves" is opt-in."""
+        assert _text_leaf_count(3) is None
+        monkeypatch.setattr(settings, "CHUNK_TEXT_MODE", "leaves")
+        assert _text_leaf_count(3) == 3
+
+    def test_prepare_chunk_data_leaf_text_only(self, sample_text):
+        """With leaf_count, chunks past the sentences keep offsets only."""
+        chunk_spans = [("leaf-1", 0, 24), ("leaf-2", 25, 50), ("parent", 0, 50)]
+
+        result = _prepare_chunk_data(sample_text, chunk_spans, leaf_count=2)
+
+        assert result[1]["text"] == "This is the second chunk."
+        assert "text" not in result[2]
+        assert (result[2]["start"], result[2]["end"]) == (0, 50)
+
+    @pytest.mark.asyncio
+    async def test_get_chunk_texts_rebuilds_internal_text(self):
+        """Offset-only chunks are sliced out of the journal text."""
+
+        class AsyncRecords:
+            def __init__(self, records):
+                self.records = records
+
+            def __aiter__(self):
+                self._iter = iter(self.records)
+                return self
+
+            async def __anext__(self):
+                try:
+                    return next(self._iter)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        entry_text = "Primera frase. Segunda frase."
+        mock_session = AsyncMock()
+        mock_session.run.return_value = AsyncRecords(
+            [
+                {
+                    "entry_text": entry_text,
+                    "chunks": [
+                        {
+                            "uuid": "leaf",
+                            "text": "Primera frase.",
+                            "start": 0,
+                            "end": 14,
+                        },
+                        {"uuid": "root", "text": None, "start": 0, "end": 29},
+                    ],
+                }
+            ]
+        )
+        mock_context_manager = AsyncMock()
+        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
+        mock_connection = Mock()
+        mock_connection.session_async = Mock(return_value=mock_context_manager)
+
+        texts = await get_chunk_texts(mock_connection, ["leaf", "root"])
+
+        assert texts == {"leaf": "Primera frase.", "root": entry_text}
+        assert await get_chunk_texts(mock_connection, []) == {}
+
 
 class TestSpanIndex:
     """Test SpanIndex functionality."""
@@ -265,3 +379,72 @@ class TestSpanIndex:
         
         results = span_index.query_containing(12, 13)
         assert len(results) == 1  # Only second span contains position 12-13
+
+    def test_span_index_nested_containment_innermost_first(self):
+        """Nested spans are returned from the innermost chunk up to the root."""
+        span_index = SpanIndex()
+        span_index.add_span(0, 30, "journal")
+        span_index.add_span(0, 30, "root")
+        span_index.add_span(0, 10, "s1")
+        span_index.add_span(11, 20, "s2")
+        span_index.add_span(21, 30, "s3")
+        span_index.add_span(0, 20, "s1-s2")
+
+        assert [c.data for c in span_index.query_containing(12, 15)] == [
+            "s2",
+            "s1-s2",
+            "root",
+            "journal",
+        ]
+        assert [c.data for c in span_index.query_containing(5, 15)] == [
+            "s1-s2",
+            "root",
+            "journal",
+        ]
+        # Gap between sentences is only covered by the chunks above them
+        assert [c[2] for c in span_index.query_containing(10, 11)] == [
+            "s1-s2",
+            "root",
+            "journal",
+        ]
+        assert span_index.query_containing(25, 31) == []
+        assert span_index.query_containing(5, 5) == []
+
+    def test_span_index_matches_linear_scan(self):
+        """Index answers agree with a brute-force scan over a balanced tree."""
+        span_index = SpanIndex()
+        sentence_spans = [(i * 10, i * 10 + 8) for i in range(13)]
+        chunk_spans, _ = _build_balanced_tree("journal", sentence_spans, span_index)
+
+        for start in range(0, 130, 3):
+            for end in range(start + 1, start + 40, 7):
+                expected = {
+                    uuid for uuid, s, e in chunk_spans if s <= start and end <= e
+                }
+                found = {c.data for c in span_index.query_containing(start, end)}
+                assert found == expected
+
+    def test_span_index_query_containing_batch(self):
+        """Batch queries return one result list per span, in order."""
+        span_index = SpanIndex()
+        span_index.add_span_batch({(0, 10): "a", (0, 4): "b", (5, 10): "c"})
+
+        results = span_index.query_containing_batch([(1, 2), (6, 9), (1, 2), (3, 6)])
+
+        assert [[c.data for c in found] for found in results] == [
+            ["b", "a"],
+            ["c", "a"],
+            ["b", "a"],
+            ["a"],
+        ]
+
+    def test_span_index_add_after_query(self):
+        """Spans added after a query are visible to the next one."""
+        span_index = SpanIndex()
+        span_index.add_span(0, 10, "a")
+        assert len(span_index.query_containing(2, 3)) == 1
+
+        span_index.add_span(0, 5, "b")
+        assert len(span_index) == 2
+        assert [c.data for c in span_index.query_containing(2, 3)] == ["b", "a"]
+        assert list(span_index) == [((0, 10), "a"), ((0, 5), "b")]
@@ -0,0 +1,182 @@
+"""
+Unit tests for Neo4j query instrumentation.
+
+Tests per-query metrics recording, the instrumented session/result proxies
+and slow query handling in Neo4jConnection.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from minerva_backend.graph.db import Neo4jConnection
+from minerva_backend.graph.query_metrics import (
+    InstrumentedSession,
+    QueryMetrics,
+    format_plan,
+)
+
+
+def make_summary(**counters):
+    return SimpleNamespace(
+        result_available_after=3,
+        result_consumed_after=2,
+        counters=SimpleNamespace(contains_updates=bool(counters), **counters),
+    )
+
+
+class FakeResult:
+    """Async iterable result with a consume() summary, like AsyncResult."""
+
+    def __init__(self, records, summary):
+        self._records = records
+        self._summary = summary
+        self.consumed = 0
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self._records:
+            yield record
+
+    async def single(self):
+        return self._records[0] if self._records else None
+
+    async def consume(self):
+        self.consumed += 1
+        return self._summary
+
+
+def test_record_builds_histogram_and_counters():
+    """Durations land in histogram buckets; summary counters accumulate."""
+    metrics = QueryMetrics()
+    metrics.record("q", 0.5, rows=1, summary=make_summary(nodes_created=2))
+    metrics.record("q", 30.0, rows=3, summary=make_summary(nodes_created=1))
+    metrics.record("q", 20_000.0, failed=True)
+
+    stats = metrics.snapshot()[0]
+
+    assert stats["count"] == 3
+    assert stats["errors"] == 1
+    assert stats["rows"] == 4
+    assert stats["max_ms"] == 20_000.0
+    assert stats["server_ms"] == 10
+    assert stats["histogram_ms"]["le_1"] == 1
+    assert stats["histogram_ms"]["le_50"] == 1
+    assert stats["histogram_ms"]["le_inf"] == 1
+    assert stats["counters"] == {"nodes_created": 3}
+
+
+@pytest.mark.asyncio
+async def test_instrumented_session_names_query_after_caller():
+    """Rows are counted while iterating and the caller names the query."""
+    metrics = QueryMetrics()
+    session = AsyncMock()
+    session.run.return_value = FakeResult(
+        [{"n": 1}, {"n": 2}], make_summary(properties_set=4)
+    )
+    instrumented = InstrumentedSession(session, metrics)
+
+    result = await instrumented.run("MATCH (n) RETURN n", {"x": 1})
+    rows = [record async for record in result]
+
+    name = (
+        "test_query_metrics."
+        "test_instrumented_session_names_query_after_caller"
+    )
+    stats = metrics.get(name)
+    assert rows == [{"n": 1}, {"n": 2}]
+    assert stats.count == 1
+    assert stats.rows == 2
+    assert stats.counters == {"properties_set": 4}
+    session.run.assert_awaited_once_with("MATCH (n) RETURN n", {"x": 1})
+
+
+@pytest.mark.asyncio
+async def test_instrumented_session_records_unread_and_failed_queries():
+    """Unread results are recorded on session close; failures count as errors."""
+    metrics = QueryMetrics()
+    session = AsyncMock()
+    unread = FakeResult([], make_summary(relationships_created=1))
+    session.run.side_effect = [unread, RuntimeError("boom")]
+    instrumented = InstrumentedSession(session, metrics)
+
+    await instrumented.run("CREATE ()-[:R]->()", query_name="create")
+    with pytest.raises(RuntimeError):
+        await instrumented.run("BROKEN", query_name="broken")
+    assert metrics.get("create") is None
+
+    await instrumented.finish_open_results()
+
+    assert metrics.get("create").counters == {"relationships_created": 1}
+    assert unread.consumed == 1
+    assert metrics.get("broken").errors == 1
+
+
+@pytest.mark.asyncio
+async def test_session_async_instruments_driver_sessions():
+    """Queries run through the connection show up in its metrics."""
+    connection = Neo4jConnection(uri="bolt://test", user="neo4j", password="test")
+    session = AsyncMock()
+    session.run.return_value = FakeResult([{"ok": 1}], make_summary())
+    context_manager = AsyncMock()
+    context_manager.__aenter__ = AsyncMock(return_value=session)
+    context_manager.__aexit__ = AsyncMock(return_value=None)
+    connection.async_driver = MagicMock()
+    connection.async_driver.session = MagicMock(return_value=context_manager)
+    connection._initialized = True
+
+    records = await connection.execute_query("RETURN 1 AS ok")
+
+    assert records == [{"ok": 1}]
+    (stats,) = connection.query_metrics.snapshot()
+    assert stats["name"].endswith("test_session_async_instruments_driver_sessions")
+    assert stats["rows"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_write_query_gets_explain_plan_once():
+    """Slow writes are explained, not profiled, and only once per interval."""
+    connection = Neo4jConnection(
+        uri="bolt://test",
+        user="neo4j",
+        password="test",
+        slow_query_ms=10,
+        profile_slow_queries=True,
+    )
+    connection._log_query_plan = AsyncMock()
+
+    summary = make_summary(nodes_created=1)
+    connection._on_query_done("write", "CREATE (n)", {}, 50.0, summary)
+    connection._on_query_done("write", "CREATE (n)", {}, 50.0, summary)
+    connection._on_query_done("fast", "MATCH (n) RETURN n", {}, 5.0, None)
+    for task in list(connection._profile_tasks):
+        await task
+
+    connection._log_query_plan.assert_awaited_once_with(
+        "write", "CREATE (n)", {}, False
+    )
+
+
+def test_format_plan_renders_tree():
+    """Plans render one operator per line, indented by depth."""
+    plan = {
+        "operatorType": "ProduceResults@neo4j",
+        "rows": 1,
+        "dbHits": 0,
+        "children": [
+            {
+                "operatorType": "NodeIndexSeek@neo4j",
+                "rows": 1,
+                "dbHits": 2,
+                "args": {"Details": "RANGE INDEX d:Day(uuid)"},
+            }
+        ],
+    }
+
+    assert format_plan(plan).splitlines() == [
+        "ProduceResults@neo4j rows=1 dbHits=0",
+        "  NodeIndexSeek@neo4j rows=1 dbHits=2  [RANGE INDEX d:Day(uuid)]",
+    ]
@@ -0,0 +1,116 @@
+"""
+Unit tests for sentence splitters.
+
+Tests the regex splitter rules and the Stanza pipeline pool.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from minerva_backend.graph.services import sentence_splitter
+from minerva_backend.graph.services.sentence_splitter import (
+    RegexSentenceSplitter,
+    StanzaSentenceSplitter,
+    create_sentence_splitter,
+)
+
+
+def texts(text, spans):
+    return [text[start:end] for start, end in spans]
+
+
+class TestRegexSentenceSplitter:
+    """Test the rule-based splitter."""
+
+    def test_splits_on_terminal_punctuation(self):
+        text = "Hoy salí temprano. ¿Qué hice? ¡Caminé mucho!"
+
+        assert texts(text, RegexSentenceSplitter().split(text)) == [
+            "Hoy salí temprano.",
+            "¿Qué hice?",
+            "¡Caminé mucho!",
+        ]
+
+    def test_skips_abbreviations_initials_and_decimals(self):
+        text = "Vi al Sr. Gómez y a J. Pérez. Compramos 2.5 kg de pan."
+
+        assert texts(text, RegexSentenceSplitter().split(text)) == [
+            "Vi al Sr. Gómez y a J. Pérez.",
+            "Compramos 2.5 kg de pan.",
+        ]
+
+    def test_splits_on_line_breaks_and_trims(self):
+        text = "  Primera línea\n\nSegunda línea sin punto  "
+
+        spans = RegexSentenceSplitter().split(text)
+
+        assert texts(text, spans) == ["Primera línea", "Segunda línea sin punto"]
+
+    def test_empty_text(self):
+        assert RegexSentenceSplitter().split("   ") == []
+
+
+def fake_pipeline():
+    """Stand-in for a Stanza pipeline: one sentence spanning the text."""
+
+    def nlp(text):
+        token_start = SimpleNamespace(start_char=0, end_char=1)
+        token_end = SimpleNamespace(start_char=len(text) - 1, end_char=len(text))
+        return SimpleNamespace(
+            sentences=[SimpleNamespace(tokens=[token_start, token_end])]
+        )
+
+    return nlp
+
+
+class TestStanzaSentenceSplitter:
+    """Test the pooled Stanza splitter."""
+
+    def test_pipeline_created_once(self):
+        factory = Mock(side_effect=fake_pipeline)
+        splitter = StanzaSentenceSplitter(pipeline_factory=factory)
+
+        splitter.warm_up()
+        assert splitter.split("Hola mundo.") == [(0, 11)]
+        assert splitter.split("Otra vez.") == [(0, 9)]
+
+        factory.assert_called_once()
+
+    def test_pool_never_exceeds_size(self):
+        factory = Mock(side_effect=fake_pipeline)
+        splitter = StanzaSentenceSplitter(pool_size=2, pipeline_factory=factory)
+
+        threads = [
+            threading.Thread(target=splitter.split, args=("Texto de prueba.",))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert 1 <= factory.call_count <= 2
+
+    @pytest.mark.asyncio
+    async def test_split_async(self):
+        splitter = StanzaSentenceSplitter.from_pipeline(fake_pipeline())
+
+        assert await splitter.split_async("Hola.") == [(0, 5)]
+
+
+def test_create_sentence_splitter_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        create_sentence_splitter("spacy")
+
+
+def test_get_sentence_splitter_is_process_wide(monkeypatch):
+    monkeypatch.setattr(sentence_splitter, "_splitter", None)
+    monkeypatch.setattr(sentence_splitter.settings, "SENTENCE_SPLITTER", "regex")
+
+    first = sentence_splitter.get_sentence_splitter()
+
+    assert isinstance(first, RegexSentenceSplitter)
+    assert sentence_splitter.get_sentence_splitter() is first
@@ -0,0 +1,180 @@
+"""
+Unit tests for TemporalRepository.
+
+Tests bulk time tree creation and the in-process Day uuid cache.
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from minerva_backend.graph.repositories.temporal_repository import TemporalRepository
+
+
+class AsyncRecords:
+    """Minimal async iterable standing in for a neo4j AsyncResult."""
+
+    def __init__(self, records):
+        self._records = records
+
+    def __aiter__(self):
+        self._iter = iter(self._records)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.fixture
+def mock_session():
+    return AsyncMock()
+
+
+@pytest.fixture
+def connection(mock_session):
+    """Fresh mocked connection, so each test starts with an empty cache."""
+    connection = MagicMock()
+    context_manager = AsyncMock()
+    context_manager.__aenter__ = AsyncMock(return_value=mock_session)
+    context_manager.__aexit__ = AsyncMock(return_value=None)
+    connection.session_async = MagicMock(return_value=context_manager)
+    return connection
+
+
+def day_result(day_uuid="day-uuid"):
+    result = AsyncMock()
+    result.single.return_value = {
+        "year_uuid": "year-uuid",
+        "month_uuid": "month-uuid",
+        "day_uuid": day_uuid,
+    }
+    return result
+
+
+@pytest.mark.asyncio
+async def test_ensure_day_is_cached(connection, mock_session):
+    """A day already ensured is answered without touching the database."""
+    mock_session.run.return_value = day_result()
+    repository = TemporalRepository(connection)
+
+    first = await repository.ensure_day_in_time_tree(date(2024, 3, 1))
+    second = await repository.ensure_day_in_time_tree(date(2024, 3, 1))
+
+    assert first == second == "day-uuid"
+    assert mock_session.run.await_count == 1
+    assert await repository.get_month_uuid(2024, 3) == "month-uuid"
+    assert await repository.get_year_uuid(2024) == "year-uuid"
+    assert mock_session.run.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_shared_per_connection(connection, mock_session):
+    """Repositories are per-request, but share the cache of their connection."""
+    mock_session.run.return_value = day_result()
+    await TemporalRepository(connection).ensure_day_in_time_tree(date(2024, 3, 1))
+
+    day_uuid = await TemporalRepository(connection).get_day_uuid(date(2024, 3, 1))
+
+    assert day_uuid == "day-uuid"
+    assert mock_session.run.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_ensure_time_tree_single_unwind(connection, mock_session):
+    """A whole year of days is created in one query and primes the cache."""
+    mock_session.run.return_value = AsyncRecords(
+        [
+            {
+                "date_str": "2024-02-29",
+                "year_uuid": "year-uuid",
+                "month_uuid": "month-uuid",
+                "day_uuid": "leap-day-uuid",
+            }
+        ]
+    )
+    repository = TemporalRepository(connection)
+
+    created = await repository.ensure_time_tree(2024, 2024)
+
+    assert created == 366
+    mock_session.run.assert_awaited_once()
+    assert "UNWIND $rows AS row" in mock_session.run.call_args[0][0]
+    assert len(mock_session.run.call_args[1]["rows"]) == 366
+    assert await repository.get_day_uuid(date(2024, 2, 29)) == "leap-day-uuid"
+    mock_session.run.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_link_nodes_to_day_batch_uses_cached_day(connection, mock_session):
+    """With the day cached, linking is a single query."""
+    repository = TemporalRepository(connection)
+    repository._remember(date(2024, 3, 1), None, None, "day-uuid")
+    link_result = AsyncMock()
+    link_result.single.return_value = {"linked": 2}
+    mock_session.run.return_value = link_result
+
+    linked = await repository.link_nodes_to_day_batch(["a", "b"], date(2024, 3, 1))
+
+    assert linked == 2
+    mock_session.run.assert_awaited_once()
+    assert mock_session.run.call_args[1]["day_uuid"] == "day-uuid"
+
+
+@pytest.mark.asyncio
+async def test_link_updates_counters_in_same_query(connection, mock_session):
+    """Linking bumps Day/Month/Year counters without a second round-trip."""
+    repository = TemporalRepository(connection)
+    repository._remember(date(2024, 3, 1), None, None, "day-uuid")
+    link_result = AsyncMock()
+    link_result.single.return_value = None
+    mock_session.run.return_value = link_result
+
+    linked = await repository.link_nodes_to_day_batch(["a"], date(2024, 3, 1))
+
+    assert linked == 0
+    query = mock_session.run.call_args[0][0]
+    assert "WHERE NOT (n)-[:OCCURRED_ON]->(d)" in query
+    assert "FOREACH (t IN [d, m, y]" in query
+    assert "t.journal_count = coalesce(t.journal_count, 0) + journals" in query
+
+
+@pytest.mark.asyncio
+async def test_month_stats_read_counters(connection, mock_session):
+    """Month statistics come from the Month node counters."""
+    stats_result = AsyncMock()
+    stats_result.single.return_value = {
+        "days_in_month": 31,
+        "journal_entries": 4,
+        "entity_mentions": 12,
+        "word_count": 800,
+        "dates_with_days": [],
+        "dates_with_entries": [],
+    }
+    mock_session.run.return_value = stats_result
+
+    stats = await TemporalRepository(connection).get_month_stats(2024, 3)
+
+    assert stats["journal_entries"] == 4
+    assert stats["entity_mentions"] == 12
+    assert stats["word_count"] == 800
+    assert "JournalEntry" not in mock_session.run.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_temporal_stats(connection, mock_session):
+    """Rebuild recomputes days, then rolls up months and years."""
+    rebuild_result = AsyncMock()
+    rebuild_result.single.return_value = {"updated": 3}
+    mock_session.run.return_value = rebuild_result
+
+    updated = await TemporalRepository(connection).rebuild_temporal_stats()
+
+    assert updated == {"days": 3, "months": 3, "years": 3}
+    queries = [c[0][0] for c in mock_session.run.call_args_list]
+    assert "MATCH (d:Day)" in queries[0]
+    assert "MATCH (m:Month)" in queries[1]
+    assert "MATCH (y:Year)" in queries[2]
@@ -0,0 +1,107 @@
+"""
+Unit tests for curation archival and compaction.
+
+Tests that old completed journals and workflows move to the archive DB with
+all their rows, that pending and recent data stay, and that compaction
+switches the database to incremental auto-vacuum.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import aiosqlite
+import pytest
+
+from minerva_models import Person, Span
+
+from minerva_backend.processing.curation_manager import CurationManager
+from minerva_backend.processing.models import EntityMapping
+
+
+@asynccontextmanager
+async def open_manager(tmp_path):
+    """Curation manager on a file database."""
+    manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+    await manager.initialize()
+    try:
+        yield manager
+    finally:
+        await manager.close()
+
+
+async def queue_journal(manager, journal_uuid):
+    person = Person(name="John", summary_short="John", summary="A person named John")
+    mapping = EntityMapping(person, [Span(start=0, end=4, text="John")])
+    await manager.queue_entities_for_curation(journal_uuid, "John", [mapping])
+    await manager.accept_entity(journal_uuid, str(person.uuid), person.model_dump())
+
+
+async def count(db_path, table):
+    async with aiosqlite.connect(db_path) as db:
+        return (await db.execute_fetchall(f"SELECT COUNT(*) FROM {table}"))[0][0]
+
+
+@pytest.mark.asyncio
+async def test_archives_old_completed_journals_and_workflows(tmp_path):
+    """Only completed parents older than the cutoff move, with their rows."""
+    archive_path = str(tmp_path / "archive.db")
+    async with open_manager(tmp_path) as manager:
+        for journal_uuid in ("old", "recent", "pending"):
+            await queue_journal(manager, journal_uuid)
+        await manager.complete_relationship_phase("old")
+        await manager.complete_relationship_phase("recent")
+        await manager.create_quote_workflow("quote-1", "/vault/book.md")
+        await manager.complete_quote_workflow("quote-1")
+        async with manager._pool.write() as db:
+            await db.execute(
+                "UPDATE journal_curation"
+                " SET completed_at = datetime('now', '-100 days') WHERE uuid = 'old'"
+            )
+            await db.execute(
+                "UPDATE quote_workflow_curation"
+                " SET created_at = datetime('now', '-100 days')"
+            )
+
+        before = await manager.get_curation_stats()
+        archived = await manager.archive_completed(
+            archive_path, datetime.utcnow() - timedelta(days=90)
+        )
+        again = await manager.archive_completed(
+            archive_path, datetime.utcnow() - timedelta(days=90)
+        )
+        pending = await manager.get_all_pending_curation_tasks()
+        stats = await manager.get_curation_stats()
+
+    assert archived == {
+        "journals": 1,
+        "quote_workflows": 1,
+        "concept_workflows": 0,
+        "rows": 4,  # journal, entity, span and quote workflow rows
+    }
+    assert again["journals"] == 0
+    assert list(pending) == ["pending"]
+    # Archived journals and items stay counted
+    assert stats == before
+    assert (stats.total_journals, stats.completed) == (3, 2)
+    assert await count(archive_path, "journal_curation") == 1
+    assert await count(archive_path, "span_curation_items") == 1
+    assert await count(archive_path, "quote_workflow_curation") == 1
+    assert await count(str(tmp_path / "curation.db"), "entity_curation_items") == 2
+
+
+@pytest.mark.asyncio
+async def test_compact_switches_to_incremental_vacuum(tmp_path):
+    """The first compaction rebuilds the file with incremental auto-vacuum."""
+    async with open_manager(tmp_path) as manager:
+        for i in range(20):
+            await queue_journal(manager, f"j-{i}")
+        await manager.clear_all()
+
+        freed = await manager.compact()
+        await manager.compact()  # incremental from now on
+        async with manager._pool.write() as db:
+            auto_vacuum = (await db.execute_fetchall("PRAGMA auto_vacuum"))[0][0]
+            free_pages = (await db.execute_fetchall("PRAGMA freelist_count"))[0][0]
+
+    assert freed > 0
+    assert (auto_vacuum, free_pages) == (2, 0)
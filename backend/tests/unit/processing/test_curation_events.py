@@ -0,0 +1,114 @@
+"""
+Unit tests for the curation event stream.
+
+Tests that CurationManager writes record events, and that the broker fans
+them out with per-subscriber filters, resync on overflow and resume by id.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from minerva_backend.processing.curation_events import (
+    ITEM_REVIEWED,
+    ITEMS_QUEUED,
+    NOTIFICATION_CREATED,
+    STAGE_COMPLETED,
+    CurationEventBroker,
+    EventFilter,
+)
+from minerva_backend.processing.curation_manager import CurationManager
+
+QUOTES = [{"uuid": f"q-{i}", "original_data_json": {"text": f"Quote {i}"}} for i in range(3)]
+
+
+@asynccontextmanager
+async def open_broker(tmp_path, queue_size=100):
+    """Curation manager on a file database with a fast-polling broker."""
+    manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+    await manager.initialize()
+    broker = CurationEventBroker(manager, poll_interval_ms=20, queue_size=queue_size)
+    try:
+        yield manager, broker
+    finally:
+        await broker.close()
+        await manager.close()
+
+
+async def collect(subscription, count, timeout=2.0):
+    """Read `count` events (None marks a resync or timeout)."""
+    return [await subscription.next(timeout) for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_writes_record_events(tmp_path):
+    """Queue, review, completion and notification writes each append an event."""
+    async with open_broker(tmp_path) as (manager, _):
+        await manager.queue_quote_curation_items("quote-1", QUOTES)
+        await manager.accept_quote_item("quote-1", "q-0")
+        await manager.reject_quote_item("quote-1", "missing")
+        await manager.complete_quote_workflow("quote-1")
+        await manager.create_notification("quote-1", "quote", "done", "Quotes done")
+        events = await manager.get_curation_events(after=0)
+
+    assert [e.kind for e in events] == [
+        ITEMS_QUEUED,
+        ITEM_REVIEWED,
+        STAGE_COMPLETED,
+        NOTIFICATION_CREATED,
+    ]
+    assert events[0].data == {"count": 3}
+    assert events[1].data == {"item_id": "q-0", "action": "accepted"}
+    assert all(e.workflow_id == "quote-1" for e in events)
+
+
+@pytest.mark.asyncio
+async def test_subscribers_receive_matching_events(tmp_path):
+    """Each subscriber gets only the events passing its filter."""
+    async with open_broker(tmp_path) as (manager, broker):
+        async with broker.subscribe(EventFilter(workflow_id="quote-2")) as mine:
+            async with broker.subscribe(
+                EventFilter(kinds=frozenset({NOTIFICATION_CREATED}))
+            ) as notifications:
+                await manager.queue_quote_curation_items("quote-1", QUOTES)
+                await manager.queue_quote_curation_items("quote-2", QUOTES)
+                await manager.create_notification(None, None, "info", "Hello")
+
+                [queued] = await collect(mine, 1)
+                [created] = await collect(notifications, 1)
+                assert await mine.next(0.1) is None
+
+    assert (queued.kind, queued.workflow_id) == (ITEMS_QUEUED, "quote-2")
+    assert created.data["title"] == "Hello"
+    assert created.to_sse().startswith(f"id: {created.id}\nevent: notification_created\n")
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_told_to_resync(tmp_path):
+    """A full queue is dropped and replaced by a resync marker."""
+    async with open_broker(tmp_path, queue_size=2) as (manager, broker):
+        async with broker.subscribe(EventFilter()) as subscription:
+            for i in range(3):
+                await manager.queue_quote_curation_items(f"quote-{i}", QUOTES)
+            await asyncio.sleep(0.2)
+
+            assert await subscription.next(1) is None
+            assert subscription.take_resync()
+            assert not subscription.take_resync()
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_missed_events(tmp_path):
+    """Subscribing with a last event id replays what came after it."""
+    async with open_broker(tmp_path) as (manager, broker):
+        await broker.start()
+        await manager.queue_quote_curation_items("quote-1", QUOTES)
+        [first] = await manager.get_curation_events(after=0)
+        await manager.complete_quote_workflow("quote-1")
+        await asyncio.sleep(0.2)
+
+        async with broker.subscribe(EventFilter(), last_event_id=first.id) as resumed:
+            [missed] = await collect(resumed, 1)
+
+    assert missed.kind == STAGE_COMPLETED
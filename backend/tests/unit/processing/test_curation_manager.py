@@ -23,7 +23,7 @@ from minerva_backend.processing.models import (
 @pytest.fixture
 def curation_manager():
     """Create curation manager instance for testing."""
-    with patch('minerva_backend.processing.curation_manager.aiosqlite.connect') as mock_connect:
+    with patch('minerva_backend.processing.sqlite_pool.aiosqlite.connect') as mock_connect:
         mock_connect.return_value.__aenter__.return_value = Mock()
         return CurationManager(db_path=":memory:")
 
@@ -65,7 +65,7 @@ class TestCurationManagerInitialization:
     
     def test_curation_manager_init(self):
         """Test curation manager initialization."""
-        with patch('minerva_backend.processing.curation_manager.aiosqlite.connect') as mock_connect:
+        with patch('minerva_backend.processing.sqlite_pool.aiosqlite.connect') as mock_connect:
             mock_connect.return_value.__aenter__.return_value = Mock()
             
             manager = CurationManager(db_path=":memory:")
@@ -88,6 +88,56 @@ class TestCurationManagerStats:
             await curation_manager.get_curation_stats()
 
 
+    @pytest.mark.asyncio
+    async def test_stats_kept_current_by_triggers(self, tmp_path):
+        """Queueing, reviewing, completing and clearing update the stats table."""
+        from minerva_models import Person, Span
+
+        people = [
+            Person(name=name, summary_short=name, summary=f"A person named {name}")
+            for name in ("John", "Ana", "Luis")
+        ]
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        try:
+            await manager.queue_entities_for_curation(
+                "j-1",
+                "John met Ana and Luis",
+                [EntityMapping(p, [Span(start=0, end=4, text="John")]) for p in people],
+            )
+            await manager.create_journal_for_curation("j-2", "Later")
+            await manager.accept_entity("j-1", str(people[0].uuid), people[0].model_dump())
+            await manager.reject_entity("j-1", str(people[1].uuid))
+            queued = await manager.get_curation_stats()
+
+            async with manager._pool.write() as db:
+                await db.execute(
+                    "UPDATE journal_curation SET created_at = datetime('now', '-2 hours')"
+                    " WHERE uuid = 'j-1'"
+                )
+            await manager.complete_relationship_phase("j-1")
+            completed = await manager.get_curation_stats()
+
+            await manager.clear_all()
+            cleared = await manager.get_curation_stats()
+        finally:
+            await manager.close()
+
+        assert (queued.total_journals, queued.pending_entities) == (2, 2)
+        assert queued.entity_stats.model_dump() == {
+            "total_extracted": 3,
+            "accepted": 1,
+            "rejected": 1,
+            "pending": 1,
+            "acceptance_rate": 0.5,
+        }
+        assert queued.avg_processing_time_minutes == 0.0
+        assert (completed.completed, completed.pending_entities) == (1, 1)
+        assert 119 <= completed.avg_processing_time_minutes <= 121
+        assert completed.oldest_pending_age_hours < 1
+        assert cleared == CurationStats()
+
+
 class TestCurationManagerPendingTasks:
     """Test pending curation tasks functionality."""
     
@@ -193,6 +243,331 @@ class TestCurationManagerPhaseCompletion:
             await curation_manager.complete_relationship_phase(journal_uuid)
 
 
+class TestCurationManagerWorkflowId:
+    """Test the Temporal workflow id stored with each journal."""
+
+    @pytest.mark.asyncio
+    async def test_workflow_id_added_to_existing_database(self, tmp_path):
+        """Databases without the column are migrated and return the stored id."""
+        import aiosqlite
+
+        db_path = str(tmp_path / "curation.db")
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute(
+                "CREATE TABLE journal_curation (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "uuid TEXT, journal_text TEXT, created_at TIMESTAMP, overall_status TEXT)"
+            )
+            await db.commit()
+        manager = CurationManager(db_path=db_path)
+
+        await manager.initialize()
+        try:
+            await manager.initialize()  # idempotent
+            await manager.create_journal_for_curation(
+                "j-1", "text", "journal-2025-09-29-j-1"
+            )
+
+            assert await manager.get_journal_workflow_id("j-1") == "journal-2025-09-29-j-1"
+            assert await manager.get_journal_workflow_id("missing") is None
+        finally:
+            await manager.close()
+
+
+class TestCurationManagerMigrations:
+    """Test the versioned migrations against databases from older versions."""
+
+    @pytest.mark.asyncio
+    async def test_json_spans_migrated_to_typed_columns(self, tmp_path):
+        """Old JSON blobs are moved to typed columns and read back unchanged."""
+        import aiosqlite
+        from minerva_models import Person, Span
+
+        person = Person(name="John", summary_short="John", summary="A person")
+        span = Span(start=0, end=4, text="John")
+        db_path = str(tmp_path / "curation.db")
+        async with aiosqlite.connect(db_path) as db:
+            await db.executescript(
+                """
+                CREATE TABLE journal_curation (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    uuid TEXT, journal_text TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    overall_status TEXT DEFAULT 'PENDING_ENTITIES');
+                CREATE TABLE entity_curation_items (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    uuid TEXT, journal_id TEXT, entity_type TEXT, original_data_json TEXT,
+                    curated_data_json TEXT, status TEXT DEFAULT 'PENDING',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    is_user_added BOOLEAN DEFAULT FALSE);
+                CREATE TABLE span_curation_items (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    uuid TEXT, journal_id TEXT, owner_uuid TEXT, span_data_json TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                """
+            )
+            await db.execute(
+                "INSERT INTO journal_curation (uuid, journal_text) VALUES ('j-1', 'John')"
+            )
+            await db.execute(
+                "INSERT INTO entity_curation_items "
+                "(uuid, journal_id, entity_type, original_data_json, curated_data_json, status) "
+                "VALUES (?, 'j-1', 'Person', ?, ?, 'ACCEPTED')",
+                (
+                    str(person.uuid),
+                    person.model_dump_json(),
+                    person.model_copy(update={"name": "Johnny"}).model_dump_json(),
+                ),
+            )
+            await db.execute(
+                "INSERT INTO span_curation_items "
+                "(uuid, journal_id, owner_uuid, span_data_json) VALUES (?, 'j-1', ?, ?)",
+                (str(span.uuid), str(person.uuid), span.model_dump_json()),
+            )
+            await db.commit()
+
+        manager = CurationManager(db_path=db_path)
+        await manager.initialize()
+        try:
+            await manager.initialize()  # already at the latest version
+            accepted = await manager.get_accepted_entities_with_spans("j-1")
+            stats = await manager.get_curation_stats()
+            async with manager._pool.read() as db:
+                version = (await db.execute_fetchall("PRAGMA user_version"))[0][0]
+                names = await db.execute_fetchall(
+                    "SELECT entity_type, name FROM entity_curation_items"
+                )
+        finally:
+            await manager.close()
+
+        assert version == 3
+        assert names == [("Person", "Johnny")]
+        assert (stats.total_journals, stats.entity_stats.accepted) == (1, 1)
+        assert accepted[0].entity.name == "Johnny"
+        assert [s.model_dump() for s in accepted[0].spans] == [span.model_dump()]
+
+
+class TestCurationManagerQueueing:
+    """Test batched queueing against a real SQLite database."""
+
+    @pytest.mark.asyncio
+    async def test_queue_entities_and_relationships_round_trip(self, tmp_path):
+        """Entities, relations, spans and contexts are stored and read back."""
+        from minerva_models import Person, Relation, Span
+        from minerva_backend.processing.models import CuratableMapping
+        from minerva_backend.prompt.extract_relationships import RelationshipContext
+
+        john = Person(name="John", summary_short="John", summary="A person named John")
+        ana = Person(name="Ana", summary_short="Ana", summary="A person named Ana")
+        relation = Relation(
+            source=str(john.uuid),
+            target=str(ana.uuid),
+            summary_short="Friends",
+            summary="John and Ana are friends",
+        )
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        try:
+            await manager.queue_entities_for_curation(
+                "j-1",
+                "John met Ana",
+                [
+                    EntityMapping(john, [Span(start=0, end=4, text="John")]),
+                    EntityMapping(ana, [Span(start=9, end=12, text="Ana")]),
+                ],
+            )
+            for entity in (john, ana):
+                await manager.accept_entity("j-1", str(entity.uuid), entity.model_dump())
+            await manager.queue_relationships_for_curation(
+                "j-1",
+                [
+                    CuratableMapping(
+                        kind="relation",
+                        data=relation,
+                        spans=[Span(start=0, end=12, text="John met Ana")],
+                        context=[
+                            RelationshipContext(
+                                entity_uuid=str(ana.uuid), sub_type=["friend"]
+                            )
+                        ],
+                    )
+                ],
+            )
+            await manager.accept_relationship(
+                "j-1", str(relation.uuid), relation.model_dump(mode="json")
+            )
+
+            entities = await manager.get_accepted_entities_with_spans("j-1")
+            relationships = await manager.get_accepted_relationships_with_spans("j-1")
+            assert await manager.get_journal_status("j-1") == "PENDING_RELATIONS"
+        finally:
+            await manager.close()
+
+        assert {m.entity.name: [s.text for s in m.spans] for m in entities} == {
+            "John": ["John"],
+            "Ana": ["Ana"],
+        }
+        assert len(relationships) == 1
+        assert [s.text for s in relationships[0].spans] == ["John met Ana"]
+        assert relationships[0].context[0].sub_type == ["friend"]
+
+    @pytest.mark.asyncio
+    async def test_spans_fetched_in_chunks(self, tmp_path, monkeypatch):
+        """Span lookups are set-based and split to respect SQLite's parameter limit."""
+        from minerva_models import Person, Span
+        from minerva_backend.processing import curation_manager as module
+
+        monkeypatch.setattr(module, "SQLITE_MAX_VARIABLES", 2)
+        people = [
+            Person(name=f"P{i}", summary_short=f"P{i}", summary=f"Person {i}")
+            for i in range(5)
+        ]
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        try:
+            await manager.queue_entities_for_curation(
+                "j-1",
+                "P0 P1 P2 P3 P4",
+                [
+                    EntityMapping(p, [Span(start=3 * i, end=3 * i + 2, text=p.name)])
+                    for i, p in enumerate(people)
+                ],
+            )
+            pending = await manager.get_all_pending_curation_tasks()
+            for person in people[:3]:
+                await manager.accept_entity("j-1", str(person.uuid), person.model_dump())
+            accepted = await manager.get_accepted_entities_with_spans("j-1")
+        finally:
+            await manager.close()
+
+        tasks = pending["j-1"].tasks
+        assert len(tasks) == 5
+        assert all(len(task.data["spans"]) == 1 for task in tasks.values())
+        assert sorted(m.spans[0].text for m in accepted) == ["P0", "P1", "P2"]
+
+    @pytest.mark.asyncio
+    async def test_queue_quote_items_in_one_batch(self, tmp_path):
+        """Hundreds of quotes are queued in one batch."""
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        items = [
+            {"uuid": f"q-{i}", "original_data_json": {"text": f"Quote {i}"}}
+            for i in range(300)
+        ]
+        try:
+            await manager.queue_quote_curation_items("quote-1", items)
+            assert await manager.get_quote_pending_count("quote-1") == 300
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_early_completion_is_recorded(self, tmp_path):
+        """Completed workflows are found by the fallback check with items pending."""
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        try:
+            await manager.create_quote_workflow("quote-1", "/vault/book.md")
+            await manager.queue_quote_curation_items(
+                "quote-1", [{"uuid": "q-1", "original_data_json": {"text": "Q"}}]
+            )
+            await manager.queue_inbox_classification_items(
+                "inbox-1",
+                [{"source_path": "Inbox/a.md", "target_folder": "Notes"}],
+            )
+            before = (
+                await manager.is_quote_workflow_completed("quote-1"),
+                await manager.is_inbox_workflow_completed("inbox-1"),
+            )
+
+            await manager.complete_quote_workflow("quote-1")
+            await manager.complete_inbox_workflow("inbox-1")
+
+            after = (
+                await manager.is_quote_workflow_completed("quote-1"),
+                await manager.is_inbox_workflow_completed("inbox-1"),
+            )
+            pending_inbox = await manager.get_pending_inbox_workflow_ids()
+            quote_pending = await manager.get_quote_pending_count("quote-1")
+        finally:
+            await manager.close()
+
+        assert before == (False, False)
+        assert after == (True, True)
+        assert pending_inbox == []
+        assert quote_pending == 1
+
+
+class TestCurationManagerPendingViews:
+    """Test paging, summary and change tracking against a real SQLite database."""
+
+    @staticmethod
+    async def _queue_journals(manager, count):
+        from minerva_models import Person
+
+        for i in range(count):
+            person = Person(name=f"P{i}", summary_short=f"P{i}", summary=f"Person {i}")
+            await manager.queue_entities_for_curation(
+                f"j-{i}", f"Journal {i}", [EntityMapping(person, [])]
+            )
+
+    @pytest.mark.asyncio
+    async def test_pending_pages_follow_cursor(self, tmp_path):
+        """Journals are paged newest first until next_cursor is None."""
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        try:
+            await self._queue_journals(manager, 3)
+            first, cursor = await manager.get_pending_curation_page(limit=2)
+            second, last_cursor = await manager.get_pending_curation_page(2, cursor)
+            with pytest.raises(ValueError):
+                await manager.get_pending_curation_page(2, "not-a-cursor")
+        finally:
+            await manager.close()
+
+        assert list(first) == ["j-2", "j-1"]
+        assert list(second) == ["j-0"]
+        assert last_cursor is None
+        assert len(second["j-0"].tasks) == 1
+
+    @pytest.mark.asyncio
+    async def test_summary_counts_pending_tasks(self, tmp_path):
+        """The summary has pending counts per journal and no text."""
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        try:
+            await self._queue_journals(manager, 2)
+            summary = await manager.get_pending_curation_summary()
+        finally:
+            await manager.close()
+
+        assert [s.journal_id for s in summary] == ["j-1", "j-0"]
+        assert all(s.pending_entities == 1 for s in summary)
+        assert all(s.pending_relationships == 0 for s in summary)
+
+    @pytest.mark.asyncio
+    async def test_changes_since_version(self, tmp_path):
+        """Writes bump the version; changes report updated and finished journals."""
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        try:
+            await self._queue_journals(manager, 3)
+            version = await manager.get_curation_version()
+            unchanged = await manager.get_curation_changes(version)
+
+            pending = await manager.get_all_pending_curation_tasks()
+            entity_uuid = next(iter(pending["j-0"].tasks))
+            await manager.reject_entity("j-0", entity_uuid)
+            await manager.complete_relationship_phase("j-1")
+
+            new_version = await manager.get_curation_version()
+            changed, removed = await manager.get_curation_changes(version)
+        finally:
+            await manager.close()
+
+        assert version > 0
+        assert unchanged == ({}, [])
+        assert new_version > version
+        assert list(changed) == ["j-0"]
+        assert changed["j-0"].tasks == {}
+        assert removed == ["j-1"]
+
+
 class TestCurationManagerUtilityMethods:
     """Test utility methods."""
     
@@ -212,3 +587,47 @@ class TestCurationManagerUtilityMethods:
                 assert "FeelingConcept" in curation_manager.ENTITY_TYPE_MAP
             else:
                 assert entity_type in curation_manager.ENTITY_TYPE_MAP
+
+
+class TestCurationManagerBulk:
+    """Test bulk and batched review against a real SQLite database."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_and_batched_review(self, tmp_path):
+        """Bulk updates touch pending items only; batches apply curated data."""
+        from minerva_models import Emotion, Person, Span
+
+        john = Person(name="John", summary_short="John", summary="A person named John")
+        ana = Person(name="Ana", summary_short="Ana", summary="A person named Ana")
+        joy = Emotion(name="Joy", summary_short="Joy", summary="Feeling of joy")
+        manager = CurationManager(db_path=str(tmp_path / "curation.db"))
+        await manager.initialize()
+        try:
+            await manager.queue_entities_for_curation(
+                "j-1",
+                "John and Ana felt joy",
+                [
+                    EntityMapping(e, [Span(start=0, end=4, text="John")])
+                    for e in (john, ana, joy)
+                ],
+            )
+            reviewed = await manager.review_items(
+                "j-1",
+                "entity",
+                {str(john.uuid): {**john.model_dump(mode="json"), "name": "Johnny"}},
+                [str(joy.uuid), "missing"],
+            )
+            # Joy is already rejected, so only Ana is left pending
+            bulk_rejected = await manager.bulk_reject("j-1", "entity", "Emotion")
+            bulk_accepted = await manager.bulk_accept_all("j-1", "entity")
+            accepted = await manager.get_accepted_entities_with_spans("j-1")
+            stats = await manager.get_curation_stats()
+            with pytest.raises(ValueError):
+                await manager.bulk_accept_all("j-1", "concept")
+        finally:
+            await manager.close()
+
+        assert reviewed == (1, 1, ["missing"])
+        assert (bulk_rejected, bulk_accepted) == (0, 1)
+        assert sorted(m.entity.name for m in accepted) == ["Ana", "Johnny"]
+        assert (stats.entity_stats.accepted, stats.entity_stats.rejected) == (2, 1)
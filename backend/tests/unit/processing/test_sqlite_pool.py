@@ -0,0 +1,89 @@
+"""
+Unit tests for the curation DB connection pool.
+
+Tests WAL setup, read-only readers, writer transaction handling and that
+concurrent readers do not block on the writer.
+"""
+
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+
+import pytest
+
+from minerva_backend.processing.sqlite_pool import SQLitePool
+
+
+@asynccontextmanager
+async def open_pool(tmp_path):
+    """Open pool on a file database with a small table."""
+    pool = SQLitePool(str(tmp_path / "curation.db"), readers=2)
+    await pool.open()
+    try:
+        async with pool.write() as db:
+            await db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, status TEXT)")
+        yield pool
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_open_enables_wal_and_pragmas(tmp_path):
+    """Connections run in WAL mode with relaxed fsync and a busy timeout."""
+    async with open_pool(tmp_path) as pool:
+        async with pool.read() as db:
+            assert (await db.execute_fetchall("PRAGMA journal_mode"))[0][0] == "wal"
+            assert (await db.execute_fetchall("PRAGMA synchronous"))[0][0] == 1  # NORMAL
+            assert (await db.execute_fetchall("PRAGMA busy_timeout"))[0][0] == 5000
+
+
+@pytest.mark.asyncio
+async def test_readers_are_read_only(tmp_path):
+    """Writes must go through the writer connection."""
+    async with open_pool(tmp_path) as pool:
+        async with pool.read() as db:
+            with pytest.raises(sqlite3.OperationalError):
+                await db.execute("INSERT INTO items (status) VALUES ('PENDING')")
+
+
+@pytest.mark.asyncio
+async def test_write_commits_open_transaction_and_rolls_back_on_error(tmp_path):
+    """Uncommitted writes are committed on exit, discarded on error."""
+    async with open_pool(tmp_path) as pool:
+        async with pool.write() as db:
+            await db.execute("INSERT INTO items (status) VALUES ('PENDING')")
+
+        with pytest.raises(ValueError):
+            async with pool.write() as db:
+                await db.execute("INSERT INTO items (status) VALUES ('REJECTED')")
+                raise ValueError("boom")
+
+        async with pool.read() as db:
+            rows = await db.execute_fetchall("SELECT status FROM items")
+        assert rows == [("PENDING",)]
+
+
+@pytest.mark.asyncio
+async def test_reads_proceed_while_writer_is_held(tmp_path):
+    """WAL readers see the last committed state while a write is in progress."""
+    async with open_pool(tmp_path) as pool:
+        async with pool.write() as db:
+            await db.execute("INSERT INTO items (status) VALUES ('PENDING')")
+
+        async def count():
+            async with pool.read() as db:
+                return (await db.execute_fetchall("SELECT COUNT(*) FROM items"))[0][0]
+
+        async with pool.write() as db:
+            await db.execute("INSERT INTO items (status) VALUES ('ACCEPTED')")
+            counts = await asyncio.wait_for(asyncio.gather(count(), count(), count()), 2)
+        assert counts == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_closed_pool_raises():
+    """Using the pool before open() fails instead of leaking connections."""
+    pool = SQLitePool(":memory:")
+    with pytest.raises(RuntimeError):
+        async with pool.read():
+            pass
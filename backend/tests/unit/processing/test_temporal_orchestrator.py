@@ -16,9 +16,7 @@ from minerva_backend.processing.temporal_orchestrator import (
     PipelineActivities,
     JournalProcessingWorkflow
 )
-from minerva_backend.graph.models.documents import JournalEntry, Span
-from minerva_backend.graph.models.entities import Person
-from minerva_backend.graph.models.relations import Relation
+from minerva_models import JournalEntry, Person, Relation, Span
 from minerva_backend.processing.models import EntityMapping, CuratableMapping
 
 
@@ -128,34 +126,74 @@ class TestPipelineActivities:
     
     def test_extract_entities_activity_exists(self):
         """Test that extract_entities activity method exists."""
-        activities = PipelineActivities()
+        activities = PipelineActivities(container=Mock())
         assert hasattr(activities, 'extract_entities')
         assert callable(getattr(activities, 'extract_entities'))
     
     def test_extract_relationships_activity_exists(self):
         """Test that extract_relationships activity method exists."""
-        activities = PipelineActivities()
+        activities = PipelineActivities(container=Mock())
         assert hasattr(activities, 'extract_relationships')
         assert callable(getattr(activities, 'extract_relationships'))
     
     def test_submit_entity_curation_activity_exists(self):
         """Test that submit_entity_curation activity method exists."""
-        activities = PipelineActivities()
+        activities = PipelineActivities(container=Mock())
         assert hasattr(activities, 'submit_entity_curation')
         assert callable(getattr(activities, 'submit_entity_curation'))
     
-    def test_wait_for_entity_curation_activity_exists(self):
-        """Test that wait_for_entity_curation activity method exists."""
-        activities = PipelineActivities()
-        assert hasattr(activities, 'wait_for_entity_curation')
-        assert callable(getattr(activities, 'wait_for_entity_curation'))
+    def test_curation_polling_activities_removed(self):
+        """Curation waits on signals; only short lookup activities remain."""
+        activities = PipelineActivities(container=Mock())
+        assert not hasattr(activities, 'wait_for_entity_curation')
+        assert not hasattr(activities, 'wait_for_relationship_curation')
+        for name in (
+            'get_journal_curation_status',
+            'get_curated_entities',
+            'get_curated_relationships',
+        ):
+            assert callable(getattr(activities, name))
+
+    @pytest.mark.asyncio
+    async def test_get_curated_entities_reads_curation_db_once(self, sample_journal_entry):
+        """The post-signal activity returns accepted entities without polling."""
+        container = Mock()
+        curation_manager = container.curation_manager.return_value
+        curation_manager.get_accepted_entities_with_spans = AsyncMock(return_value=[])
+        activities = PipelineActivities(container=container)
+
+        assert await activities.get_curated_entities(sample_journal_entry) == []
+        curation_manager.get_accepted_entities_with_spans.assert_awaited_once_with(
+            sample_journal_entry.uuid
+        )
     
     def test_extract_feelings_activity_exists(self):
         """Test that extract_feelings activity method exists."""
-        activities = PipelineActivities()
+        activities = PipelineActivities(container=Mock())
         assert hasattr(activities, 'extract_feelings')
         assert callable(getattr(activities, 'extract_feelings'))
 
+    @pytest.mark.asyncio
+    async def test_activities_reuse_injected_container(self, sample_journal_entry):
+        """Activities use the worker's container instead of building their own."""
+        container = Mock()
+        container.kg_service.return_value.add_journal_entry = AsyncMock()
+        container.extraction_service.return_value.extract_entities = AsyncMock(
+            return_value=[]
+        )
+        activities = PipelineActivities(container=container)
+
+        with patch('minerva_backend.containers.Container') as container_class:
+            assert await activities.extract_entities(sample_journal_entry) == []
+            assert await activities.write_to_knowledge_graph(
+                sample_journal_entry, [], []
+            )
+
+        container_class.assert_not_called()
+        container.kg_service.return_value.add_journal_entry.assert_awaited_once_with(
+            sample_journal_entry, [], []
+        )
+
 
 class TestPipelineOrchestrator:
     """Test pipeline orchestrator."""
@@ -251,6 +289,31 @@ class TestPipelineOrchestrator:
         assert result is False
 
 
+    @pytest.mark.asyncio
+    async def test_signal_workflow_success(self, pipeline_orchestrator):
+        """Signals are sent to the workflow handle by name."""
+        mock_handle = Mock()
+        mock_handle.signal = AsyncMock()
+        pipeline_orchestrator.client.get_workflow_handle.return_value = mock_handle
+
+        result = await pipeline_orchestrator.signal_workflow(
+            "journal-1", "entity_curation_complete"
+        )
+
+        assert result is True
+        pipeline_orchestrator.client.get_workflow_handle.assert_called_once_with("journal-1")
+        mock_handle.signal.assert_awaited_once_with("entity_curation_complete")
+
+    @pytest.mark.asyncio
+    async def test_signal_workflow_error(self, pipeline_orchestrator):
+        """A signal that cannot be delivered is reported, not raised."""
+        mock_handle = Mock()
+        mock_handle.signal = AsyncMock(side_effect=Exception("Workflow not found"))
+        pipeline_orchestrator.client.get_workflow_handle.return_value = mock_handle
+
+        assert await pipeline_orchestrator.signal_workflow("journal-1", "x") is False
+
+
 class TestJournalProcessingWorkflow:
     """Test journal processing workflow."""
     